@@ -4,6 +4,7 @@ import ast
 from dataclasses import dataclass
 from pathlib import Path
 
+from ..project import FileInventory, SourceRepository, find_files
 from .dependency_graph import DependencyGraphBuilder
 from .metrics_utils import (
     calculate_lcc,
@@ -44,14 +45,28 @@ class CohesionMetrics:
 class CouplingCohesionAnalyzer:
     """Analyze coupling and cohesion metrics for Python code."""
 
-    def __init__(self, verbose: bool = False) -> None:
+    def __init__(
+        self,
+        verbose: bool = False,
+        sources: SourceRepository | None = None,
+        inventory: FileInventory | None = None,
+    ) -> None:
         """Initialize the analyzer.
 
         Args:
             verbose: If True, print progress information
+            sources: Shared source repository. If omitted, a private repository
+                is created so each file is parsed once across the coupling and
+                cohesion passes.
+            inventory: Shared file inventory. If omitted, the directory is
+                scanned once and shared with the dependency graph builder.
         """
         self.verbose = verbose
-        self.graph_builder = DependencyGraphBuilder(verbose=verbose)
+        self.sources = sources if sources is not None else SourceRepository()
+        self.inventory = inventory
+        self.graph_builder = DependencyGraphBuilder(
+            verbose=verbose, sources=self.sources, inventory=inventory
+        )
 
     def analyze_directory(self, path: str) -> tuple[list[CouplingMetrics], list[CohesionMetrics]]:
         """Analyze a directory for coupling and cohesion metrics.
@@ -67,11 +82,12 @@ class CouplingCohesionAnalyzer:
         if not root.exists():
             raise ValueError(f"Path does not exist: {path}")
 
-        # Get all Python files
-        if root.is_file():
-            python_files = [root]
-        else:
-            python_files = list(root.rglob("*.py"))
+        # Get all Python files, listing the tree once for both passes
+        inventory = self.inventory
+        if root.is_dir() and (inventory is None or not inventory.covers(root)):
+            inventory = FileInventory.scan(root)
+        self.graph_builder.inventory = inventory
+        python_files = find_files(root, "python", inventory)
 
         if self.verbose:
             print(f"Analyzing {len(python_files)} Python files...")
@@ -122,7 +138,7 @@ class CouplingCohesionAnalyzer:
         instability = self.calculate_instability(ca, ce)
 
         # Calculate abstractness
-        abstract_count, total_count = count_abstract_classes(module_path)
+        abstract_count, total_count = count_abstract_classes(module_path, self.sources)
         abstractness = abstract_count / total_count if total_count > 0 else 0.0
 
         # Calculate distance from main sequence
@@ -187,8 +203,7 @@ class CouplingCohesionAnalyzer:
         metrics: list[CohesionMetrics] = []
 
         try:
-            with open(file_path, encoding="utf-8") as f:
-                tree = ast.parse(f.read(), filename=str(file_path))
+            tree = self.sources.parse(file_path)
         except Exception:
             return metrics
 
@@ -5,19 +5,31 @@ import os
 from collections import defaultdict
 from pathlib import Path
 
+from ..project import FileInventory, ModuleIndex, SourceRepository, find_files
+
 
 class DependencyGraphBuilder:
     """Build and analyze module dependency graphs."""
 
-    def __init__(self, verbose: bool = False) -> None:
+    def __init__(
+        self,
+        verbose: bool = False,
+        sources: SourceRepository | None = None,
+        inventory: FileInventory | None = None,
+    ) -> None:
         """Initialize the dependency graph builder.
 
         Args:
             verbose: If True, print progress information
+            sources: Shared source repository (a private one is created if omitted)
+            inventory: Shared file inventory (the tree is scanned if omitted)
         """
         self.verbose = verbose
+        self.sources = sources if sources is not None else SourceRepository(retain_trees=False)
+        self.inventory = inventory
         self.module_map: dict[str, str] = {}  # module name -> file path
         self.reverse_map: dict[str, str] = {}  # file path -> module name
+        self.module_index = ModuleIndex()
 
     def build(self, root_path: str) -> dict[str, set[str]]:
         """Build dependency graph for all modules in the given path.
@@ -37,16 +49,15 @@ class DependencyGraphBuilder:
         if self.verbose:
             print(f"Scanning Python files in {root}...")
 
-        if root.is_file():
-            python_files = [root]
-        else:
-            python_files = list(root.rglob("*.py"))
+        python_files = find_files(root, "python", self.inventory)
 
         for file_path in python_files:
             module_name = self._file_to_module_name(file_path, root)
             self.module_map[module_name] = str(file_path)
             self.reverse_map[str(file_path)] = module_name
 
+        self.module_index = ModuleIndex(self.module_map)
+
         if self.verbose:
             print(f"Found {len(python_files)} Python files")
 
@@ -111,8 +122,7 @@ class DependencyGraphBuilder:
         imports: list[str] = []
 
         try:
-            with open(file_path, encoding="utf-8") as f:
-                tree = ast.parse(f.read(), filename=str(file_path))
+            tree = self.sources.parse(file_path)
         except Exception:
             return imports
 
@@ -142,16 +152,10 @@ class DependencyGraphBuilder:
         Returns:
             Resolved module name or None if not in our codebase
         """
-        # Direct match
-        if import_name in self.module_map:
-            return import_name
-
-        # Try to find partial matches (for submodules)
-        parts = import_name.split(".")
-        for i in range(len(parts), 0, -1):
-            candidate = ".".join(parts[:i])
-            if candidate in self.module_map:
-                return candidate
+        # Direct match, or the longest module prefix (for submodules)
+        resolved = self.module_index.resolve(import_name)
+        if resolved is not None:
+            return resolved
 
         # Try relative imports
         from_module = self.reverse_map.get(from_file, "")
@@ -159,7 +163,7 @@ class DependencyGraphBuilder:
             from_parts = from_module.split(".")
             # Try same package
             same_package = ".".join(from_parts[:-1] + [import_name.split(".")[0]])
-            if same_package in self.module_map:
+            if same_package in self.module_index:
                 return same_package
 
         return None
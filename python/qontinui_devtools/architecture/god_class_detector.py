@@ -2,10 +2,11 @@
 
 import ast
 from collections import defaultdict
-from dataclasses import dataclass, field
-from pathlib import Path
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
 from typing import Any
 
+from ..project import AnalysisCache, FileInventory, SourceRepository, find_files
 from .ast_metrics import (
     calculate_complexity,
     count_attributes,
@@ -60,12 +61,17 @@ class ExtractionSuggestion:
 class GodClassDetector:
     """Detect god classes violating SRP."""
 
+    CACHE_VERSION = "1"
+
     def __init__(
         self,
         min_lines: int = 500,
         min_methods: int = 20,
         max_lcom: float = 0.8,
         verbose: bool = False,
+        sources: SourceRepository | None = None,
+        cache: AnalysisCache | None = None,
+        inventory: FileInventory | None = None,
     ) -> None:
         """Initialize detector with configurable thresholds.
 
@@ -74,11 +80,17 @@ class GodClassDetector:
             min_methods: Minimum method count to consider as god class
             max_lcom: Maximum LCOM threshold (higher = worse cohesion)
             verbose: Enable verbose output
+            sources: Shared source repository (a private one is created if omitted)
+            cache: Persistent cache for per-file results (disabled if omitted)
+            inventory: Shared file inventory (the tree is scanned if omitted)
         """
         self.min_lines = min_lines
         self.min_methods = min_methods
         self.max_lcom = max_lcom
         self.verbose = verbose
+        self.sources = sources if sources is not None else SourceRepository(retain_trees=False)
+        self.cache = cache
+        self.inventory = inventory
 
     def analyze_directory(self, path: str) -> list[ClassMetrics]:
         """Analyze all Python files in a directory.
@@ -89,19 +101,7 @@ class GodClassDetector:
         Returns:
             List of god class metrics
         """
-        god_classes: list[Any] = []
-        path_obj = Path(path)
-
-        # Find all Python files
-        python_files = list(path_obj.rglob("*.py"))
-
-        for file_path in python_files:
-            try:
-                file_god_classes = self.analyze_file(str(file_path))
-                god_classes.extend(file_god_classes)
-            except Exception as e:
-                if self.verbose:
-                    print(f"Error analyzing {file_path}: {e}")
+        god_classes = list(self.iter_findings(path))
 
         # Sort by severity and line count
         severity_order = {"critical": 0, "high": 1, "medium": 2}
@@ -109,6 +109,22 @@ class GodClassDetector:
 
         return god_classes
 
+    def iter_findings(self, path: str) -> Iterator[ClassMetrics]:
+        """Yield god classes file by file as each file is analyzed.
+
+        Args:
+            path: Directory path to analyze
+
+        Yields:
+            God class metrics in file order (unsorted by severity)
+        """
+        for file_path in find_files(path, "python", self.inventory):
+            try:
+                yield from self.analyze_file(str(file_path))
+            except Exception as e:
+                if self.verbose:
+                    print(f"Error analyzing {file_path}: {e}")
+
     def analyze_file(self, file_path: str) -> list[ClassMetrics]:
         """Analyze a single Python file.
 
@@ -119,12 +135,16 @@ class GodClassDetector:
             List of god class metrics found in file
         """
         god_classes: list[Any] = []
+        config = [self.min_lines, self.min_methods, self.max_lcom]
 
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                source = f.read()
+        if self.cache is not None:
+            cached = self.cache.get("god_classes", file_path, self.CACHE_VERSION, config)
+            if cached is not None:
+                return [ClassMetrics(**data) for data in cached]
 
-            tree = ast.parse(source)
+        try:
+            source = self.sources.read(file_path)
+            tree = self.sources.parse(file_path)
 
             # Find all classes
             for node in ast.walk(tree):
@@ -136,6 +156,16 @@ class GodClassDetector:
         except Exception as e:
             if self.verbose:
                 print(f"Error parsing {file_path}: {e}")
+            return god_classes
+
+        if self.cache is not None:
+            self.cache.put(
+                "god_classes",
+                file_path,
+                [asdict(metrics) for metrics in god_classes],
+                self.CACHE_VERSION,
+                config,
+            )
 
         return god_classes
 
@@ -156,8 +186,7 @@ class GodClassDetector:
             ClassMetrics object
         """
         if source is None:
-            with open(file_path, encoding="utf-8") as f:
-                source = f.read()
+            source = self.sources.read(file_path)
 
         # Basic metrics
         total_lines, code_lines = count_lines(node, source)
@@ -311,10 +340,8 @@ class GodClassDetector:
 
         try:
             # Read the source file
-            with open(metrics.file_path, encoding="utf-8") as f:
-                source = f.read()
-
-            tree = ast.parse(source)
+            source = self.sources.read(metrics.file_path)
+            tree = self.sources.parse(metrics.file_path)
 
             # Find the class node
             class_node = None
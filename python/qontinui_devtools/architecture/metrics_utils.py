@@ -3,6 +3,8 @@
 import ast
 from collections import defaultdict
 
+from ..project import SourceRepository
+
 
 def calculate_lcom4(class_node: ast.ClassDef) -> float:
     """Calculate LCOM4 (Lack of Cohesion of Methods - version 4).
@@ -331,7 +333,9 @@ def calculate_lcom(class_node: ast.ClassDef) -> float:
     return lcom / total_pairs
 
 
-def count_abstract_classes(module_path: str) -> tuple[int, int]:
+def count_abstract_classes(
+    module_path: str, sources: SourceRepository | None = None
+) -> tuple[int, int]:
     """Count abstract and total classes in a module.
 
     A class is considered abstract if:
@@ -340,13 +344,17 @@ def count_abstract_classes(module_path: str) -> tuple[int, int]:
 
     Args:
         module_path: Path to the Python module
+        sources: Shared source repository to take the parsed module from
 
     Returns:
         Tuple of (abstract_count, total_count)
     """
     try:
-        with open(module_path, encoding="utf-8") as f:
-            tree = ast.parse(f.read(), filename=module_path)
+        if sources is not None:
+            tree = sources.parse(module_path)
+        else:
+            with open(module_path, encoding="utf-8") as f:
+                tree = ast.parse(f.read(), filename=module_path)
     except Exception:
         return (0, 0)
 
@@ -13,6 +13,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from ..project import FileInventory, SourceRepository, find_files
 from .clustering import MethodCluster, cluster_methods_by_keywords
 
 
@@ -51,13 +52,22 @@ class SRPAnalyzer:
     responsibilities by clustering their methods semantically.
     """
 
-    def __init__(self, verbose: bool = False) -> None:
+    def __init__(
+        self,
+        verbose: bool = False,
+        sources: SourceRepository | None = None,
+        inventory: FileInventory | None = None,
+    ) -> None:
         """Initialize the SRP analyzer.
 
         Args:
             verbose: Whether to print verbose output during analysis
+            sources: Shared source repository (a private one is created if omitted)
+            inventory: Shared file inventory (the tree is scanned if omitted)
         """
         self.verbose = verbose
+        self.sources = sources if sources is not None else SourceRepository(retain_trees=False)
+        self.inventory = inventory
         self.stats: dict[str, int] = {
             "files_analyzed": 0,
             "classes_analyzed": 0,
@@ -81,10 +91,7 @@ class SRPAnalyzer:
         violations: list[Any] = []
 
         # Find all Python files
-        if path_obj.is_file():
-            python_files = [path_obj]
-        else:
-            python_files = list(path_obj.rglob("*.py"))
+        python_files = find_files(path_obj, "python", self.inventory)
 
         if self.verbose:
             print(f"Analyzing {len(python_files)} Python files...")
@@ -115,10 +122,7 @@ class SRPAnalyzer:
         violations: list[Any] = []
 
         try:
-            with open(file_path, encoding="utf-8") as f:
-                source = f.read()
-
-            tree = ast.parse(source, filename=file_path)
+            tree = self.sources.parse(file_path)
 
             # Find all class definitions
             for node in ast.walk(tree):
@@ -59,21 +59,53 @@ def get_git_root() -> Path | None:
         return None
 
 
+def get_files_to_check(filenames: Sequence[str], since: str | None) -> list[str]:
+    """Choose the Python files a hook checks.
+
+    Args:
+        filenames: Filenames passed by pre-commit (take precedence)
+        since: Git revision; files changed since it are checked instead of
+            the staged files
+
+    Returns:
+        Python file paths to check
+    """
+    if filenames:
+        return [f for f in filenames if f.endswith(".py")]
+
+    if since:
+        from qontinui_devtools.project import changed_files
+
+        try:
+            return [str(f) for f in changed_files(since) if f.suffix == ".py"]
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            sys.exit(1)
+
+    return get_staged_python_files()
+
+
+since_option = click.option(
+    "--since",
+    metavar="REF",
+    help="Check files changed since a git revision instead of the staged files",
+)
+
+
 @click.command()
 @click.argument("filenames", nargs=-1)
-def check_circular_imports(filenames: Sequence[str]) -> None:
-    """Check for circular imports in staged files.
+@since_option
+def check_circular_imports(filenames: Sequence[str], since: str | None) -> None:
+    """Check for circular imports involving the staged files.
 
     Args:
         filenames: Optional list of filenames to check
+        since: Optional git revision to check changes since
     """
     console.print("[cyan]Checking for circular imports...[/cyan]")
 
     # Get files to check
-    if filenames:
-        files_to_check = [f for f in filenames if f.endswith(".py")]
-    else:
-        files_to_check = get_staged_python_files()
+    files_to_check = get_files_to_check(filenames, since)
 
     if not files_to_check:
         console.print("[yellow]No Python files to check[/yellow]")
@@ -88,9 +120,12 @@ def check_circular_imports(filenames: Sequence[str]) -> None:
     # Try to import and run the circular dependency detector
     try:
         from qontinui_devtools.import_analysis import CircularDependencyDetector
+        from qontinui_devtools.project import AnalysisCache
 
-        detector = CircularDependencyDetector(str(git_root))
-        cycles = detector.analyze()
+        # Unchanged files come from the cached import graph; only cycles
+        # through the checked files are searched
+        detector = CircularDependencyDetector(str(git_root), cache=AnalysisCache())
+        cycles = detector.analyze(changed_files=files_to_check)
 
         if cycles:
             console.print(f"[red]❌ Found {len(cycles)} circular dependencies:[/red]")
@@ -124,21 +159,22 @@ def check_circular_imports(filenames: Sequence[str]) -> None:
     default=30,
     help="Minimum methods to consider a god class (default: 30)",
 )
-def check_new_god_classes(filenames: Sequence[str], min_lines: int, min_methods: int) -> None:
+@since_option
+def check_new_god_classes(
+    filenames: Sequence[str], min_lines: int, min_methods: int, since: str | None
+) -> None:
     """Check if any staged files contain god classes.
 
     Args:
         filenames: Optional list of filenames to check
         min_lines: Minimum lines to flag as god class
         min_methods: Minimum methods to flag as god class
+        since: Optional git revision to check changes since
     """
     console.print("[cyan]Checking for god classes...[/cyan]")
 
     # Get files to check
-    if filenames:
-        files_to_check = [f for f in filenames if f.endswith(".py")]
-    else:
-        files_to_check = get_staged_python_files()
+    files_to_check = get_files_to_check(filenames, since)
 
     if not files_to_check:
         console.print("[yellow]No Python files to check[/yellow]")
@@ -193,20 +229,19 @@ def check_new_god_classes(filenames: Sequence[str], min_lines: int, min_methods:
     default="high",
     help="Minimum severity to fail on (default: high)",
 )
-def check_race_conditions(filenames: Sequence[str], severity: str) -> None:
+@since_option
+def check_race_conditions(filenames: Sequence[str], severity: str, since: str | None) -> None:
     """Check for race conditions in staged files.
 
     Args:
         filenames: Optional list of filenames to check
         severity: Minimum severity to fail on
+        since: Optional git revision to check changes since
     """
     console.print("[cyan]Checking for race conditions...[/cyan]")
 
     # Get files to check
-    if filenames:
-        files_to_check = [f for f in filenames if f.endswith(".py")]
-    else:
-        files_to_check = get_staged_python_files()
+    files_to_check = get_files_to_check(filenames, since)
 
     if not files_to_check:
         console.print("[yellow]No Python files to check[/yellow]")
@@ -276,20 +311,19 @@ def check_race_conditions(filenames: Sequence[str], severity: str) -> None:
     default=15,
     help="Maximum cyclomatic complexity allowed (default: 15)",
 )
-def check_complexity(filenames: Sequence[str], max_complexity: int) -> None:
+@since_option
+def check_complexity(filenames: Sequence[str], max_complexity: int, since: str | None) -> None:
     """Check cyclomatic complexity of staged files.
 
     Args:
         filenames: Optional list of filenames to check
         max_complexity: Maximum allowed complexity
+        since: Optional git revision to check changes since
     """
     console.print("[cyan]Checking code complexity...[/cyan]")
 
     # Get files to check
-    if filenames:
-        files_to_check = [f for f in filenames if f.endswith(".py")]
-    else:
-        files_to_check = get_staged_python_files()
+    files_to_check = get_files_to_check(filenames, since)
 
     if not files_to_check:
         console.print("[yellow]No Python files to check[/yellow]")
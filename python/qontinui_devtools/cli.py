@@ -1,8 +1,9 @@
 """Command-line interface for Qontinui DevTools."""
 
 import sys
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 from rich.console import Console
@@ -10,8 +11,173 @@ from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.table import Table
 
+if TYPE_CHECKING:
+    from .project import AnalysisCache
+    from .reporting.finding_stream import Finding
+
 console = Console()
 
+no_cache_option = click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-analyze every file instead of reusing results from .qontinui-devtools/cache",
+)
+
+
+def _analysis_cache(no_cache: bool) -> "AnalysisCache | None":
+    """Create the persistent per-file result cache unless disabled."""
+    if no_cache:
+        return None
+
+    from .project import AnalysisCache
+
+    return AnalysisCache()
+
+
+stream_option = click.option(
+    "--stream",
+    type=click.Choice(["ndjson", "sarif"], case_sensitive=False),
+    help="Write findings as NDJSON or SARIF while the scan runs (to --output, or stdout)",
+)
+
+
+def _stream_findings(
+    findings: "Iterable[Finding]", format: str, output: str | None, tool: str
+) -> int:
+    """Write findings with a streaming writer as the analyzer yields them.
+
+    Nothing else is printed to stdout when writing there, so the stream can
+    be piped into another tool.
+
+    Returns:
+        Number of findings written
+    """
+    from .reporting.finding_stream import open_finding_writer
+
+    with open_finding_writer(format, output, tool) as writer:
+        for finding in findings:
+            writer.write(finding)
+
+    if output:
+        console.print(f"[green]{writer.count} finding(s) written to: {output}[/green]")
+    return writer.count
+
+
+def _vulnerability_finding(vuln: Any) -> "Finding":
+    """Convert a security Vulnerability to a streamed finding."""
+    from .reporting.finding_stream import Finding
+
+    return Finding(
+        rule_id=vuln.type.value,
+        message=vuln.description,
+        severity=vuln.severity.value,
+        file_path=vuln.file_path,
+        line=vuln.line_number,
+        tool="security",
+        properties={
+            "cwe_id": vuln.cwe_id,
+            "owasp_category": vuln.owasp_category,
+            "remediation": vuln.remediation,
+            "confidence": vuln.confidence,
+        },
+    )
+
+
+def _god_class_finding(cls: Any) -> "Finding":
+    """Convert god class metrics to a streamed finding."""
+    from .reporting.finding_stream import Finding
+
+    return Finding(
+        rule_id="god_class",
+        message=(
+            f"{cls.name} has {cls.line_count} lines and {cls.method_count} methods "
+            f"(LCOM {cls.lcom:.2f})"
+        ),
+        severity=cls.severity,
+        file_path=cls.file_path,
+        line=cls.line_start,
+        tool="god-classes",
+        properties={"class": cls.name, "responsibilities": cls.responsibilities},
+    )
+
+
+def _race_finding(race: Any) -> "Finding":
+    """Convert a RaceCondition to a streamed finding."""
+    from .reporting.finding_stream import Finding
+
+    return Finding(
+        rule_id="race_condition",
+        message=race.description,
+        severity=race.severity,
+        file_path=race.shared_state.file_path,
+        line=race.shared_state.line_number,
+        tool="concurrency",
+        properties={
+            "state": race.shared_state.name,
+            "suggestion": race.suggestion,
+            "patterns": race.patterns_detected,
+        },
+    )
+
+
+def _ts_complexity_finding(issue: Any) -> "Finding":
+    """Convert a TypeScript ComplexityIssue to a streamed finding."""
+    from .reporting.finding_stream import Finding
+
+    return Finding(
+        rule_id=issue.type,
+        message=f"{issue.name}: {issue.metric} exceeds {issue.threshold}",
+        severity=issue.severity,
+        file_path=str(issue.file_path),
+        line=issue.line_number,
+        tool="ts-complexity",
+        properties={"metric": issue.metric, "threshold": issue.threshold},
+    )
+
+
+def _type_issue_finding(issue: Any) -> "Finding":
+    """Convert a TypeScript TypeIssue to a streamed finding."""
+    from .reporting.finding_stream import Finding
+
+    return Finding(
+        rule_id=issue.type,
+        message=issue.context,
+        severity=issue.severity,
+        file_path=str(issue.file_path),
+        line=issue.line_number,
+        tool="ts-types",
+    )
+
+
+def _unsafe_finding(block: Any) -> "Finding":
+    """Convert a Rust UnsafeBlock to a streamed finding."""
+    from .reporting.finding_stream import Finding
+
+    return Finding(
+        rule_id=f"unsafe_{block.category}",
+        message=f"Unsafe {block.block_type}: {block.code_snippet}",
+        severity="low",
+        file_path=block.file_path,
+        line=block.line_number,
+        tool="rust-unsafe",
+        properties={"block_type": block.block_type, "category": block.category},
+    )
+
+
+def _rust_complexity_finding(metric: Any) -> "Finding":
+    """Convert Rust ComplexityMetrics to a streamed finding."""
+    from .reporting.finding_stream import Finding
+
+    return Finding(
+        rule_id=f"complex_{metric.element_type}",
+        message=f"{metric.name}: {metric.details}",
+        severity="medium",
+        file_path=metric.file_path,
+        line=metric.line_number,
+        tool="rust-complexity",
+        properties={"complexity": metric.complexity, "lines": metric.lines},
+    )
+
 
 @click.group()
 @click.version_option(version="1.1.0")
@@ -55,7 +221,35 @@ def import_cmd() -> None:
     default="text",
     help="Output format",
 )
-def check_imports(path: str, strict: bool, output: str | None, format: str) -> None:
+@click.option(
+    "--cycle-mode",
+    type=click.Choice(["auto", "scc", "all"], case_sensitive=False),
+    default="auto",
+    help="Enumerate all cycles, summarize strongly connected components, or pick automatically",
+)
+@click.option(
+    "--max-cycles",
+    type=click.IntRange(min=1),
+    default=10_000,
+    help="Maximum number of cycles to enumerate in 'all' mode",
+)
+@click.option(
+    "--cycle-timeout",
+    type=click.FloatRange(min=0),
+    default=30.0,
+    help="Seconds allowed for cycle enumeration in 'all' mode",
+)
+@no_cache_option
+def check_imports(
+    path: str,
+    strict: bool,
+    output: str | None,
+    format: str,
+    cycle_mode: str,
+    max_cycles: int,
+    cycle_timeout: float,
+    no_cache: bool,
+) -> None:
     """Check for circular dependencies in Python code.
 
     Analyzes Python files to detect circular import dependencies that can
@@ -71,6 +265,9 @@ def check_imports(path: str, strict: bool, output: str | None, format: str) -> N
 
         # Save report to file
         qontinui-devtools import check ./src --output report.json --format json
+
+        # Report each tangled group of modules once, with imports to cut
+        qontinui-devtools import check ./src --cycle-mode scc
     """
     try:
         from .import_analysis import CircularDependencyDetector
@@ -79,7 +276,14 @@ def check_imports(path: str, strict: bool, output: str | None, format: str) -> N
         sys.exit(1)
 
     try:
-        detector = CircularDependencyDetector(path, verbose=True)
+        detector = CircularDependencyDetector(
+            path,
+            verbose=True,
+            cache=_analysis_cache(no_cache),
+            cycle_mode=cycle_mode.lower(),
+            max_cycles=max_cycles,
+            cycle_timeout=cycle_timeout,
+        )
         cycles = detector.analyze()
 
         # Use the rich report from detector
@@ -101,6 +305,9 @@ def check_imports(path: str, strict: bool, output: str | None, format: str) -> N
         console.print(f"  Total imports: {stats['total_imports']}")
         console.print(f"  Dependencies: {stats['total_dependencies']}")
         console.print(f"  Cycles found: {stats['cycles_found']}")
+        if stats["cyclic_components"]:
+            console.print(f"  Cyclic components: {stats['cyclic_components']}")
+            console.print(f"  Imports to cut: {stats['feedback_edges']}")
 
         if cycles and strict:
             sys.exit(1)
@@ -220,7 +427,10 @@ def concurrency() -> None:
 )
 @click.option("--output", type=click.Path(), help="Save report to file")
 @click.option("--detailed", is_flag=True, help="Show detailed analysis")
-def check_concurrency(path: str, severity: str, output: str | None, detailed: bool) -> None:
+@stream_option
+def check_concurrency(
+    path: str, severity: str, output: str | None, detailed: bool, stream: str | None
+) -> None:
     """Check for race conditions and concurrency issues.
 
     Performs static analysis to detect potential race conditions, missing locks,
@@ -236,6 +446,9 @@ def check_concurrency(path: str, severity: str, output: str | None, detailed: bo
 
         # Detailed output
         qontinui-devtools concurrency check ./src --detailed
+
+        # Stream SARIF for code scanning while files are analyzed
+        qontinui-devtools concurrency check ./src --stream sarif --output races.sarif
     """
     try:
         from .concurrency import RaceConditionDetector
@@ -243,6 +456,22 @@ def check_concurrency(path: str, severity: str, output: str | None, detailed: bo
         console.print("[red]Error: Concurrency analysis module not available[/red]")
         sys.exit(1)
 
+    severity_order = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+    min_level = severity_order.get(severity.lower(), 1)
+
+    if stream:
+        _stream_findings(
+            (
+                _race_finding(race)
+                for race in RaceConditionDetector(path).iter_findings()
+                if severity_order[race.severity] >= min_level
+            ),
+            stream,
+            output,
+            "concurrency",
+        )
+        return
+
     console.print(f"[bold cyan]Analyzing concurrency in:[/bold cyan] {path}\n")
 
     try:
@@ -250,8 +479,6 @@ def check_concurrency(path: str, severity: str, output: str | None, detailed: bo
         races = detector.analyze()
 
         # Filter by severity
-        severity_order = {"low": 0, "medium": 1, "high": 2, "critical": 3}
-        min_level = severity_order.get(severity.lower(), 1)
         races = [r for r in races if severity_order[r.severity] >= min_level]
 
         if races:
@@ -323,7 +550,13 @@ def test() -> None:
 @click.option("--iterations", default=100, help="Iterations per thread")
 @click.option("--target", required=True, help="Target function (module:function)")
 @click.option("--timeout", default=30, help="Timeout in seconds")
-def test_race(threads: int, iterations: int, target: str, timeout: int) -> None:
+@click.option(
+    "--backend",
+    type=click.Choice(["threads", "processes", "asyncio", "free-threaded", "auto"]),
+    default="threads",
+    help="How workers run (free-threaded needs a CPython build with the GIL disabled)",
+)
+def test_race(threads: int, iterations: int, target: str, timeout: int, backend: str) -> None:
     """Run race condition stress test.
 
     Executes a function concurrently from multiple threads to detect
@@ -336,6 +569,9 @@ def test_race(threads: int, iterations: int, target: str, timeout: int) -> None:
 
         # Heavy stress test
         qontinui-devtools test race --target mymodule:my_function --threads 50 --iterations 1000
+
+        # Run workers as processes instead of threads
+        qontinui-devtools test race --target mymodule:my_function --backend processes
     """
     try:
         from .concurrency import RaceConditionTester
@@ -348,7 +584,8 @@ def test_race(threads: int, iterations: int, target: str, timeout: int) -> None:
             f"[cyan]Threads:[/cyan] {threads}\n"
             f"[cyan]Iterations:[/cyan] {iterations}\n"
             f"[cyan]Target:[/cyan] {target}\n"
-            f"[cyan]Timeout:[/cyan] {timeout}s",
+            f"[cyan]Timeout:[/cyan] {timeout}s\n"
+            f"[cyan]Backend:[/cyan] {backend}",
             title="Race Condition Test Configuration",
             border_style="blue",
         )
@@ -366,7 +603,7 @@ def test_race(threads: int, iterations: int, target: str, timeout: int) -> None:
         func = getattr(module, func_name)
 
         # Run test
-        tester = RaceConditionTester(threads=threads, iterations=iterations)
+        tester = RaceConditionTester(threads=threads, iterations=iterations, backend=backend)
 
         with console.status("[bold green]Running tests..."):
             result = tester.test_function(func)
@@ -622,9 +859,14 @@ def profile_memory(
 @profile.command("action")
 @click.argument("script_file", type=click.Path(exists=True))
 @click.option("--output", default="profile.json", help="Output JSON file")
-@click.option("--flame-graph", type=click.Path(), help="Generate flame graph (SVG or JSON)")
 @click.option(
-    "--format", type=click.Choice(["svg", "json"]), default="svg", help="Flame graph format"
+    "--flame-graph", type=click.Path(), help="Generate flame graph (SVG, JSON or collapsed stacks)"
+)
+@click.option(
+    "--format",
+    type=click.Choice(["svg", "json", "collapsed"]),
+    default="svg",
+    help="Flame graph format",
 )
 @click.option("--sample-interval", default=0.001, help="Stack sampling interval in seconds")
 @click.option(
@@ -851,8 +1093,16 @@ def architecture() -> None:
     "--detail", type=click.Choice(["low", "medium", "high"]), default="medium", help="Detail level"
 )
 @click.option("--output", type=click.Path(), help="Save report to file")
+@no_cache_option
+@stream_option
 def detect_god_classes(
-    path: str, min_lines: int, min_methods: int, detail: str, output: str | None
+    path: str,
+    min_lines: int,
+    min_methods: int,
+    detail: str,
+    output: str | None,
+    no_cache: bool,
+    stream: str | None,
 ) -> None:
     """Detect god classes violating Single Responsibility Principle.
 
@@ -873,6 +1123,9 @@ def detect_god_classes(
 
         # Save report to file
         qontinui-devtools architecture god-classes ./src --output report.md
+
+        # Stream findings as NDJSON to stdout
+        qontinui-devtools architecture god-classes ./src --stream ndjson
     """
     try:
         from .architecture import GodClassDetector
@@ -880,7 +1133,18 @@ def detect_god_classes(
         console.print("[red]Error: Architecture analysis module not available[/red]")
         sys.exit(1)
 
-    detector = GodClassDetector(min_lines=min_lines, min_methods=min_methods, verbose=True)
+    detector = GodClassDetector(
+        min_lines=min_lines,
+        min_methods=min_methods,
+        verbose=not stream,
+        cache=_analysis_cache(no_cache),
+    )
+
+    if stream:
+        _stream_findings(
+            map(_god_class_finding, detector.iter_findings(path)), stream, output, "god-classes"
+        )
+        return
 
     with console.status("[bold green]Analyzing classes..."):
         god_classes = detector.analyze_directory(path)
@@ -1325,8 +1589,14 @@ def quality() -> None:
     default="text",
     help="Output format",
 )
+@no_cache_option
 def detect_dead_code(
-    path: str, code_type: str, min_confidence: float, output: str | None, format: str
+    path: str,
+    code_type: str,
+    min_confidence: float,
+    output: str | None,
+    format: str,
+    no_cache: bool,
 ) -> None:
     """Detect unused code in Python projects.
 
@@ -1358,7 +1628,7 @@ def detect_dead_code(
         sys.exit(1)
 
     with console.status("[bold green]Analyzing code for dead code..."):
-        detector = DeadCodeDetector(path)
+        detector = DeadCodeDetector(path, cache=_analysis_cache(no_cache))
 
         # Get dead code based on type
         if code_type == "all":
@@ -1509,7 +1779,24 @@ def security() -> None:
     default="medium",
     help="Minimum severity to report",
 )
-def scan_security(path: str, output: str | None, format: str, severity: str) -> None:
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Worker processes for scanning (0 = one per CPU)",
+)
+@no_cache_option
+@stream_option
+def scan_security(
+    path: str,
+    output: str | None,
+    format: str,
+    severity: str,
+    jobs: int,
+    no_cache: bool,
+    stream: str | None,
+) -> None:
     """Scan for security vulnerabilities.
 
     Analyzes Python code for common security issues including:
@@ -1530,6 +1817,12 @@ def scan_security(path: str, output: str | None, format: str, severity: str) ->
 
         # Generate HTML report
         qontinui-devtools security scan ./src --output security.html --format html
+
+        # Scan with all CPU cores
+        qontinui-devtools security scan ./src --jobs 0
+
+        # Stream SARIF for GitHub code scanning as files finish
+        qontinui-devtools security scan ./src --stream sarif --output security.sarif
     """
     try:
         from .security import SecurityAnalyzer
@@ -1537,13 +1830,6 @@ def scan_security(path: str, output: str | None, format: str, severity: str) ->
         console.print("[red]Error: Security analysis module not available[/red]")
         sys.exit(1)
 
-    console.print(f"[bold cyan]Scanning for security vulnerabilities:[/bold cyan] {path}\n")
-
-    analyzer = SecurityAnalyzer()
-    with console.status("[bold green]Analyzing security..."):
-        report = analyzer.analyze_directory(path)
-
-    # Filter by severity
     from .security.models import Severity as SevEnum
 
     severity_map = {
@@ -1554,6 +1840,26 @@ def scan_security(path: str, output: str | None, format: str, severity: str) ->
     }
     min_severity = severity_map.get(severity.lower(), SevEnum.MEDIUM)
 
+    analyzer = SecurityAnalyzer(cache=_analysis_cache(no_cache))
+
+    if stream:
+        _stream_findings(
+            (
+                _vulnerability_finding(vuln)
+                for vuln in analyzer.iter_findings(path, jobs=jobs)
+                if vuln.severity <= min_severity
+            ),
+            stream,
+            output,
+            "security",
+        )
+        return
+
+    console.print(f"[bold cyan]Scanning for security vulnerabilities:[/bold cyan] {path}\n")
+
+    with console.status("[bold green]Analyzing security..."):
+        report = analyzer.analyze_directory(path, jobs=jobs)
+
     # Filter vulnerabilities based on severity
     filtered_vulns = [v for v in report.vulnerabilities if v.severity <= min_severity]
 
@@ -2199,6 +2505,18 @@ def save_report(data: Any, output: str, format: str, detector: Any = None) -> No
                         for c in data
                     ],
                     "statistics": detector.get_statistics() if detector else {},
+                    "components": (
+                        [
+                            {
+                                "modules": comp.modules,
+                                "cycles": comp.cycles,
+                                "feedback_edges": [list(edge) for edge in comp.feedback_edges],
+                            }
+                            for comp in detector.components
+                        ]
+                        if detector
+                        else []
+                    ),
                 },
                 f,
                 indent=2,
@@ -2513,7 +2831,29 @@ def generate_report(results: dict[str, Any], output: str, format: str) -> None:
 )
 @click.option("--output", type=click.Path(), help="Output file path (used with --format)")
 @click.option("--verbose", is_flag=True, help="Enable verbose output")
-def analyze(path: str, report: str | None, format: str, output: str | None, verbose: bool) -> None:
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Worker processes for analysis (0 = one per CPU)",
+)
+@click.option(
+    "--since",
+    metavar="REF",
+    help="Only analyze files changed since a git revision (e.g. main or HEAD~1)",
+)
+@no_cache_option
+def analyze(
+    path: str,
+    report: str | None,
+    format: str,
+    output: str | None,
+    verbose: bool,
+    jobs: int,
+    since: str | None,
+    no_cache: bool,
+) -> None:
     """Run comprehensive analysis and generate interactive HTML report.
 
     This command runs all available analysis tools (imports, architecture, quality,
@@ -2535,6 +2875,12 @@ def analyze(path: str, report: str | None, format: str, output: str | None, verb
 
         # Verbose mode
         qontinui-devtools analyze ./src --report report.html --verbose
+
+        # Use all CPU cores
+        qontinui-devtools analyze ./src --report report.html --jobs 0
+
+        # Only files changed on this branch
+        qontinui-devtools analyze ./src --since main
     """
     try:
         from .reporting import HTMLReportGenerator, ReportAggregator
@@ -2542,10 +2888,23 @@ def analyze(path: str, report: str | None, format: str, output: str | None, verb
         console.print("[red]Error: Reporting module not available[/red]")
         sys.exit(1)
 
+    changed = None
+    if since:
+        from .project import changed_files
+
+        try:
+            changed = changed_files(since, path)
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            sys.exit(1)
+        console.print(f"[dim]{len(changed)} file(s) changed since {since}[/dim]")
+
     console.print(f"[bold]Running comprehensive analysis on: {path}[/bold]\n")
 
     # Create aggregator and run all analyses
-    aggregator = ReportAggregator(path, verbose=verbose)
+    aggregator = ReportAggregator(
+        path, verbose=verbose, jobs=jobs, changed_files=changed, cache=_analysis_cache(no_cache)
+    )
 
     with console.status("[bold green]Running all analyses..."):
         try:
@@ -2733,7 +3092,9 @@ def start_dashboard(host: str, port: int, interval: float) -> None:
     collector = MetricsCollector(sample_interval=interval)
 
     # Create and start server
-    server = DashboardServer(host=host, port=port, metrics_collector=collector)
+    server = DashboardServer(
+        host=host, port=port, metrics_collector=collector, tick_interval=interval
+    )
 
     try:
         console.print(f"\n[green]✅ Dashboard running at http://{host}:{port}[/green]")
@@ -2983,7 +3344,10 @@ def ts_dead_code(path: str, strict: bool, output: str | None, min_confidence: fl
     "--threshold", type=float, default=80.0, help="Minimum type coverage percentage (0-100)"
 )
 @click.option("--output", type=click.Path(), help="Save report to file")
-def ts_type_coverage(path: str, strict: bool, threshold: float, output: str | None) -> None:
+@stream_option
+def ts_type_coverage(
+    path: str, strict: bool, threshold: float, output: str | None, stream: str | None
+) -> None:
     """Analyze TypeScript type coverage.
 
     Measures how well TypeScript code is typed, including coverage of
@@ -2999,6 +3363,9 @@ def ts_type_coverage(path: str, strict: bool, threshold: float, output: str | No
 
         # Save report to file
         qontinui-devtools ts types ./src --output coverage.txt
+
+        # Stream type issues as NDJSON
+        qontinui-devtools ts types ./src --stream ndjson --output issues.ndjson
     """
     try:
         from .typescript_analysis import TypeCoverageAnalyzer
@@ -3006,6 +3373,15 @@ def ts_type_coverage(path: str, strict: bool, threshold: float, output: str | No
         console.print("[red]Error: TypeScript analysis module not available[/red]")
         sys.exit(1)
 
+    if stream:
+        analyzer = TypeCoverageAnalyzer(path)
+        _stream_findings(
+            map(_type_issue_finding, analyzer.iter_findings()), stream, output, "ts-types"
+        )
+        if strict and analyzer.coverage_percentage < threshold:
+            sys.exit(1)
+        return
+
     try:
         analyzer = TypeCoverageAnalyzer(path, verbose=True)
         coverage = analyzer.analyze()
@@ -3041,6 +3417,7 @@ def ts_type_coverage(path: str, strict: bool, threshold: float, output: str | No
 @click.option("--max-function-lines", type=int, default=50, help="Maximum lines per function")
 @click.option("--max-complexity", type=int, default=10, help="Maximum cyclomatic complexity")
 @click.option("--output", type=click.Path(), help="Save report to file")
+@stream_option
 def ts_complexity(
     path: str,
     strict: bool,
@@ -3048,6 +3425,7 @@ def ts_complexity(
     max_function_lines: int,
     max_complexity: int,
     output: str | None,
+    stream: str | None,
 ) -> None:
     """Analyze code complexity in TypeScript/JavaScript.
 
@@ -3064,6 +3442,9 @@ def ts_complexity(
 
         # Save report to file
         qontinui-devtools ts complexity ./src --output complexity.txt
+
+        # Stream issues as SARIF
+        qontinui-devtools ts complexity ./src --stream sarif --output complexity.sarif
     """
     try:
         from .typescript_analysis import ComplexityAnalyzer
@@ -3071,6 +3452,20 @@ def ts_complexity(
         console.print("[red]Error: TypeScript analysis module not available[/red]")
         sys.exit(1)
 
+    if stream:
+        analyzer = ComplexityAnalyzer(
+            path,
+            max_file_lines=max_file_lines,
+            max_function_lines=max_function_lines,
+            max_complexity=max_complexity,
+        )
+        count = _stream_findings(
+            map(_ts_complexity_finding, analyzer.iter_findings()), stream, output, "ts-complexity"
+        )
+        if strict and count:
+            sys.exit(1)
+        return
+
     try:
         analyzer = ComplexityAnalyzer(
             path,
@@ -3369,7 +3764,8 @@ def rust_dead_code(path: str, verbose: bool, output: str | None, min_confidence:
 @click.argument("path", type=click.Path(exists=True))
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed progress")
 @click.option("--output", type=click.Path(), help="Save report to file")
-def rust_unsafe(path: str, verbose: bool, output: str | None) -> None:
+@stream_option
+def rust_unsafe(path: str, verbose: bool, output: str | None, stream: str | None) -> None:
     """Analyze unsafe code usage in Rust projects.
 
     Finds and categorizes all unsafe blocks, functions, and trait
@@ -3385,6 +3781,9 @@ def rust_unsafe(path: str, verbose: bool, output: str | None) -> None:
 
         # Save report to file
         qontinui-devtools rust unsafe ./src --output unsafe_report.txt
+
+        # Stream unsafe blocks as NDJSON
+        qontinui-devtools rust unsafe ./src --stream ndjson
     """
     try:
         from .rust_analysis import UnsafeAnalyzer
@@ -3392,6 +3791,15 @@ def rust_unsafe(path: str, verbose: bool, output: str | None) -> None:
         console.print("[red]Error: Rust analysis module not available[/red]")
         sys.exit(1)
 
+    if stream:
+        _stream_findings(
+            map(_unsafe_finding, UnsafeAnalyzer(path).iter_findings()),
+            stream,
+            output,
+            "rust-unsafe",
+        )
+        return
+
     try:
         analyzer = UnsafeAnalyzer(path, verbose=verbose)
         unsafe_blocks = analyzer.analyze()
@@ -3421,7 +3829,10 @@ def rust_unsafe(path: str, verbose: bool, output: str | None) -> None:
 @click.option(
     "--threshold", type=int, default=10, help="Complexity threshold for flagging functions"
 )
-def rust_complexity(path: str, verbose: bool, output: str | None, threshold: int) -> None:
+@stream_option
+def rust_complexity(
+    path: str, verbose: bool, output: str | None, threshold: int, stream: str | None
+) -> None:
     """Measure code complexity in Rust projects.
 
     Analyzes function complexity, file sizes, and complex match statements
@@ -3437,6 +3848,9 @@ def rust_complexity(path: str, verbose: bool, output: str | None, threshold: int
 
         # Save report to file
         qontinui-devtools rust complexity ./src --output complexity.txt
+
+        # Stream complex elements as SARIF
+        qontinui-devtools rust complexity ./src --stream sarif --output complexity.sarif
     """
     try:
         from .rust_analysis import ComplexityAnalyzer
@@ -3444,6 +3858,16 @@ def rust_complexity(path: str, verbose: bool, output: str | None, threshold: int
         console.print("[red]Error: Rust analysis module not available[/red]")
         sys.exit(1)
 
+    if stream:
+        analyzer = ComplexityAnalyzer(path, complexity_threshold=threshold)
+        _stream_findings(
+            map(_rust_complexity_finding, analyzer.iter_findings()),
+            stream,
+            output,
+            "rust-complexity",
+        )
+        return
+
     try:
         analyzer = ComplexityAnalyzer(path, verbose=verbose, complexity_threshold=threshold)
         metrics = analyzer.analyze()
@@ -3672,5 +4096,30 @@ def check_id_types(paths: tuple[str, ...], verbose: bool, output: str | None, st
         sys.exit(1)
 
 
+@main.group()
+def cache() -> None:
+    """Analysis cache commands.
+
+    Analyzers store per-file results in .qontinui-devtools/cache so that
+    repeated runs only re-analyze files whose content changed.
+    """
+    pass
+
+
+@cache.command("clear")
+def clear_cache() -> None:
+    """Remove all cached analysis results.
+
+    Examples:
+
+        qontinui-devtools cache clear
+    """
+    from .project import AnalysisCache
+
+    analysis_cache = AnalysisCache()
+    analysis_cache.clear()
+    console.print(f"[green]✅ Cleared analysis cache:[/green] {analysis_cache.cache_dir}")
+
+
 if __name__ == "__main__":
     main()
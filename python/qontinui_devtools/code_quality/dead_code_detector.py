@@ -15,7 +15,8 @@ definitions and usages across the codebase.
 import ast
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+
+from qontinui_devtools.project import AnalysisCache, FileInventory, SourceRepository, find_files
 
 
 @dataclass
@@ -51,6 +52,25 @@ class DefinitionCollector(ast.NodeVisitor):
         self._in_class = False
         self._in_function = False
 
+    def to_dict(self) -> dict[str, dict[str, int]]:
+        """Convert collected definitions to dictionary format."""
+        return {
+            "functions": self.functions,
+            "classes": self.classes,
+            "imports": self.imports,
+            "variables": self.variables,
+        }
+
+    @classmethod
+    def from_dict(cls, file_path: str, data: dict[str, dict[str, int]]) -> "DefinitionCollector":
+        """Restore collected definitions from dictionary format."""
+        collector = cls(file_path)
+        collector.functions = data["functions"]
+        collector.classes = data["classes"]
+        collector.imports = data["imports"]
+        collector.variables = data["variables"]
+        return collector
+
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Visit function definition."""
         # Skip special methods like __init__, __str__, etc. (they're used implicitly)
@@ -171,38 +191,37 @@ class DeadCodeDetector:
     across all Python files in the project.
     """
 
-    def __init__(self, root_path: str) -> None:
+    CACHE_VERSION = "1"
+
+    def __init__(
+        self,
+        root_path: str,
+        sources: SourceRepository | None = None,
+        cache: AnalysisCache | None = None,
+        inventory: FileInventory | None = None,
+    ) -> None:
         """Initialize the detector.
 
         Args:
             root_path: Root directory to analyze
+            sources: Shared source repository. If omitted, a private repository
+                is created so the definition and usage passes share one parse.
+            cache: Persistent cache for per-file definitions and usages
+                (disabled if omitted)
+            inventory: Shared file inventory (the tree is scanned if omitted)
         """
         self.root_path = Path(root_path)
+        self.sources = sources if sources is not None else SourceRepository()
+        self.cache = cache
+        self.inventory = inventory
         self._definitions: dict[str, DefinitionCollector] = {}
         self._all_usages: set[str] = set()
         self._python_files: list[Path] = []
 
     def _find_python_files(self) -> list[Path]:
         """Find all Python files in the project."""
-        python_files: list[Any] = []
-        for path in self.root_path.rglob("*.py"):
-            # Skip common directories
-            parts = path.parts
-            skip_dirs = {
-                "__pycache__",
-                ".pytest_cache",
-                ".git",
-                ".tox",
-                "venv",
-                ".venv",
-                "env",
-                ".env",
-                "node_modules",
-            }
-            if any(skip_dir in parts for skip_dir in skip_dirs):
-                continue
-            python_files.append(path)
-        return python_files
+        # Caches, VCS and common virtualenv names are pruned by every scan
+        return find_files(self.root_path, "python", self.inventory, {"env", ".env"})
 
     def _parse_file(self, file_path: Path) -> ast.AST | None:
         """Parse a Python file into an AST.
@@ -214,9 +233,7 @@ class DeadCodeDetector:
             AST node or None if parsing fails
         """
         try:
-            with open(file_path, encoding="utf-8") as f:
-                source = f.read()
-            return ast.parse(source, filename=str(file_path))
+            return self.sources.parse(file_path)
         except (SyntaxError, UnicodeDecodeError):
             return None
 
@@ -225,6 +242,14 @@ class DeadCodeDetector:
         self._python_files = self._find_python_files()
 
         for file_path in self._python_files:
+            if self.cache is not None:
+                cached = self.cache.get("dead_code.definitions", file_path, self.CACHE_VERSION)
+                if cached is not None:
+                    self._definitions[str(file_path)] = DefinitionCollector.from_dict(
+                        str(file_path), cached
+                    )
+                    continue
+
             tree = self._parse_file(file_path)
             if tree is None:
                 continue
@@ -233,9 +258,20 @@ class DeadCodeDetector:
             collector.visit(tree)
             self._definitions[str(file_path)] = collector
 
+            if self.cache is not None:
+                self.cache.put(
+                    "dead_code.definitions", file_path, collector.to_dict(), self.CACHE_VERSION
+                )
+
     def _scan_usages(self) -> None:
         """Scan all files for usages."""
         for file_path in self._python_files:
+            if self.cache is not None:
+                cached = self.cache.get("dead_code.usages", file_path, self.CACHE_VERSION)
+                if cached is not None:
+                    self._all_usages.update(cached)
+                    continue
+
             tree = self._parse_file(file_path)
             if tree is None:
                 continue
@@ -244,6 +280,14 @@ class DeadCodeDetector:
             collector.visit(tree)
             self._all_usages.update(collector.used_names)
 
+            if self.cache is not None:
+                self.cache.put(
+                    "dead_code.usages",
+                    file_path,
+                    sorted(collector.used_names),
+                    self.CACHE_VERSION,
+                )
+
     def _find_unused(self) -> list[DeadCode]:
         """Find all unused code by comparing definitions and usages."""
         dead_code: list[DeadCode] = []
@@ -2,13 +2,34 @@
 
 This package provides tools for detecting and testing race conditions:
 - Static analysis with RaceConditionDetector
-- Runtime stress testing with RaceConditionTester
+- Runtime stress testing with RaceConditionTester, on thread, process,
+  asyncio or free-threaded backends
 - State instrumentation with SharedStateTracker
 - Pre-built test scenarios
 """
 
+from .backends import (
+    BACKENDS,
+    AsyncioBackend,
+    BackendRun,
+    ExecutionBackend,
+    FreeThreadedBackend,
+    ProcessBackend,
+    SharedArray,
+    ThreadBackend,
+    available_backends,
+    get_backend,
+)
 from .decorators import concurrent_test, stress_test, tracked_test
-from .instrumentation import Access, InstrumentedObject, RaceConflict, SharedStateTracker
+from .instrumentation import (
+    Access,
+    InstrumentedObject,
+    RaceConflict,
+    SharedStateTracker,
+    TrackedLock,
+    instrument,
+    uninstrument,
+)
 from .race_detector import RaceCondition, RaceConditionDetector, SharedState
 from .race_tester import RaceConditionTester, RaceTestResult, compare_results
 
@@ -17,6 +38,17 @@ __all__ = [
     "RaceConditionTester",
     "RaceTestResult",
     "compare_results",
+    # Execution backends
+    "ExecutionBackend",
+    "BackendRun",
+    "ThreadBackend",
+    "FreeThreadedBackend",
+    "ProcessBackend",
+    "AsyncioBackend",
+    "SharedArray",
+    "BACKENDS",
+    "available_backends",
+    "get_backend",
     # Static analysis
     "RaceConditionDetector",
     "RaceCondition",
@@ -28,6 +60,9 @@ __all__ = [
     # Instrumentation
     "SharedStateTracker",
     "InstrumentedObject",
+    "TrackedLock",
+    "instrument",
+    "uninstrument",
     "Access",
     "RaceConflict",
 ]
@@ -5,6 +5,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from ..project import SourceRepository
+
 
 @dataclass
 class StateAccess:
@@ -421,15 +423,23 @@ class CombinedVisitor(ast.NodeVisitor):
         return self.context
 
 
-def analyze_file(file_path: str | Path) -> AnalysisContext:
-    """Analyze a Python file for race conditions."""
+def analyze_file(file_path: str | Path, sources: SourceRepository | None = None) -> AnalysisContext:
+    """Analyze a Python file for race conditions.
+
+    Args:
+        file_path: Path to the Python file
+        sources: Shared source repository to take the parsed module from
+    """
     file_path = Path(file_path)
 
     try:
-        with open(file_path, encoding="utf-8") as f:
-            source = f.read()
+        if sources is not None:
+            tree = sources.parse(file_path)
+        else:
+            with open(file_path, encoding="utf-8") as f:
+                source = f.read()
 
-        tree = ast.parse(source, filename=str(file_path))
+            tree = ast.parse(source, filename=str(file_path))
         visitor = CombinedVisitor(str(file_path))
         return visitor.analyze(tree)
 
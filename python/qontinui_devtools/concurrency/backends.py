@@ -0,0 +1,526 @@
+"""Execution backends for RaceConditionTester.
+
+A backend runs a number of workers concurrently, each calling the function
+under test for a number of iterations. All workers wait on a start barrier
+first, so they contend from the first call instead of trickling in as the
+pool spins up.
+
+Available backends:
+- ``threads``: a thread pool (the default). Under the GIL, pure-Python
+  races surface less often and CPU-bound workers mostly measure GIL
+  contention.
+- ``free-threaded``: the same thread pool on a free-threaded CPython
+  build (3.13t) with the GIL disabled, so workers run truly in parallel.
+- ``processes``: a process pool. Workers share state through
+  ``SharedArray``, which lives in ``multiprocessing.shared_memory``; the
+  function, its arguments and its results must be picklable.
+- ``asyncio``: tasks on one event loop, for coroutine functions. Races
+  show up where the function awaits between reading and writing state.
+"""
+
+import asyncio
+import concurrent.futures
+import inspect
+import multiprocessing
+import pickle
+import struct
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Literal
+
+# Element types SharedArray supports, as struct format characters
+SharedArrayTypecode = Literal["b", "B", "h", "H", "i", "I", "l", "L", "q", "Q", "f", "d"]
+
+
+@dataclass
+class BackendRun:
+    """Raw outcome of running workers on a backend.
+
+    Attributes:
+        successful: Number of successful iterations
+        failed: Number of failed iterations
+        execution_times: Duration of each iteration (seconds)
+        results: Return values of successful iterations
+        failure_details: Failure messages
+        exception_types: Names of exception types raised
+        timed_out: Whether the workers didn't finish within the timeout
+    """
+
+    successful: int = 0
+    failed: int = 0
+    execution_times: list[float] = field(default_factory=list)
+    results: list[Any] = field(default_factory=list)
+    failure_details: list[str] = field(default_factory=list)
+    exception_types: set[str] = field(default_factory=set)
+    timed_out: bool = False
+
+    def record_success(self, result: Any, duration: float) -> None:
+        """Record an iteration that returned."""
+        self.successful += 1
+        self.execution_times.append(duration)
+        self.results.append(result)
+
+    def record_failure(self, error: Exception, duration: float) -> None:
+        """Record an iteration that raised."""
+        exception_type = type(error).__name__
+        self.failed += 1
+        self.execution_times.append(duration)
+        self.exception_types.add(exception_type)
+        self.failure_details.append(f"{exception_type}: {error}")
+
+    def merge(self, other: "BackendRun") -> None:
+        """Add the outcome of another worker."""
+        self.successful += other.successful
+        self.failed += other.failed
+        self.execution_times.extend(other.execution_times)
+        self.results.extend(other.results)
+        self.failure_details.extend(other.failure_details)
+        self.exception_types |= other.exception_types
+        self.timed_out = self.timed_out or other.timed_out
+
+
+def _run_iterations(
+    func: Callable, args: tuple[Any, ...], kwargs: dict[str, Any], iterations: int
+) -> BackendRun:
+    """Call ``func`` repeatedly, recording each outcome locally."""
+    run = BackendRun()
+    perf_counter = time.perf_counter
+    for _ in range(iterations):
+        start = perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            run.record_failure(e, perf_counter() - start)
+        else:
+            run.record_success(result, perf_counter() - start)
+    return run
+
+
+def _wait_for_start(barrier: threading.Barrier, timeout: float) -> None:
+    """Wait for all workers; start anyway if some never arrive."""
+    try:
+        barrier.wait(timeout)
+    except threading.BrokenBarrierError:
+        pass
+
+
+def _collect(futures: list[concurrent.futures.Future], timed_out: bool) -> BackendRun:
+    """Merge the outcomes of the worker futures that finished."""
+    run = BackendRun(timed_out=timed_out)
+    for future in futures:
+        if not future.done():
+            continue
+        try:
+            run.merge(future.result())
+        except Exception as e:
+            # The worker itself failed, e.g. its process died or its results
+            # could not be pickled
+            run.failure_details.append(f"Worker error: {type(e).__name__}: {e}")
+            run.exception_types.add(type(e).__name__)
+    if timed_out:
+        run.failure_details.append("Test timeout exceeded")
+    return run
+
+
+class ExecutionBackend(ABC):
+    """Base class for the ways RaceConditionTester runs workers.
+
+    Subclasses set ``name`` and implement ``run``.
+    """
+
+    name = "base"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Whether the backend can run in this interpreter."""
+        return True
+
+    @abstractmethod
+    def run(
+        self,
+        func: Callable,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        workers: int,
+        iterations: int,
+        timeout: float,
+    ) -> BackendRun:
+        """Run ``workers`` concurrent workers, each calling ``func`` ``iterations`` times.
+
+        Args:
+            func: Function to test
+            args: Positional arguments for the function
+            kwargs: Keyword arguments for the function
+            workers: Number of concurrent workers
+            iterations: Number of calls per worker
+            timeout: Maximum time to wait for all workers (seconds)
+
+        Returns:
+            Combined outcome of all workers; on timeout, only that of the
+            workers that finished
+        """
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class ThreadBackend(ExecutionBackend):
+    """Run workers as threads in a thread pool."""
+
+    name = "threads"
+
+    def run(
+        self,
+        func: Callable,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        workers: int,
+        iterations: int,
+        timeout: float,
+    ) -> BackendRun:
+        barrier = threading.Barrier(workers)
+
+        def worker() -> BackendRun:
+            _wait_for_start(barrier, timeout)
+            return _run_iterations(func, args, kwargs, iterations)
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        futures = [executor.submit(worker) for _ in range(workers)]
+        _, not_done = concurrent.futures.wait(futures, timeout=timeout)
+        # Threads can't be stopped: on timeout, return without joining and
+        # leave hung workers to finish in the background
+        executor.shutdown(wait=not not_done, cancel_futures=True)
+        return _collect(futures, timed_out=bool(not_done))
+
+
+class FreeThreadedBackend(ThreadBackend):
+    """Run workers as threads on a free-threaded build with the GIL disabled.
+
+    Raises:
+        RuntimeError: If the GIL is enabled in this interpreter
+    """
+
+    name = "free-threaded"
+
+    def __init__(self) -> None:
+        if not self.is_available():
+            raise RuntimeError(
+                "The free-threaded backend needs a free-threaded CPython build "
+                "(3.13t or later) running with the GIL disabled"
+            )
+
+    @classmethod
+    def is_available(cls) -> bool:
+        is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+        return is_gil_enabled is not None and not is_gil_enabled()
+
+
+_start_barrier: Any = None
+
+
+def _init_process(barrier: Any) -> None:
+    """Process pool initializer: keep the start barrier for the workers."""
+    global _start_barrier
+    _start_barrier = barrier
+
+
+def _process_worker(
+    func: Callable, args: tuple[Any, ...], kwargs: dict[str, Any], iterations: int, timeout: float
+) -> BackendRun:
+    """Worker run in a pool process."""
+    _wait_for_start(_start_barrier, timeout)
+    return _run_iterations(func, args, kwargs, iterations)
+
+
+class ProcessBackend(ExecutionBackend):
+    """Run workers in separate processes.
+
+    Each worker gets its own interpreter, so CPU-bound code runs in
+    parallel without GIL contention. Workers share state only through
+    ``SharedArray`` (or other process-shared objects) passed as arguments.
+
+    Args:
+        start_method: Multiprocessing start method ("fork", "spawn" or
+            "forkserver"); the platform default if None
+    """
+
+    name = "processes"
+
+    def __init__(self, start_method: str | None = None) -> None:
+        self.start_method = start_method
+
+    def run(
+        self,
+        func: Callable,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        workers: int,
+        iterations: int,
+        timeout: float,
+    ) -> BackendRun:
+        try:
+            pickle.dumps((func, args, kwargs))
+        except Exception as e:
+            raise TypeError(
+                "The processes backend needs a picklable function and arguments "
+                f"(e.g. a module-level function): {e}"
+            ) from e
+
+        context = multiprocessing.get_context(self.start_method)
+        barrier = context.Barrier(workers)
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_process,
+            initargs=(barrier,),
+        )
+        futures = [
+            executor.submit(_process_worker, func, args, kwargs, iterations, timeout)
+            for _ in range(workers)
+        ]
+        _, not_done = concurrent.futures.wait(futures, timeout=timeout)
+        run = _collect(futures, timed_out=bool(not_done))
+
+        if not_done:
+            # Kill hung workers instead of joining them
+            processes = list(executor._processes.values())
+            executor.shutdown(wait=False, cancel_futures=True)
+            for process in processes:
+                process.terminate()
+            for process in processes:
+                process.join()
+        else:
+            executor.shutdown()
+        return run
+
+    def __repr__(self) -> str:
+        return f"ProcessBackend(start_method={self.start_method!r})"
+
+
+class AsyncioBackend(ExecutionBackend):
+    """Run workers as tasks on a new event loop.
+
+    Coroutine functions are awaited; plain functions are called and each
+    iteration then yields to the loop so the workers interleave. Must not
+    be used from a thread that is already running an event loop.
+    """
+
+    name = "asyncio"
+
+    def run(
+        self,
+        func: Callable,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        workers: int,
+        iterations: int,
+        timeout: float,
+    ) -> BackendRun:
+        return asyncio.run(self._run(func, args, kwargs, workers, iterations, timeout))
+
+    async def _run(
+        self,
+        func: Callable,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        workers: int,
+        iterations: int,
+        timeout: float,
+    ) -> BackendRun:
+        barrier = asyncio.Barrier(workers)
+        perf_counter = time.perf_counter
+
+        async def worker() -> BackendRun:
+            try:
+                await asyncio.wait_for(barrier.wait(), timeout)
+            except (TimeoutError, asyncio.BrokenBarrierError):
+                pass
+
+            run = BackendRun()
+            for _ in range(iterations):
+                start = perf_counter()
+                try:
+                    result = func(*args, **kwargs)
+                    if inspect.isawaitable(result):
+                        result = await result
+                except Exception as e:
+                    run.record_failure(e, perf_counter() - start)
+                else:
+                    run.record_success(result, perf_counter() - start)
+                await asyncio.sleep(0)
+            return run
+
+        tasks = [asyncio.ensure_future(worker()) for _ in range(workers)]
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        run = BackendRun(timed_out=bool(pending))
+        for task in tasks:
+            if not task.cancelled():
+                run.merge(task.result())
+        if pending:
+            run.failure_details.append("Test timeout exceeded")
+        return run
+
+
+BACKENDS: dict[str, type[ExecutionBackend]] = {
+    backend.name: backend
+    for backend in (ThreadBackend, FreeThreadedBackend, ProcessBackend, AsyncioBackend)
+}
+
+
+def available_backends() -> list[str]:
+    """Get the names of the backends that can run in this interpreter."""
+    return [name for name, backend in BACKENDS.items() if backend.is_available()]
+
+
+def get_backend(backend: "str | ExecutionBackend") -> ExecutionBackend:
+    """Resolve a backend name to a backend instance.
+
+    Args:
+        backend: Backend instance, name from ``BACKENDS``, or "auto" for
+            free-threaded when available and threads otherwise
+
+    Returns:
+        Backend instance
+
+    Raises:
+        ValueError: If the name is unknown
+        RuntimeError: If the backend can't run in this interpreter
+    """
+    if isinstance(backend, ExecutionBackend):
+        return backend
+    if backend == "auto":
+        backend = "free-threaded" if FreeThreadedBackend.is_available() else "threads"
+    try:
+        backend_class = BACKENDS[backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown backend {backend!r}; expected one of {', '.join(BACKENDS)} or auto"
+        ) from None
+    return backend_class()
+
+
+class SharedArray:
+    """Fixed-size numeric array in shared memory, for process workers.
+
+    Pass it as an argument to the function under test: when pickled to a
+    worker process it attaches to the same memory block by name. Element
+    updates are plain loads and stores, so ``array[0] += 1`` from several
+    workers loses updates just like unsynchronized shared state does.
+
+    New arrays are zero-filled. The creating process owns the block:
+    ``close`` frees it there, and in workers only detaches.
+
+    Args:
+        size: Number of elements
+        typecode: ``struct`` format character of the elements ("q" for
+            64-bit integers, "d" for doubles)
+
+    Example:
+        with SharedArray(1) as counter:
+            tester = RaceConditionTester(threads=4, iterations=1000, backend="processes")
+            tester.test_function(increment, counter)
+            lost_updates = 4000 - counter[0]
+    """
+
+    # Elements as ints or floats, depending on the typecode; None once closed
+    _array: "memoryview[Any] | None"
+
+    def __init__(self, size: int, typecode: SharedArrayTypecode = "q") -> None:
+        if size <= 0:
+            raise ValueError("size must be positive")
+        itemsize = struct.calcsize(typecode)
+        self._attach(shared_memory.SharedMemory(create=True, size=size * itemsize), size, typecode)
+        self._owner = True
+
+    def _attach(
+        self, memory: shared_memory.SharedMemory, size: int, typecode: SharedArrayTypecode
+    ) -> None:
+        self._memory = memory
+        self._size = size
+        self._typecode = typecode
+        # The block may be rounded up to whole pages, so slice before casting
+        buffer = memory.buf
+        assert buffer is not None  # Only None once the block is closed
+        self._view = buffer[: size * struct.calcsize(typecode)]
+        self._array = self._view.cast(typecode)
+        self._owner = False
+
+    @classmethod
+    def _from_name(cls, name: str, size: int, typecode: SharedArrayTypecode) -> "SharedArray":
+        """Attach to an existing block in another process."""
+        array = cls.__new__(cls)
+        if sys.version_info >= (3, 13):
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            memory = shared_memory.SharedMemory(name=name)
+        array._attach(memory, size, typecode)
+        return array
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (SharedArray._from_name, (self.name, self._size, self._typecode))
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block."""
+        return self._memory.name
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _values(self) -> "memoryview[Any]":
+        """The elements, or an error once the array is closed."""
+        if self._array is None:
+            raise ValueError("SharedArray is closed")
+        return self._array
+
+    def __getitem__(self, index: int) -> Any:
+        return self._values()[index]
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        self._values()[index] = value
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.tolist())
+
+    def tolist(self) -> list[Any]:
+        """Copy the elements into a list."""
+        return list(self._values())
+
+    def close(self) -> None:
+        """Detach from the block, and free it if this process created it."""
+        if self._array is None:
+            return
+        self._array.release()
+        self._view.release()
+        self._array = None
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+    def __enter__(self) -> "SharedArray":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # Release the buffer views before SharedMemory's own cleanup runs
+        array = getattr(self, "_array", None)
+        if array is not None:
+            array.release()
+            self._view.release()
+            self._array = None
+
+    def __repr__(self) -> str:
+        if self._array is None:
+            return f"SharedArray(name={self.name!r}, closed)"
+        return f"SharedArray({self.tolist()!r}, typecode={self._typecode!r})"
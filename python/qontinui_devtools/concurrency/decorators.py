@@ -11,7 +11,11 @@ from .race_tester import RaceConditionTester, RaceTestResult
 
 
 def concurrent_test(
-    threads: int = 10, iterations: int = 100, timeout: float = 30.0, track_state: bool = False
+    threads: int = 10,
+    iterations: int = 100,
+    timeout: float = 30.0,
+    track_state: bool = False,
+    backend: str = "threads",
 ) -> Callable:
     """Decorator to run test concurrently.
 
@@ -23,6 +27,8 @@ def concurrent_test(
         iterations: Number of iterations per thread
         timeout: Maximum time to wait for all threads (seconds)
         track_state: Whether to use instrumentation to track state access
+        backend: How workers run ("threads", "processes", "asyncio",
+            "free-threaded" or "auto")
 
     Returns:
         Decorator function
@@ -42,7 +48,11 @@ def concurrent_test(
     def decorator(func: Callable) -> Callable:
         def wrapper(*args: Any, **kwargs: Any) -> RaceTestResult:
             tester = RaceConditionTester(
-                threads=threads, iterations=iterations, timeout=timeout, track_state=track_state
+                threads=threads,
+                iterations=iterations,
+                timeout=timeout,
+                track_state=track_state,
+                backend=backend,
             )
             return tester.test_function(func, *args, **kwargs)
 
@@ -2,10 +2,21 @@
 
 This module provides tools to track access to shared state and detect
 concurrent read-write or write-write conflicts that indicate race conditions.
+
+``InstrumentedObject`` tracks every attribute and item access through
+``__getattribute__``, which slows instrumented code so much that it can
+change thread interleavings enough to hide races. ``instrument`` is the
+low-overhead alternative: it switches an object to a subclass generated
+once per class and field set, in which only the tracked fields are
+descriptors. They log ``time.perf_counter_ns`` timestamps to a per-thread
+buffer, and every other attribute is accessed at full speed.
 """
 
+import inspect
 import threading
 import time
+from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
@@ -48,12 +59,65 @@ class RaceConflict:
         )
 
 
+# Logged access: (obj_id, timestamp, thread_id, is_write, location, vector clock),
+# with the timestamp in seconds, or in perf_counter_ns units in ns_entries
+_LogEntry = tuple[int, float, int, bool, str, dict[int, int] | None]
+# The same without obj_id, as kept per object once merged
+_MergedEntry = tuple[float, int, bool, str, dict[int, int] | None]
+
+
+class _AccessLog:
+    """Accesses recorded by one thread, waiting to be merged."""
+
+    __slots__ = ("entries", "ns_entries", "thread")
+
+    def __init__(self, thread: threading.Thread) -> None:
+        self.thread = thread
+        # deque.append and popleft are atomic, so the owner appends without a lock
+        self.entries: deque[_LogEntry] = deque()
+        self.ns_entries: deque[_LogEntry] = deque()
+
+
+class _ThreadState(threading.local):
+    """Per-thread access log of a tracker, registered on first use in each thread."""
+
+    def __init__(self, tracker: "SharedStateTracker") -> None:
+        self.tid = threading.get_ident()
+        log = _AccessLog(threading.current_thread())
+        self.entries = log.entries
+        # One lookup gives generated wrappers everything they need
+        self.ns_record = (log.ns_entries.append, self.tid)
+        with tracker._lock:
+            tracker._logs.append(log)
+
+
+def _happens_before(earlier: _MergedEntry, later: _MergedEntry) -> bool:
+    """Whether lock synchronization orders ``earlier`` before ``later``."""
+    earlier_thread = earlier[1]
+    epoch = earlier[4][earlier_thread] if earlier[4] is not None else 1
+    later_clock = later[4]
+    return later_clock is not None and epoch <= later_clock.get(earlier_thread, 0)
+
+
 class SharedStateTracker:
     """Track access to shared state to detect races.
 
     This class records all reads and writes to shared objects and analyzes
     them to find concurrent access patterns that indicate race conditions.
 
+    Recording is lock-free: each thread appends to its own access log, and
+    the logs are merged into per-object, time-ordered lists when conflicts
+    or statistics are requested. Each merge only sorts the new accesses in
+    (already merged ones stay sorted), and a sliding-window sweep over each
+    object's accesses then finds every cross-thread read-write and
+    write-write pair within ``conflict_window``, in O(n log n) plus the
+    number of accesses in each window.
+
+    Lock acquires and releases reported with ``record_acquire`` and
+    ``record_release`` (or by using a ``TrackedLock``) maintain a vector
+    clock per thread. Accesses ordered by such synchronization
+    (happens-before) are not reported as conflicts, however close in time.
+
     Example:
         tracker = SharedStateTracker()
 
@@ -74,9 +138,44 @@ class SharedStateTracker:
             conflict_window: Time window in seconds to consider accesses
                 as concurrent (default 1ms)
         """
-        self._accesses: dict[int, list[Access]] = {}
-        self._lock = threading.Lock()
         self._conflict_window = conflict_window
+        # Guards merged accesses and the list of logs
+        self._lock = threading.Lock()
+        self._logs: list[_AccessLog] = []
+        self._local = _ThreadState(self)
+        self._accesses: dict[int, list[_MergedEntry]] = {}
+
+        # Vector clocks by thread ID. Published clocks are never mutated, so
+        # accesses can keep a reference to the clock they were made under
+        self._sync_lock = threading.Lock()
+        self._clocks: dict[int, dict[int, int]] = {}
+        self._lock_clocks: dict[int, dict[int, int]] = {}
+
+        # Converts perf_counter_ns readings to time.time() seconds
+        self._ns_offset = time.time() - time.perf_counter_ns() / 1e9
+
+        # Classes generated by instrument(), by (class, tracked fields)
+        self._instrumented_classes: dict[tuple[type, frozenset[str]], type] = {}
+        # Item-tracking proxy classes, by wrapped class
+        self._proxy_classes: dict[type, type] = {}
+
+    def _record(
+        self,
+        obj_id: int,
+        thread_id: int | None,
+        timestamp: float | None,
+        is_write: bool,
+        location: str,
+    ) -> None:
+        """Append an access to the calling thread's log."""
+        if thread_id is None:
+            thread_id = threading.get_ident()
+        if timestamp is None:
+            timestamp = time.time()
+
+        self._local.entries.append(
+            (obj_id, timestamp, thread_id, is_write, location, self._clocks.get(thread_id))
+        )
 
     def record_read(
         self,
@@ -93,19 +192,7 @@ class SharedStateTracker:
             timestamp: Access timestamp (defaults to current time)
             location: Optional location in code
         """
-        if thread_id is None:
-            thread_id = threading.get_ident()
-        if timestamp is None:
-            timestamp = time.time()
-
-        access = Access(
-            thread_id=thread_id, timestamp=timestamp, access_type="read", location=location
-        )
-
-        with self._lock:
-            if obj_id not in self._accesses:
-                self._accesses[obj_id] = []
-            self._accesses[obj_id].append(access)
+        self._record(obj_id, thread_id, timestamp, False, location)
 
     def record_write(
         self,
@@ -122,21 +209,85 @@ class SharedStateTracker:
             timestamp: Access timestamp (defaults to current time)
             location: Optional location in code
         """
+        self._record(obj_id, thread_id, timestamp, True, location)
+
+    def record_acquire(self, lock_id: int, thread_id: int | None = None) -> None:
+        """Record that a thread acquired a lock.
+
+        The thread's later accesses happen after everything that preceded
+        earlier releases of the lock.
+
+        Args:
+            lock_id: ID of the lock
+            thread_id: Thread ID (defaults to current thread)
+        """
         if thread_id is None:
             thread_id = threading.get_ident()
-        if timestamp is None:
-            timestamp = time.time()
 
-        access = Access(
-            thread_id=thread_id, timestamp=timestamp, access_type="write", location=location
-        )
+        with self._sync_lock:
+            clock = dict(self._clocks.get(thread_id) or {thread_id: 1})
+            for other, epoch in self._lock_clocks.get(lock_id, {}).items():
+                if epoch > clock.get(other, 0):
+                    clock[other] = epoch
+            self._clocks[thread_id] = clock
 
-        with self._lock:
-            if obj_id not in self._accesses:
-                self._accesses[obj_id] = []
-            self._accesses[obj_id].append(access)
+    def record_release(self, lock_id: int, thread_id: int | None = None) -> None:
+        """Record that a thread released a lock.
 
-    def detect_conflicts(self) -> list[RaceConflict]:
+        Args:
+            lock_id: ID of the lock
+            thread_id: Thread ID (defaults to current thread)
+        """
+        if thread_id is None:
+            thread_id = threading.get_ident()
+
+        with self._sync_lock:
+            clock = self._clocks.get(thread_id) or {thread_id: 1}
+            lock_clock = self._lock_clocks.setdefault(lock_id, {})
+            for other, epoch in clock.items():
+                if epoch > lock_clock.get(other, 0):
+                    lock_clock[other] = epoch
+
+            # Accesses after the release start a new epoch
+            next_clock = dict(clock)
+            next_clock[thread_id] += 1
+            self._clocks[thread_id] = next_clock
+
+    def _merge_logs(self) -> None:
+        """Move logged accesses into the per-object lists (caller holds the lock)."""
+        changed: set[int] = set()
+        offset = self._ns_offset
+        for log in self._logs:
+            entries = log.entries
+            for _ in range(len(entries)):
+                entry = entries.popleft()
+                obj_id = entry[0]
+                accesses = self._accesses.get(obj_id)
+                if accesses is None:
+                    accesses = self._accesses[obj_id] = []
+                accesses.append(entry[1:])
+                changed.add(obj_id)
+
+            entries = log.ns_entries
+            for _ in range(len(entries)):
+                entry = entries.popleft()
+                obj_id = entry[0]
+                accesses = self._accesses.get(obj_id)
+                if accesses is None:
+                    accesses = self._accesses[obj_id] = []
+                accesses.append((entry[1] / 1e9 + offset, *entry[2:]))
+                changed.add(obj_id)
+
+        # Timsort merges the sorted prefix with the new run in linear time
+        for obj_id in changed:
+            self._accesses[obj_id].sort(key=lambda entry: entry[0])
+
+        # Forget logs of threads that have exited, now that they are empty
+        self._logs = [
+            log for log in self._logs if log.thread.is_alive() or log.entries or log.ns_entries
+        ]
+
+    def detect_conflicts(self, max_conflicts: int | None = None) -> list[RaceConflict]:
         """Find concurrent read-write or write-write conflicts.
 
         Analyzes all recorded accesses to find patterns that indicate
@@ -144,57 +295,74 @@ class SharedStateTracker:
         - Write-Write: Two writes from different threads within conflict window
         - Read-Write: Read and write from different threads within conflict window
 
+        Every such pair is reported, not only adjacent accesses, unless lock
+        synchronization recorded with the tracker orders the two accesses.
+
+        Args:
+            max_conflicts: Stop after this many conflicts (None for all)
+
         Returns:
-            List of detected race conflicts
+            List of detected race conflicts, ordered by object and time
         """
         conflicts: list[RaceConflict] = []
+        window = self._conflict_window
 
         with self._lock:
+            self._merge_logs()
+
             for obj_id, accesses in self._accesses.items():
-                # Sort by timestamp
-                sorted_accesses = sorted(accesses, key=lambda a: a.timestamp)
-
-                # Check each pair of consecutive accesses
-                for i in range(len(sorted_accesses) - 1):
-                    access_1 = sorted_accesses[i]
-                    access_2 = sorted_accesses[i + 1]
-
-                    # Skip if same thread
-                    if access_1.thread_id == access_2.thread_id:
-                        continue
-
-                    time_diff = access_2.timestamp - access_1.timestamp
-
-                    # Check if within conflict window
-                    if time_diff > self._conflict_window:
-                        continue
-
-                    # Determine conflict type
-                    conflict_type = None
-                    if access_1.access_type == "write" and access_2.access_type == "write":
-                        conflict_type = "write-write"
-                    elif access_1.access_type == "write" and access_2.access_type == "read":
-                        conflict_type = "write-read"
-                    elif access_1.access_type == "read" and access_2.access_type == "write":
-                        conflict_type = "read-write"
-
-                    if conflict_type:
-                        conflicts.append(
-                            RaceConflict(
-                                obj_id=obj_id,
-                                access_1=access_1,
-                                access_2=access_2,
-                                conflict_type=conflict_type,
-                                time_difference=time_diff,
-                            )
-                        )
+                recent: deque[_MergedEntry] = deque()
+                recent_writes: deque[_MergedEntry] = deque()
+
+                for access in accesses:
+                    timestamp, thread_id, is_write = access[0], access[1], access[2]
+                    while recent and timestamp - recent[0][0] > window:
+                        recent.popleft()
+                    while recent_writes and timestamp - recent_writes[0][0] > window:
+                        recent_writes.popleft()
+
+                    # A write conflicts with any access, a read only with writes
+                    for earlier in recent if is_write else recent_writes:
+                        if earlier[1] == thread_id or _happens_before(earlier, access):
+                            continue
+                        conflicts.append(self._conflict(obj_id, earlier, access))
+                        if max_conflicts is not None and len(conflicts) >= max_conflicts:
+                            return conflicts
+
+                    recent.append(access)
+                    if is_write:
+                        recent_writes.append(access)
 
         return conflicts
 
+    @staticmethod
+    def _conflict(obj_id: int, earlier: _MergedEntry, later: _MergedEntry) -> RaceConflict:
+        """Build the report for a conflicting pair of accesses."""
+        access_1, access_2 = (
+            Access(
+                thread_id=entry[1],
+                timestamp=entry[0],
+                access_type="write" if entry[2] else "read",
+                location=entry[3],
+            )
+            for entry in (earlier, later)
+        )
+        return RaceConflict(
+            obj_id=obj_id,
+            access_1=access_1,
+            access_2=access_2,
+            conflict_type=f"{access_1.access_type}-{access_2.access_type}",
+            time_difference=later[0] - earlier[0],
+        )
+
     def clear(self) -> None:
-        """Clear all recorded accesses."""
+        """Clear all recorded accesses and synchronization state."""
         with self._lock:
+            self._merge_logs()
             self._accesses.clear()
+        with self._sync_lock:
+            self._clocks.clear()
+            self._lock_clocks.clear()
 
     def get_stats(self) -> dict[str, Any]:
         """Get statistics about recorded accesses.
@@ -208,36 +376,86 @@ class SharedStateTracker:
             - threads: Set of thread IDs
         """
         with self._lock:
-            total_accesses = sum(len(accesses) for accesses in self._accesses.values())
-            read_count = sum(
-                1
-                for accesses in self._accesses.values()
-                for a in accesses
-                if a.access_type == "read"
-            )
-            write_count = sum(
-                1
-                for accesses in self._accesses.values()
-                for a in accesses
-                if a.access_type == "write"
-            )
-            threads = {a.thread_id for accesses in self._accesses.values() for a in accesses}
+            self._merge_logs()
+
+            total_accesses = 0
+            write_count = 0
+            threads: set[int] = set()
+            for accesses in self._accesses.values():
+                total_accesses += len(accesses)
+                for access in accesses:
+                    write_count += access[2]
+                    threads.add(access[1])
 
             return {
                 "total_accesses": total_accesses,
                 "total_objects": len(self._accesses),
-                "read_count": read_count,
+                "read_count": total_accesses - write_count,
                 "write_count": write_count,
                 "thread_count": len(threads),
                 "threads": threads,
             }
 
 
+class TrackedLock:
+    """Lock that reports acquires and releases to a SharedStateTracker.
+
+    Accesses made while holding the lock are then known to be ordered, so
+    properly locked code produces no conflicts.
+
+    Example:
+        tracker = SharedStateTracker()
+        lock = TrackedLock(tracker)
+
+        with lock:
+            tracker.record_write(id(counter))
+    """
+
+    def __init__(self, tracker: SharedStateTracker, lock: Any = None) -> None:
+        """Initialize tracked lock.
+
+        Args:
+            tracker: Tracker to report synchronization to
+            lock: Lock to wrap (defaults to a new threading.Lock)
+        """
+        self._lock = lock if lock is not None else threading.Lock()
+        self._tracker = tracker
+        self._lock_id = id(self._lock)
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """Acquire the lock and record the acquire.
+
+        Args:
+            blocking: Whether to wait for the lock
+            timeout: Maximum time to wait in seconds (-1 waits forever)
+
+        Returns:
+            Whether the lock was acquired
+        """
+        acquired: bool = self._lock.acquire(blocking, timeout)
+        if acquired:
+            self._tracker.record_acquire(self._lock_id)
+        return acquired
+
+    def release(self) -> None:
+        """Record the release and release the lock."""
+        self._tracker.record_release(self._lock_id)
+        self._lock.release()
+
+    def __enter__(self) -> "TrackedLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+
 class InstrumentedObject:
     """Wrapper that tracks access to an object.
 
     This class wraps any object and automatically tracks reads and writes
-    using a SharedStateTracker.
+    using a SharedStateTracker. Every attribute read goes through Python
+    code; use ``instrument`` where the overhead matters.
 
     Example:
         tracker = SharedStateTracker()
@@ -297,3 +515,191 @@ class InstrumentedObject:
 
         tracker.record_write(obj_id, location=f"setitem:{key}")
         obj[key] = value
+
+
+_MISSING = object()
+
+
+def _field_descriptor(
+    name: str, original: Any, state: _ThreadState, clocks: dict[int, dict[int, int]]
+) -> property:
+    """Property that logs access to one field and stores it where the class did.
+
+    Args:
+        name: Field name
+        original: The class's own attribute for the field: a data
+            descriptor that stores it (e.g. a slot), a class-level default
+            or ``_MISSING``
+        state: Per-thread logs of the tracker
+        clocks: Vector clocks of the tracker
+    """
+    read_location = f"getattr:{name}"
+    write_location = f"setattr:{name}"
+    perf_counter_ns = time.perf_counter_ns
+
+    if hasattr(type(original), "__set__"):
+        get_value = original.__get__
+        set_value = original.__set__
+    else:
+
+        def get_value(obj: Any) -> Any:
+            try:
+                return obj.__dict__[name]
+            except KeyError:
+                if original is _MISSING:
+                    raise AttributeError(name) from None
+                return original  # Class-level default
+
+        def set_value(obj: Any, value: Any) -> None:
+            obj.__dict__[name] = value
+
+    def fget(obj: Any) -> Any:
+        append, tid = state.ns_record
+        append((id(obj), perf_counter_ns(), tid, False, read_location, clocks.get(tid)))
+        return get_value(obj)
+
+    def fset(obj: Any, value: Any) -> None:
+        append, tid = state.ns_record
+        append((id(obj), perf_counter_ns(), tid, True, write_location, clocks.get(tid)))
+        set_value(obj, value)
+
+    return property(fget, fset)
+
+
+def _instrumented_class(cls: type, fields: frozenset[str], tracker: SharedStateTracker) -> type:
+    """Get the subclass of ``cls`` that tracks ``fields`` for a tracker."""
+    key = (cls, fields)
+    subclass = tracker._instrumented_classes.get(key)
+    if subclass is None:
+        namespace: dict[str, Any] = {"__slots__": (), "_instrumented_base": cls}
+        for name in fields:
+            original = inspect.getattr_static(cls, name, _MISSING)
+            namespace[name] = _field_descriptor(name, original, tracker._local, tracker._clocks)
+        subclass = type(cls.__name__, (cls,), namespace)
+        subclass.__qualname__ = cls.__qualname__
+        tracker._instrumented_classes[key] = subclass
+    return subclass
+
+
+def _proxy_class(cls: type, tracker: SharedStateTracker) -> type:
+    """Get the item-tracking proxy class for objects whose class can't be switched."""
+    proxy_class = tracker._proxy_classes.get(cls)
+    if proxy_class is not None:
+        return proxy_class
+
+    state = tracker._local
+    clocks = tracker._clocks
+    perf_counter_ns = time.perf_counter_ns
+
+    def __getitem__(proxy: Any, key: Any) -> Any:
+        append, tid = state.ns_record
+        obj = proxy._obj
+        append((id(obj), perf_counter_ns(), tid, False, "getitem", clocks.get(tid)))
+        return obj[key]
+
+    def __setitem__(proxy: Any, key: Any, value: Any) -> None:
+        append, tid = state.ns_record
+        obj = proxy._obj
+        append((id(obj), perf_counter_ns(), tid, True, "setitem", clocks.get(tid)))
+        obj[key] = value
+
+    def __delitem__(proxy: Any, key: Any) -> None:
+        append, tid = state.ns_record
+        obj = proxy._obj
+        append((id(obj), perf_counter_ns(), tid, True, "delitem", clocks.get(tid)))
+        del obj[key]
+
+    def __eq__(proxy: Any, other: Any) -> Any:
+        if type(other).__dict__.get("_instrumented_proxy"):
+            other = other._obj
+        return proxy._obj == other
+
+    proxy_class = type(
+        f"Instrumented{cls.__name__}",
+        (),
+        {
+            "__slots__": ("_obj",),
+            "_instrumented_proxy": True,
+            "__getitem__": __getitem__,
+            "__setitem__": __setitem__,
+            "__delitem__": __delitem__,
+            "__eq__": __eq__,
+            "__hash__": lambda proxy: hash(proxy._obj),
+            "__getattr__": lambda proxy, name: getattr(proxy._obj, name),
+            "__len__": lambda proxy: len(proxy._obj),
+            "__iter__": lambda proxy: iter(proxy._obj),
+            "__contains__": lambda proxy, item: item in proxy._obj,
+            "__repr__": lambda proxy: repr(proxy._obj),
+        },
+    )
+    tracker._proxy_classes[cls] = proxy_class
+    return proxy_class
+
+
+def instrument(obj: Any, tracker: SharedStateTracker, fields: Iterable[str] | None = None) -> Any:
+    """Track access to selected fields of an object with low overhead.
+
+    The object's class is switched to a subclass generated once per class,
+    field set and tracker, in which each tracked field is a descriptor
+    that appends the access to the calling thread's buffer with a
+    ``time.perf_counter_ns`` timestamp. The object keeps its identity and
+    passes ``isinstance`` checks, its methods run unchanged (and their
+    access to tracked fields is recorded too), and untracked attributes
+    cost nothing extra.
+
+    Containers and other objects whose class can't be switched (built-in
+    types) are wrapped in a proxy that records item reads, writes and
+    deletions, without their keys. The proxy also forwards attribute
+    access, ``len``, iteration, membership, equality and hashing; other
+    operators are not forwarded, so apply them to ``uninstrument(proxy)``.
+
+    Args:
+        obj: Object to instrument
+        tracker: Tracker to record accesses
+        fields: Attribute names to track (defaults to the public attributes
+            in the object's ``__dict__`` or its class's ``__slots__``)
+
+    Returns:
+        ``obj`` itself, or a proxy for objects whose class can't be switched
+
+    Example:
+        tracker = SharedStateTracker()
+        account = instrument(Account(), tracker, fields=["balance"])
+
+        account.balance += 10  # Recorded as a read and a write
+        account.deposit(5)  # Runs unchanged; its balance access is recorded
+        uninstrument(account)
+    """
+    cls = type(obj)
+    if fields is None:
+        names: Iterable[str] = getattr(obj, "__dict__", None) or ()
+        if not names:
+            slots = getattr(cls, "__slots__", ())
+            names = (slots,) if isinstance(slots, str) else slots
+        fields = [name for name in names if not name.startswith("_")]
+
+    base = cls.__dict__.get("_instrumented_base", cls)
+    try:
+        obj.__class__ = _instrumented_class(base, frozenset(fields), tracker)
+    except TypeError:
+        proxy: Any = object.__new__(_proxy_class(cls, tracker))
+        proxy._obj = obj
+        return proxy
+    return obj
+
+
+def uninstrument(obj: Any) -> Any:
+    """Stop tracking an object instrumented with ``instrument``.
+
+    Args:
+        obj: Object returned by ``instrument``
+
+    Returns:
+        The original object, with its original class restored
+    """
+    if type(obj).__dict__.get("_instrumented_proxy"):
+        return obj._obj
+    base = type(obj).__dict__.get("_instrumented_base")
+    if base is not None:
+        obj.__class__ = base
+    return obj
@@ -1,9 +1,12 @@
 """Race condition detector for static analysis of threading issues."""
 
+import sys
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from ..project import FileInventory, SourceRepository, find_files
 from .ast_analyzer import AnalysisContext, StateAccess, analyze_file
 from .heuristics import (
     calculate_severity,
@@ -49,6 +52,8 @@ class RaceConditionDetector:
         self,
         root_path: str | Path | None = None,
         exclude_patterns: list[str] | None = None,
+        sources: SourceRepository | None = None,
+        inventory: FileInventory | None = None,
     ) -> None:
         """
         Initialize race condition detector.
@@ -56,8 +61,12 @@ class RaceConditionDetector:
         Args:
             root_path: Root directory to analyze (optional, defaults to current directory)
             exclude_patterns: Patterns to exclude (e.g., ["test_", "venv/"])
+            sources: Shared source repository (a private one is created if omitted)
+            inventory: Shared file inventory (the tree is scanned if omitted)
         """
         self.root_path = Path(root_path) if root_path else Path.cwd()
+        self.sources = sources if sources is not None else SourceRepository(retain_trees=False)
+        self.inventory = inventory
         self.exclude_patterns = exclude_patterns or [
             "test_",
             "__pycache__",
@@ -82,7 +91,7 @@ class RaceConditionDetector:
         # Step 2: Analyze each file
         for file_path in python_files:
             try:
-                context = analyze_file(file_path)
+                context = analyze_file(file_path, self.sources)
                 self.contexts[str(file_path)] = context
             except Exception as e:
                 # Log and continue
@@ -101,6 +110,33 @@ class RaceConditionDetector:
 
         return self.race_conditions
 
+    def iter_findings(self) -> Iterator[RaceCondition]:
+        """
+        Yield race conditions file by file as each file is analyzed.
+
+        Race detection only looks at one file's state and accesses, so each
+        file's results are final once it is analyzed. Contexts are not kept
+        on the detector, which keeps memory bounded on large trees.
+
+        Yields:
+            Race conditions in file order, sorted by severity within a file.
+        """
+        severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+        for file_path in self._find_python_files():
+            try:
+                context = analyze_file(file_path, self.sources)
+            except Exception as e:
+                # Keep stdout free for the findings being streamed
+                print(f"Error analyzing {file_path}: {e}", file=sys.stderr)
+                continue
+
+            key = str(file_path)
+            states = self._file_shared_states(key, context)
+            races = self._races_in(states, {key: context})
+            races.sort(key=lambda r: severity_order.get(r.severity, 4))
+            yield from races
+
     def analyze_file(self, file_path: str | Path) -> list[RaceCondition]:
         """
         Analyze a single Python file for race conditions.
@@ -115,7 +151,7 @@ class RaceConditionDetector:
 
         # Analyze the file and store context
         try:
-            context = analyze_file(file_path)
+            context = analyze_file(file_path, self.sources)
             self.contexts[str(file_path)] = context
         except Exception as e:
             # Return empty list on error
@@ -147,27 +183,35 @@ class RaceConditionDetector:
         shared_states: list[Any] = []
 
         for file_path, context in self.contexts.items():
-            for state_dict in context.shared_states:
-                # Check if likely thread-safe
-                is_safe = is_likely_thread_safe(
-                    state_name=state_dict["name"],
-                    state_type=state_dict["type"],
-                    type_annotation=state_dict.get("inferred_type", "unknown"),
-                    context=context,
-                )
-
-                shared_state = SharedState(
-                    name=state_dict["name"],
-                    type=state_dict["type"],
-                    file_path=file_path,
-                    line_number=state_dict["line_number"],
-                    col_offset=state_dict.get("col_offset", 0),
-                    is_protected=is_safe,
-                    inferred_type=state_dict.get("inferred_type", "unknown"),
-                    class_name=state_dict.get("class_name"),
-                )
-
-                shared_states.append(shared_state)
+            shared_states.extend(self._file_shared_states(file_path, context))
+
+        return shared_states
+
+    def _file_shared_states(self, file_path: str, context: AnalysisContext) -> list[SharedState]:
+        """Build the shared states of one analyzed file."""
+        shared_states: list[SharedState] = []
+
+        for state_dict in context.shared_states:
+            # Check if likely thread-safe
+            is_safe = is_likely_thread_safe(
+                state_name=state_dict["name"],
+                state_type=state_dict["type"],
+                type_annotation=state_dict.get("inferred_type", "unknown"),
+                context=context,
+            )
+
+            shared_state = SharedState(
+                name=state_dict["name"],
+                type=state_dict["type"],
+                file_path=file_path,
+                line_number=state_dict["line_number"],
+                col_offset=state_dict.get("col_offset", 0),
+                is_protected=is_safe,
+                inferred_type=state_dict.get("inferred_type", "unknown"),
+                class_name=state_dict.get("class_name"),
+            )
+
+            shared_states.append(shared_state)
 
         return shared_states
 
@@ -216,15 +260,21 @@ class RaceConditionDetector:
 
     def _detect_race_conditions(self) -> list[RaceCondition]:
         """Detect race conditions from shared state and access patterns."""
+        return self._races_in(self.shared_states, self.contexts)
+
+    def _races_in(
+        self, states: list[SharedState], contexts: dict[str, AnalysisContext]
+    ) -> list[RaceCondition]:
+        """Detect race conditions among the given states using their files' contexts."""
         race_conditions: list[Any] = []
 
-        for state in self.shared_states:
+        for state in states:
             # Skip if already marked as protected
             if state.is_protected:
                 continue
 
             # Get context
-            context = self.contexts.get(state.file_path)
+            context = contexts.get(state.file_path)
             if not context:
                 continue
 
@@ -364,14 +414,11 @@ class RaceConditionDetector:
         if self.root_path.is_file():
             return [self.root_path]
 
-        python_files: list[Any] = []
-        for file_path in self.root_path.rglob("*.py"):
-            # Check exclusion patterns
-            if any(pattern in str(file_path) for pattern in self.exclude_patterns):
-                continue
-            python_files.append(file_path)
-
-        return python_files
+        return [
+            file_path
+            for file_path in find_files(self.root_path, "python", self.inventory)
+            if not any(pattern in str(file_path) for pattern in self.exclude_patterns)
+        ]
 
     def generate_report(self, include_low: bool = False) -> str:
         """
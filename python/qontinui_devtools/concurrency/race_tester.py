@@ -1,17 +1,18 @@
 """Race condition tester for stress testing concurrent code.
 
 This module provides tools to run functions concurrently with multiple threads
-and detect race conditions through stress testing and instrumentation.
+and detect race conditions through stress testing and instrumentation. The
+workers can also run as processes, asyncio tasks or free-threaded threads;
+see ``backends``.
 """
 
-import concurrent.futures
 import statistics
-import threading
-import time
-from collections.abc import Callable
+from collections import Counter
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from typing import Any
 
+from .backends import ExecutionBackend, get_backend
 from .instrumentation import SharedStateTracker
 
 
@@ -30,6 +31,7 @@ class RaceTestResult:
         execution_times: List of execution times for each iteration
         exceptions: List of unique exception types encountered
         conflicts: List of detected race conflicts from instrumentation
+        backend: Name of the execution backend the workers ran on
     """
 
     test_name: str
@@ -42,6 +44,7 @@ class RaceTestResult:
     execution_times: list[float] = field(default_factory=list)
     exceptions: list[str] = field(default_factory=list)
     conflicts: list[Any] = field(default_factory=list)
+    backend: str = "threads"
 
     @property
     def success_rate(self) -> float:
@@ -75,6 +78,7 @@ class RaceTestResult:
         """String representation."""
         lines = [
             f"Race Test Result: {self.test_name}",
+            f"  Backend: {self.backend}",
             f"  Iterations: {self.total_iterations}",
             f"  Success: {self.successful} ({self.success_rate:.1f}%)",
             f"  Failed: {self.failed}",
@@ -117,6 +121,10 @@ class RaceConditionTester:
     - Timing variance
     - Instrumentation conflicts
 
+    Workers are threads by default; pass ``backend`` to run them as
+    processes, asyncio tasks or free-threaded threads instead (see
+    ``backends``).
+
     Example:
         tester = RaceConditionTester(threads=10, iterations=100)
 
@@ -135,19 +143,28 @@ class RaceConditionTester:
         iterations: int = 100,
         timeout: float = 30.0,
         track_state: bool = False,
+        backend: str | ExecutionBackend = "threads",
     ) -> None:
         """Initialize race condition tester.
 
         Args:
-            threads: Number of concurrent threads
-            iterations: Number of iterations per thread
-            timeout: Maximum time to wait for all threads (seconds)
+            threads: Number of concurrent workers
+            iterations: Number of iterations per worker
+            timeout: Maximum time to wait for all workers (seconds)
             track_state: Whether to use instrumentation to track state access
+                (only sees accesses made in this process)
+            backend: How workers run: "threads", "processes", "asyncio",
+                "free-threaded", "auto", or an ``ExecutionBackend``
+
+        Raises:
+            ValueError: If the backend name is unknown
+            RuntimeError: If the backend can't run in this interpreter
         """
         self.threads = threads
         self.iterations = iterations
         self.timeout = timeout
         self.track_state = track_state
+        self.backend = get_backend(backend)
         self._tracker: SharedStateTracker | None = None
 
         if track_state:
@@ -170,54 +187,15 @@ class RaceConditionTester:
         test_name = func.__name__ if hasattr(func, "__name__") else "unknown"
         total_iterations = self.threads * self.iterations
 
-        # Track results
-        successful = 0
-        failed = 0
-        failure_details: list[str] = []
-        execution_times: list[float] = []
-        exception_types: set[str] = set()
-        results: list[Any] = []
-
-        # Lock for thread-safe updates
-        lock = threading.Lock()
-
-        def worker() -> None:
-            """Worker function for each thread."""
-            nonlocal successful, failed
-
-            for _ in range(self.iterations):
-                start_time = time.time()
-                try:
-                    result = func(*args, **kwargs)
-                    end_time = time.time()
-
-                    with lock:
-                        successful += 1
-                        execution_times.append(end_time - start_time)
-                        results.append(result)
-
-                except Exception as e:
-                    end_time = time.time()
-                    exception_type = type(e).__name__
-
-                    with lock:
-                        failed += 1
-                        exception_types.add(exception_type)
-                        failure_details.append(f"{exception_type}: {str(e)}")
-                        execution_times.append(end_time - start_time)
-
-        # Run concurrent test
-        start_time = time.time()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.threads) as executor:
-            futures = [executor.submit(worker) for _ in range(self.threads)]
-
-            try:
-                concurrent.futures.wait(futures, timeout=self.timeout)
-            except concurrent.futures.TimeoutError:
-                failure_details.append("Test timeout exceeded")
-
-        end_time = time.time()
-        end_time - start_time
+        run = self.backend.run(
+            func,
+            args,
+            kwargs,
+            workers=self.threads,
+            iterations=self.iterations,
+            timeout=self.timeout,
+        )
+        execution_times = run.execution_times
 
         # Calculate timing variance
         timing_variance = 0.0
@@ -226,10 +204,10 @@ class RaceConditionTester:
 
         # Detect race conditions
         race_detected = self._detect_race(
-            failed=failed,
+            failed=run.failed,
             timing_variance=timing_variance,
             execution_times=execution_times,
-            results=results,
+            results=run.results,
         )
 
         # Get conflicts from instrumentation
@@ -242,16 +220,50 @@ class RaceConditionTester:
         return RaceTestResult(
             test_name=test_name,
             total_iterations=total_iterations,
-            successful=successful,
-            failed=failed,
+            successful=run.successful,
+            failed=run.failed,
             race_detected=race_detected,
-            failure_details=failure_details,
+            failure_details=run.failure_details,
             timing_variance=timing_variance,
             execution_times=execution_times,
-            exceptions=list(exception_types),
+            exceptions=list(run.exception_types),
             conflicts=conflicts,
+            backend=self.backend.name,
         )
 
+    def test_backends(
+        self,
+        func: Callable,
+        *args: Any,
+        backends: Iterable[str | ExecutionBackend],
+        **kwargs: Any,
+    ) -> list[RaceTestResult]:
+        """Test a function on several backends with the same settings.
+
+        Args:
+            func: Function to test
+            *args: Positional arguments for function
+            backends: Backends to run on, in order
+            **kwargs: Keyword arguments for function
+
+        Returns:
+            One RaceTestResult per backend; ``backend`` tells them apart
+
+        Example:
+            results = tester.test_backends(update, shared, backends=["threads", "processes"])
+            found_by = [r.backend for r in results if r.race_detected]
+        """
+        return [
+            RaceConditionTester(
+                threads=self.threads,
+                iterations=self.iterations,
+                timeout=self.timeout,
+                track_state=self.track_state,
+                backend=backend,
+            ).test_function(func, *args, **kwargs)
+            for backend in backends
+        ]
+
     def _detect_race(
         self, failed: int, timing_variance: float, execution_times: list[float], results: list[Any]
     ) -> bool:
@@ -304,6 +316,7 @@ class RaceConditionTester:
                 - kwargs: Keyword arguments (optional)
                 - threads: Override thread count (optional)
                 - iterations: Override iteration count (optional)
+                - backend: Override execution backend (optional)
 
         Returns:
             List of RaceTestResult for each scenario
@@ -316,6 +329,7 @@ class RaceConditionTester:
             kwargs = scenario.get("kwargs", {})
             threads = scenario.get("threads", self.threads)
             iterations = scenario.get("iterations", self.iterations)
+            backend = scenario.get("backend", self.backend)
 
             # Create tester with scenario-specific settings
             tester = RaceConditionTester(
@@ -323,6 +337,7 @@ class RaceConditionTester:
                 iterations=iterations,
                 timeout=self.timeout,
                 track_state=self.track_state,
+                backend=backend,
             )
 
             result = tester.test_function(target, *args, **kwargs)
@@ -360,7 +375,11 @@ class RaceConditionTester:
                 i = iterations if iterations is not None else self.iterations
 
                 tester = RaceConditionTester(
-                    threads=t, iterations=i, timeout=self.timeout, track_state=self.track_state
+                    threads=t,
+                    iterations=i,
+                    timeout=self.timeout,
+                    track_state=self.track_state,
+                    backend=self.backend,
                 )
 
                 return tester.test_function(func, *args, **kwargs)
@@ -398,6 +417,7 @@ def compare_results(results: list[RaceTestResult]) -> dict[str, Any]:
     # Find worst performers
     worst_by_failures = sorted(results, key=lambda r: r.failed, reverse=True)
     worst_by_variance = sorted(results, key=lambda r: r.timing_variance, reverse=True)
+    races_by_backend = Counter(r.backend for r in results if r.race_detected)
 
     return {
         "total_tests": total_tests,
@@ -408,4 +428,5 @@ def compare_results(results: list[RaceTestResult]) -> dict[str, Any]:
         "failure_rate": (total_failures / total_iterations * 100) if total_iterations > 0 else 0,
         "worst_by_failures": worst_by_failures[0].test_name if worst_by_failures else None,
         "worst_by_variance": worst_by_variance[0].test_name if worst_by_variance else None,
+        "races_by_backend": dict(races_by_backend),
     }
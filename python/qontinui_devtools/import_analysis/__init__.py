@@ -22,6 +22,7 @@ Example (Static analysis):
 """
 
 from .circular_detector import CircularDependency, CircularDependencyDetector
+from .cycle_analysis import CycleComponent
 from .import_tracer import ImportEvent, ImportGraph, ImportTracer
 from .visualizer import generate_html_report, visualize_import_graph
 
@@ -33,6 +34,7 @@ __all__ = [
     "generate_html_report",
     "CircularDependency",
     "CircularDependencyDetector",
+    "CycleComponent",
 ]
 
 __version__ = "1.0.0"
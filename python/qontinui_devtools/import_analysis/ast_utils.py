@@ -8,6 +8,8 @@ import ast
 from dataclasses import dataclass
 from pathlib import Path
 
+from ..project import FileInventory, SourceRepository, find_files
+
 
 @dataclass
 class ImportStatement:
@@ -110,11 +112,15 @@ class ImportExtractor(ast.NodeVisitor):
         self.generic_visit(node)
 
 
-def extract_imports(file_path: str) -> list[ImportStatement]:
+def extract_imports(
+    file_path: str, sources: SourceRepository | None = None
+) -> list[ImportStatement]:
     """Parse a Python file and extract all import statements.
 
     Args:
         file_path: Path to the Python file to analyze
+        sources: Shared source repository; when given, the file is read and
+            parsed through it so other analyzers can reuse the tree
 
     Returns:
         List of ImportStatement objects found in the file
@@ -129,16 +135,14 @@ def extract_imports(file_path: str) -> list[ImportStatement]:
         raise FileNotFoundError(f"File not found: {file_path}")
 
     try:
-        source = path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        # Try with a different encoding
-        try:
-            source = path.read_text(encoding="latin-1")
-        except Exception as e:
-            raise ValueError(f"Could not read file {file_path}: {e}") from e
-
-    try:
-        tree = ast.parse(source, filename=str(path))
+        if sources is not None:
+            try:
+                tree = sources.parse(path)
+            except UnicodeDecodeError:
+                # Fall back to a permissive encoding outside the shared repository
+                tree = ast.parse(_read_source(path), filename=str(path))
+        else:
+            tree = ast.parse(_read_source(path), filename=str(path))
     except SyntaxError as e:
         raise SyntaxError(f"Syntax error in {file_path}: {e}") from e
 
@@ -148,6 +152,18 @@ def extract_imports(file_path: str) -> list[ImportStatement]:
     return extractor.imports
 
 
+def _read_source(path: Path) -> str:
+    """Read a source file, falling back to latin-1 for non-UTF-8 files."""
+    try:
+        return path.read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        # Try with a different encoding
+        try:
+            return path.read_text(encoding="latin-1")
+        except Exception as e:
+            raise ValueError(f"Could not read file {path}: {e}") from e
+
+
 def module_path_from_file(file_path: str, root_path: str) -> str:
     """Convert a file path to a Python module path.
 
@@ -211,28 +227,19 @@ def resolve_import_to_module(
     return import_stmt.module
 
 
-def find_python_files(root_path: str) -> list[str]:
+def find_python_files(root_path: str, inventory: FileInventory | None = None) -> list[str]:
     """Find all Python files in a directory tree.
 
     Args:
         root_path: Root directory to search
+        inventory: Shared file inventory (the tree is scanned if omitted)
 
     Returns:
-        List of absolute paths to Python files
+        Sorted list of absolute paths to Python files
     """
     root = Path(root_path).resolve()
-    python_files: list[str] = []
-
-    for path in root.rglob("*.py"):
-        # Skip common directories that shouldn't be analyzed
-        skip_dirs = {".git", ".venv", "venv", "__pycache__", ".pytest_cache", "build", "dist"}
-
-        if any(skip_dir in path.parts for skip_dir in skip_dirs):
-            continue
-
-        python_files.append(str(path))
-
-    return python_files
+    # Build output is skipped on top of the directories every scan prunes
+    return [str(path) for path in find_files(root, "python", inventory, {"build", "dist"})]
 
 
 def get_module_file_path(module_name: str, root_path: str) -> str | None:
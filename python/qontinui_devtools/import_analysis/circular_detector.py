@@ -4,8 +4,10 @@ This module provides static analysis of Python import statements to detect
 circular dependencies without executing the code.
 """
 
+import os
 import time
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
@@ -13,7 +15,14 @@ import networkx as nx
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from ..project import AnalysisCache, FileInventory, ModuleIndex, SourceRepository
 from .ast_utils import ImportStatement, extract_imports, find_python_files, module_path_from_file
+from .cycle_analysis import (
+    CycleComponent,
+    enumerate_cycles,
+    find_cycle_components,
+    summarize_components,
+)
 from .fix_suggester import FixSuggestion, analyze_cycle, suggest_best_break_point
 
 
@@ -49,6 +58,20 @@ class CircularDependencyDetector:
     4. Detects cycles using graph algorithms
     5. Suggests fixes based on usage patterns
 
+    Cycles are found in one of two modes. "all" enumerates every elementary
+    cycle, up to ``max_cycles`` and ``cycle_timeout``. "scc" reports each
+    strongly connected component once, with a few representative shortest
+    cycles and the feedback edges to cut; it stays fast on densely tangled
+    packages where enumeration is exponential. "auto" (the default) uses
+    "scc" when a component has more than ``scc_threshold`` modules or when
+    enumeration hits its cap or timeout, and "all" otherwise.
+
+    With a cache, the import graph of the last run is kept as a baseline and
+    files whose size and mtime are unchanged are not read again. Passing
+    ``changed_files`` to ``analyze`` restricts cycle search to the strongly
+    connected components containing the changed modules, which are the only
+    places a change can create or break a cycle.
+
     Example:
         >>> detector = CircularDependencyDetector('/path/to/project')
         >>> cycles = detector.analyze()
@@ -57,26 +80,81 @@ class CircularDependencyDetector:
         ...     print(cycle.suggestion.description)
     """
 
-    def __init__(self, root_path: str, verbose: bool = False) -> None:
+    CACHE_VERSION = "1"
+
+    CYCLE_MODES = ("auto", "scc", "all")
+
+    def __init__(
+        self,
+        root_path: str,
+        verbose: bool = False,
+        sources: SourceRepository | None = None,
+        cache: AnalysisCache | None = None,
+        cycle_mode: str = "auto",
+        max_cycles: int | None = 10_000,
+        cycle_timeout: float | None = 30.0,
+        cycles_per_component: int = 5,
+        scc_threshold: int = 20,
+        inventory: FileInventory | None = None,
+    ) -> None:
         """Initialize the detector.
 
         Args:
             root_path: Root directory of the Python project to analyze
             verbose: If True, print progress information
+            sources: Shared source repository (a private one is created if omitted)
+            cache: Persistent cache for per-file imports and the import graph
+                baseline (disabled if omitted)
+            cycle_mode: "auto", "scc" or "all" (see class docstring)
+            max_cycles: Cap on enumerated cycles in "all" mode (None for no cap)
+            cycle_timeout: Seconds allowed for enumeration (None for no limit)
+            cycles_per_component: Representative cycles reported per component
+            scc_threshold: Largest component "auto" mode still enumerates
+            inventory: Shared file inventory (the tree is scanned if omitted)
+
+        Raises:
+            ValueError: If cycle_mode is not a known mode
         """
+        if cycle_mode not in self.CYCLE_MODES:
+            raise ValueError(
+                f"Unknown cycle mode: {cycle_mode} (expected one of {', '.join(self.CYCLE_MODES)})"
+            )
+
         self.root_path = Path(root_path).resolve()
         self.verbose = verbose
         self.console = Console()
+        self.sources = sources if sources is not None else SourceRepository(retain_trees=False)
+        self.cache = cache
+        self.inventory = inventory
+        self.cycle_mode = cycle_mode
+        self.max_cycles = max_cycles
+        self.cycle_timeout = cycle_timeout
+        self.cycles_per_component = cycles_per_component
+        self.scc_threshold = scc_threshold
 
         # State populated during analysis
         self.file_map: dict[str, str] = {}  # module -> file path
+        self.module_index = ModuleIndex()
         self.import_map: dict[str, list[ImportStatement]] = {}  # module -> imports
         self.graph: nx.DiGraph = nx.DiGraph()
+        self.scope: set[str] | None = None  # modules searched for cycles (None for all)
+        self._baseline: dict[str, dict[str, Any]] = {}  # import graph from the last run
+        self._next_baseline: dict[str, dict[str, Any]] = {}
+        self._changed: set[str] = set()
         self.cycles: list[list[str]] = []
+        self.components: list[CycleComponent] = []
+        self.effective_cycle_mode = cycle_mode
+        self.cycles_truncated = False
 
-    def analyze(self) -> list[CircularDependency]:
+    def analyze(
+        self, changed_files: Sequence[str | Path] | None = None
+    ) -> list[CircularDependency]:
         """Perform full analysis and return detected circular dependencies.
 
+        Args:
+            changed_files: Only report cycles through the components of these
+                files (all cycles if omitted)
+
         Returns:
             List of CircularDependency objects, one per detected cycle
         """
@@ -85,11 +163,18 @@ class CircularDependencyDetector:
         if self.verbose:
             self.console.print(f"\n[bold]Analyzing project:[/bold] {self.root_path}")
 
+        changed = (
+            {os.path.abspath(os.fspath(f)) for f in changed_files}
+            if changed_files is not None
+            else None
+        )
+
         # Step 1: Scan directory for Python files
-        self._scan_directory()
+        self._scan_directory(changed)
 
         # Step 2: Build dependency graph
         self._build_dependency_graph()
+        self.scope = self._affected_modules(changed) if changed is not None else None
 
         # Step 3: Find cycles
         self._find_cycles()
@@ -103,13 +188,23 @@ class CircularDependencyDetector:
             self.console.print(f"\n[bold green]Analysis complete[/bold green] in {elapsed:.2f}s")
             self.console.print(f"Files scanned: {len(self.file_map)}")
             self.console.print(f"Dependencies: {len(self.graph.edges())}")
+            if self.scope is not None:
+                self.console.print(f"Modules searched: {len(self.scope)}")
             self.console.print(f"Cycles found: {len(circular_deps)}")
 
         return circular_deps
 
-    def _scan_directory(self) -> None:
-        """Scan directory tree and extract imports from all Python files."""
-        python_files = find_python_files(str(self.root_path))
+    def _scan_directory(self, changed: set[str] | None = None) -> None:
+        """Scan directory tree and extract imports from all Python files.
+
+        Args:
+            changed: Absolute paths of files known to have changed; they are
+                re-read even if the baseline looks current
+        """
+        python_files = find_python_files(str(self.root_path), self.inventory)
+        self._baseline = self._load_baseline()
+        self._changed = changed or set()
+        self._next_baseline = {}
 
         if self.verbose:
             with Progress(
@@ -128,6 +223,22 @@ class CircularDependencyDetector:
             for file_path in python_files:
                 self._process_file(file_path)
 
+        if self.cache is not None:
+            self.cache.put_project(
+                "import_graph", self._next_baseline, self.CACHE_VERSION, str(self.root_path)
+            )
+
+    def _load_baseline(self) -> dict[str, dict[str, Any]]:
+        """Load the import graph stored by the previous cached run.
+
+        Returns:
+            Mapping of module name to file path, size, mtime and imports
+        """
+        if self.cache is None:
+            return {}
+        baseline = self.cache.get_project("import_graph", self.CACHE_VERSION, str(self.root_path))
+        return baseline if isinstance(baseline, dict) else {}
+
     def _process_file(self, file_path: str) -> None:
         """Process a single Python file to extract imports.
 
@@ -144,16 +255,57 @@ class CircularDependencyDetector:
             # Store file mapping
             self.file_map[module_name] = file_path
 
-            # Extract imports
-            imports = extract_imports(file_path)
+            # Extract imports, reusing the baseline if the file looks untouched
+            stat = os.stat(file_path)
+            entry = self._baseline.get(module_name)
+            if (
+                entry is not None
+                and entry["path"] == file_path
+                and entry["size"] == stat.st_size
+                and entry["mtime_ns"] == stat.st_mtime_ns
+                and os.path.abspath(file_path) not in self._changed
+            ):
+                imports = [ImportStatement(**data) for data in entry["imports"]]
+            else:
+                imports = self._extract_imports(file_path)
             self.import_map[module_name] = imports
 
-        except (SyntaxError, ValueError) as e:
+            if self.cache is not None:
+                self._next_baseline[module_name] = {
+                    "path": file_path,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "imports": [asdict(imp) for imp in imports],
+                }
+
+        except (OSError, SyntaxError, ValueError) as e:
             if self.verbose:
                 self.console.print(f"[yellow]Warning: Could not parse {file_path}: {e}[/yellow]")
 
+    def _extract_imports(self, file_path: str) -> list[ImportStatement]:
+        """Extract imports from a file, reusing cached results when unchanged.
+
+        Args:
+            file_path: Path to the Python file
+
+        Returns:
+            List of import statements in the file
+        """
+        if self.cache is None:
+            return extract_imports(file_path, sources=self.sources)
+
+        cached = self.cache.get("imports", file_path, self.CACHE_VERSION)
+        if cached is not None:
+            return [ImportStatement(**data) for data in cached]
+
+        imports = extract_imports(file_path, sources=self.sources)
+        self.cache.put("imports", file_path, [asdict(imp) for imp in imports], self.CACHE_VERSION)
+        return imports
+
     def _build_dependency_graph(self) -> None:
         """Build directed graph of module dependencies."""
+        self.module_index = ModuleIndex(self.file_map)
+
         # Add all modules as nodes
         for module in self.file_map.keys():
             self.graph.add_node(module)
@@ -167,6 +319,30 @@ class CircularDependencyDetector:
                 if imported_module and imported_module in self.file_map:
                     self.graph.add_edge(module, imported_module, import_stmt=import_stmt)
 
+    def _affected_modules(self, changed: set[str]) -> set[str]:
+        """Get the modules whose cycles a set of changed files can affect.
+
+        A cycle through a changed module lies entirely inside that module's
+        strongly connected component: the modules it reaches that also
+        (transitively) import it back.
+
+        Args:
+            changed: Absolute paths of changed files
+
+        Returns:
+            Union of the components containing the changed modules
+        """
+        changed_modules = {
+            module
+            for module, file_path in self.file_map.items()
+            if os.path.abspath(file_path) in changed
+        }
+        scope: set[str] = set()
+        for component in nx.strongly_connected_components(self.graph):
+            if not changed_modules.isdisjoint(component):
+                scope.update(component)
+        return scope
+
     def _resolve_import(self, import_module: str, current_module: str) -> str | None:
         """Resolve an import to a module in our project.
 
@@ -177,29 +353,48 @@ class CircularDependencyDetector:
         Returns:
             Resolved module name if it's in our project, None otherwise
         """
-        # Check for exact match
-        if import_module in self.file_map:
-            return import_module
-
-        # Check if it's a submodule import (e.g., 'foo.bar' importing 'foo')
-        parts = import_module.split(".")
-        for i in range(len(parts), 0, -1):
-            partial = ".".join(parts[:i])
-            if partial in self.file_map:
-                return partial
-
-        return None
+        # Longest project module prefix (e.g., 'foo.bar.Baz' resolves to 'foo.bar')
+        return self.module_index.resolve(import_module)
 
     def _find_cycles(self) -> None:
-        """Find all cycles in the dependency graph."""
+        """Find cycles in the dependency graph according to the cycle mode."""
+        self.components = []
+        self.cycles_truncated = False
+        mode = self.cycle_mode
+        graph = self.graph if self.scope is None else self.graph.subgraph(self.scope)
+
         try:
-            # NetworkX's simple_cycles finds all elementary cycles
-            self.cycles = list(nx.simple_cycles(self.graph))
+            if mode == "auto":
+                components = find_cycle_components(graph)
+                if components and len(components[0]) > self.scc_threshold:
+                    mode = "scc"
+                else:
+                    mode = "all"
+
+            if mode == "all":
+                # NetworkX's simple_cycles finds all elementary cycles
+                self.cycles, self.cycles_truncated = enumerate_cycles(
+                    graph, self.max_cycles, self.cycle_timeout
+                )
+                if self.cycles_truncated and self.verbose:
+                    self.console.print(
+                        f"[yellow]Cycle enumeration stopped after {len(self.cycles)} cycles[/yellow]"
+                    )
+                if self.cycles_truncated and self.cycle_mode == "auto":
+                    mode = "scc"
+
+            if mode == "scc":
+                self.components = summarize_components(graph, self.cycles_per_component)
+                self.cycles = [
+                    cycle[:-1] for component in self.components for cycle in component.cycles
+                ]
         except Exception as e:
             if self.verbose:
                 self.console.print(f"[red]Error finding cycles: {e}[/red]")
             self.cycles = []
 
+        self.effective_cycle_mode = mode
+
     def _analyze_cycles(self) -> list[CircularDependency]:
         """Analyze detected cycles and generate fix suggestions.
 
@@ -295,8 +490,19 @@ class CircularDependencyDetector:
         lines.append("=" * 80)
         lines.append(f"\nProject: {self.root_path}")
         lines.append(f"Total cycles found: {len(cycles)}")
+        if self.cycles_truncated:
+            lines.append("Cycle enumeration was stopped early; the list is incomplete.")
         lines.append("")
 
+        for idx, component in enumerate(self.components, 1):
+            lines.append("-" * 80)
+            lines.append(f"\nComponent #{idx}: {component.size} mutually dependent modules")
+            lines.append(f"Modules: {', '.join(component.modules)}")
+            lines.append("Imports to cut to break every cycle in this component:")
+            for importer, imported in component.feedback_edges:
+                lines.append(f"  {importer} -> {imported}")
+            lines.append("")
+
         for idx, cycle in enumerate(cycles, 1):
             lines.append("-" * 80)
             lines.append(f"\nCycle #{idx} [{cycle.severity.upper()} SEVERITY]")
@@ -337,6 +543,18 @@ class CircularDependencyDetector:
 
         self.console.print(f"\n[bold red]✗ Found {len(cycles)} circular dependencies[/bold red]\n")
 
+        if self.cycles_truncated:
+            self.console.print("[yellow]Cycle enumeration was stopped early.[/yellow]\n")
+
+        for idx, component in enumerate(self.components, 1):
+            self.console.print(
+                f"[bold]Component #{idx}[/bold]: {component.size} mutually dependent modules, "
+                f"{len(component.feedback_edges)} imports to cut"
+            )
+            for importer, imported in component.feedback_edges:
+                self.console.print(f"  [cyan]{importer} → {imported}[/cyan]")
+            self.console.print("")
+
         for idx, cycle in enumerate(cycles, 1):
             # Severity color
             severity_color = {"high": "red", "medium": "yellow", "low": "blue"}[cycle.severity]
@@ -383,7 +601,12 @@ class CircularDependencyDetector:
             "total_modules": len(self.graph.nodes()),
             "total_dependencies": len(self.graph.edges()),
             "cycles_found": len(self.cycles),
+            "modules_searched": len(self.scope) if self.scope is not None else len(self.graph),
             "severity_breakdown": self._get_severity_breakdown(),
+            "cycle_mode": self.effective_cycle_mode,
+            "cycles_truncated": self.cycles_truncated,
+            "cyclic_components": len(self.components),
+            "feedback_edges": sum(len(c.feedback_edges) for c in self.components),
         }
 
     def _get_severity_breakdown(self) -> dict[str, int]:
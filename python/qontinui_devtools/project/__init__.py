@@ -0,0 +1,33 @@
+"""Project-level infrastructure shared by the static analyzers.
+
+Provides a ``SourceRepository`` that reads and parses each Python file once
+so that any number of analyzers can share the same source text and AST, a
+``FileInventory`` that lists the project's files in a single directory walk,
+an ``AnalysisCache`` that persists per-file analyzer results across runs, a
+``ModuleIndex`` that resolves imports to project modules, and
+``changed_files`` for analyzing only what changed since a git revision.
+
+Example:
+    >>> from qontinui_devtools.project import SourceRepository
+    >>> sources = SourceRepository()
+    >>> tree = sources.parse("src/module.py")
+"""
+
+from .analysis_cache import DEFAULT_CACHE_DIR, AnalysisCache
+from .file_inventory import DEFAULT_EXCLUDED_DIRS, FileEntry, FileInventory, find_files
+from .git_changes import changed_files
+from .module_index import ModuleIndex
+from .source_repository import SourceFile, SourceRepository
+
+__all__ = [
+    "AnalysisCache",
+    "DEFAULT_CACHE_DIR",
+    "DEFAULT_EXCLUDED_DIRS",
+    "changed_files",
+    "FileEntry",
+    "FileInventory",
+    "find_files",
+    "ModuleIndex",
+    "SourceFile",
+    "SourceRepository",
+]
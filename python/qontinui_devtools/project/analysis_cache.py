@@ -0,0 +1,219 @@
+"""Persistent on-disk cache for per-file analyzer results.
+
+Results are stored as JSON under ``.qontinui-devtools/cache``, one entry
+per file path, analyzer namespace and version, and analyzer configuration.
+Each entry records the hash of the file content it was computed from and is
+only used while the file still has that content. A warm run only
+re-analyzes files whose content changed since the previous run, and
+overwrites their entries in place; everything else is loaded from disk.
+
+Analyzers are responsible for converting their results to and from
+JSON-compatible data (usually via ``to_dict``/``from_dict``).
+
+Project-level entries (``get_project``/``put_project``) hold whole-project
+baselines, such as an import graph, that an analyzer validates itself.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+DEFAULT_CACHE_DIR = Path(".qontinui-devtools") / "cache"
+
+
+class AnalysisCache:
+    """Content-validated store for per-file analysis results.
+
+    Example:
+        >>> cache = AnalysisCache()
+        >>> detector = GodClassDetector(cache=cache)
+        >>> detector.analyze_directory("src")  # cold: analyzes every file
+        >>> detector.analyze_directory("src")  # warm: only changed files
+        >>> cache.stats["hits"]
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (defaults to
+                ``.qontinui-devtools/cache`` in the current directory)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+        self._digests: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.stats: dict[str, int] = {"hits": 0, "misses": 0, "writes": 0, "errors": 0}
+
+    def file_digest(self, file_path: str | Path) -> str:
+        """Get the SHA-256 digest of a file's content (computed once per run).
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Hex digest of the file bytes
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        path = os.path.abspath(os.fspath(file_path))
+        digest = self._digests.get(path)
+        if digest is None:
+            with open(path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            with self._lock:
+                self._digests[path] = digest
+        return digest
+
+    def _entry_path(self, namespace: str, file_path: str | Path, version: str, config: Any) -> Path:
+        """Compute the on-disk location of a file's cache entry.
+
+        The content digest is not part of the key, so a changed file's entry
+        is overwritten instead of leaving the old one behind.
+        """
+        return self._key_path(
+            namespace, [namespace, version, os.path.abspath(os.fspath(file_path)), config]
+        )
+
+    def _key_path(self, namespace: str, key_parts: list[Any]) -> Path:
+        """Map key parts to an entry file under the namespace directory."""
+        key_data = json.dumps(key_parts, sort_keys=True, default=str)
+        key = hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+        return self.cache_dir / namespace / key[:2] / f"{key}.json"
+
+    def _read(self, entry: Path, digest: str | None = None) -> Any | None:
+        """Read an entry file, counting the hit or miss.
+
+        Args:
+            entry: Entry file to read
+            digest: Content digest the entry must have been stored with;
+                None for project entries, which are stored unwrapped
+        """
+        try:
+            with open(entry, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            self.stats["misses"] += 1
+            return None
+        except (OSError, ValueError):
+            self.stats["errors"] += 1
+            return None
+
+        if digest is not None:
+            if not isinstance(data, dict) or data.get("digest") != digest:
+                # Stored for different content of the file
+                self.stats["misses"] += 1
+                return None
+            data = data.get("data")
+
+        self.stats["hits"] += 1
+        return data
+
+    def _write(self, entry: Path, data: Any) -> None:
+        """Write an entry file atomically, counting failures instead of raising."""
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            # Write atomically so concurrent runs never observe partial entries
+            fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, entry)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            self.stats["errors"] += 1
+            return
+
+        self.stats["writes"] += 1
+
+    def get(
+        self, namespace: str, file_path: str | Path, version: str, config: Any = None
+    ) -> Any | None:
+        """Load a cached result for a file.
+
+        Args:
+            namespace: Analyzer-specific namespace (e.g. ``"security"``)
+            file_path: File the result belongs to
+            version: Analyzer version; bump it when result semantics change
+            config: JSON-compatible analyzer configuration affecting the result
+
+        Returns:
+            The stored JSON data, or None on a miss or unreadable entry
+        """
+        try:
+            digest = self.file_digest(file_path)
+        except FileNotFoundError:
+            self.stats["misses"] += 1
+            return None
+        except OSError:
+            self.stats["errors"] += 1
+            return None
+        return self._read(self._entry_path(namespace, file_path, version, config), digest)
+
+    def put(
+        self,
+        namespace: str,
+        file_path: str | Path,
+        data: Any,
+        version: str,
+        config: Any = None,
+    ) -> None:
+        """Store a result for a file.
+
+        Replaces the file's previous entry for the same key. Failures to
+        write are counted in ``stats`` but never raised, so a read-only or
+        full disk only disables caching.
+
+        Args:
+            namespace: Analyzer-specific namespace
+            file_path: File the result belongs to
+            data: JSON-compatible result data
+            version: Analyzer version
+            config: JSON-compatible analyzer configuration affecting the result
+        """
+        try:
+            digest = self.file_digest(file_path)
+        except OSError:
+            self.stats["errors"] += 1
+            return
+        self._write(
+            self._entry_path(namespace, file_path, version, config),
+            {"digest": digest, "data": data},
+        )
+
+    def get_project(self, namespace: str, version: str, config: Any = None) -> Any | None:
+        """Load a project-level entry (not tied to one file's content).
+
+        Args:
+            namespace: Analyzer-specific namespace
+            version: Analyzer version
+            config: JSON-compatible key data, e.g. the project root
+
+        Returns:
+            The stored JSON data, or None on a miss or unreadable entry
+        """
+        return self._read(self._key_path(namespace, [namespace, version, "project", config]))
+
+    def put_project(self, namespace: str, data: Any, version: str, config: Any = None) -> None:
+        """Store a project-level entry, replacing any previous one.
+
+        Args:
+            namespace: Analyzer-specific namespace
+            data: JSON-compatible data
+            version: Analyzer version
+            config: JSON-compatible key data, e.g. the project root
+        """
+        self._write(self._key_path(namespace, [namespace, version, "project", config]), data)
+
+    def clear(self) -> None:
+        """Remove every cache entry from disk."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        with self._lock:
+            self._digests.clear()
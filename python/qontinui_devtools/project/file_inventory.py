@@ -0,0 +1,379 @@
+"""Single-pass project file discovery shared by all analyzers.
+
+``FileInventory.scan`` walks a directory tree once with ``os.scandir``. It
+prunes excluded directories (virtualenvs, ``node_modules``, ``target``, VCS
+and tool caches) and paths matched by ``.gitignore`` while traversing, so
+they are never listed, and records every source file with its size, mtime
+and language. Analyzers then select their files from the inventory instead
+of each running its own ``rglob`` over the whole tree.
+"""
+
+import os
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+# File extension -> language name
+LANGUAGES: dict[str, str] = {
+    ".py": "python",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".rs": "rust",
+}
+
+# Directories never worth analyzing, pruned for every language
+DEFAULT_EXCLUDED_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".venv",
+        "venv",
+        "node_modules",
+        "target",
+        "__pycache__",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".ruff_cache",
+        ".tox",
+        ".nox",
+        ".qontinui-devtools",
+    }
+)
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """A source file found by the project walk.
+
+    Attributes:
+        path: Path to the file (prefixed with the scanned root as given)
+        size: Size in bytes
+        mtime: Last modification time (seconds since the epoch)
+        language: Language name from ``LANGUAGES``
+    """
+
+    path: Path
+    size: int
+    mtime: float
+    language: str
+
+
+class _IgnoreRule:
+    """One pattern from a .gitignore file."""
+
+    __slots__ = ("regex", "negated", "dir_only")
+
+    def __init__(self, pattern: str) -> None:
+        self.negated = pattern.startswith("!")
+        if self.negated:
+            pattern = pattern[1:]
+        elif pattern.startswith("\\"):
+            pattern = pattern[1:]
+
+        self.dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+
+        # Patterns without an inner slash match at any depth
+        if "/" not in pattern:
+            pattern = "**/" + pattern
+        self.regex = re.compile(_glob_to_regex(pattern.lstrip("/")))
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        """Check whether the rule matches a path relative to its .gitignore."""
+        if self.dir_only and not is_dir:
+            return False
+        return self.regex.fullmatch(rel_path) is not None
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore glob into a regular expression."""
+    out: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif c == "*":
+            out.append("[^/]*")
+            i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[" and "]" in pattern[i + 1 :]:
+            end = pattern.index("]", i + 1)
+            body = pattern[i + 1 : end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = end + 1
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+
+class _IgnoreFile:
+    """The rules of one .gitignore file, applied below its directory."""
+
+    __slots__ = ("base", "rules")
+
+    def __init__(self, base: str, lines: Iterable[str]) -> None:
+        self.base = base
+        self.rules: list[_IgnoreRule] = []
+        for line in lines:
+            line = line.rstrip("\n").rstrip()
+            if line and not line.startswith("#"):
+                self.rules.append(_IgnoreRule(line))
+
+    @classmethod
+    def load(cls, directory: str) -> "_IgnoreFile | None":
+        """Load the .gitignore of a directory, if it has one."""
+        try:
+            with open(os.path.join(directory, ".gitignore"), encoding="utf-8") as f:
+                ignore = cls(_posix(directory), f)
+        except (OSError, UnicodeDecodeError):
+            return None
+        return ignore if ignore.rules else None
+
+    def match(self, abs_path: str, is_dir: bool) -> bool | None:
+        """Get the last matching rule's verdict (None if no rule matches)."""
+        rel_path = abs_path[len(self.base) :].lstrip("/")
+        verdict = None
+        for rule in self.rules:
+            if rule.matches(rel_path, is_dir):
+                verdict = not rule.negated
+        return verdict
+
+
+def _posix(path: str) -> str:
+    """Absolute path with forward slashes, for gitignore matching."""
+    return os.path.abspath(path).replace(os.sep, "/")
+
+
+def _is_ignored(ignores: list[_IgnoreFile], abs_path: str, is_dir: bool) -> bool:
+    """Check a path against .gitignore files, deepest file taking precedence."""
+    ignored = False
+    for ignore in ignores:
+        verdict = ignore.match(abs_path, is_dir)
+        if verdict is not None:
+            ignored = verdict
+    return ignored
+
+
+def _ancestor_ignores(root: str) -> list[_IgnoreFile]:
+    """Load .gitignore files above the root, up to the enclosing repository.
+
+    Returns nothing when the root is not inside a git repository, since git
+    would not apply those files either.
+    """
+    ignores: list[_IgnoreFile] = []
+    directory = os.path.abspath(root)
+    while not os.path.exists(os.path.join(directory, ".git")):
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return []
+        directory = parent
+        ignore = _IgnoreFile.load(directory)
+        if ignore is not None:
+            ignores.append(ignore)
+    ignores.reverse()
+    return ignores
+
+
+class FileInventory:
+    """Source files of a project, discovered in one directory walk.
+
+    Example:
+        >>> inventory = FileInventory.scan("src")
+        >>> python_files = inventory.files("python")
+        >>> detector = GodClassDetector(inventory=inventory)
+    """
+
+    def __init__(self, root: str | Path, entries: Iterable[FileEntry]) -> None:
+        """Initialize the inventory.
+
+        Args:
+            root: Directory the entries were found in
+            entries: Files in the inventory
+        """
+        self.root = Path(root)
+        self._abs_root = _posix(os.fspath(root)).rstrip("/")
+        self.entries: list[FileEntry] = sorted(entries, key=lambda e: e.path)
+        # Paths relative to the root, for prefix and directory-name filtering
+        skip = len(self._abs_root) + 1
+        self._rel_paths = [_posix(os.fspath(e.path))[skip:] for e in self.entries]
+
+    @classmethod
+    def scan(
+        cls,
+        root: str | Path,
+        exclude_dirs: Iterable[str] = DEFAULT_EXCLUDED_DIRS,
+        use_gitignore: bool = True,
+    ) -> "FileInventory":
+        """Walk a directory tree once and record its source files.
+
+        Excluded and ignored directories are pruned, not filtered afterwards,
+        so their contents are never listed. Unreadable directories are
+        skipped.
+
+        Args:
+            root: Directory to scan
+            exclude_dirs: Directory names to prune anywhere in the tree
+            use_gitignore: Whether to honor .gitignore files in and above the root
+
+        Returns:
+            Inventory of files with a known language extension
+        """
+        excluded = frozenset(exclude_dirs)
+        root_str = os.fspath(root)
+        entries: list[FileEntry] = []
+
+        ignores = _ancestor_ignores(root_str) if use_gitignore else []
+        stack: list[tuple[str, str, list[_IgnoreFile]]] = [(root_str, _posix(root_str), ignores)]
+
+        while stack:
+            directory, abs_dir, ignores = stack.pop()
+            if use_gitignore:
+                ignore = _IgnoreFile.load(directory)
+                if ignore is not None:
+                    ignores = ignores + [ignore]
+
+            try:
+                with os.scandir(directory) as it:
+                    dir_entries = list(it)
+            except OSError:
+                continue
+
+            for entry in dir_entries:
+                abs_path = f"{abs_dir}/{entry.name}"
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in excluded:
+                            continue
+                        if ignores and _is_ignored(ignores, abs_path, True):
+                            continue
+                        stack.append((entry.path, abs_path, ignores))
+                        continue
+
+                    language = LANGUAGES.get(os.path.splitext(entry.name)[1])
+                    if language is None or not entry.is_file():
+                        continue
+                    if ignores and _is_ignored(ignores, abs_path, False):
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+
+                entries.append(FileEntry(Path(entry.path), stat.st_size, stat.st_mtime, language))
+
+        return cls(root, entries)
+
+    def covers(self, path: str | Path) -> bool:
+        """Check whether a path lies inside the scanned root.
+
+        Args:
+            path: File or directory path
+
+        Returns:
+            True if the inventory lists the files below ``path``
+        """
+        target = _posix(os.fspath(path))
+        return target == self._abs_root or target.startswith(self._abs_root + "/")
+
+    def select(
+        self,
+        language: str | Iterable[str] | None = None,
+        under: str | Path | None = None,
+        exclude_dirs: Iterable[str] = (),
+    ) -> Iterator[FileEntry]:
+        """Select entries by language, subdirectory and excluded directories.
+
+        Args:
+            language: Language name(s) to keep (all languages if omitted)
+            under: Only keep files below this directory (must be covered)
+            exclude_dirs: Additional directory names to leave out
+
+        Yields:
+            Matching entries in path order
+        """
+        languages = {language} if isinstance(language, str) else language
+        if languages is not None:
+            languages = set(languages)
+        excluded = set(exclude_dirs)
+
+        prefix = ""
+        if under is not None:
+            under_abs = _posix(os.fspath(under)).rstrip("/")
+            if under_abs != self._abs_root:
+                prefix = under_abs[len(self._abs_root) + 1 :] + "/"
+
+        for entry, rel_path in zip(self.entries, self._rel_paths, strict=True):
+            if languages is not None and entry.language not in languages:
+                continue
+            if not rel_path.startswith(prefix):
+                continue
+            if excluded and not excluded.isdisjoint(rel_path.split("/")[:-1]):
+                continue
+            yield entry
+
+    def files(
+        self,
+        language: str | Iterable[str] | None = None,
+        under: str | Path | None = None,
+        exclude_dirs: Iterable[str] = (),
+    ) -> list[Path]:
+        """Get the paths of selected files (see ``select``).
+
+        Args:
+            language: Language name(s) to keep (all languages if omitted)
+            under: Only keep files below this directory (must be covered)
+            exclude_dirs: Additional directory names to leave out
+
+        Returns:
+            File paths in sorted order
+        """
+        return [entry.path for entry in self.select(language, under, exclude_dirs)]
+
+    def __len__(self) -> int:
+        """Number of files in the inventory."""
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[FileEntry]:
+        """Iterate over all entries in path order."""
+        return iter(self.entries)
+
+
+def find_files(
+    path: str | Path,
+    language: str | Iterable[str],
+    inventory: FileInventory | None = None,
+    exclude_dirs: Iterable[str] = (),
+) -> list[Path]:
+    """Find a language's files below a path, reusing a shared inventory.
+
+    Args:
+        path: File or directory to search
+        language: Language name(s) to keep
+        inventory: Shared inventory; used when it covers ``path``, otherwise
+            the path is scanned
+        exclude_dirs: Additional directory names to leave out
+
+    Returns:
+        Sorted file paths (just ``path`` itself if it is a matching file)
+    """
+    path = Path(path)
+    if path.is_file():
+        languages = {language} if isinstance(language, str) else set(language)
+        return [path] if LANGUAGES.get(path.suffix) in languages else []
+
+    if inventory is None or not inventory.covers(path):
+        inventory = FileInventory.scan(path)
+    return inventory.files(language, under=path, exclude_dirs=exclude_dirs)
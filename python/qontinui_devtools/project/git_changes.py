@@ -0,0 +1,65 @@
+"""Files changed since a git revision.
+
+Used by ``--since`` modes so that analyses and pre-commit hooks only look at
+what a change touched instead of re-scanning the whole project.
+"""
+
+import subprocess
+from pathlib import Path
+
+
+def _git(args: list[str], cwd: Path) -> str:
+    """Run a git command and return its output.
+
+    Raises:
+        ValueError: If git is not available or the command fails
+    """
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except FileNotFoundError as e:
+        raise ValueError("git is not installed") from e
+    except subprocess.CalledProcessError as e:
+        raise ValueError(e.stderr.strip() or f"git {' '.join(args)} failed") from e
+    return result.stdout
+
+
+def changed_files(since: str, path: str | Path = ".", include_untracked: bool = True) -> list[Path]:
+    """Get the files added, modified or renamed since a git revision.
+
+    Committed, staged and unstaged changes are all included, since the
+    working tree is compared against the revision. Deleted files are left
+    out because there is nothing left to analyze.
+
+    Args:
+        since: Git revision to compare against (e.g. ``main`` or ``HEAD~3``)
+        path: Any directory inside the repository
+        include_untracked: Whether to include new files not yet added to git
+
+    Returns:
+        Sorted absolute paths of changed files that exist on disk
+
+    Raises:
+        ValueError: If ``path`` is not in a git repository or ``since`` is
+            not a valid revision
+    """
+    if since.startswith("-"):
+        raise ValueError(f"Invalid revision: {since}")
+
+    cwd = Path(path).resolve()
+    if cwd.is_file():
+        cwd = cwd.parent
+
+    top = Path(_git(["rev-parse", "--show-toplevel"], cwd).strip())
+    output = _git(["diff", "--name-only", "--diff-filter=ACMR", "-z", since, "--"], cwd)
+    if include_untracked:
+        output += _git(["ls-files", "--others", "--exclude-standard", "--full-name", "-z"], cwd)
+    names = [name for name in output.split("\0") if name]
+
+    files = {(top / name).resolve() for name in names}
+    return sorted(f for f in files if f.is_file())
@@ -0,0 +1,128 @@
+"""Prebuilt module-name index for resolving Python imports.
+
+Import graph builders resolve every import statement to the longest module
+prefix that belongs to the project (``import pkg.mod.Class`` resolves to
+``pkg.mod``). ``ModuleIndex`` stores the project's module names in a trie
+built once from the directory listing, so each lookup walks the dotted name
+a single time instead of re-joining every prefix, and repeated imports of
+the same name are answered from a memo.
+"""
+
+from collections.abc import Iterator
+
+
+class _TrieNode:
+    """One dotted-name component in the module trie."""
+
+    __slots__ = ("children", "path")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.path: str | None = None
+
+
+class ModuleIndex:
+    """Index of the project's modules for longest-prefix import resolution.
+
+    Example:
+        >>> index = ModuleIndex({"pkg.models": "src/pkg/models.py"})
+        >>> index.resolve("pkg.models.User")
+        'pkg.models'
+        >>> index.resolve("os.path") is None
+        True
+    """
+
+    def __init__(self, modules: dict[str, str] | None = None) -> None:
+        """Initialize the index.
+
+        Args:
+            modules: Mapping of module name to file path to add up front
+        """
+        self._root = _TrieNode()
+        self._size = 0
+        self._resolved: dict[str, str | None] = {}
+        for module, file_path in (modules or {}).items():
+            self.add(module, file_path)
+
+    def add(self, module: str, file_path: str) -> None:
+        """Add a module to the index.
+
+        Args:
+            module: Dotted module name (e.g. ``"pkg.models"``)
+            file_path: File that defines the module
+        """
+        node = self._root
+        for part in module.split("."):
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _TrieNode()
+            node = child
+
+        if node.path is None:
+            self._size += 1
+        node.path = file_path
+        self._resolved.clear()
+
+    def resolve(self, name: str) -> str | None:
+        """Resolve an imported name to the longest matching project module.
+
+        Args:
+            name: Dotted name from an import statement
+
+        Returns:
+            Module name, or None if no prefix of ``name`` is a project module
+        """
+        try:
+            return self._resolved[name]
+        except KeyError:
+            pass
+
+        parts = name.split(".")
+        node = self._root
+        matched = 0
+        for depth, part in enumerate(parts, 1):
+            child = node.children.get(part)
+            if child is None:
+                break
+            node = child
+            if node.path is not None:
+                matched = depth
+
+        module = ".".join(parts[:matched]) if matched else None
+        self._resolved[name] = module
+        return module
+
+    def get_path(self, module: str) -> str | None:
+        """Get the file path of an exact module name.
+
+        Args:
+            module: Dotted module name
+
+        Returns:
+            File path, or None if the module is not in the index
+        """
+        node = self._root
+        for part in module.split("."):
+            child = node.children.get(part)
+            if child is None:
+                return None
+            node = child
+        return node.path
+
+    def __contains__(self, module: object) -> bool:
+        """Check whether an exact module name is in the index."""
+        return isinstance(module, str) and self.get_path(module) is not None
+
+    def __len__(self) -> int:
+        """Number of modules in the index."""
+        return self._size
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over module names in the index."""
+        stack: list[tuple[str, _TrieNode]] = [("", self._root)]
+        while stack:
+            prefix, node = stack.pop()
+            if node.path is not None:
+                yield prefix
+            for part, child in node.children.items():
+                stack.append((f"{prefix}.{part}" if prefix else part, child))
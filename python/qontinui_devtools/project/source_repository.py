@@ -0,0 +1,214 @@
+"""Project-scoped cache of Python sources and their parsed ASTs.
+
+Every static analyzer in qontinui-devtools starts from the same two steps:
+read a ``.py`` file and ``ast.parse`` it. When several analyzers run over the
+same project (for example from ``ReportAggregator``), those steps dominate the
+runtime. A ``SourceRepository`` performs them at most once per file and hands
+the same text and tree to every analyzer that asks for it.
+
+Trees returned by the repository are shared between analyzers and must be
+treated as read-only. Analyzers used on their own create a private repository
+with ``retain_trees=False``, which holds only the file currently being
+analyzed, so that standalone runs keep their previous memory profile; pass a
+shared repository to make the parse-once behaviour kick in.
+"""
+
+import ast
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass
+class SourceFile:
+    """Cached state for a single source file.
+
+    Attributes:
+        path: Absolute path of the file
+        source: Decoded file contents (None if the file could not be read)
+        tree: Parsed module (None until parsed, or if parsing failed)
+        error: Exception raised while reading or parsing, re-raised on access
+    """
+
+    path: str
+    source: str | None = None
+    tree: ast.Module | None = None
+    error: Exception | None = None
+    _lines: list[str] | None = field(default=None, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def lines(self) -> list[str]:
+        """Source split into lines (computed once)."""
+        if self._lines is None:
+            self._lines = self.source.splitlines() if self.source is not None else []
+        return self._lines
+
+
+class SourceRepository:
+    """Read-once, parse-once store for the Python files of a project.
+
+    The repository is safe to share between threads: each file is read and
+    parsed under its own lock, so concurrent callers wait for the first one
+    instead of repeating the work. Read and parse failures are cached as
+    well, so a broken file costs one attempt per run and raises the same
+    exception to every caller.
+
+    Example:
+        >>> sources = SourceRepository()
+        >>> god_classes = GodClassDetector(sources=sources).analyze_directory("src")
+        >>> vulns = SecurityAnalyzer(sources=sources).analyze_directory("src")
+        >>> sources.stats["parses"]  # each file parsed once for both analyzers
+    """
+
+    def __init__(self, encoding: str = "utf-8", retain_trees: bool = True) -> None:
+        """Initialize an empty repository.
+
+        Args:
+            encoding: Encoding used to decode source files
+            retain_trees: Keep parsed trees and sources for reuse. When False
+                only the most recently accessed file is held, so its source
+                is shared between ``read``, ``lines`` and ``parse`` calls
+                for that file, and every ``parse`` call re-parses it.
+        """
+        self.encoding = encoding
+        self.retain_trees = retain_trees
+        self._files: dict[str, SourceFile] = {}
+        self._lock = threading.Lock()
+        self.stats: dict[str, int] = {"reads": 0, "parses": 0, "hits": 0}
+
+    @staticmethod
+    def _key(file_path: str | Path) -> str:
+        """Normalize a path to the key used for caching."""
+        return os.path.abspath(os.fspath(file_path))
+
+    def _entry(self, key: str) -> SourceFile:
+        """Get or create the cache entry for a normalized path."""
+        with self._lock:
+            entry = self._files.get(key)
+            if entry is None:
+                if not self.retain_trees:
+                    # Hold one file at a time; callers keep their own reference
+                    self._files.clear()
+                entry = SourceFile(path=key)
+                self._files[key] = entry
+            return entry
+
+    def _count(self, stat: str) -> None:
+        """Increment a statistics counter."""
+        with self._lock:
+            self.stats[stat] += 1
+
+    def get(self, file_path: str | Path) -> SourceFile:
+        """Get the cached entry for a file, reading it if necessary.
+
+        Args:
+            file_path: Path to the source file
+
+        Returns:
+            SourceFile holding the decoded source
+
+        Raises:
+            OSError: If the file cannot be read
+            UnicodeDecodeError: If the file is not valid in the configured encoding
+        """
+        entry = self._entry(self._key(file_path))
+
+        with entry._lock:
+            if entry.source is not None:
+                self._count("hits")
+                return entry
+            if entry.error is not None:
+                raise entry.error
+            try:
+                with open(entry.path, encoding=self.encoding) as f:
+                    entry.source = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                entry.error = e
+                raise
+
+        self._count("reads")
+        return entry
+
+    def read(self, file_path: str | Path) -> str:
+        """Get the decoded source of a file.
+
+        Args:
+            file_path: Path to the source file
+
+        Returns:
+            File contents
+        """
+        source = self.get(file_path).source
+        assert source is not None
+        return source
+
+    def lines(self, file_path: str | Path) -> list[str]:
+        """Get the source of a file split into lines.
+
+        Args:
+            file_path: Path to the source file
+
+        Returns:
+            List of source lines without line endings
+        """
+        return self.get(file_path).lines
+
+    def parse(self, file_path: str | Path) -> ast.Module:
+        """Get the parsed AST of a file.
+
+        Args:
+            file_path: Path to the Python file
+
+        Returns:
+            Parsed module. The tree is shared and must not be modified.
+
+        Raises:
+            SyntaxError: If the file is not valid Python
+            OSError: If the file cannot be read
+            UnicodeDecodeError: If the file is not valid in the configured encoding
+        """
+        entry = self.get(file_path)
+
+        with entry._lock:
+            if entry.tree is not None:
+                return entry.tree
+            if entry.error is not None:
+                raise entry.error
+
+            try:
+                tree = ast.parse(entry.source or "", filename=entry.path)
+            except (SyntaxError, ValueError) as e:
+                entry.error = e
+                raise
+
+            if self.retain_trees:
+                entry.tree = tree
+
+        self._count("parses")
+        return tree
+
+    def invalidate(self, file_path: str | Path) -> None:
+        """Drop the cached state for a file so the next access re-reads it.
+
+        Args:
+            file_path: Path to the source file
+        """
+        with self._lock:
+            self._files.pop(self._key(file_path), None)
+
+    def clear(self) -> None:
+        """Drop all cached sources and trees."""
+        with self._lock:
+            self._files.clear()
+
+    def __contains__(self, file_path: object) -> bool:
+        """Check whether a file has already been loaded."""
+        if not isinstance(file_path, str | Path):
+            return False
+        return self._key(file_path) in self._files
+
+    def __len__(self) -> int:
+        """Number of files currently held by the repository."""
+        return len(self._files)
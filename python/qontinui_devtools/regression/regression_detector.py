@@ -9,6 +9,7 @@ from typing import Any
 
 from qontinui_schemas.common import utc_now
 
+from ..project import AnalysisCache
 from .models import (
     ChangeType,
     FunctionSignature,
@@ -27,7 +28,10 @@ class RegressionDetector:
     """Detects regressions and breaking changes between code versions."""
 
     def __init__(
-        self, snapshot_dir: Path | None = None, performance_threshold: float = 0.10
+        self,
+        snapshot_dir: Path | None = None,
+        performance_threshold: float = 0.10,
+        cache: AnalysisCache | None = None,
     ) -> None:
         """
         Initialize regression detector.
@@ -35,7 +39,9 @@ class RegressionDetector:
         Args:
             snapshot_dir: Directory to store snapshots (default: .regression_snapshots)
             performance_threshold: Threshold for performance regressions (default: 10%)
+            cache: Persistent cache for per-file API signatures (disabled if omitted)
         """
+        self.cache = cache
         self.snapshot_dir = snapshot_dir or Path(".regression_snapshots")
         self.snapshot_dir.mkdir(parents=True, exist_ok=True)
         self.performance_threshold = performance_threshold
@@ -57,7 +63,7 @@ class RegressionDetector:
             Created snapshot
         """
         source_path = Path(source_path)
-        snapshot = APISnapshot()
+        snapshot = APISnapshot(cache=self.cache)
         snapshot.create_snapshot(source_path, version)
 
         if save:
@@ -8,6 +8,7 @@ from typing import Any
 
 from qontinui_schemas.common import utc_now
 
+from ..project import AnalysisCache, SourceRepository
 from .models import ClassSignature, FunctionSignature
 
 logger = logging.getLogger(__name__)
@@ -16,8 +17,19 @@ logger = logging.getLogger(__name__)
 class APISnapshot:
     """Creates and manages API snapshots for regression detection."""
 
-    def __init__(self) -> None:
-        """Initialize API snapshot manager."""
+    CACHE_VERSION = "1"
+
+    def __init__(
+        self, sources: SourceRepository | None = None, cache: AnalysisCache | None = None
+    ) -> None:
+        """Initialize API snapshot manager.
+
+        Args:
+            sources: Shared source repository (a private one is created if omitted)
+            cache: Persistent cache for per-file signatures (disabled if omitted)
+        """
+        self.sources = sources if sources is not None else SourceRepository(retain_trees=False)
+        self.cache = cache
         self.functions: dict[str, FunctionSignature] = {}
         self.classes: dict[str, ClassSignature] = {}
         self.metadata: dict[str, Any] = {}
@@ -63,28 +75,54 @@ class APISnapshot:
             file_path: Path to Python file
             base_path: Base path for relative module paths
         """
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                source = f.read()
+        module_path = self._get_module_path(file_path, base_path)
 
-            tree = ast.parse(source, filename=str(file_path))
-            module_path = self._get_module_path(file_path, base_path)
+        if self.cache is not None:
+            cached = self.cache.get("api_snapshot", file_path, self.CACHE_VERSION, module_path)
+            if cached is not None:
+                for key, data in cached["functions"].items():
+                    self.functions[key] = FunctionSignature.from_dict(data)
+                for key, data in cached["classes"].items():
+                    self.classes[key] = ClassSignature.from_dict(data)
+                return
+
+        functions: dict[str, FunctionSignature] = {}
+        classes: dict[str, ClassSignature] = {}
+
+        try:
+            tree = self.sources.parse(file_path)
 
             for node in ast.walk(tree):
                 if isinstance(node, ast.FunctionDef):
                     sig = self._extract_function_signature(node, module_path)
                     if sig and sig.is_public:
                         key = f"{module_path}.{sig.name}"
-                        self.functions[key] = sig
+                        functions[key] = sig
 
                 elif isinstance(node, ast.ClassDef):
                     cls_sig = self._extract_class_signature(node, module_path)
                     if cls_sig and cls_sig.is_public:
                         key = f"{module_path}.{cls_sig.name}"
-                        self.classes[key] = cls_sig
+                        classes[key] = cls_sig
 
         except SyntaxError as e:
             logger.warning(f"Syntax error in {file_path}: {e}")
+            return
+
+        self.functions.update(functions)
+        self.classes.update(classes)
+
+        if self.cache is not None:
+            self.cache.put(
+                "api_snapshot",
+                file_path,
+                {
+                    "functions": {k: v.to_dict() for k, v in functions.items()},
+                    "classes": {k: v.to_dict() for k, v in classes.items()},
+                },
+                self.CACHE_VERSION,
+                module_path,
+            )
 
     def _get_module_path(self, file_path: Path, base_path: Path) -> str:
         """Convert file path to module path."""
@@ -345,7 +383,7 @@ class APISnapshot:
         Returns:
             New snapshot with filtered APIs
         """
-        filtered = APISnapshot()
+        filtered = APISnapshot(sources=self.sources, cache=self.cache)
         filtered.metadata = self.metadata.copy()
 
         filtered.functions = {
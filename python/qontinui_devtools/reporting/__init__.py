@@ -2,7 +2,8 @@
 Reporting tools for qontinui-devtools.
 
 This package provides comprehensive HTML report generation that aggregates
-results from all analysis tools into a single interactive document.
+results from all analysis tools into a single interactive document, and
+NDJSON/SARIF writers that stream findings as analyzers produce them.
 
 Example:
     >>> from qontinui_devtools.reporting import ReportAggregator, HTMLReportGenerator
@@ -23,6 +24,14 @@ from .charts import (
                      create_scatter_chart,
                      create_stacked_bar_chart,
 )
+from .finding_stream import (
+    STREAM_FORMATS,
+    Finding,
+    FindingWriter,
+    NDJSONWriter,
+    SARIFWriter,
+    open_finding_writer,
+)
 from .html_reporter import HTMLReportGenerator, ReportData, ReportSection
 
 __all__ = [
@@ -31,6 +40,13 @@ __all__ = [
     "ReportData",
     "ReportSection",
     "ReportAggregator",
+    # Streaming findings
+    "Finding",
+    "FindingWriter",
+    "NDJSONWriter",
+    "SARIFWriter",
+    "STREAM_FORMATS",
+    "open_finding_writer",
     # Chart functions
     "create_bar_chart",
     "create_pie_chart",
@@ -5,28 +5,66 @@ This module runs all analysis tools and aggregates their results into a single R
 """
 
 import html
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from qontinui_schemas.common import utc_now
 
+from ..project import AnalysisCache, FileInventory, SourceRepository
 from .html_reporter import ReportData, ReportSection
 
+# Analyses that run per file and can be split into batches
+_BATCH_ANALYSES = ("architecture", "quality", "concurrency")
+
+# Batches submitted per worker, so uneven batches still balance across workers
+_BATCHES_PER_JOB = 4
+
 
 class ReportAggregator:
     """Aggregate results from all analysis tools."""
 
-    def __init__(self, project_path: str, verbose: bool = False) -> None:
+    def __init__(
+        self,
+        project_path: str,
+        verbose: bool = False,
+        sources: SourceRepository | None = None,
+        jobs: int = 1,
+        inventory: FileInventory | None = None,
+        changed_files: list[Path] | None = None,
+        cache: AnalysisCache | None = None,
+    ) -> None:
         """
         Initialize the report aggregator.
 
         Args:
             project_path: Path to the project to analyze
             verbose: Enable verbose logging
+            sources: Source repository shared by all analyzers. Each file is
+                read and parsed once no matter how many analyses use it.
+            jobs: Number of worker processes. 1 runs everything in this
+                process, 0 uses one worker per CPU.
+            inventory: File inventory shared by all analyzers. If omitted, the
+                project is listed once on first use.
+            changed_files: Restrict analysis to these files (e.g. from
+                ``changed_files(since)``). Per-file analyses skip every other
+                file and import analysis only searches the changed modules'
+                dependency cycles. All files are analyzed if omitted.
+            cache: Persistent cache whose import graph baseline spares
+                re-parsing unchanged files (disabled if omitted)
         """
         self.project_path = Path(project_path)
         self.verbose = verbose
         self.results: dict[str, Any] = {}
+        self.sources = sources if sources is not None else SourceRepository()
+        self.jobs = jobs if jobs > 0 else os.cpu_count() or 1
+        self.inventory = inventory
+        self.changed_files = (
+            {os.path.abspath(f) for f in changed_files} if changed_files is not None else None
+        )
+        self.cache = cache
 
         if not self.project_path.exists():
             raise ValueError(f"Project path does not exist: {project_path}")
@@ -50,52 +88,110 @@ class ReportAggregator:
         )
 
         # Run analyses
-        try:
-            self.results["imports"] = self._run_import_analysis()
-            if self.verbose:
-                print("✓ Import analysis complete")
-        except Exception as e:
-            if self.verbose:
-                print(f"✗ Import analysis failed: {e}")
-            self.results["imports"] = {"error": str(e)}
+        if self.jobs > 1:
+            self._run_analyses_in_processes()
+        else:
+            self.results["imports"] = self._run_guarded(
+                "Import analysis", self._run_import_analysis
+            )
+            self.results["architecture"] = self._run_guarded(
+                "Architecture analysis", self._run_architecture_analysis
+            )
+            self.results["quality"] = self._run_guarded("Quality checks", self._run_quality_checks)
+            self.results["concurrency"] = self._run_guarded(
+                "Concurrency analysis", self._run_concurrency_analysis
+            )
 
-        try:
-            self.results["architecture"] = self._run_architecture_analysis()
-            if self.verbose:
-                print("✓ Architecture analysis complete")
-        except Exception as e:
-            if self.verbose:
-                print(f"✗ Architecture analysis failed: {e}")
-            self.results["architecture"] = {"error": str(e)}
+        # Create report data
+        return self._create_report_data(report_data)
 
-        try:
-            self.results["quality"] = self._run_quality_checks()
-            if self.verbose:
-                print("✓ Quality checks complete")
-        except Exception as e:
-            if self.verbose:
-                print(f"✗ Quality checks failed: {e}")
-            self.results["quality"] = {"error": str(e)}
+    def _run_guarded(self, label: str, analysis: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        """Run one analysis, converting failures into an error result.
 
+        Args:
+            label: Human-readable analysis name for verbose output
+            analysis: Callable producing the analysis result
+
+        Returns:
+            Analysis result, or ``{"error": ...}`` if it raised
+        """
         try:
-            self.results["concurrency"] = self._run_concurrency_analysis()
+            result = analysis()
             if self.verbose:
-                print("✓ Concurrency analysis complete")
+                print(f"✓ {label} complete")
+            return result
         except Exception as e:
             if self.verbose:
-                print(f"✗ Concurrency analysis failed: {e}")
-            self.results["concurrency"] = {"error": str(e)}
+                print(f"✗ {label} failed: {e}")
+            return {"error": str(e)}
 
-        # Create report data
-        return self._create_report_data(report_data)
+    def _run_analyses_in_processes(self) -> None:
+        """Run all analyses on a process pool.
+
+        Import analysis needs the whole project and runs as one task. The
+        per-file analyses are split into contiguous batches of the sorted file
+        list; each worker runs architecture, quality and concurrency analysis
+        on its batch with one shared source repository. Batch results are
+        merged in submission order, so the output matches a serial run.
+        """
+        files = [str(path) for path in self._python_files()]
+        batch_size = max(1, -(-len(files) // (self.jobs * _BATCHES_PER_JOB)))
+        batches = [files[i : i + batch_size] for i in range(0, len(files), batch_size)] or [[]]
+
+        if self.verbose:
+            print(f"Using {self.jobs} worker processes for {len(batches)} batches")
+
+        project_path = str(self.project_path)
+        with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+            import_future = pool.submit(
+                _run_import_task,
+                project_path,
+                self._file_inventory(),
+                sorted(self.changed_files) if self.changed_files is not None else None,
+                # The cache holds a lock, so workers open their own on the same directory
+                str(self.cache.cache_dir) if self.cache is not None else None,
+            )
+            batch_futures = [pool.submit(_run_batch_task, project_path, batch) for batch in batches]
+
+            self.results["imports"] = self._run_guarded("Import analysis", import_future.result)
+            batch_results = [
+                self._run_guarded(f"Batch {i + 1}/{len(batches)}", future.result)
+                for i, future in enumerate(batch_futures)
+            ]
+
+        # A batch that failed as a whole reports the same error for every analysis
+        for name in _BATCH_ANALYSES:
+            self.results[name] = _merge_results(
+                [result.get(name, result) for result in batch_results]
+            )
+
+    def _file_inventory(self) -> FileInventory:
+        """Get the project's file inventory, listing the project on first use."""
+        if self.inventory is None:
+            self.inventory = FileInventory.scan(self.project_path)
+        return self.inventory
+
+    def _python_files(self) -> list[Path]:
+        """Get the Python files to analyze (all, or only changed ones) in a stable order."""
+        files = self._file_inventory().files("python")
+        if self.changed_files is None:
+            return files
+        return [f for f in files if os.path.abspath(f) in self.changed_files]
 
     def _run_import_analysis(self) -> dict[str, Any]:
         """Run import analysis using CircularDependencyDetector."""
         try:
             from ..import_analysis import CircularDependencyDetector
 
-            detector = CircularDependencyDetector(str(self.project_path))
-            cycles = detector.analyze()
+            detector = CircularDependencyDetector(
+                str(self.project_path),
+                sources=self.sources,
+                cache=self.cache,
+                inventory=self._file_inventory(),
+            )
+            cycles = detector.analyze(
+                changed_files=sorted(self.changed_files) if self.changed_files is not None else None
+            )
 
             return {
                 "circular_dependencies": len(cycles),
@@ -106,18 +202,23 @@ class ReportAggregator:
         except ImportError:
             return {"error": "Import analysis module not available"}
 
-    def _run_architecture_analysis(self) -> dict[str, Any]:
-        """Run architecture analysis using GodClassDetector and SRPAnalyzer."""
+    def _run_architecture_analysis(self, files: list[Path] | None = None) -> dict[str, Any]:
+        """Run architecture analysis using GodClassDetector and SRPAnalyzer.
+
+        Args:
+            files: Files to analyze (defaults to every Python file in the project)
+        """
         result: dict[str, Any] = {}
+        files = files if files is not None else self._python_files()
 
         try:
             from ..architecture import GodClassDetector
 
-            detector = GodClassDetector()
+            detector = GodClassDetector(sources=self.sources)
             god_classes: list[Any] = []
 
             # Scan all Python files
-            for py_file in self.project_path.rglob("*.py"):
+            for py_file in files:
                 try:
                     classes = detector.analyze_file(str(py_file))
                     god_classes.extend(classes)
@@ -133,11 +234,11 @@ class ReportAggregator:
         try:
             from ..architecture import SRPAnalyzer
 
-            analyzer = SRPAnalyzer()
+            analyzer = SRPAnalyzer(sources=self.sources)
             violations: list[Any] = []
 
             # Scan all Python files
-            for py_file in self.project_path.rglob("*.py"):
+            for py_file in files:
                 try:
                     file_violations = analyzer.analyze_file(str(py_file))
                     violations.extend(file_violations)
@@ -151,8 +252,12 @@ class ReportAggregator:
 
         return result
 
-    def _run_quality_checks(self) -> dict[str, Any]:
-        """Run code quality checks."""
+    def _run_quality_checks(self, files: list[Path] | None = None) -> dict[str, Any]:
+        """Run code quality checks.
+
+        Args:
+            files: Files to check (defaults to every Python file in the project)
+        """
         result: dict[str, Any] = {
             "total_files": 0,
             "total_lines": 0,
@@ -162,12 +267,12 @@ class ReportAggregator:
         }
 
         # Count files and lines
-        for py_file in self.project_path.rglob("*.py"):
+        for py_file in files if files is not None else self._python_files():
             if "test" in str(py_file):
                 continue
 
             try:
-                content = py_file.read_text(encoding="utf-8")
+                content = self.sources.read(py_file)
                 result["total_files"] += 1
                 result["total_lines"] += len(content.splitlines())
 
@@ -199,16 +304,20 @@ class ReportAggregator:
 
         return result
 
-    def _run_concurrency_analysis(self) -> dict[str, Any]:
-        """Run concurrency analysis using RaceConditionDetector."""
+    def _run_concurrency_analysis(self, files: list[Path] | None = None) -> dict[str, Any]:
+        """Run concurrency analysis using RaceConditionDetector.
+
+        Args:
+            files: Files to analyze (defaults to every Python file in the project)
+        """
         try:
             from ..concurrency import RaceConditionDetector
 
-            detector = RaceConditionDetector()
+            detector = RaceConditionDetector(sources=self.sources)
             race_conditions: list[Any] = []
 
             # Scan all Python files
-            for py_file in self.project_path.rglob("*.py"):
+            for py_file in files if files is not None else self._python_files():
                 try:
                     races = detector.analyze_file(str(py_file))
                     race_conditions.extend(races)
@@ -494,3 +603,59 @@ class ReportAggregator:
             severity=severity,
             metrics={"total_recommendations": len(recommendations)},
         )
+
+
+def _run_import_task(
+    project_path: str,
+    inventory: FileInventory,
+    changed_files: list[str] | None = None,
+    cache_dir: str | None = None,
+) -> dict[str, Any]:
+    """Run import analysis in a worker process."""
+    return ReportAggregator(
+        project_path,
+        inventory=inventory,
+        changed_files=[Path(f) for f in changed_files] if changed_files is not None else None,
+        cache=AnalysisCache(cache_dir) if cache_dir is not None else None,
+    )._run_import_analysis()
+
+
+def _run_batch_task(project_path: str, file_paths: list[str]) -> dict[str, dict[str, Any]]:
+    """Run the per-file analyses on one batch of files in a worker process."""
+    aggregator = ReportAggregator(project_path)
+    files = [Path(path) for path in file_paths]
+    return {
+        "architecture": aggregator._run_guarded(
+            "Architecture analysis", lambda: aggregator._run_architecture_analysis(files)
+        ),
+        "quality": aggregator._run_guarded(
+            "Quality checks", lambda: aggregator._run_quality_checks(files)
+        ),
+        "concurrency": aggregator._run_guarded(
+            "Concurrency analysis", lambda: aggregator._run_concurrency_analysis(files)
+        ),
+    }
+
+
+def _merge_results(partials: list[dict[str, Any]]) -> dict[str, Any]:
+    """Merge per-batch analysis results in order.
+
+    Counts are summed and detail lists concatenated; any other value (such as
+    an error message) is taken from the first batch that reported it.
+
+    Args:
+        partials: Results of the same analysis for consecutive batches
+
+    Returns:
+        Combined result
+    """
+    merged: dict[str, Any] = {}
+    for partial in partials:
+        for key, value in partial.items():
+            if key not in merged:
+                merged[key] = list(value) if isinstance(value, list) else value
+            elif isinstance(value, list):
+                merged[key].extend(value)
+            elif isinstance(value, int | float) and not isinstance(value, bool):
+                merged[key] += value
+    return merged
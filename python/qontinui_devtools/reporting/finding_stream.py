@@ -0,0 +1,217 @@
+"""Streaming writers for analyzer findings.
+
+Analyzers expose ``iter_findings()`` generators that yield results as each
+file finishes. The writers here serialize those results one at a time, so a
+scan of a very large repository never holds the whole report in memory and
+consumers can start reading before the scan ends.
+
+Two formats are supported:
+
+- NDJSON: one JSON object per line, flushed after every finding
+- SARIF 2.1.0: the format read by GitHub code scanning and most CI tools
+
+Example:
+    >>> from qontinui_devtools.reporting import Finding, open_finding_writer
+    >>> with open_finding_writer("sarif", "results.sarif", tool="security") as writer:
+    ...     for vuln in analyzer.iter_findings("src"):
+    ...         writer.write(Finding(...))
+"""
+
+import json
+import sys
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+STREAM_FORMATS = ("ndjson", "sarif")
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_VERSION = "2.1.0"
+
+# Severity -> SARIF result level
+_SARIF_LEVELS = {
+    "critical": "error",
+    "high": "error",
+    "medium": "warning",
+    "low": "note",
+    "info": "note",
+}
+
+
+@dataclass
+class Finding:
+    """A single analyzer result in a tool-independent shape.
+
+    Attributes:
+        rule_id: Identifier of the check that fired (e.g. "sql_injection")
+        message: Human-readable description of the problem
+        severity: "critical", "high", "medium", "low" or "info"
+        file_path: File the finding is in
+        line: 1-based line number (0 if unknown)
+        tool: Name of the analyzer that produced the finding
+        properties: Additional analyzer-specific JSON-compatible data
+    """
+
+    rule_id: str
+    message: str
+    severity: str
+    file_path: str
+    line: int
+    tool: str
+    properties: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-compatible dictionary."""
+        return asdict(self)
+
+
+class FindingWriter(ABC):
+    """Base class for writers that emit findings as they arrive.
+
+    Subclasses implement ``_begin``, ``_write`` and ``_end``. Writers are
+    context managers; leaving the block finishes the document and closes the
+    stream if the writer opened it.
+    """
+
+    def __init__(self, stream: TextIO, tool: str, close_stream: bool = False) -> None:
+        """Initialize the writer.
+
+        Args:
+            stream: Text stream to write to
+            tool: Name of the analyzer producing the findings
+            close_stream: Whether ``close`` also closes the stream
+        """
+        self.stream = stream
+        self.tool = tool
+        self.count = 0
+        self._close_stream = close_stream
+        self._closed = False
+        self._begin()
+
+    def write(self, finding: Finding) -> None:
+        """Write one finding.
+
+        Args:
+            finding: Finding to write
+
+        Raises:
+            ValueError: If the writer has been closed
+        """
+        if self._closed:
+            raise ValueError("Cannot write to a closed finding writer")
+        self._write(finding)
+        self.count += 1
+
+    def close(self) -> None:
+        """Finish the document (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        self._end()
+        self.stream.flush()
+        if self._close_stream:
+            self.stream.close()
+
+    def __enter__(self) -> "FindingWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _begin(self) -> None:  # noqa: B027 - optional hook
+        """Write anything that precedes the first finding."""
+
+    @abstractmethod
+    def _write(self, finding: Finding) -> None:
+        """Write one finding to the stream."""
+
+    def _end(self) -> None:  # noqa: B027 - optional hook
+        """Write anything that follows the last finding."""
+
+
+class NDJSONWriter(FindingWriter):
+    """Write findings as newline-delimited JSON, one object per line."""
+
+    def _write(self, finding: Finding) -> None:
+        self.stream.write(json.dumps(finding.to_dict(), default=str))
+        self.stream.write("\n")
+        self.stream.flush()
+
+
+class SARIFWriter(FindingWriter):
+    """Write findings as a SARIF 2.1.0 log with a single run.
+
+    Results are written as they arrive. The tool section, whose rule list is
+    only known at the end, is written after the results; JSON object keys are
+    unordered, so the log stays valid.
+    """
+
+    def _begin(self) -> None:
+        self._rules: dict[str, str] = {}  # rule id -> first message seen
+        self.stream.write(
+            f'{{"$schema": {json.dumps(SARIF_SCHEMA)}, "version": "{SARIF_VERSION}", '
+            '"runs": [{"results": ['
+        )
+
+    def _write(self, finding: Finding) -> None:
+        self._rules.setdefault(finding.rule_id, finding.message)
+        result: dict[str, Any] = {
+            "ruleId": finding.rule_id,
+            "level": _SARIF_LEVELS.get(finding.severity, "warning"),
+            "message": {"text": finding.message},
+            "locations": [
+                {
+                    "physicalLocation": {
+                        "artifactLocation": {"uri": Path(finding.file_path).as_posix()},
+                        "region": {"startLine": max(finding.line, 1)},
+                    }
+                }
+            ],
+            "properties": {"severity": finding.severity, **finding.properties},
+        }
+        if self.count:
+            self.stream.write(", ")
+        self.stream.write(json.dumps(result, default=str))
+
+    def _end(self) -> None:
+        driver = {
+            "name": f"qontinui-devtools {self.tool}",
+            "rules": [
+                {
+                    "id": rule_id,
+                    "shortDescription": {"text": rule_id.replace("_", " ")},
+                    "fullDescription": {"text": self._rules[rule_id]},
+                }
+                for rule_id in sorted(self._rules)
+            ],
+        }
+        self.stream.write(f'], "tool": {{"driver": {json.dumps(driver)}}}}}]}}\n')
+
+
+_WRITERS: dict[str, type[FindingWriter]] = {"ndjson": NDJSONWriter, "sarif": SARIFWriter}
+
+
+def open_finding_writer(format: str, output: str | Path | None, tool: str) -> FindingWriter:
+    """Create a streaming writer for a file or standard output.
+
+    Args:
+        format: "ndjson" or "sarif"
+        output: File to write (standard output if None)
+        tool: Name of the analyzer producing the findings
+
+    Returns:
+        Writer to use as a context manager
+
+    Raises:
+        ValueError: If the format is not a streaming format
+    """
+    writer_class = _WRITERS.get(format.lower())
+    if writer_class is None:
+        raise ValueError(
+            f"Unknown stream format: {format} (expected one of {', '.join(STREAM_FORMATS)})"
+        )
+
+    if output is None:
+        return writer_class(sys.stdout, tool)
+    return writer_class(open(output, "w", encoding="utf-8"), tool, close_stream=True)
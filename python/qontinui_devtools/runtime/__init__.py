@@ -7,7 +7,8 @@ tracking events through the Qontinui system.
 
 from .action_profiler import ActionProfile, ActionProfiler, ProfilingSession
 from .dashboard_server import DashboardServer
-from .event_tracer import Checkpoint, EventFlow, EventTrace, EventTracer
+from .event_tracer import Checkpoint, CompactEventTrace, EventFlow, EventTrace, EventTracer
+from .growth_matrix import GrowthMatrix, fit_growth
 from .latency_analyzer import (
                                analyze_latencies,
                                calculate_throughput,
@@ -15,9 +16,11 @@ from .latency_analyzer import (
                                detect_anomalies,
                                find_bottleneck,
                                generate_latency_report,
+                               stage_statistics,
 )
 from .leak_detector import (
                                analyze_growth_trend,
+                               analyze_growth_trends,
                                analyze_object_retention,
                                classify_leak_severity,
                                detect_common_leak_patterns,
@@ -30,6 +33,7 @@ from .leak_detector import (
 
 # Memory profiling
 from .memory_profiler import MemoryLeak, MemoryProfiler, MemorySnapshot
+from .memory_sampler import MemorySampler, MemoryTrack
 from .memory_viz import (
                                generate_html_report,
                                plot_comparison,
@@ -43,17 +47,30 @@ from .metrics import (
                                calculate_action_type_metrics,
                                calculate_metrics,
                                calculate_percentile,
+                               calculate_percentiles,
                                calculate_phase_metrics,
                                format_duration,
                                format_memory,
 )
 from .metrics_collector import ActionMetrics, EventMetrics, MetricsCollector, SystemMetrics
+from .reference_graph import ReferenceGraph
+from .sketches import QuantileSketch, SlidingWindow, WindowTotals
+from .stack_sampler import StackSampler
 from .timeline import export_chrome_trace, export_timeline_html
+from .trace_writer import (
+                               BackgroundTraceExporter,
+                               ChromeTraceWriter,
+                               PerfettoTraceWriter,
+                               TraceWriter,
+                               chrome_trace_events,
+                               open_trace_writer,
+)
 
 __all__ = [
     # Event tracing
     "EventTracer",
     "EventTrace",
+    "CompactEventTrace",
     "EventFlow",
     "Checkpoint",
     # Latency analysis
@@ -63,16 +80,27 @@ __all__ = [
     "calculate_throughput",
     "compare_traces",
     "generate_latency_report",
+    "stage_statistics",
     # Timeline export
     "export_chrome_trace",
     "export_timeline_html",
+    "TraceWriter",
+    "ChromeTraceWriter",
+    "PerfettoTraceWriter",
+    "BackgroundTraceExporter",
+    "chrome_trace_events",
+    "open_trace_writer",
     # Action profiling
     "ActionProfiler",
     "ActionProfile",
     "ProfilingSession",
+    "StackSampler",
+    "MemorySampler",
+    "MemoryTrack",
     "PerformanceMetrics",
     "calculate_metrics",
     "calculate_percentile",
+    "calculate_percentiles",
     "calculate_phase_metrics",
     "calculate_action_type_metrics",
     "format_duration",
@@ -83,11 +111,19 @@ __all__ = [
     "SystemMetrics",
     "ActionMetrics",
     "EventMetrics",
+    # Streaming statistics
+    "QuantileSketch",
+    "SlidingWindow",
+    "WindowTotals",
     # Memory profiling
     "MemoryProfiler",
     "MemorySnapshot",
     "MemoryLeak",
+    "GrowthMatrix",
+    "fit_growth",
     "analyze_growth_trend",
+    "analyze_growth_trends",
+    "ReferenceGraph",
     "find_reference_chains",
     "find_leaked_objects",
     "classify_leak_severity",
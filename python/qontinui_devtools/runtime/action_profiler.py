@@ -5,6 +5,7 @@ analyzing action execution, including timing, CPU usage, memory tracking,
 and flame graph generation.
 """
 
+import threading
 import time
 import uuid
 from collections.abc import Iterator
@@ -14,6 +15,9 @@ from typing import Any
 
 import psutil
 
+from .memory_sampler import MemorySampler
+from .stack_sampler import StackSampler
+
 
 @dataclass
 class ActionProfile:
@@ -31,6 +35,7 @@ class ActionProfile:
     peak_memory: int
     phases: dict[str, float] = field(default_factory=dict)  # Phase name → duration
     stack_samples: list[tuple[float, list[str]]] = field(default_factory=list)  # For flame graph
+    memory_samples: list[tuple[float, int]] = field(default_factory=list)  # (time, RSS bytes)
     success: bool = True
     error: str | None = None
 
@@ -70,6 +75,16 @@ class ActionProfiler:
     - Memory usage (before/after/delta/peak)
     - Optional stack sampling for flame graphs
 
+    Stack sampling runs a ``StackSampler`` thread for the duration of the
+    session. Samples taken while an action runs are attributed to that
+    action's ``stack_samples`` (the innermost action when they are nested)
+    and can be passed straight to the ``flame_graph`` functions.
+
+    Peak memory tracking runs one ``MemorySampler`` thread shared by all
+    actions in the session. Each action then reports the highest RSS seen
+    while it ran, not just the larger of its start and end readings, along
+    with a downsampled memory curve in ``memory_samples``.
+
     Example:
         profiler = ActionProfiler()
         profiler.start_session()
@@ -89,6 +104,8 @@ class ActionProfiler:
         enable_memory: bool = True,
         enable_cpu: bool = True,
         enable_stack_sampling: bool = False,
+        track_peak_memory: bool = False,
+        memory_sample_interval: float = 0.005,  # 5ms
     ) -> None:
         """Initialize the profiler.
 
@@ -96,17 +113,27 @@ class ActionProfiler:
             sample_interval: Interval for stack sampling in seconds (if enabled)
             enable_memory: Track memory usage
             enable_cpu: Track CPU time
-            enable_stack_sampling: Sample call stacks for flame graphs (expensive)
+            enable_stack_sampling: Sample call stacks for flame graphs
+            track_peak_memory: Sample RSS in the background during actions for
+                true peaks and memory curves (requires enable_memory)
+            memory_sample_interval: Interval between RSS samples in seconds
         """
         self.sample_interval = sample_interval
         self.enable_memory = enable_memory
         self.enable_cpu = enable_cpu
         self.enable_stack_sampling = enable_stack_sampling
+        self.track_peak_memory = track_peak_memory and enable_memory
 
         self._session_id: str | None = None
         self._session_start: float | None = None
         self._profiles: list[ActionProfile] = []
         self._process = psutil.Process()
+        self._stack_sampler = StackSampler(sample_interval) if enable_stack_sampling else None
+        self._memory_sampler = (
+            MemorySampler(memory_sample_interval, process=self._process)
+            if self.track_peak_memory
+            else None
+        )
 
     def start_session(self) -> str:
         """Start a new profiling session.
@@ -120,6 +147,9 @@ class ActionProfiler:
         self._session_id = str(uuid.uuid4())
         self._session_start = time.perf_counter()
         self._profiles = []
+        for sampler in (self._stack_sampler, self._memory_sampler):
+            if sampler is not None:
+                sampler.start()
         return self._session_id
 
     @contextmanager
@@ -179,19 +209,13 @@ class ActionProfiler:
             stack_samples=[],
         )
 
-        # Stack sampling setup (if enabled)
-        if self.enable_stack_sampling:
-            pass
-            # Note: Actual stack sampling would require threading or signal-based approach
-            # For now, we'll just mark it as available
-            # A production implementation would use a background thread or py-spy
+        # Attribute this thread's stack samples to the action while it runs
+        thread_id = threading.get_ident()
+        if self._stack_sampler is not None:
+            self._stack_sampler.attach(thread_id, profile.stack_samples)
+        memory_track = self._memory_sampler.attach() if self._memory_sampler else None
 
         try:
-            # Track peak memory during execution
-            if self.enable_memory:
-                # Sample once at start
-                peak_memory = memory_before
-
             # Yield profile for user code
             yield profile
 
@@ -211,6 +235,13 @@ class ActionProfiler:
             raise
 
         finally:
+            if self._stack_sampler is not None:
+                self._stack_sampler.detach(thread_id)
+            if self._memory_sampler is not None and memory_track is not None:
+                self._memory_sampler.detach(memory_track)
+                profile.peak_memory = max(profile.peak_memory, memory_track.peak)
+                profile.memory_samples = memory_track.samples
+
             # Final measurements
             end_time = time.perf_counter()
             end_cpu = time.process_time() if self.enable_cpu else 0.0
@@ -235,6 +266,9 @@ class ActionProfiler:
             raise RuntimeError("Session start time not recorded.")
 
         session_end = time.perf_counter()
+        for sampler in (self._stack_sampler, self._memory_sampler):
+            if sampler is not None:
+                sampler.stop()
 
         # Calculate summary statistics
         summary = self.get_summary()
@@ -298,26 +332,25 @@ class ActionProfiler:
 
         Args:
             output_path: Path to save the flame graph
-            format: Output format ("svg" or "json" for speedscope)
+            format: Output format ("svg", "json" for speedscope or "collapsed")
 
         Raises:
             ValueError: If no stack samples available
             ImportError: If flame graph generation dependencies not available
         """
-        # Collect all stack samples from profiles
-        all_samples: list[tuple[float, list[str]]] = []
+        from .flame_graph import StackTrie, generate_flame_graph
+
+        # Aggregate the samples of all profiles by stack
+        trie = StackTrie()
         for profile in self._profiles:
-            all_samples.extend(profile.stack_samples)
+            trie.add_samples(profile.stack_samples)
 
-        if not all_samples:
+        if not trie.total:
             raise ValueError(
                 "No stack samples available. Enable stack sampling when creating profiler."
             )
 
-        # Import flame graph generator
-        from .flame_graph import generate_flame_graph
-
-        generate_flame_graph(all_samples, output_path, format=format)
+        generate_flame_graph(trie, output_path, format=format)
 
     def export_to_json(self, output_path: str) -> None:
         """Export current profiles to JSON.
@@ -343,6 +376,7 @@ class ActionProfiler:
                     "memory_delta": p.memory_delta,
                     "peak_memory": p.peak_memory,
                     "phases": p.phases,
+                    "memory_samples": p.memory_samples,
                     "success": p.success,
                     "error": p.error,
                 }
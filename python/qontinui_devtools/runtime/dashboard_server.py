@@ -2,11 +2,28 @@
 
 This module provides a web server with WebSocket support for streaming
 real-time metrics to connected clients.
+
+Metrics are sampled once per tick and serialized once per distinct
+message, however many clients are connected. Each client has its own
+sender task and bounded outgoing queue, so a slow client never delays the
+others. When a client's queue is full, ticks are dropped for that client
+only. The next message it gets is a delta against the last state actually
+queued for it, so dropping never corrupts its view.
+
+Wire protocol (server to client):
+- A plain metrics dict (no "type"): the full state, sent on connect and
+  on "request_metrics"
+- ``{"type": "delta", "changes": {...}}``: changed fields since the
+  client's previous state, nested like the metrics dict
+- ``{"type": "history", "samples": [...]}``: recent full states, oldest
+  first, sent on "request_history"
+- ``{"type": "pong", "timestamp": ...}``: reply to "ping"
 """
 
 import asyncio
 import json
 import logging
+from collections import deque
 from pathlib import Path
 from typing import Any
 
@@ -18,13 +35,52 @@ from .metrics_collector import MetricsCollector
 logger = logging.getLogger(__name__)
 
 
+def _diff_state(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """Fields of ``new`` that differ from ``old``, recursing into dicts.
+
+    Keys missing from ``new`` are reported as None.
+    """
+    changes: dict[str, Any] = {}
+    for key, value in new.items():
+        previous = old.get(key)
+        if isinstance(value, dict) and isinstance(previous, dict):
+            nested = _diff_state(previous, value)
+            if nested:
+                changes[key] = nested
+        elif key not in old or value != previous:
+            changes[key] = value
+    for key in old.keys() - new.keys():
+        changes[key] = None
+    return changes
+
+
+class _ClientChannel:
+    """Outgoing message queue and delta base for one WebSocket client."""
+
+    __slots__ = ("dropped", "queue", "state", "ws")
+
+    def __init__(self, ws: web.WebSocketResponse) -> None:
+        self.ws = ws
+        self.queue: asyncio.Queue[str] = asyncio.Queue()
+        # Last full state queued for this client; deltas are computed against it
+        self.state: dict[str, Any] | None = None
+        self.dropped = 0
+
+    def send_state(self, state: dict[str, Any]) -> None:
+        """Queue a full state and make it the delta base."""
+        self.queue.put_nowait(json.dumps(state))
+        self.state = state
+
+
 class DashboardServer:
     """WebSocket server for real-time metrics streaming.
 
     This server provides:
     - HTTP endpoint serving the dashboard HTML
     - WebSocket endpoint for real-time metrics streaming
-    - Support for multiple concurrent clients
+    - Support for multiple concurrent clients with per-client send queues
+    - Delta updates against each client's last state
+    - Replay of recent states for late joiners
     - Automatic client management and cleanup
 
     Example:
@@ -40,6 +96,10 @@ class DashboardServer:
         host: Server host address (default: "localhost")
         port: Server port number (default: 8765)
         metrics_collector: Optional MetricsCollector instance
+        tick_interval: Seconds between broadcasts (default: 1.0)
+        history_size: Number of recent states kept for replay (default: 60)
+        client_queue_size: Maximum queued ticks per client before ticks are
+            dropped for it (default: 8)
     """
 
     def __init__(
@@ -47,6 +107,9 @@ class DashboardServer:
         host: str = "localhost",
         port: int = 8765,
         metrics_collector: MetricsCollector | None = None,
+        tick_interval: float = 1.0,
+        history_size: int = 60,
+        client_queue_size: int = 8,
     ) -> None:
         """Initialize the dashboard server.
 
@@ -54,13 +117,20 @@ class DashboardServer:
             host: Server host address
             port: Server port number
             metrics_collector: Optional MetricsCollector instance
+            tick_interval: Seconds between broadcasts
+            history_size: Number of recent states kept for replay
+            client_queue_size: Maximum queued ticks per client
         """
         self.host = host
         self.port = port
         self.collector = metrics_collector or MetricsCollector()
+        self.tick_interval = tick_interval
+        self.client_queue_size = client_queue_size
         self.clients: set[web.WebSocketResponse] = set()
         self.app = web.Application()
         self._setup_routes()
+        self._channels: dict[web.WebSocketResponse, _ClientChannel] = {}
+        self._history: deque[dict[str, Any]] = deque(maxlen=history_size)
         self._broadcast_task: asyncio.Task[None] | None = None
         self._runner: web.AppRunner | None = None
 
@@ -82,14 +152,17 @@ class DashboardServer:
         await ws.prepare(request)
 
         # Add client to set
+        channel = _ClientChannel(ws)
         self.clients.add(ws)
+        self._channels[ws] = channel
+        sender = asyncio.create_task(self._send_loop(channel))
         logger.info(f"Client connected. Total clients: {len(self.clients)}")
 
         try:
-            # Send initial metrics immediately
+            # Send initial metrics immediately, reusing the last tick if there is one
             try:
-                metrics = self.collector.get_latest_metrics()
-                await ws.send_json(metrics)
+                state = self._history[-1] if self._history else self.collector.get_latest_metrics()
+                channel.send_state(state)
             except Exception as e:
                 logger.error(f"Error sending initial metrics: {e}")
 
@@ -109,11 +182,34 @@ class DashboardServer:
         except Exception as e:
             logger.error(f"WebSocket handler error: {e}")
         finally:
-            self.clients.discard(ws)
+            sender.cancel()
+            self._remove_client(ws)
             logger.info(f"Client disconnected. Total clients: {len(self.clients)}")
 
         return ws
 
+    def _remove_client(self, ws: web.WebSocketResponse) -> None:
+        """Forget a client and its queue."""
+        self.clients.discard(ws)
+        self._channels.pop(ws, None)
+
+    async def _send_loop(self, channel: _ClientChannel) -> None:
+        """Send a client's queued messages in order.
+
+        Args:
+            channel: Client to serve
+        """
+        try:
+            while True:
+                message = await channel.queue.get()
+                await channel.ws.send_str(message)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Error sending to client: {e}")
+            self._remove_client(channel.ws)
+            await channel.ws.close()
+
     async def _handle_client_message(self, ws: web.WebSocketResponse, data: dict[str, Any]) -> None:
         """Handle messages from clients.
 
@@ -121,13 +217,22 @@ class DashboardServer:
             ws: WebSocket connection
             data: Message data
         """
+        channel = self._channels.get(ws)
+        if channel is None:
+            return
+
         msg_type = data.get("type")
 
         if msg_type == "ping":
-            await ws.send_json({"type": "pong", "timestamp": data.get("timestamp")})
+            channel.queue.put_nowait(
+                json.dumps({"type": "pong", "timestamp": data.get("timestamp")})
+            )
         elif msg_type == "request_metrics":
-            metrics = self.collector.get_latest_metrics()
-            await ws.send_json(metrics)
+            channel.send_state(self.collector.get_latest_metrics())
+        elif msg_type == "request_history":
+            channel.queue.put_nowait(
+                json.dumps({"type": "history", "samples": list(self._history)})
+            )
 
     async def index_handler(self, request: web.Request) -> web.Response:
         """Serve dashboard HTML.
@@ -280,6 +385,7 @@ class DashboardServer:
                 console.log('Connected to dashboard server');
                 reconnectAttempts = 0;
                 updateConnectionStatus(true);
+                ws.send(JSON.stringify({ type: 'request_history' }));
             };
 
             ws.onclose = () => {
@@ -299,14 +405,47 @@ class DashboardServer:
 
             ws.onmessage = (event) => {
                 try {
-                    const metrics = JSON.parse(event.data);
-                    updateDashboard(metrics);
+                    handleMessage(JSON.parse(event.data));
                 } catch (e) {
                     console.error('Error parsing metrics:', e);
                 }
             };
         }
 
+        // Latest full metrics; deltas from the server are merged into it
+        let state = null;
+
+        function applyDelta(target, changes) {
+            for (const [key, value] of Object.entries(changes)) {
+                const current = target[key];
+                if (value !== null && typeof value === 'object' && !Array.isArray(value) &&
+                    current !== null && typeof current === 'object') {
+                    applyDelta(current, value);
+                } else {
+                    target[key] = value;
+                }
+            }
+            return target;
+        }
+
+        function handleMessage(message) {
+            if (message.type === 'delta') {
+                if (state) {
+                    updateDashboard(applyDelta(state, message.changes));
+                }
+            } else if (message.type === 'history') {
+                // Replay recent samples so late joiners see full charts
+                [systemChart, actionChart, queueChart, errorChart].forEach(chart => {
+                    chart.data.labels = [];
+                    chart.data.datasets.forEach(d => { d.data = []; });
+                });
+                message.samples.forEach(sample => updateDashboard(sample));
+            } else if (!message.type) {
+                state = message;
+                updateDashboard(state);
+            }
+        }
+
         function updateConnectionStatus(connected) {
             const indicator = document.getElementById('connection-status');
             const text = document.getElementById('connection-text');
@@ -483,7 +622,8 @@ class DashboardServer:
             }
 
             // Update charts
-            const now = new Date().toLocaleTimeString();
+            const sampledAt = metrics.system?.timestamp;
+            const now = (sampledAt ? new Date(sampledAt * 1000) : new Date()).toLocaleTimeString();
             const maxPoints = 60; // Keep 60 data points (1 minute at 1s intervals)
 
             // System chart
@@ -536,33 +676,47 @@ class DashboardServer:
 </body>
 </html>"""
 
+    def broadcast_once(self) -> None:
+        """Sample metrics once and queue them for every client.
+
+        Clients sharing a delta base share one serialized message. Clients
+        whose queue already holds ``client_queue_size`` messages skip this
+        tick.
+        """
+        state = self.collector.get_latest_metrics()
+        self._history.append(state)
+
+        # Serialized message per delta base (None for a full state)
+        messages: dict[int | None, str] = {}
+        for channel in list(self._channels.values()):
+            if channel.queue.qsize() >= self.client_queue_size:
+                channel.dropped += 1
+                continue
+
+            base = channel.state
+            key = id(base) if base is not None else None
+            message = messages.get(key)
+            if message is None:
+                if base is None:
+                    message = json.dumps(state)
+                else:
+                    message = json.dumps({"type": "delta", "changes": _diff_state(base, state)})
+                messages[key] = message
+
+            channel.queue.put_nowait(message)
+            channel.state = state
+
     async def broadcast_metrics(self) -> None:
         """Broadcast metrics to all connected clients continuously."""
         while True:
             try:
-                if self.clients:
-                    metrics = self.collector.get_latest_metrics()
-
-                    # Send to all clients
-                    disconnected_clients = set()
-                    for ws in self.clients.copy():
-                        try:
-                            await ws.send_json(metrics)
-                        except ConnectionResetError:
-                            disconnected_clients.add(ws)
-                        except Exception as e:
-                            logger.error(f"Error sending to client: {e}")
-                            disconnected_clients.add(ws)
-
-                    # Remove disconnected clients
-                    self.clients -= disconnected_clients
-
-                await asyncio.sleep(1.0)
+                self.broadcast_once()
+                await asyncio.sleep(self.tick_interval)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in broadcast loop: {e}")
-                await asyncio.sleep(1.0)
+                await asyncio.sleep(self.tick_interval)
 
     async def start_async(self) -> None:
         """Start the dashboard server asynchronously."""
@@ -595,6 +749,7 @@ class DashboardServer:
         for ws in list(self.clients):
             await ws.close()
         self.clients.clear()
+        self._channels.clear()
 
         # Stop web server
         if self._runner:
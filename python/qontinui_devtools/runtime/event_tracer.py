@@ -4,11 +4,51 @@ This module provides comprehensive event tracing capabilities to track events
 from frontend through Tauri, Python, ActionExecutor, and HAL layers.
 """
 
+import sys
 import threading
 import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
+from .sketches import QuantileSketch
+
+# Checkpoint name table shared by all traces: ID -> name and name -> ID
+_checkpoint_names: list[str] = []
+_checkpoint_ids: dict[str, int] = {}
+_checkpoint_names_lock = threading.Lock()
+
+
+def intern_checkpoint_name(name: str) -> int:
+    """Get the ID of a checkpoint name, adding it to the name table if new.
+
+    Names are interned once and never removed, so checkpoint names should
+    come from a small fixed set (not e.g. include an event ID).
+
+    Args:
+        name: Checkpoint name
+
+    Returns:
+        Integer ID usable with ``checkpoint_name``
+    """
+    name_id = _checkpoint_ids.get(name)
+    if name_id is None:
+        with _checkpoint_names_lock:
+            name_id = _checkpoint_ids.get(name)
+            if name_id is None:
+                name_id = len(_checkpoint_names)
+                # Publish the name before its ID so lock-free readers can resolve it
+                _checkpoint_names.append(sys.intern(name))
+                _checkpoint_ids[name] = name_id
+    return name_id
+
+
+def checkpoint_name(name_id: int) -> str:
+    """Get the checkpoint name for an ID from ``intern_checkpoint_name``."""
+    return _checkpoint_names[name_id]
+
 
 @dataclass
 class Checkpoint:
@@ -100,6 +140,225 @@ class EventTrace:
 
         return latencies
 
+    def last_stage(self) -> tuple[str, float] | None:
+        """Get the most recent stage and its latency.
+
+        Returns:
+            Tuple of (stage name, latency), or None with fewer than two checkpoints
+        """
+        if len(self.checkpoints) < 2:
+            return None
+        previous, last = self.checkpoints[-2], self.checkpoints[-1]
+        return f"{previous.name} -> {last.name}", last.timestamp - previous.timestamp
+
+    @property
+    def checkpoint_count(self) -> int:
+        """Number of checkpoints recorded."""
+        return len(self.checkpoints)
+
+    @property
+    def first_timestamp(self) -> float | None:
+        """Timestamp of the first checkpoint (None if there are none)."""
+        return self.checkpoints[0].timestamp if self.checkpoints else None
+
+    def checkpoint_columns(self) -> tuple[array, array]:
+        """Get the checkpoints as columns for vectorized analysis.
+
+        Returns:
+            Tuple of (name IDs from ``intern_checkpoint_name``, timestamps)
+        """
+        names = array("I", [intern_checkpoint_name(c.name) for c in self.checkpoints])
+        timestamps = array("d", [c.timestamp for c in self.checkpoints])
+        return names, timestamps
+
+
+class CompactEventTrace:
+    """Trace of a single event, stored as columns instead of objects.
+
+    A drop-in replacement for ``EventTrace`` that keeps checkpoints in
+    typed arrays: interned name IDs, timestamps and thread IDs. Metadata is
+    stored only for checkpoints that have some. A checkpoint costs about 20
+    bytes instead of several hundred for a ``Checkpoint`` with its empty
+    metadata dict, which matters when tracing millions of events.
+
+    ``checkpoints`` builds ``Checkpoint`` objects on demand, so code written
+    against ``EventTrace`` keeps working; analysis code should prefer
+    ``checkpoint_columns``.
+    """
+
+    __slots__ = (
+        "event_id",
+        "event_type",
+        "created_at",
+        "completed",
+        "total_latency",
+        "_names",
+        "_timestamps",
+        "_thread_ids",
+        "_metadata",
+    )
+
+    def __init__(
+        self,
+        event_id: str,
+        event_type: str,
+        created_at: float,
+        completed: bool = False,
+        total_latency: float = 0.0,
+    ) -> None:
+        """Initialize the trace.
+
+        Args:
+            event_id: Unique event identifier
+            event_type: Type of event (e.g., "click", "keypress")
+            created_at: Creation time (seconds since the epoch)
+            completed: Whether the event has completed
+            total_latency: Latency from the first checkpoint in seconds
+        """
+        self.event_id = event_id
+        self.event_type = event_type
+        self.created_at = created_at
+        self.completed = completed
+        self.total_latency = total_latency
+        self._names = array("I")
+        self._timestamps = array("d")
+        self._thread_ids = array("Q")
+        self._metadata: dict[int, dict[str, Any]] | None = None
+
+    def add_checkpoint(
+        self, name: str, timestamp: float | None = None, metadata: dict[str, Any] | None = None
+    ) -> None:
+        """Add a checkpoint to the trace.
+
+        Args:
+            name: Checkpoint name (e.g., "frontend_emit", "tauri_receive")
+            timestamp: Optional timestamp (defaults to current time)
+            metadata: Optional metadata dictionary
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        if metadata:
+            if self._metadata is None:
+                self._metadata = {}
+            self._metadata[len(self._names)] = metadata
+
+        # Timestamps go last: their length is the published checkpoint count
+        self._names.append(intern_checkpoint_name(name))
+        self._thread_ids.append(threading.get_ident())
+        self._timestamps.append(timestamp)
+
+        # Update total latency
+        if len(self._timestamps) > 1:
+            self.total_latency = timestamp - self._timestamps[0]
+
+    @property
+    def checkpoints(self) -> list[Checkpoint]:
+        """Checkpoints as objects (built on each access)."""
+        metadata = self._metadata or {}
+        return [
+            Checkpoint(
+                name=_checkpoint_names[name_id],
+                timestamp=timestamp,
+                metadata=metadata.get(i, {}),
+                thread_id=thread_id,
+            )
+            for i, (name_id, timestamp, thread_id) in enumerate(
+                zip(self._names, self._timestamps, self._thread_ids, strict=False)
+            )
+        ]
+
+    def last_stage(self) -> tuple[str, float] | None:
+        """Get the most recent stage and its latency.
+
+        Returns:
+            Tuple of (stage name, latency), or None with fewer than two checkpoints
+        """
+        n = len(self._timestamps)
+        if n < 2:
+            return None
+        stage = (
+            f"{_checkpoint_names[self._names[n - 2]]} -> {_checkpoint_names[self._names[n - 1]]}"
+        )
+        return stage, self._timestamps[n - 1] - self._timestamps[n - 2]
+
+    @property
+    def checkpoint_count(self) -> int:
+        """Number of checkpoints recorded."""
+        return len(self._timestamps)
+
+    @property
+    def first_timestamp(self) -> float | None:
+        """Timestamp of the first checkpoint (None if there are none)."""
+        return self._timestamps[0] if self._timestamps else None
+
+    def checkpoint_columns(self) -> tuple[array, array]:
+        """Get the checkpoints as columns for vectorized analysis.
+
+        Returns:
+            Tuple of (name IDs from ``intern_checkpoint_name``, timestamps)
+        """
+        count = len(self._timestamps)
+        return self._names[:count], self._timestamps[:count]
+
+    def get_latency(self, from_checkpoint: str, to_checkpoint: str) -> float:
+        """Get latency between two checkpoints.
+
+        Args:
+            from_checkpoint: Starting checkpoint name
+            to_checkpoint: Ending checkpoint name
+
+        Returns:
+            Latency in seconds
+
+        Raises:
+            ValueError: If checkpoints not found
+        """
+        from_id = _checkpoint_ids.get(from_checkpoint)
+        to_id = _checkpoint_ids.get(to_checkpoint)
+        from_idx = None
+        to_idx = None
+
+        for i, name_id in enumerate(self._names):
+            if name_id == from_id:
+                from_idx = i
+            if name_id == to_id:
+                to_idx = i
+
+        if from_idx is None:
+            raise ValueError(f"Checkpoint not found: {from_checkpoint}")
+        if to_idx is None:
+            raise ValueError(f"Checkpoint not found: {to_checkpoint}")
+        if to_idx <= from_idx:
+            raise ValueError("to_checkpoint must come after from_checkpoint")
+
+        return self._timestamps[to_idx] - self._timestamps[from_idx]
+
+    def get_stage_latencies(self) -> dict[str, float]:
+        """Get latencies between consecutive checkpoints.
+
+        Returns:
+            Dictionary mapping stage names to latencies
+        """
+        names = self._names
+        timestamps = self._timestamps
+        return {
+            f"{_checkpoint_names[names[i]]} -> {_checkpoint_names[names[i + 1]]}": (
+                timestamps[i + 1] - timestamps[i]
+            )
+            for i in range(len(names) - 1)
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactEventTrace(event_id={self.event_id!r}, event_type={self.event_type!r}, "
+            f"checkpoints={self.checkpoint_count}, completed={self.completed})"
+        )
+
+
+# Either trace storage, as returned by EventTracer
+AnyEventTrace = EventTrace | CompactEventTrace
+
 
 @dataclass
 class EventFlow:
@@ -121,6 +380,26 @@ class EventTracer:
     This class provides thread-safe event tracing with checkpoint recording,
     latency measurement, and flow analysis.
 
+    With ``compact=True`` traces are ``CompactEventTrace`` instances, which
+    store checkpoints in typed arrays and cut tracing memory by an order of
+    magnitude for long soak runs.
+
+    Stage latencies and total event latencies are also fed into quantile
+    sketches as they are recorded (``get_stage_sketches`` and
+    ``get_latency_sketch``). The sketches cover every event since the tracer
+    was created or cleared, including evicted ones, use bounded memory, and
+    answer percentile queries without sorting.
+
+    Traces are kept in insertion order, so evicting the oldest trace when the
+    tracer is full is O(1). Only starting and evicting traces takes the
+    tracer-wide lock. Checkpoints, the hot path, look the trace up without
+    it and take one of ``lock_stripes`` striped locks chosen by event ID, so
+    workers recording different events rarely contend.
+
+    Completion listeners (``add_completion_listener``) are called with each
+    trace as it completes; ``BackgroundTraceExporter`` uses one to stream
+    traces to disk while recording.
+
     Common checkpoint names:
         - "frontend_emit": Event emitted from frontend
         - "tauri_receive": Received by Tauri
@@ -144,22 +423,40 @@ class EventTracer:
         >>> print(f"Avg latency: {flow.avg_latency:.3f}s")
     """
 
-    def __init__(self, max_traces: int = 10000, enable_metadata: bool = True) -> None:
+    def __init__(
+        self,
+        max_traces: int = 10000,
+        enable_metadata: bool = True,
+        lock_stripes: int = 16,
+        compact: bool = False,
+    ) -> None:
         """Initialize event tracer.
 
         Args:
             max_traces: Maximum number of traces to keep in memory
             enable_metadata: Whether to collect metadata
+            lock_stripes: Number of locks guarding checkpoint updates
+                (rounded up to a power of two)
+            compact: Whether to store traces as ``CompactEventTrace``
         """
-        self._traces: dict[str, EventTrace] = {}
+        self._traces: OrderedDict[str, AnyEventTrace] = OrderedDict()
+        self._trace_class = CompactEventTrace if compact else EventTrace
         self._lock = threading.Lock()
+        stripes = 1 << max(0, lock_stripes - 1).bit_length()
+        self._stripes = [threading.Lock() for _ in range(stripes)]
+        self._stripe_mask = stripes - 1
+        # Per-stripe sketches, updated under the stripe lock and merged on read
+        self._stage_sketches: list[dict[str, QuantileSketch]] = [{} for _ in range(stripes)]
+        self._latency_sketches = [QuantileSketch() for _ in range(stripes)]
         self._max_traces = max_traces
         self._enable_metadata = enable_metadata
+        # Replaced rather than mutated, so complete_trace reads it without a lock
+        self._completion_listeners: tuple[Callable[[AnyEventTrace], None], ...] = ()
         self._running = True  # Tracer is active once instantiated
 
     def start_trace(
         self, event_id: str, event_type: str, metadata: dict[str, Any] | None = None
-    ) -> EventTrace:
+    ) -> AnyEventTrace:
         """Start tracing an event.
 
         Args:
@@ -170,21 +467,48 @@ class EventTracer:
         Returns:
             EventTrace instance
         """
+        trace = self._new_trace(event_id, event_type, metadata)
+
         with self._lock:
-            # Evict oldest trace if at capacity
-            if len(self._traces) >= self._max_traces:
-                oldest_id = min(self._traces.keys(), key=lambda k: self._traces[k].created_at)
-                del self._traces[oldest_id]
+            # A restarted event becomes the newest trace
+            if self._traces.pop(event_id, None) is None:
+                self._evict_for_new_trace()
+            self._traces[event_id] = trace
 
-            trace = EventTrace(event_id=event_id, event_type=event_type, created_at=time.time())
+        return trace
 
-            self._traces[event_id] = trace
+    def _new_trace(
+        self, event_id: str, event_type: str, metadata: dict[str, Any] | None
+    ) -> AnyEventTrace:
+        """Build a trace with its initial checkpoint, before it is visible."""
+        trace = self._trace_class(event_id=event_id, event_type=event_type, created_at=time.time())
+        if self._enable_metadata:
+            trace.add_checkpoint("trace_start", metadata=metadata)
+        return trace
+
+    def _evict_for_new_trace(self) -> None:
+        """Evict oldest traces if at capacity. Caller holds ``_lock``."""
+        while self._traces and len(self._traces) >= self._max_traces:
+            self._traces.popitem(last=False)
 
-            # Add initial checkpoint with metadata
-            if self._enable_metadata:
-                trace.add_checkpoint("trace_start", metadata=metadata)
+    def _get_or_start(self, event_id: str) -> AnyEventTrace:
+        """Get an event's trace, starting an "unknown" one if there is none.
 
-            return trace
+        Unlike ``start_trace``, never replaces a trace that another thread
+        started in the meantime.
+        """
+        trace = self._new_trace(event_id, "unknown", None)
+        with self._lock:
+            existing = self._traces.get(event_id)
+            if existing is not None:
+                return existing
+            self._evict_for_new_trace()
+            self._traces[event_id] = trace
+        return trace
+
+    def _stripe(self, event_id: str) -> int:
+        """Get the index of the lock guarding updates to an event's trace."""
+        return hash(event_id) & self._stripe_mask
 
     def checkpoint(
         self, event_id: str, checkpoint_name: str, metadata: dict[str, Any] | None = None
@@ -196,17 +520,28 @@ class EventTracer:
             checkpoint_name: Name of the checkpoint
             metadata: Optional metadata dictionary
         """
-        with self._lock:
-            trace = self._traces.get(event_id)
-            if trace is None:
-                # Auto-create trace if not found
-                trace = self.start_trace(event_id, "unknown")
-
+        # Single dict lookups are atomic, so the hot path skips the global lock
+        trace = self._traces.get(event_id)
+        if trace is None:
+            # Auto-create trace if not found
+            trace = self._get_or_start(event_id)
+
+        stripe = self._stripe(event_id)
+        with self._stripes[stripe]:
             trace.add_checkpoint(
                 checkpoint_name, metadata=metadata if self._enable_metadata else None
             )
 
-    def complete_trace(self, event_id: str) -> EventTrace:
+            stage = trace.last_stage()
+            if stage is not None:
+                stage_name, latency = stage
+                sketches = self._stage_sketches[stripe]
+                sketch = sketches.get(stage_name)
+                if sketch is None:
+                    sketch = sketches[stage_name] = QuantileSketch()
+                sketch.add(latency)
+
+    def complete_trace(self, event_id: str) -> AnyEventTrace:
         """Mark event as completed.
 
         Args:
@@ -218,20 +553,52 @@ class EventTracer:
         Raises:
             KeyError: If event not found
         """
-        with self._lock:
-            trace = self._traces.get(event_id)
-            if trace is None:
-                raise KeyError(f"Trace not found: {event_id}")
+        trace = self._traces.get(event_id)
+        if trace is None:
+            raise KeyError(f"Trace not found: {event_id}")
 
+        stripe = self._stripe(event_id)
+        with self._stripes[stripe]:
             trace.completed = True
 
             # Update total latency
-            if trace.checkpoints:
-                trace.total_latency = time.time() - trace.checkpoints[0].timestamp
+            first_timestamp = trace.first_timestamp
+            if first_timestamp is not None:
+                trace.total_latency = time.time() - first_timestamp
+                self._latency_sketches[stripe].add(trace.total_latency)
+
+        for listener in self._completion_listeners:
+            listener(trace)
+
+        return trace
+
+    def add_completion_listener(self, listener: Callable[[AnyEventTrace], None]) -> None:
+        """Register a callback to run with each trace when it completes.
+
+        Listeners run on the thread calling ``complete_trace``, so they
+        should hand the trace off rather than do slow work.
+
+        Args:
+            listener: Callable taking the completed trace
+        """
+        with self._lock:
+            self._completion_listeners = (*self._completion_listeners, listener)
+
+    def remove_completion_listener(self, listener: Callable[[AnyEventTrace], None]) -> None:
+        """Unregister a callback added with ``add_completion_listener``.
+
+        Args:
+            listener: Callable to remove
 
-            return trace
+        Raises:
+            ValueError: If the listener is not registered
+        """
+        with self._lock:
+            listeners = list(self._completion_listeners)
+            listeners.remove(listener)
+            self._completion_listeners = tuple(listeners)
 
-    def get_trace(self, event_id: str) -> EventTrace | None:
+    def get_trace(self, event_id: str) -> AnyEventTrace | None:
         """Get trace by ID.
 
         Args:
@@ -240,10 +607,9 @@ class EventTracer:
         Returns:
             EventTrace or None if not found
         """
-        with self._lock:
-            return self._traces.get(event_id)
+        return self._traces.get(event_id)
 
-    def get_all_traces(self) -> list[EventTrace]:
+    def get_all_traces(self) -> list[AnyEventTrace]:
         """Get all traces.
 
         Returns:
@@ -258,6 +624,8 @@ class EventTracer:
         Returns:
             EventFlow analysis
         """
+        from .latency_analyzer import stage_statistics
+
         with self._lock:
             traces = list(self._traces.values())
 
@@ -292,18 +660,9 @@ class EventTracer:
             p95_latency = 0.0
             p99_latency = 0.0
 
-        # Aggregate stage latencies
-        stage_latencies: dict[str, list[float]] = {}
-
-        for trace in traces:
-            for stage, latency in trace.get_stage_latencies().items():
-                if stage not in stage_latencies:
-                    stage_latencies[stage] = []
-                stage_latencies[stage].append(latency)
-
-        # Calculate average stage latencies
+        # Average stage latencies, computed over checkpoint columns
         avg_stage_latencies = {
-            stage: sum(lats) / len(lats) for stage, lats in stage_latencies.items()
+            stage: stats["mean"] for stage, stats in stage_statistics(traces).items()
         }
 
         # Find bottleneck
@@ -322,7 +681,7 @@ class EventTracer:
             stage_latencies=avg_stage_latencies,
         )
 
-    def find_lost_events(self, timeout: float = 5.0) -> list[EventTrace]:
+    def find_lost_events(self, timeout: float = 5.0) -> list[AnyEventTrace]:
         """Find events that didn't complete within timeout.
 
         Args:
@@ -332,34 +691,76 @@ class EventTracer:
             List of lost EventTrace instances
         """
         with self._lock:
-            current_time = time.time()
-            lost_traces: list[Any] = []
+            traces = list(self._traces.values())
 
-            for trace in self._traces.values():
-                if not trace.completed:
-                    age = current_time - trace.created_at
-                    if age > timeout:
-                        lost_traces.append(trace)
+        current_time = time.time()
+        lost_traces: list[Any] = []
 
-            return lost_traces
+        for trace in traces:
+            if not trace.completed:
+                age = current_time - trace.created_at
+                if age > timeout:
+                    lost_traces.append(trace)
+
+        return lost_traces
 
     def export_trace_timeline(self, output_path: str) -> None:
         """Export timeline visualization (Chrome trace format).
 
+        Traces are streamed to the file one at a time. Paths ending in
+        ``.perfetto-trace`` or ``.pftrace`` are written in Perfetto's
+        protobuf format instead.
+
         Args:
             output_path: Output file path
         """
-        from .timeline import export_chrome_trace
+        from .trace_writer import open_trace_writer
 
         with self._lock:
             traces = list(self._traces.values())
 
-        export_chrome_trace(traces, output_path)
+        with open_trace_writer(output_path) as writer:
+            writer.write_traces(traces)
+
+    def get_stage_sketches(self) -> dict[str, QuantileSketch]:
+        """Get quantile sketches of every stage's latency.
+
+        Returns:
+            Dictionary mapping stage names to sketches (merged copies)
+
+        Example:
+            >>> p99 = tracer.get_stage_sketches()["frontend_emit -> tauri_receive"].percentile(99)
+        """
+        merged: dict[str, QuantileSketch] = {}
+        for lock, sketches in zip(self._stripes, self._stage_sketches, strict=True):
+            with lock:
+                for stage, sketch in sketches.items():
+                    if stage in merged:
+                        merged[stage].merge(sketch)
+                    else:
+                        merged[stage] = sketch.copy()
+        return merged
+
+    def get_latency_sketch(self) -> QuantileSketch:
+        """Get a quantile sketch of the total latency of completed events.
+
+        Returns:
+            Merged copy of the per-stripe sketches
+        """
+        merged = QuantileSketch()
+        for lock, sketch in zip(self._stripes, self._latency_sketches, strict=True):
+            with lock:
+                merged.merge(sketch)
+        return merged
 
     def clear(self) -> None:
-        """Clear all traces."""
+        """Clear all traces and latency sketches."""
         with self._lock:
             self._traces.clear()
+        for i, lock in enumerate(self._stripes):
+            with lock:
+                self._stage_sketches[i] = {}
+                self._latency_sketches[i] = QuantileSketch()
 
     def start(self) -> None:
         """Start the tracer (for compatibility with tests).
@@ -385,7 +786,7 @@ class EventTracer:
         event_id = f"event_{time.time()}_{threading.get_ident()}"
         self.start_trace(event_id, event_name, metadata)
 
-    def get_events(self) -> list[EventTrace]:
+    def get_events(self) -> list[AnyEventTrace]:
         """Get all events (for compatibility with tests).
 
         Returns:
@@ -408,15 +809,18 @@ class EventTracer:
             Dictionary with statistics
         """
         with self._lock:
-            return {
-                "total_traces": len(self._traces),
-                "max_traces": self._max_traces,
-                "enable_metadata": self._enable_metadata,
-                "memory_usage_bytes": sum(
-                    len(trace.checkpoints) * 100  # Rough estimate
-                    for trace in self._traces.values()
-                ),
-            }
+            traces = list(self._traces.values())
+
+        compact = self._trace_class is CompactEventTrace
+        checkpoint_size = 20 if compact else 100  # Rough estimate
+        return {
+            "total_traces": len(traces),
+            "max_traces": self._max_traces,
+            "enable_metadata": self._enable_metadata,
+            "lock_stripes": len(self._stripes),
+            "compact": compact,
+            "memory_usage_bytes": sum(trace.checkpoint_count for trace in traces) * checkpoint_size,
+        }
 
     @property
     def is_running(self) -> bool:
@@ -1,16 +1,315 @@
 """Flame graph generation for performance profiling.
 
 This module provides utilities for generating flame graphs from stack samples,
-supporting both SVG (static) and speedscope JSON (interactive) formats.
+supporting SVG (static), speedscope JSON (interactive) and collapsed-stack
+text formats.
+
+A stack sample is a ``(timestamp, frames)`` tuple whose frames are listed from
+the outermost call to the innermost, as recorded by ``StackSampler``.
+
+Samples are first aggregated into a ``StackTrie`` (``aggregate_stacks``),
+which stores every distinct call path once with its sample count. All
+outputs are generated from the trie, so their size and generation time
+depend on the number of distinct stacks rather than on the number of
+samples, which reaches millions for an hour at 1 kHz. Frames narrower than
+``min_width`` pixels are pruned while rendering, so an SVG only ever
+contains frames that can be seen.
+
+The trie also reads and writes Brendan Gregg's collapsed-stack format
+(``a;b;c 42`` per line), used by ``flamegraph.pl``, ``inferno`` and most
+profilers, and two tries can be compared in a differential flame graph.
+
+Example:
+    >>> trie = aggregate_stacks(profile.stack_samples)
+    >>> trie.write_collapsed("action.folded")
+    >>> baseline = StackTrie.read_collapsed("baseline.folded")
+    >>> svg = differential_svg(baseline, trie)
 """
 
 import json
-from collections import defaultdict
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from html import escape
+from pathlib import Path
 from typing import Any
 
+StackSamples = list[tuple[float, list[str]]]
+
+
+class StackTrie(Mapping[tuple[str, ...], int]):
+    """Sample counts aggregated by call path.
+
+    Each node is a frame under its caller and holds the number of samples
+    whose stack ends there (self count) and the number whose stack passes
+    through it (total count). Nodes live in parallel arrays indexed by node
+    ID, with node 0 as the root.
+
+    As a mapping, the trie maps each distinct sampled stack to its count,
+    like the dictionary ``aggregate_stacks`` used to return.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty trie."""
+        self._names: list[str] = [""]
+        self._parents = array("i", [-1])
+        self._children: list[dict[str, int] | None] = [None]
+        self._self = array("q", [0])
+        self._total = array("q", [0])
+        self._distinct = 0
+
+    @classmethod
+    def from_samples(cls, stack_samples: Iterable[tuple[float, Sequence[str]]]) -> "StackTrie":
+        """Build a trie from ``(timestamp, stack)`` samples.
+
+        Args:
+            stack_samples: Stack samples, e.g. from ``StackSampler``
+
+        Returns:
+            New trie
+        """
+        trie = cls()
+        trie.add_samples(stack_samples)
+        return trie
+
+    @property
+    def total(self) -> int:
+        """Total number of samples."""
+        return self._total[0]
+
+    @property
+    def node_count(self) -> int:
+        """Number of frames in the trie, excluding the root."""
+        return len(self._names) - 1
+
+    def add(self, stack: Sequence[str], count: int = 1) -> None:
+        """Add samples of one stack.
+
+        Args:
+            stack: Frames from the outermost call to the innermost
+            count: Number of samples
+
+        Raises:
+            ValueError: If count is not positive
+        """
+        if count < 1:
+            raise ValueError(f"count must be positive, got {count}")
+
+        node = 0
+        self._total[0] += count
+        for frame in stack:
+            children = self._children[node]
+            if children is None:
+                children = self._children[node] = {}
+            child = children.get(frame)
+            if child is None:
+                child = children[frame] = self._add_node(frame, node)
+            self._total[child] += count
+            node = child
+
+        if self._self[node] == 0:
+            self._distinct += 1
+        self._self[node] += count
+
+    def _add_node(self, name: str, parent: int) -> int:
+        self._names.append(name)
+        self._parents.append(parent)
+        self._children.append(None)
+        self._self.append(0)
+        self._total.append(0)
+        return len(self._names) - 1
+
+    def add_samples(self, stack_samples: Iterable[tuple[float, Sequence[str]]]) -> None:
+        """Add ``(timestamp, stack)`` samples.
+
+        Identical stacks are counted first (hashing in C), so each distinct
+        stack is walked into the trie once.
+
+        Args:
+            stack_samples: Stack samples, e.g. from ``StackSampler``
+        """
+        for stack, count in Counter(tuple(stack) for _, stack in stack_samples).items():
+            self.add(stack, count)
+
+    def merge(self, other: "StackTrie") -> None:
+        """Add all samples of another trie to this one.
+
+        Args:
+            other: Trie to merge in
+        """
+        for stack, count in other.items():
+            self.add(stack, count)
+
+    def _stack(self, node: int) -> tuple[str, ...]:
+        """Frames from the root to a node."""
+        frames: list[str] = []
+        while node > 0:
+            frames.append(self._names[node])
+            node = self._parents[node]
+        frames.reverse()
+        return tuple(frames)
+
+    def _find(self, stack: Sequence[str]) -> int | None:
+        """Node ID of a stack, or None if it was never sampled."""
+        node = 0
+        for frame in stack:
+            children = self._children[node]
+            child = children.get(frame) if children is not None else None
+            if child is None:
+                return None
+            node = child
+        return node
+
+    def __getitem__(self, stack: tuple[str, ...]) -> int:
+        node = self._find(stack)
+        if node is None or self._self[node] == 0:
+            raise KeyError(stack)
+        return self._self[node]
+
+    def __iter__(self) -> Iterator[tuple[str, ...]]:
+        for node in range(len(self._names)):
+            if self._self[node]:
+                yield self._stack(node)
+
+    def __len__(self) -> int:
+        return self._distinct
+
+    def inclusive(self, stack: Sequence[str]) -> int:
+        """Get the number of samples whose stack starts with ``stack``.
+
+        Args:
+            stack: Frames from the outermost call
+
+        Returns:
+            Sample count (0 if the path was never sampled)
+        """
+        node = self._find(stack)
+        return 0 if node is None else self._total[node]
+
+    def prune(self, min_fraction: float) -> "StackTrie":
+        """Get a copy without frames below a share of all samples.
+
+        The samples of a removed frame are kept as self samples of its
+        nearest remaining caller, so totals and the width of every
+        remaining frame are unchanged.
+
+        Args:
+            min_fraction: Minimum share of all samples a frame must have
+                (e.g. 0.001 for 0.1%)
+
+        Returns:
+            Pruned trie
+        """
+        threshold = min_fraction * self.total
+        pruned = StackTrie()
+        pending = [0]
+        while pending:
+            node = pending.pop()
+            folded = self._self[node]
+            for child in (self._children[node] or {}).values():
+                if self._total[child] >= threshold:
+                    pending.append(child)
+                else:
+                    folded += self._total[child]
+            if folded:
+                pruned.add(self._stack(node), folded)
+        return pruned
+
+    def to_collapsed(self) -> Iterator[str]:
+        """Yield the trie in collapsed-stack format, one stack per line.
+
+        Semicolons inside frame names are replaced with commas, since the
+        format uses them as separators.
+
+        Yields:
+            Lines like ``main;run;step 42`` (without newlines)
+        """
+        for stack, count in self.items():
+            yield ";".join(frame.replace(";", ",") for frame in stack) + f" {count}"
+
+    def write_collapsed(self, path: str | Path) -> None:
+        """Write the trie to a collapsed-stack file.
+
+        Args:
+            path: Output file path (conventionally ``.folded`` or ``.collapsed``)
+        """
+        with open(path, "w") as f:
+            for line in self.to_collapsed():
+                f.write(line + "\n")
+
+    @classmethod
+    def from_collapsed(cls, lines: Iterable[str]) -> "StackTrie":
+        """Build a trie from collapsed-stack lines.
+
+        Blank lines are skipped. Repeated stacks are summed.
+
+        Args:
+            lines: Lines like ``main;run;step 42``
+
+        Returns:
+            New trie
+
+        Raises:
+            ValueError: If a line has no valid sample count
+        """
+        trie = cls()
+        for line_number, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line:
+                continue
+            frames, _, count = line.rpartition(" ")
+            try:
+                trie.add(frames.split(";") if frames else (), int(count))
+            except ValueError as e:
+                raise ValueError(f"Invalid collapsed stack on line {line_number}: {line!r}") from e
+        return trie
+
+    @classmethod
+    def read_collapsed(cls, path: str | Path) -> "StackTrie":
+        """Read a trie from a collapsed-stack file.
+
+        Args:
+            path: File written by ``write_collapsed`` or another profiler
+
+        Returns:
+            New trie
+        """
+        with open(path) as f:
+            return cls.from_collapsed(f)
+
+    def _walk(self, min_count: float) -> Iterator[tuple[int, int, int]]:
+        """Visit nodes depth-first in name order, skipping narrow subtrees.
+
+        Yields:
+            (node, depth, offset) tuples, where depth starts at 1 for root
+            frames and offset is the number of samples to the left
+        """
+        pending = [(0, 0, 0)]
+        while pending:
+            node, depth, offset = pending.pop()
+            if node:
+                yield node, depth, offset
+            children = self._children[node]
+            if not children:
+                continue
+            visible: list[tuple[int, int, int]] = []
+            for name in sorted(children):
+                child = children[name]
+                if self._total[child] >= min_count:
+                    visible.append((child, depth + 1, offset))
+                offset += self._total[child]
+            pending.extend(reversed(visible))
+
+
+def _as_trie(stack_samples: "StackSamples | StackTrie") -> StackTrie:
+    """Get a trie for samples or a trie."""
+    if isinstance(stack_samples, StackTrie):
+        return stack_samples
+    return StackTrie.from_samples(stack_samples)
+
 
 def generate_flame_graph(
-    stack_samples: list[tuple[float, list[str]]],
+    stack_samples: "StackSamples | StackTrie",
     output_path: str,
     title: str = "Action Profile",
     format: str = "svg",
@@ -18,43 +317,52 @@ def generate_flame_graph(
     """Generate flame graph from stack samples.
 
     Args:
-        stack_samples: List of (timestamp, stack_frames) tuples
+        stack_samples: List of (timestamp, stack_frames) tuples, or a StackTrie
         output_path: Path to save the output file
         title: Title for the flame graph
-        format: Output format - "svg" for static SVG or "json" for speedscope format
+        format: Output format - "svg" for static SVG, "json" for speedscope
+            format or "collapsed" for collapsed stacks
 
     Raises:
         ValueError: If format is not supported or samples are empty
     """
-    if not stack_samples:
+    trie = _as_trie(stack_samples)
+    if not trie.total:
         raise ValueError("Cannot generate flame graph from empty samples")
 
     if format == "json":
-        data = samples_to_speedscope(stack_samples, title)
+        data = samples_to_speedscope(trie, title)
         with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+            json.dump(data, f)
     elif format == "svg":
-        svg_content = samples_to_svg(stack_samples, title)
+        svg_content = samples_to_svg(trie, title)
         with open(output_path, "w") as f:
             f.write(svg_content)
+    elif format == "collapsed":
+        trie.write_collapsed(output_path)
     else:
-        raise ValueError(f"Unsupported format: {format}. Use 'svg' or 'json'")
+        raise ValueError(f"Unsupported format: {format}. Use 'svg', 'json' or 'collapsed'")
 
 
 def samples_to_speedscope(
-    stack_samples: list[tuple[float, list[str]]], name: str = "Profile"
+    stack_samples: "StackSamples | StackTrie", name: str = "Profile"
 ) -> dict[str, Any]:
     """Convert stack samples to speedscope JSON format.
 
     Speedscope (https://www.speedscope.app/) is an interactive flame graph visualizer.
 
+    The profile lists each distinct stack once, weighted by its sample
+    count, so the sample order (speedscope's time order view) is not kept.
+
     Args:
-        stack_samples: List of (timestamp, stack_frames) tuples
+        stack_samples: List of (timestamp, stack_frames) tuples, or a StackTrie
         name: Profile name
 
     Returns:
         Dictionary in speedscope format
     """
+    trie = _as_trie(stack_samples)
+
     # Build frame index
     frames: list[str] = []
     frame_index: dict[str, int] = {}
@@ -65,19 +373,12 @@ def samples_to_speedscope(
             frames.append(frame)
         return frame_index[frame]
 
-    # Convert samples to speedscope format
-    events: list[dict[str, Any]] = []
-    start_time = stack_samples[0][0] if stack_samples else 0.0
-
-    for timestamp, stack in stack_samples:
-        relative_time = timestamp - start_time
-        # Convert to microseconds for speedscope
-        time_us = int(relative_time * 1_000_000)
-
-        # Add stack frames (reversed - deepest first for speedscope)
-        frame_indices = [get_frame_index(frame) for frame in reversed(stack)]
-
-        events.append({"type": "O", "at": time_us, "frame": frame_indices[-1]})
+    samples: list[list[int]] = []
+    weights: list[int] = []
+    for stack, count in trie.items():
+        # Stacks are listed from the outermost frame to the innermost
+        samples.append([get_frame_index(frame) for frame in stack])
+        weights.append(count)
 
     # Build speedscope profile
     speedscope_data = {
@@ -88,13 +389,11 @@ def samples_to_speedscope(
             {
                 "type": "sampled",
                 "name": name,
-                "unit": "microseconds",
+                "unit": "none",
                 "startValue": 0,
-                "endValue": (
-                    int((stack_samples[-1][0] - start_time) * 1_000_000) if stack_samples else 0
-                ),
-                "samples": [[get_frame_index(f) for f in reversed(s)] for _, s in stack_samples],
-                "weights": [1] * len(stack_samples),
+                "endValue": trie.total,
+                "samples": samples,
+                "weights": weights,
             }
         ],
     }
@@ -102,116 +401,184 @@ def samples_to_speedscope(
     return speedscope_data
 
 
+# Color palette
+_COLORS = [
+    "#e74c3c",
+    "#3498db",
+    "#2ecc71",
+    "#f39c12",
+    "#9b59b6",
+    "#1abc9c",
+    "#e67e22",
+    "#34495e",
+]
+
+_FRAME_HEIGHT = 20
+
+
+def _render_svg(
+    trie: StackTrie,
+    title: str,
+    width: int,
+    height: int,
+    min_width: float,
+    color: Any,
+) -> str:
+    """Render a trie as SVG, with ``color(node, frame_name)`` choosing fills."""
+    if not trie.total:
+        return _generate_empty_svg(title, width, height)
+
+    scale = width / trie.total
+    frames = list(trie._walk(min_width / scale))
+    max_depth = max((depth for _, depth, _ in frames), default=0)
+
+    # Root frames at the bottom, callees stacked above their callers
+    svg_height = max_depth * _FRAME_HEIGHT + 100  # Extra for title and padding
+
+    svg_parts = [
+        f'<svg width="{width}" height="{svg_height}" xmlns="http://www.w3.org/2000/svg">',
+        f'<text x="{width/2}" y="30" text-anchor="middle" font-size="18" font-weight="bold">'
+        f"{escape(title)}</text>",
+        '<g transform="translate(0, 50)">',
+    ]
+
+    for node, depth, offset in frames:
+        frame_name = trie._names[node]
+        count = trie._total[node]
+        x = offset * scale
+        frame_width = count * scale
+        y = svg_height - 100 - (depth - 1) * _FRAME_HEIGHT
+
+        # Truncate frame name if too long
+        display_name = frame_name
+        if frame_width < 100:
+            display_name = frame_name[: int(frame_width / 8)]
+            if len(display_name) < len(frame_name):
+                display_name += "..."
+
+        percent = count / trie.total * 100
+        svg_parts.extend(
+            [
+                f"<g><title>{escape(frame_name)} ({count} samples, {percent:.2f}%)</title>",
+                f'<rect x="{x}" y="{y}" width="{frame_width}" height="{_FRAME_HEIGHT}" '
+                f'fill="{color(node, frame_name)}" stroke="white" stroke-width="0.5"/>',
+                f'<text x="{x + 2}" y="{y + _FRAME_HEIGHT - 5}" '
+                f'font-size="11" fill="white" font-family="monospace">{escape(display_name)}'
+                "</text></g>",
+            ]
+        )
+
+    svg_parts.extend(["</g>", "</svg>"])
+
+    return "\n".join(svg_parts)
+
+
 def samples_to_svg(
-    stack_samples: list[tuple[float, list[str]]],
+    stack_samples: "StackSamples | StackTrie",
     title: str = "Flame Graph",
     width: int = 1200,
     height: int = 800,
+    min_width: float = 1.0,
 ) -> str:
     """Generate SVG flame graph from stack samples.
 
     This creates a simplified flame graph representation. For production use,
     consider using dedicated libraries like py-flame-graph or Brendan Gregg's
-    FlameGraph tool.
+    FlameGraph tool (fed with ``StackTrie.write_collapsed`` output).
 
     Args:
-        stack_samples: List of (timestamp, stack_frames) tuples
+        stack_samples: List of (timestamp, stack_frames) tuples, or a StackTrie
         title: Graph title
         width: SVG width in pixels
-        height: SVG height in pixels
+        height: SVG height in pixels (used when there are no samples)
+        min_width: Frames narrower than this many pixels are left out,
+            together with their callees
 
     Returns:
         SVG content as string
     """
-    # Aggregate stacks to count occurrences
-    stack_counts: dict[tuple[str, ...], int] = defaultdict(int)
-    for _, stack in stack_samples:
-        # Build cumulative stacks (root to leaf)
-        for i in range(1, len(stack) + 1):
-            stack_tuple: tuple[str, ...] = tuple(stack[:i])
-            stack_counts[stack_tuple] += 1
-
-    if not stack_counts:
-        return _generate_empty_svg(title, width, height)
-
-    # Calculate total samples for normalization
-    total_samples = len(stack_samples)
-
-    # Build flame graph structure
-    # Each level is a list of (frame_name, x, width, parent_stack)
-    levels: list[list[tuple[str, float, float, tuple[str, ...]]]] = []
-
-    # Sort stacks by depth
-    stacks_by_depth: dict[int, list[tuple[tuple[str, ...], int]]] = defaultdict(list)
-    for stack_key, count in stack_counts.items():
-        stacks_by_depth[len(stack_key)].append((stack_key, count))
+    trie = _as_trie(stack_samples)
+    return _render_svg(
+        trie,
+        title,
+        width,
+        height,
+        min_width,
+        lambda node, frame_name: _COLORS[hash(frame_name) % len(_COLORS)],
+    )
 
-    # Build levels bottom-up
-    for depth in sorted(stacks_by_depth.keys()):
-        level: list[tuple[str, float, float, tuple[str, ...]]] = []
-        x_offset = 0.0
 
-        for stack_tuple, count in sorted(stacks_by_depth[depth], key=lambda x: x[0]):
-            frame_width = (count / total_samples) * width
-            frame_name = stack_tuple[-1]  # Last frame in stack
+def diff_stacks(before: StackTrie, after: StackTrie) -> dict[tuple[str, ...], tuple[int, int]]:
+    """Pair up the sample counts of two profiles by stack.
 
-            level.append((frame_name, x_offset, frame_width, stack_tuple))
-            x_offset += frame_width
+    This is the data behind ``difffolded.pl``-style differential flame graphs.
 
-        levels.append(level)
+    Args:
+        before: Baseline profile
+        after: Profile to compare against the baseline
 
-    # Generate SVG
-    frame_height = 20
-    svg_height = len(levels) * frame_height + 100  # Extra for title and padding
+    Returns:
+        Mapping of every stack in either profile to its (before, after) counts
+    """
+    counts: dict[tuple[str, ...], list[int]] = defaultdict(lambda: [0, 0])
+    for stack, count in before.items():
+        counts[stack][0] = count
+    for stack, count in after.items():
+        counts[stack][1] = count
+    return {stack: (old, new) for stack, (old, new) in counts.items()}
+
+
+def differential_svg(
+    before: "StackSamples | StackTrie",
+    after: "StackSamples | StackTrie",
+    title: str = "Differential Flame Graph",
+    width: int = 1200,
+    height: int = 800,
+    min_width: float = 1.0,
+) -> str:
+    """Generate a differential flame graph of two profiles.
 
-    svg_parts = [
-        f'<svg width="{width}" height="{svg_height}" xmlns="http://www.w3.org/2000/svg">',
-        f'<text x="{width/2}" y="30" text-anchor="middle" font-size="18" font-weight="bold">{title}</text>',
-        '<g transform="translate(0, 50)">',
-    ]
+    Frames are laid out from ``after``. Each is colored by how its share of
+    all samples changed since ``before``: red where it grew, blue where it
+    shrank, with the strongest change fully saturated. Shares are compared
+    rather than counts, so profiles of different lengths can be compared.
 
-    # Color palette
-    colors = [
-        "#e74c3c",
-        "#3498db",
-        "#2ecc71",
-        "#f39c12",
-        "#9b59b6",
-        "#1abc9c",
-        "#e67e22",
-        "#34495e",
-    ]
+    Args:
+        before: Baseline samples or trie
+        after: Samples or trie to compare against the baseline
+        title: Graph title
+        width: SVG width in pixels
+        height: SVG height in pixels (used when ``after`` has no samples)
+        min_width: Frames narrower than this many pixels are left out
 
-    # Render frames
-    for level_idx, level in enumerate(levels):
-        y = svg_height - 100 - (level_idx * frame_height)
+    Returns:
+        SVG content as string
+    """
+    old = _as_trie(before)
+    new = _as_trie(after)
+    if not new.total:
+        return _generate_empty_svg(title, width, height)
 
-        for frame_name, x, frame_width, _stack in level:
-            if frame_width < 1:  # Skip very narrow frames
-                continue
+    # Change in share of every visible frame of the new profile
+    deltas: dict[int, float] = {}
+    old_total = old.total or 1
+    for node, _, _ in new._walk(min_width * new.total / width):
+        old_node = old._find(new._stack(node))
+        old_count = old._total[old_node] if old_node is not None else 0
+        deltas[node] = new._total[node] / new.total - old_count / old_total
 
-            # Choose color based on frame name hash
-            color = colors[hash(frame_name) % len(colors)]
-
-            # Truncate frame name if too long
-            display_name = frame_name
-            if frame_width < 100:
-                display_name = frame_name[: int(frame_width / 8)]
-                if len(display_name) < len(frame_name):
-                    display_name += "..."
-
-            svg_parts.extend(
-                [
-                    f'<rect x="{x}" y="{y}" width="{frame_width}" height="{frame_height}" '
-                    f'fill="{color}" stroke="white" stroke-width="0.5"/>',
-                    f'<text x="{x + 2}" y="{y + frame_height - 5}" '
-                    f'font-size="11" fill="white" font-family="monospace">{display_name}</text>',
-                ]
-            )
+    largest = max((abs(delta) for delta in deltas.values()), default=0.0) or 1.0
 
-    svg_parts.extend(["</g>", "</svg>"])
+    def color(node: int, frame_name: str) -> str:
+        intensity = abs(deltas[node]) / largest
+        fade = int(230 * (1 - intensity))
+        if deltas[node] > 0:
+            return f"rgb(230,{fade},{fade})"
+        if deltas[node] < 0:
+            return f"rgb({fade},{fade},230)"
+        return "rgb(180,180,180)"
 
-    return "\n".join(svg_parts)
+    return _render_svg(new, title, width, height, min_width, color)
 
 
 def _generate_empty_svg(title: str, width: int, height: int) -> str:
@@ -227,41 +594,37 @@ def _generate_empty_svg(title: str, width: int, height: int) -> str:
     """
     return f"""<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">
     <text x="{width/2}" y="{height/2}" text-anchor="middle" font-size="18" fill="#999">
-        {title} - No samples available
+        {escape(title)} - No samples available
     </text>
 </svg>"""
 
 
-def aggregate_stacks(stack_samples: list[tuple[float, list[str]]]) -> dict[tuple[str, ...], int]:
+def aggregate_stacks(stack_samples: StackSamples) -> StackTrie:
     """Aggregate stack samples into counts.
 
     Args:
         stack_samples: List of (timestamp, stack_frames) tuples
 
     Returns:
-        Dictionary mapping stack tuples to their occurrence counts
+        StackTrie, which maps stack tuples to their occurrence counts
     """
-    counts: dict[tuple[str, ...], int] = defaultdict(int)
-    for _, stack in stack_samples:
-        stack_tuple = tuple(stack)
-        counts[stack_tuple] += 1
-    return dict(counts)
+    return StackTrie.from_samples(stack_samples)
 
 
 def get_hot_paths(
-    stack_samples: list[tuple[float, list[str]]], top_n: int = 10
+    stack_samples: "StackSamples | StackTrie", top_n: int = 10
 ) -> list[tuple[tuple[str, ...], int, float]]:
     """Find the hottest execution paths.
 
     Args:
-        stack_samples: List of (timestamp, stack_frames) tuples
+        stack_samples: List of (timestamp, stack_frames) tuples, or a StackTrie
         top_n: Number of top paths to return
 
     Returns:
         List of (stack, count, percentage) tuples sorted by count
     """
-    counts = aggregate_stacks(stack_samples)
-    total = len(stack_samples)
+    counts = _as_trie(stack_samples)
+    total = counts.total
 
     hot_paths = [(stack, count, (count / total) * 100) for stack, count in counts.items()]
 
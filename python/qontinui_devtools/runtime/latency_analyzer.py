@@ -2,12 +2,142 @@
 
 This module provides advanced latency analysis including percentile calculations,
 bottleneck detection, and anomaly detection.
+
+Stage statistics are computed from the traces' checkpoint columns (name IDs
+and timestamps) rather than from per-trace stage dictionaries. With NumPy
+installed the grouping, sorting and percentiles are vectorized; otherwise a
+pure-Python fallback gives the same results.
 """
 
+from array import array
 from typing import TYPE_CHECKING, Any
 
+from .event_tracer import checkpoint_name
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 if TYPE_CHECKING:
-    from .event_tracer import EventTrace
+    from .event_tracer import AnyEventTrace as EventTrace
+
+
+def _checkpoint_columns(traces: list["EventTrace"]) -> tuple[array, array, list[int]]:
+    """Concatenate the checkpoint columns of all traces.
+
+    Returns:
+        Tuple of (name IDs, timestamps, index of each trace's first checkpoint)
+    """
+    names = array("I")
+    timestamps = array("d")
+    starts: list[int] = []
+    for trace in traces:
+        starts.append(len(names))
+        trace_names, trace_timestamps = trace.checkpoint_columns()
+        names.extend(trace_names)
+        timestamps.extend(trace_timestamps)
+    return names, timestamps, starts
+
+
+def _stage_name(from_id: int, to_id: int) -> str:
+    return f"{checkpoint_name(from_id)} -> {checkpoint_name(to_id)}"
+
+
+def _stats(sorted_latencies: list[float], total: float) -> dict[str, float]:
+    """Build the statistics of one stage from its sorted latencies."""
+    n = len(sorted_latencies)
+    return {
+        "mean": total / n,
+        "p50": sorted_latencies[int(n * 0.50)],
+        "p95": sorted_latencies[int(n * 0.95)],
+        "p99": sorted_latencies[int(n * 0.99)],
+        "min": sorted_latencies[0],
+        "max": sorted_latencies[-1],
+        "count": n,
+    }
+
+
+def _stage_statistics_numpy(names: array, timestamps: array, starts: list[int]) -> dict[str, Any]:
+    """Vectorized stage statistics over concatenated checkpoint columns."""
+    ids = np.frombuffer(names, dtype=np.uint32).astype(np.int64)
+    stamps = np.frombuffer(timestamps, dtype=np.float64)
+
+    # Transition i goes from checkpoint i to i + 1; drop those that cross traces
+    keep = np.ones(len(ids) - 1, dtype=bool)
+    boundaries = np.asarray(starts[1:], dtype=np.int64) - 1
+    keep[boundaries[(boundaries >= 0) & (boundaries < len(keep))]] = False
+
+    # Encode each (from, to) pair of name IDs as one integer
+    width = int(ids.max()) + 1
+    codes = (ids[:-1] * width + ids[1:])[keep]
+    durations = np.diff(stamps)[keep]
+    if not len(codes):
+        return {}
+
+    stage_codes, first_seen, groups = np.unique(codes, return_index=True, return_inverse=True)
+    groups = groups.ravel()
+    counts = np.bincount(groups, minlength=len(stage_codes))
+    totals = np.bincount(groups, weights=durations, minlength=len(stage_codes))
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    # Sort by stage, then latency, so each stage is a sorted run
+    ordered = durations[np.lexsort((durations, groups))]
+
+    result: dict[str, Any] = {}
+    for group in np.argsort(first_seen, kind="stable"):
+        start = int(offsets[group])
+        run = ordered[start : start + int(counts[group])]
+        code = int(stage_codes[group])
+        result[_stage_name(code // width, code % width)] = _stats(
+            run.tolist(), float(totals[group])
+        )
+    return result
+
+
+def _stage_statistics_python(names: array, timestamps: array, starts: list[int]) -> dict[str, Any]:
+    """Pure-Python stage statistics over concatenated checkpoint columns."""
+    stage_latencies: dict[tuple[int, int], list[float]] = {}
+    ends = starts[1:] + [len(names)]
+
+    for start, end in zip(starts, ends, strict=True):
+        for i in range(start, end - 1):
+            key = (names[i], names[i + 1])
+            latency = timestamps[i + 1] - timestamps[i]
+            latencies = stage_latencies.get(key)
+            if latencies is None:
+                stage_latencies[key] = [latency]
+            else:
+                latencies.append(latency)
+
+    return {
+        _stage_name(*key): _stats(sorted(latencies), sum(latencies))
+        for key, latencies in stage_latencies.items()
+    }
+
+
+def stage_statistics(traces: list["EventTrace"]) -> dict[str, dict[str, float]]:
+    """Compute latency statistics for every stage across traces.
+
+    A stage is a pair of consecutive checkpoints. Every occurrence of a
+    stage is counted, including repeats within one trace. Percentiles use
+    the nearest-rank index ``int(n * q)`` into the sorted latencies.
+
+    Args:
+        traces: EventTrace or CompactEventTrace instances
+
+    Returns:
+        Dictionary mapping stage names (in first-seen order) to statistics
+        with "mean", "p50", "p95", "p99", "min", "max" and "count"
+    """
+    names, timestamps, starts = _checkpoint_columns(traces)
+    if len(names) < 2:
+        return {}
+    if NUMPY_AVAILABLE:
+        return _stage_statistics_numpy(names, timestamps, starts)
+    return _stage_statistics_python(names, timestamps, starts)
 
 
 def analyze_latencies(traces: list["EventTrace"]) -> dict[str, dict[str, float]]:
@@ -37,36 +167,7 @@ def analyze_latencies(traces: list["EventTrace"]) -> dict[str, dict[str, float]]
         >>> latencies = analyze_latencies(tracer.get_all_traces())
         >>> print(f"P95: {latencies['frontend_emit -> tauri_receive']['p95']:.3f}s")
     """
-    # Collect latencies for each stage
-    stage_latencies: dict[str, list[float]] = {}
-
-    for trace in traces:
-        for stage, latency in trace.get_stage_latencies().items():
-            if stage not in stage_latencies:
-                stage_latencies[stage] = []
-            stage_latencies[stage].append(latency)
-
-    # Calculate statistics for each stage
-    result: dict[Any, Any] = {}
-
-    for stage, latencies in stage_latencies.items():
-        if not latencies:
-            continue
-
-        sorted_latencies = sorted(latencies)
-        n = len(sorted_latencies)
-
-        result[stage] = {
-            "mean": sum(latencies) / n,
-            "p50": sorted_latencies[int(n * 0.50)],
-            "p95": sorted_latencies[int(n * 0.95)] if n > 1 else sorted_latencies[0],
-            "p99": sorted_latencies[int(n * 0.99)] if n > 1 else sorted_latencies[0],
-            "min": sorted_latencies[0],
-            "max": sorted_latencies[-1],
-            "count": n,
-        }
-
-    return result
+    return stage_statistics(traces)
 
 
 def find_bottleneck(traces: list["EventTrace"]) -> str:
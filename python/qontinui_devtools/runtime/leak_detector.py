@@ -9,8 +9,12 @@ This module provides:
 
 import gc
 import sys
+from collections.abc import Mapping, Sequence
 from typing import Any
 
+from .growth_matrix import fit_growth
+from .reference_graph import DEFAULT_MAX_NODES, DEFAULT_TIME_LIMIT, ReferenceGraph
+
 
 def analyze_growth_trend(
     samples: list[tuple[float, Any]], threshold: float = 0.01
@@ -55,63 +59,56 @@ def analyze_growth_trend(
     return is_growing, slope
 
 
-def find_reference_chains(obj: Any, max_depth: int = 5, max_chains: int = 10) -> list[list[str]]:
+def analyze_growth_trends(
+    timestamps: Sequence[float],
+    series: Mapping[str, Sequence[float]],
+    threshold: float = 0.01,
+) -> dict[str, tuple[bool, float]]:
+    """Analyze many series sampled at the same times in one vectorized fit.
+
+    Equivalent to calling analyze_growth_trend for each series, without
+    rebuilding and summing a sample list per series.
+
+    Args:
+        timestamps: Sample times shared by every series
+        series: Mapping of name to values, one per timestamp
+        threshold: Minimum growth rate to consider as growing
+
+    Returns:
+        Mapping of name to (is_growing, growth_rate)
+    """
+    names = list(series)
+    slopes, _ = fit_growth(timestamps, [series[name] for name in names])
+    return {name: (slope > threshold, slope) for name, slope in zip(names, slopes, strict=True)}
+
+
+def find_reference_chains(
+    obj: Any,
+    max_depth: int = 5,
+    max_chains: int = 10,
+    graph: ReferenceGraph | None = None,
+    max_nodes: int = DEFAULT_MAX_NODES,
+    time_limit: float = DEFAULT_TIME_LIMIT,
+) -> list[list[str]]:
     """Find reference chains keeping an object alive.
 
-    Uses gc.get_referrers() to trace back what's holding references.
+    Searches breadth-first over a referrer index instead of calling
+    gc.get_referrers() for every visited object.
 
     Args:
         obj: Object to analyze
         max_depth: Maximum depth to traverse
         max_chains: Maximum number of chains to return
+        graph: Referrer index to reuse across calls (built if omitted)
+        max_nodes: Maximum number of objects to expand
+        time_limit: Maximum search time in seconds
 
     Returns:
         List of reference chains (each chain is a list of type names)
     """
-    chains: list[list[str]] = []
-    visited = set()
-
-    def _trace_referrers(current_obj: Any, current_chain: list[str], depth: int) -> None:
-        """Recursively trace referrers."""
-        if depth >= max_depth or len(chains) >= max_chains:
-            return
-
-        obj_id = id(current_obj)
-        if obj_id in visited:
-            return
-
-        visited.add(obj_id)
-
-        try:
-            referrers = gc.get_referrers(current_obj)
-        except Exception:
-            return
-
-        for referrer in referrers:
-            # Skip frame objects and module dicts
-            if isinstance(referrer, type(sys._getframe())):
-                continue
-
-            ref_type = type(referrer).__name__
-
-            # Skip this module's locals
-            if isinstance(referrer, dict) and "__name__" in referrer:
-                continue
-
-            new_chain = current_chain + [ref_type]
-
-            # If we found a significant referrer, record the chain
-            if ref_type in ("module", "type", "function", "method"):
-                chains.append(new_chain)
-                if len(chains) >= max_chains:
-                    return
-
-            # Continue tracing
-            _trace_referrers(referrer, new_chain, depth + 1)
-
-    _trace_referrers(obj, [type(obj).__name__], 0)
-
-    return chains
+    if graph is None:
+        graph = ReferenceGraph()
+    return graph.reference_chains(obj, max_depth, max_chains, max_nodes, time_limit)
 
 
 def find_leaked_objects(baseline_objects: set[int], current_objects: list[Any]) -> list[Any]:
@@ -158,90 +155,75 @@ def classify_leak_severity(count_increase: int, size_mb: float, growth_rate: flo
     return "low"
 
 
-def analyze_object_retention(obj: Any) -> dict[str, Any]:
+def analyze_object_retention(obj: Any, graph: ReferenceGraph | None = None) -> dict[str, Any]:
     """Analyze why an object is being retained in memory.
 
     Args:
         obj: Object to analyze
+        graph: Referrer index to look referrers up in (gc.get_referrers()
+            is called once if omitted)
 
     Returns:
         Dictionary with retention analysis
     """
+    referrers = graph.referrers(obj) if graph is not None else gc.get_referrers(obj)
+
     analysis = {
         "type": type(obj).__name__,
         "size": sys.getsizeof(obj),
-        "referrer_count": len(gc.get_referrers(obj)),
+        "referrer_count": len(referrers),
         "is_tracked": gc.is_tracked(obj),
         "referent_count": len(gc.get_referents(obj)) if hasattr(gc, "get_referents") else 0,
     }
 
     # Analyze referrers
-    try:
-        referrers = gc.get_referrers(obj)
-        referrer_types: dict[str, int] = {}
-        for ref in referrers:
-            ref_type = type(ref).__name__
-            referrer_types[ref_type] = referrer_types.get(ref_type, 0) + 1
+    referrer_types: dict[str, int] = {}
+    for ref in referrers:
+        ref_type = type(ref).__name__
+        referrer_types[ref_type] = referrer_types.get(ref_type, 0) + 1
 
-        analysis["referrer_types"] = referrer_types
-    except Exception as e:
-        analysis["referrer_types"] = {"error": str(e)}
+    analysis["referrer_types"] = referrer_types
 
     return analysis
 
 
-def find_cycles_containing(obj: Any) -> list[list[Any]]:
+def find_cycles_containing(
+    obj: Any,
+    graph: ReferenceGraph | None = None,
+    max_cycles: int = 10,
+    max_nodes: int = DEFAULT_MAX_NODES,
+    time_limit: float = DEFAULT_TIME_LIMIT,
+) -> list[list[Any]]:
     """Find reference cycles containing the given object.
 
     Args:
         obj: Object to check for cycles
+        graph: Referrer index to reuse across calls (built if omitted)
+        max_cycles: Maximum number of cycles to return
+        max_nodes: Maximum number of objects to visit
+        time_limit: Maximum search time in seconds
 
     Returns:
-        List of cycles (each cycle is a list of objects)
+        List of cycles (each cycle is a list of objects starting with obj)
     """
-    cycles: list[list[Any]] = []
-    visited = set()
-    path: list[Any] = []
-
-    def _dfs(current: Any) -> None:
-        """Depth-first search for cycles."""
-        current_id = id(current)
-
-        if current_id in visited:
-            # Found a cycle
-            if current in path:
-                cycle_start = path.index(current)
-                cycle = path[cycle_start:]
-                if len(cycle) > 1:  # Ignore self-references
-                    cycles.append(cycle[:])
-            return
+    if graph is None:
+        graph = ReferenceGraph()
+    return graph.cycles_containing(obj, max_cycles, max_nodes, time_limit)
 
-        visited.add(current_id)
-        path.append(current)
 
-        try:
-            referents = gc.get_referents(current)
-            for referent in referents:
-                # Skip frames and common containers
-                if isinstance(referent, type(sys._getframe()) | type | type(gc)):
-                    continue
-                _dfs(referent)
-        except Exception:
-            pass
-
-        path.pop()
-
-    _dfs(obj)
-
-    return cycles
-
-
-def get_object_size_deep(obj: Any, seen: set[int] | None = None) -> int:
+def get_object_size_deep(
+    obj: Any, seen: set[int] | None = None, max_nodes: int | None = None
+) -> int:
     """Calculate deep size of an object including referenced objects.
 
+    Walks the object iteratively, so deeply nested structures do not hit
+    the recursion limit. For the memory freed by releasing an object, see
+    ReferenceGraph.retained_size.
+
     Args:
         obj: Object to measure
-        seen: Set of already seen object IDs (for recursion)
+        seen: Set of already seen object IDs (updated in place)
+        max_nodes: Stop after measuring this many objects (no limit if None)
 
     Returns:
         Total size in bytes
@@ -249,28 +231,33 @@ def get_object_size_deep(obj: Any, seen: set[int] | None = None) -> int:
     if seen is None:
         seen = set()
 
-    obj_id = id(obj)
-    if obj_id in seen:
-        return 0
-
-    seen.add(obj_id)
-    size = sys.getsizeof(obj)
-
-    # Recursively measure referenced objects
-    if isinstance(obj, dict):
-        size += sum(
-            get_object_size_deep(k, seen) + get_object_size_deep(v, seen) for k, v in obj.items()
-        )
-    elif isinstance(obj, list | tuple | set | frozenset):
-        size += sum(get_object_size_deep(item, seen) for item in obj)
-    elif hasattr(obj, "__dict__"):
-        size += get_object_size_deep(obj.__dict__, seen)
-    elif hasattr(obj, "__slots__"):
-        size += sum(
-            get_object_size_deep(getattr(obj, slot, None), seen)
-            for slot in obj.__slots__
-            if hasattr(obj, slot)
-        )
+    size = 0
+    stack = [obj]
+
+    while stack:
+        current = stack.pop()
+        current_id = id(current)
+        if current_id in seen:
+            continue
+        if max_nodes is not None and len(seen) >= max_nodes:
+            break
+
+        seen.add(current_id)
+        size += sys.getsizeof(current)
+
+        # Queue referenced objects
+        if isinstance(current, dict):
+            for key, value in current.items():
+                stack.append(key)
+                stack.append(value)
+        elif isinstance(current, list | tuple | set | frozenset):
+            stack.extend(current)
+        elif hasattr(current, "__dict__"):
+            stack.append(current.__dict__)
+        elif hasattr(current, "__slots__"):
+            stack.extend(
+                getattr(current, slot, None) for slot in current.__slots__ if hasattr(current, slot)
+            )
 
     return size
 
@@ -9,11 +9,15 @@ This module provides tools for:
 """
 
 import gc
+import random
+import threading
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any
 
+from .growth_matrix import GrowthMatrix
+
 try:
     import psutil
 except ImportError:
@@ -37,6 +41,9 @@ class MemorySnapshot:
     top_objects: list[tuple[str, int]]  # (type, size_bytes)
     tracemalloc_snapshot: Any | None = None  # tracemalloc snapshot
     gc_stats: dict[str, Any] = field(default_factory=dict)
+    allocation_diff: list[tuple[str, int]] = field(
+        default_factory=list
+    )  # (filename, size_diff_bytes) vs previous snapshot
 
     def __str__(self) -> str:
         """String representation of snapshot."""
@@ -75,24 +82,50 @@ class MemoryProfiler:
         enable_tracemalloc: bool = True,
         snapshot_interval: float = 5.0,
         track_top_n: int = 20,
+        gc_generation: int | None = 2,
+        object_sample_rate: float = 1.0,
+        retain_tracemalloc_snapshots: bool = True,
     ) -> None:
         """Initialize memory profiler.
 
+        The defaults reproduce a full, exact snapshot. For frequent snapshots
+        in a large process, collect only the young generations
+        (``gc_generation=0``), count a fraction of the tracked objects
+        (``object_sample_rate=0.01``) and drop old tracemalloc snapshots
+        (``retain_tracemalloc_snapshots=False``).
+
         Args:
             enable_tracemalloc: Enable tracemalloc for detailed tracking
             snapshot_interval: Default interval between snapshots (seconds)
             track_top_n: Number of top objects to track by size
+            gc_generation: Generation passed to ``gc.collect`` before each
+                snapshot (0-2), or None to skip collection
+            object_sample_rate: Fraction of gc-tracked objects inspected when
+                counting by type; counts are scaled back up (0 < rate <= 1)
+            retain_tracemalloc_snapshots: Keep every tracemalloc snapshot on its
+                MemorySnapshot; when False only the latest is kept for diffing
         """
         if psutil is None:
             raise ImportError(
                 "psutil is required for memory profiling. " "Install it with: pip install psutil"
             )
 
+        if gc_generation is not None and not 0 <= gc_generation <= 2:
+            raise ValueError("gc_generation must be 0, 1, 2 or None")
+        if not 0.0 < object_sample_rate <= 1.0:
+            raise ValueError("object_sample_rate must be in (0, 1]")
+
         self._snapshots: list[MemorySnapshot] = []
         self._baseline: MemorySnapshot | None = None
         self._enable_tracemalloc = enable_tracemalloc and tracemalloc is not None
         self._interval = snapshot_interval
         self._track_top_n = track_top_n
+        self._gc_generation = gc_generation
+        self._sample_step = max(1, round(1.0 / object_sample_rate))
+        self._retain_tracemalloc = retain_tracemalloc_snapshots
+        self._last_tracemalloc: Any | None = None
+        self._growth = GrowthMatrix()
+        self._lock = threading.Lock()
         self._running = False
         self._process = psutil.Process()
 
@@ -115,6 +148,7 @@ class MemoryProfiler:
         if self._enable_tracemalloc:
             tracemalloc.stop()
 
+        self._last_tracemalloc = None
         self._running = False
 
     def take_snapshot(self) -> MemorySnapshot:
@@ -123,25 +157,30 @@ class MemoryProfiler:
         Returns:
             MemorySnapshot with current memory state
         """
-        # Force garbage collection for accurate measurement
-        gc.collect()
+        if self._gc_generation is not None:
+            gc.collect(self._gc_generation)
 
         # Get process memory info
         mem_info = self._process.memory_info()
 
-        # Count objects by type
-        objects_by_type = self._count_objects_by_type()
-
-        # Get top objects by estimated size
-        top_objects = self._get_top_objects()
+        # Count objects by type (one pass over gc.get_objects())
+        objects_by_type, total_objects = self._count_objects_by_type()
 
         # Get GC statistics
-        gc_stats = self._get_gc_stats()
+        gc_stats = self._get_gc_stats(total_objects)
 
-        # Take tracemalloc snapshot
+        # One tracemalloc snapshot serves top objects and the diff
         tm_snapshot = None
-        if self._enable_tracemalloc:
+        top_objects: list[tuple[str, int]] = []
+        allocation_diff: list[tuple[str, int]] = []
+        if self._enable_tracemalloc and tracemalloc.is_tracing():
             tm_snapshot = tracemalloc.take_snapshot()
+            top_objects = self._get_top_objects(tm_snapshot)
+            allocation_diff = self._diff_allocations(tm_snapshot)
+            self._last_tracemalloc = tm_snapshot
+
+        if not self._retain_tracemalloc and self._snapshots:
+            self._snapshots[-1].tracemalloc_snapshot = None
 
         snapshot = MemorySnapshot(
             timestamp=time.time(),
@@ -152,40 +191,51 @@ class MemoryProfiler:
             top_objects=top_objects,
             tracemalloc_snapshot=tm_snapshot,
             gc_stats=gc_stats,
+            allocation_diff=allocation_diff,
         )
 
-        self._snapshots.append(snapshot)
+        with self._lock:
+            self._snapshots.append(snapshot)
+            self._growth.append(snapshot.timestamp, objects_by_type)
         return snapshot
 
-    def _count_objects_by_type(self) -> dict[str, int]:
-        """Count all objects by their type.
+    def _count_objects_by_type(self) -> tuple[dict[str, int], int]:
+        """Count gc-tracked objects by their type.
+
+        With a sample rate below 1.0 only every n-th object (from a random
+        offset) is inspected and the counts are scaled by n.
 
         Returns:
-            Dictionary mapping type names to counts
+            (type name → count, total number of tracked objects)
         """
+        objects = gc.get_objects()
+        total = len(objects)
+        step = self._sample_step
+        sample = objects[random.randrange(step) :: step] if step > 1 else objects
+        del objects
+
         objects_by_type: dict[str, int] = defaultdict(int)
 
-        for obj in gc.get_objects():
+        for obj in sample:
             try:
                 type_name = type(obj).__name__
-                objects_by_type[type_name] += 1
+                objects_by_type[type_name] += step
             except Exception:
                 # Skip objects that cause issues
                 continue
 
-        return dict(objects_by_type)
+        return dict(objects_by_type), total
+
+    def _get_top_objects(self, snapshot: Any) -> list[tuple[str, int]]:
+        """Get top N allocation sites by size.
 
-    def _get_top_objects(self) -> list[tuple[str, int]]:
-        """Get top N objects by estimated size.
+        Args:
+            snapshot: tracemalloc snapshot to summarize
 
         Returns:
-            List of (type_name, estimated_size) tuples
+            List of (traceback, size_bytes) tuples
         """
-        if not self._enable_tracemalloc:
-            return []
-
         try:
-            snapshot = tracemalloc.take_snapshot()
             top_stats = snapshot.statistics("lineno")
 
             # Group by type and sum sizes
@@ -202,15 +252,41 @@ class MemoryProfiler:
         except Exception:
             return []
 
-    def _get_gc_stats(self) -> dict[str, Any]:
+    def _diff_allocations(self, snapshot: Any) -> list[tuple[str, int]]:
+        """Diff a tracemalloc snapshot against the previous one by filename.
+
+        Args:
+            snapshot: Newly taken tracemalloc snapshot
+
+        Returns:
+            Top N (filename, size_diff_bytes) tuples, largest change first
+        """
+        if self._last_tracemalloc is None:
+            return []
+
+        try:
+            stats = snapshot.compare_to(self._last_tracemalloc, "filename")
+        except Exception:
+            return []
+
+        return [
+            (stat.traceback[0].filename, stat.size_diff)
+            for stat in stats[: self._track_top_n]
+            if stat.size_diff != 0
+        ]
+
+    def _get_gc_stats(self, total_objects: int) -> dict[str, Any]:
         """Get garbage collection statistics.
 
+        Args:
+            total_objects: Number of gc-tracked objects
+
         Returns:
             Dictionary with GC stats
         """
         return {
             "collections": gc.get_count(),
-            "objects": len(gc.get_objects()),
+            "objects": total_objects,
             "garbage": len(gc.garbage),
             "is_enabled": gc.isenabled(),
         }
@@ -223,6 +299,10 @@ class MemoryProfiler:
     ) -> list[MemoryLeak]:
         """Detect memory leaks from snapshots.
 
+        All types are fitted at once from the running sums of the
+        snapshot count matrix, so each call costs O(types) regardless of
+        how many snapshots have been taken.
+
         Args:
             min_samples: Minimum number of samples required
             growth_threshold: Minimum growth rate (objects/sec)
@@ -231,28 +311,16 @@ class MemoryProfiler:
         Returns:
             List of detected memory leaks
         """
-        if len(self._snapshots) < min_samples:
-            return []
-
-        leaks: list[MemoryLeak] = []
-
-        # Get all object types that appear in snapshots
-        all_types: set[str] = set()
-        for snapshot in self._snapshots:
-            all_types.update(snapshot.objects_by_type.keys())
+        with self._lock:
+            if len(self._growth) < min_samples:
+                return []
 
-        # Analyze each object type
-        for obj_type in all_types:
-            samples = [(s.timestamp, s.objects_by_type.get(obj_type, 0)) for s in self._snapshots]
-
-            # Check for steady growth
-            is_growing, growth_rate, confidence = self._analyze_growth(samples, growth_threshold)
+            growing = self._growth.growing(growth_threshold)
+            leaks: list[MemoryLeak] = []
 
-            if is_growing:
-                # Calculate metrics
-                first_count = samples[0][1]
-                last_count = samples[-1][1]
-                count_increase = last_count - first_count
+            for obj_type, growth_rate, confidence in growing:
+                samples = self._growth.samples(obj_type)
+                count_increase = samples[-1][1] - samples[0][1]
 
                 if count_increase >= min_increase:
                     # Estimate size increase (rough)
@@ -273,54 +341,6 @@ class MemoryProfiler:
 
         return leaks
 
-    def _analyze_growth(
-        self, samples: list[tuple[float, int]], threshold: float
-    ) -> tuple[bool, float, float]:
-        """Analyze if samples show steady growth.
-
-        Uses simple linear regression to detect growth trend.
-
-        Args:
-            samples: List of (timestamp, count) tuples
-            threshold: Minimum growth rate threshold
-
-        Returns:
-            (is_growing, growth_rate, confidence)
-        """
-        if len(samples) < 2:
-            return False, 0.0, 0.0
-
-        # Extract times and counts
-        times = [s[0] - samples[0][0] for s in samples]  # Normalize to start at 0
-        counts = [s[1] for s in samples]
-
-        # Simple linear regression: y = mx + b
-        n = len(samples)
-        sum_x = sum(times)
-        sum_y = sum(counts)
-        sum_xy = sum(t * c for t, c in zip(times, counts, strict=False))
-        sum_xx = sum(t * t for t in times)
-
-        # Calculate slope (growth rate)
-        denominator = n * sum_xx - sum_x * sum_x
-        if denominator == 0:
-            return False, 0.0, 0.0
-
-        slope = (n * sum_xy - sum_x * sum_y) / denominator
-        intercept = (sum_y - slope * sum_x) / n
-
-        # Calculate R-squared (confidence)
-        mean_y = sum_y / n
-        ss_tot = sum((c - mean_y) ** 2 for c in counts)
-        ss_res = sum((counts[i] - (slope * times[i] + intercept)) ** 2 for i in range(n))
-
-        r_squared = 1.0 - (ss_res / ss_tot) if ss_tot > 0 else 0.0
-
-        # Check if growth is significant
-        is_growing = slope > threshold and r_squared > 0.7
-
-        return is_growing, slope, r_squared
-
     def _estimate_size_increase(self, obj_type: str, count_increase: int) -> float:
         """Estimate memory size increase for object type.
 
@@ -471,7 +491,9 @@ class MemoryProfiler:
 
     def clear(self) -> None:
         """Clear all collected snapshots."""
-        self._snapshots.clear()
+        with self._lock:
+            self._snapshots.clear()
+            self._growth = GrowthMatrix()
         self._baseline = None
 
     def get_memory_usage(self) -> dict[str, float]:
@@ -0,0 +1,172 @@
+"""Background sampling of process memory for per-action peaks.
+
+Reading RSS only when an action starts and ends misses transient spikes,
+such as a decoded screenshot that is freed before the action returns.
+``MemorySampler`` runs one background thread that reads RSS every
+``interval`` seconds and updates every action currently attached to it, so
+concurrent actions share a single thread. Each action keeps its true peak
+and a memory curve that is downsampled to at most ``max_points`` readings,
+so long actions use bounded memory.
+
+``tracemalloc.reset_peak`` was not used: its peak is process-wide, so it
+cannot be attributed to one of several concurrent actions, and tracing
+Python allocations slows the profiled code down.
+"""
+
+import threading
+import time
+
+import psutil
+
+
+class MemoryTrack:
+    """Peak and downsampled RSS curve of one attached action.
+
+    Attributes:
+        peak: Highest RSS seen in bytes
+        samples: (perf_counter timestamp, RSS bytes) readings, at most
+            ``max_points`` of them, evenly thinned as the action runs
+    """
+
+    __slots__ = ("peak", "samples", "max_points", "_stride", "_seen")
+
+    def __init__(self, max_points: int) -> None:
+        self.peak = 0
+        self.samples: list[tuple[float, int]] = []
+        self.max_points = max_points
+        self._stride = 1  # Keep every _stride-th reading
+        self._seen = 0
+
+    def record(self, timestamp: float, rss: int) -> None:
+        """Record one reading."""
+        if rss > self.peak:
+            self.peak = rss
+
+        if self._seen % self._stride == 0:
+            self.samples.append((timestamp, rss))
+            if len(self.samples) > self.max_points:
+                # Halve the resolution of the whole curve
+                del self.samples[1::2]
+                self._stride *= 2
+        self._seen += 1
+
+
+class MemorySampler:
+    """Sample process RSS from one background thread for all attached actions.
+
+    Example:
+        >>> sampler = MemorySampler(interval=0.005)
+        >>> sampler.start()
+        >>> track = sampler.attach()
+        >>> decode_screenshot()
+        >>> sampler.detach(track)
+        >>> sampler.stop()
+        >>> print(track.peak)
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.005,
+        max_points: int = 256,
+        process: psutil.Process | None = None,
+    ) -> None:
+        """Initialize the sampler.
+
+        Args:
+            interval: Time between RSS readings in seconds
+            max_points: Maximum readings kept per action
+            process: Process to measure (defaults to the current process)
+
+        Raises:
+            ValueError: If interval is not positive or max_points is below 2
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if max_points < 2:
+            raise ValueError("max_points must be at least 2")
+
+        self.interval = interval
+        self.max_points = max_points
+        self._process = process or psutil.Process()
+        self._tracks: set[MemoryTrack] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the sampling thread (no-op if already running)."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="qontinui-memory-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread and wait for it to exit."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=5.0)
+        self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the sampling thread is running."""
+        return self._thread is not None
+
+    def attach(self) -> MemoryTrack:
+        """Start tracking memory for an action.
+
+        Takes a first reading immediately, so the track always has a peak.
+
+        Returns:
+            Track updated by the sampler until ``detach`` is called
+        """
+        track = MemoryTrack(self.max_points)
+        track.record(time.perf_counter(), self._rss())
+        with self._lock:
+            self._tracks.add(track)
+        return track
+
+    def detach(self, track: MemoryTrack) -> MemoryTrack:
+        """Stop tracking an action, taking a final reading.
+
+        Args:
+            track: Track returned by ``attach``
+
+        Returns:
+            The same track, now final
+        """
+        with self._lock:
+            self._tracks.discard(track)
+        track.record(time.perf_counter(), self._rss())
+        return track
+
+    def sample(self) -> None:
+        """Take one reading and record it in every attached track."""
+        if not self._tracks:
+            return
+
+        timestamp = time.perf_counter()
+        rss = self._rss()
+        # Record under the lock so a detached track never changes afterwards
+        with self._lock:
+            for track in self._tracks:
+                track.record(timestamp, rss)
+
+    def _rss(self) -> int:
+        try:
+            return int(self._process.memory_info().rss)
+        except psutil.Error:
+            return 0
+
+    def _run(self) -> None:
+        """Sampling loop run by the background thread."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception:
+                # Keep sampling even if one reading fails
+                pass
@@ -47,13 +47,34 @@ def calculate_percentile(values: list[float], percentile: float) -> float:
     Raises:
         ValueError: If values is empty or percentile is out of range
     """
+    return calculate_percentiles(values, [percentile])[0]
+
+
+def calculate_percentiles(values: list[float], percentiles: list[float]) -> list[float]:
+    """Calculate several percentiles with a single sort.
+
+    Args:
+        values: List of numeric values
+        percentiles: Percentiles to calculate (0-100)
+
+    Returns:
+        Percentile values, in the order requested
+
+    Raises:
+        ValueError: If values is empty or a percentile is out of range
+    """
     if not values:
         raise ValueError("Cannot calculate percentile of empty list")
 
-    if not 0 <= percentile <= 100:
+    if not all(0 <= p <= 100 for p in percentiles):
         raise ValueError("Percentile must be between 0 and 100")
 
     sorted_values = sorted(values)
+    return [_interpolate(sorted_values, p) for p in percentiles]
+
+
+def _interpolate(sorted_values: list[float], percentile: float) -> float:
+    """Get a percentile of sorted values by linear interpolation between ranks."""
     n = len(sorted_values)
 
     if percentile == 0:
@@ -101,9 +122,7 @@ def calculate_metrics(profiles: list[ActionProfile]) -> PerformanceMetrics:
     max_duration = max(durations)
 
     # Percentiles
-    p50_duration = calculate_percentile(durations, 50)
-    p95_duration = calculate_percentile(durations, 95)
-    p99_duration = calculate_percentile(durations, 99)
+    p50_duration, p95_duration, p99_duration = calculate_percentiles(durations, [50, 95, 99])
 
     # CPU metrics
     cpu_times = [p.cpu_time for p in profiles]
@@ -172,14 +191,15 @@ def calculate_phase_metrics(profiles: list[ActionProfile]) -> dict[str, dict[str
     phase_metrics: dict[str, dict[str, float]] = {}
     for phase_name, durations in phase_data.items():
         if durations:
+            p50, p95 = calculate_percentiles(durations, [50, 95])
             phase_metrics[phase_name] = {
                 "count": len(durations),
                 "total": sum(durations),
                 "avg": sum(durations) / len(durations),
                 "min": min(durations),
                 "max": max(durations),
-                "p50": calculate_percentile(durations, 50),
-                "p95": calculate_percentile(durations, 95),
+                "p50": p50,
+                "p95": p95,
             }
 
     return phase_metrics
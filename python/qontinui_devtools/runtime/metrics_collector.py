@@ -2,6 +2,15 @@
 
 This module provides classes for collecting system, action, and event metrics
 in real-time with minimal overhead (<1%).
+
+Rates, averages and percentiles are maintained incrementally (sliding-window
+counters and quantile sketches), so sampling the metrics does not rescan the
+recorded history.
+
+Recording is lock-free: each thread appends to its own buffer, and the
+buffers are drained into the aggregates by the collection thread and by any
+call that reads metrics. Recording threads therefore never contend with each
+other or with readers.
 """
 
 import queue
@@ -13,6 +22,12 @@ from typing import Any
 
 import psutil
 
+from .sketches import QuantileSketch, SlidingWindow
+
+# A thread drains its own buffer once it holds this many records, which bounds
+# memory when nothing reads the metrics
+_BUFFER_FLUSH_SIZE = 4096
+
 
 @dataclass
 class SystemMetrics:
@@ -38,6 +53,9 @@ class ActionMetrics:
     queue_depth: int
     success_rate: float
     error_count: int
+    p50_duration: float = 0.0
+    p95_duration: float = 0.0
+    p99_duration: float = 0.0
 
 
 @dataclass
@@ -50,6 +68,9 @@ class EventMetrics:
     events_failed: int
     avg_processing_time: float
     queue_depth: int
+    p50_processing_time: float = 0.0
+    p95_processing_time: float = 0.0
+    p99_processing_time: float = 0.0
 
 
 @dataclass
@@ -62,12 +83,26 @@ class ActionRecord:
     success: bool
 
 
+class _RecordBuffer:
+    """Records appended by one thread, waiting to be drained."""
+
+    __slots__ = ("actions", "events", "thread")
+
+    def __init__(self, thread: threading.Thread) -> None:
+        self.thread = thread
+        # deque.append and popleft are atomic, so the owner appends without a lock
+        self.actions: deque[tuple[float, str, float, bool]] = deque()
+        self.events: deque[tuple[float, bool]] = deque()
+
+
 class MetricsCollector:
     """Collect real-time system and application metrics.
 
     This collector runs in a background thread and samples metrics at regular
     intervals. It maintains a rolling window of recent data for calculating
-    rates and averages.
+    rates and averages, and quantile sketches of action durations and event
+    processing times for percentiles. ``get_sketches`` and ``merge_sketches``
+    combine the percentiles of collectors running in several processes.
 
     Example:
         >>> collector = MetricsCollector(sample_interval=1.0)
@@ -101,6 +136,9 @@ class MetricsCollector:
         self._action_history: deque[ActionRecord] = deque(maxlen=history_size)
         self._current_action: str | None = None
         self._action_queue_depth = 0
+        self._action_errors = 0  # Failed actions in _action_history
+        self._action_window = SlidingWindow(window_seconds=60.0)
+        self._action_durations = QuantileSketch()
         self._action_lock = threading.Lock()
 
         # Event tracking
@@ -108,9 +146,16 @@ class MetricsCollector:
         self._events_processed = 0
         self._events_failed = 0
         self._event_durations: deque[float] = deque(maxlen=history_size)
+        self._event_duration_total = 0.0  # Sum of _event_durations
+        self._event_sketch = QuantileSketch()
         self._event_queue_depth = 0
         self._event_lock = threading.Lock()
 
+        # Per-thread record buffers, drained under the action and event locks
+        self._local = threading.local()
+        self._buffers: list[_RecordBuffer] = []
+        self._buffers_lock = threading.Lock()
+
         # System metrics cache
         self._last_cpu_percent = 0.0
 
@@ -205,44 +250,30 @@ class MetricsCollector:
         Returns:
             ActionMetrics with current action statistics
         """
+        self.flush()
         with self._action_lock:
             now = time.time()
-            window_start = now - 60.0  # 1 minute window
-
-            # Filter recent actions
-            recent_actions = [
-                action for action in self._action_history if action.timestamp >= window_start
-            ]
-
-            # Calculate metrics
-            total_actions = len(self._action_history)
-            actions_per_minute = float(len(recent_actions))
-
-            # Calculate average duration
-            if recent_actions:
-                avg_duration = sum(a.duration for a in recent_actions) / len(recent_actions)
-            else:
-                avg_duration = 0.0
+            recent = self._action_window.totals(now)  # Last minute
 
-            # Calculate success rate
-            if recent_actions:
-                successes = sum(1 for a in recent_actions if a.success)
-                success_rate = (successes / len(recent_actions)) * 100.0
+            if recent.count:
+                success_rate = (recent.count - recent.failures) / recent.count * 100.0
             else:
                 success_rate = 100.0
 
-            # Count errors
-            error_count = sum(1 for a in self._action_history if not a.success)
+            durations = self._action_durations.summary()
 
             return ActionMetrics(
                 timestamp=now,
-                total_actions=total_actions,
-                actions_per_minute=actions_per_minute,
-                avg_duration=avg_duration,
+                total_actions=len(self._action_history),
+                actions_per_minute=float(recent.count),
+                avg_duration=recent.mean,
                 current_action=self._current_action,
                 queue_depth=self._action_queue_depth,
                 success_rate=success_rate,
-                error_count=error_count,
+                error_count=self._action_errors,
+                p50_duration=durations["p50"],
+                p95_duration=durations["p95"],
+                p99_duration=durations["p99"],
             )
 
     def collect_event_metrics(self) -> EventMetrics:
@@ -251,12 +282,14 @@ class MetricsCollector:
         Returns:
             EventMetrics with current event statistics
         """
+        self.flush()
         with self._event_lock:
             # Calculate average processing time
             if self._event_durations:
-                avg_time = sum(self._event_durations) / len(self._event_durations)
+                avg_time = self._event_duration_total / len(self._event_durations)
             else:
                 avg_time = 0.0
+            processing_times = self._event_sketch.summary()
 
             return EventMetrics(
                 timestamp=time.time(),
@@ -265,6 +298,9 @@ class MetricsCollector:
                 events_failed=self._events_failed,
                 avg_processing_time=avg_time,
                 queue_depth=self._event_queue_depth,
+                p50_processing_time=processing_times["p50"],
+                p95_processing_time=processing_times["p95"],
+                p99_processing_time=processing_times["p99"],
             )
 
     def get_latest_metrics(self) -> dict[str, Any]:
@@ -295,6 +331,9 @@ class MetricsCollector:
                 "queue_depth": actions.queue_depth,
                 "success_rate": actions.success_rate,
                 "error_count": actions.error_count,
+                "p50_duration": actions.p50_duration,
+                "p95_duration": actions.p95_duration,
+                "p99_duration": actions.p99_duration,
             },
             "events": {
                 "timestamp": events.timestamp,
@@ -303,26 +342,98 @@ class MetricsCollector:
                 "events_failed": events.events_failed,
                 "avg_processing_time": events.avg_processing_time,
                 "queue_depth": events.queue_depth,
+                "p50_processing_time": events.p50_processing_time,
+                "p95_processing_time": events.p95_processing_time,
+                "p99_processing_time": events.p99_processing_time,
             },
         }
 
     def record_action(self, name: str, duration: float, success: bool = True) -> None:
         """Record an action execution.
 
+        Appends to the calling thread's buffer without taking a lock.
+
         Args:
             name: Name of the action
             duration: Execution duration in seconds
             success: Whether the action succeeded
         """
-        with self._action_lock:
-            self._action_history.append(
-                ActionRecord(
-                    timestamp=time.time(),
-                    name=name,
-                    duration=duration,
-                    success=success,
-                )
-            )
+        buffer = self._thread_buffer()
+        buffer.actions.append((time.time(), name, duration, success))
+        if len(buffer.actions) >= _BUFFER_FLUSH_SIZE:
+            self._drain(buffer)
+
+    def _thread_buffer(self) -> _RecordBuffer:
+        """Get the calling thread's record buffer, registering it on first use."""
+        buffer: _RecordBuffer | None = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = _RecordBuffer(threading.current_thread())
+            self._local.buffer = buffer
+            with self._buffers_lock:
+                self._buffers.append(buffer)
+        return buffer
+
+    def flush(self) -> None:
+        """Fold every thread's buffered records into the aggregates.
+
+        Called by the collection thread and before metrics are read, so
+        callers only need it to inspect the aggregates directly.
+        """
+        with self._buffers_lock:
+            buffers = list(self._buffers)
+
+        for buffer in buffers:
+            self._drain(buffer)
+
+        # Forget buffers of threads that have exited, once they are empty
+        if any(not buffer.thread.is_alive() for buffer in buffers):
+            with self._buffers_lock:
+                self._buffers = [
+                    buffer
+                    for buffer in self._buffers
+                    if buffer.thread.is_alive() or buffer.actions or buffer.events
+                ]
+
+    def _drain(self, buffer: _RecordBuffer) -> None:
+        """Move one buffer's records into the aggregates."""
+        actions = buffer.actions
+        if actions:
+            with self._action_lock:
+                history = self._action_history
+                for _ in range(len(actions)):
+                    timestamp, name, duration, success = actions.popleft()
+                    if len(history) == history.maxlen and not history[0].success:
+                        self._action_errors -= 1  # The oldest record is about to be dropped
+                    if not success:
+                        self._action_errors += 1
+
+                    history.append(
+                        ActionRecord(
+                            timestamp=timestamp,
+                            name=name,
+                            duration=duration,
+                            success=success,
+                        )
+                    )
+                    self._action_window.add(duration, success, timestamp)
+                    self._action_durations.add(duration)
+
+        events = buffer.events
+        if events:
+            with self._event_lock:
+                durations = self._event_durations
+                for _ in range(len(events)):
+                    processing_time, success = events.popleft()
+                    self._events_queued += 1
+                    if success:
+                        self._events_processed += 1
+                        if len(durations) == durations.maxlen:
+                            self._event_duration_total -= durations[0]
+                        durations.append(processing_time)
+                        self._event_duration_total += processing_time
+                        self._event_sketch.add(processing_time)
+                    else:
+                        self._events_failed += 1
 
     def set_current_action(self, name: str | None) -> None:
         """Set the currently executing action.
@@ -345,17 +456,16 @@ class MetricsCollector:
     def record_event(self, processing_time: float, success: bool = True) -> None:
         """Record an event processing.
 
+        Appends to the calling thread's buffer without taking a lock.
+
         Args:
             processing_time: Time taken to process event in seconds
             success: Whether processing succeeded
         """
-        with self._event_lock:
-            self._events_queued += 1
-            if success:
-                self._events_processed += 1
-                self._event_durations.append(processing_time)
-            else:
-                self._events_failed += 1
+        buffer = self._thread_buffer()
+        buffer.events.append((processing_time, success))
+        if len(buffer.events) >= _BUFFER_FLUSH_SIZE:
+            self._drain(buffer)
 
     def set_event_queue_depth(self, depth: int) -> None:
         """Set the current event queue depth.
@@ -366,6 +476,37 @@ class MetricsCollector:
         with self._event_lock:
             self._event_queue_depth = depth
 
+    def get_sketches(self) -> dict[str, QuantileSketch]:
+        """Get copies of the collector's quantile sketches.
+
+        Returns:
+            Dictionary with "action_duration" and "event_processing_time"
+            sketches, e.g. to serialize with ``to_dict`` and send to another
+            process
+        """
+        self.flush()
+        with self._action_lock:
+            action_duration = self._action_durations.copy()
+        with self._event_lock:
+            event_processing_time = self._event_sketch.copy()
+        return {
+            "action_duration": action_duration,
+            "event_processing_time": event_processing_time,
+        }
+
+    def merge_sketches(self, sketches: dict[str, QuantileSketch]) -> None:
+        """Merge sketches from another collector (e.g. a worker process).
+
+        Args:
+            sketches: Sketches as returned by another collector's ``get_sketches``
+        """
+        if "action_duration" in sketches:
+            with self._action_lock:
+                self._action_durations.merge(sketches["action_duration"])
+        if "event_processing_time" in sketches:
+            with self._event_lock:
+                self._event_sketch.merge(sketches["event_processing_time"])
+
     def get_metrics_from_queue(self, timeout: float = 0.1) -> dict[str, Any] | None:
         """Get next metrics from queue.
 
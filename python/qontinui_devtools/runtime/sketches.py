@@ -0,0 +1,414 @@
+"""Streaming quantile sketches and sliding-window counters.
+
+Percentiles of latencies and durations are usually computed by sorting every
+sample each time they are read. ``QuantileSketch`` instead keeps a
+logarithmically bucketed histogram in the style of DDSketch: each value is
+counted in the bucket ``ceil(log(v) / log(gamma))``, so any quantile it
+reports is within a fixed relative error of the true value. Adding a sample
+is O(1), memory is bounded by the number of buckets, and sketches built in
+different threads or worker processes can be merged exactly.
+
+``SlidingWindow`` keeps counts, sums and failures for the last N seconds in
+a ring of fixed time slots, so rates and averages over a recent window are
+read without rescanning a history of records.
+
+Neither class is thread-safe; callers guard them with their own locks.
+
+Example:
+    >>> sketch = QuantileSketch(relative_accuracy=0.01)
+    >>> for latency in latencies:
+    ...     sketch.add(latency)
+    >>> p95 = sketch.percentile(95)
+    >>> merged = QuantileSketch.from_dict(worker_payload)
+    >>> merged.merge(sketch)
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Any
+
+# Values closer to zero than this are counted in the zero bucket
+_MIN_INDEXABLE = 1e-9
+
+
+class _BucketStore:
+    """Bucket counts for one sign of value, with bounded size."""
+
+    __slots__ = ("buckets", "floor", "max_buckets")
+
+    def __init__(self, max_buckets: int) -> None:
+        self.buckets: dict[int, int] = {}
+        # Buckets below this index have been collapsed into it
+        self.floor: int | None = None
+        self.max_buckets = max_buckets
+
+    def add(self, index: int, count: int) -> None:
+        if self.floor is not None and index < self.floor:
+            index = self.floor
+        self.buckets[index] = self.buckets.get(index, 0) + count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def merge(self, other: "_BucketStore") -> None:
+        if other.floor is not None and (self.floor is None or other.floor > self.floor):
+            # Adopt the coarser floor so both sides clamp low values the same way
+            self.floor = other.floor
+            below = [i for i in self.buckets if i < self.floor]
+            if below:
+                collapsed = sum(self.buckets.pop(i) for i in below)
+                self.buckets[self.floor] = self.buckets.get(self.floor, 0) + collapsed
+        for index, count in other.buckets.items():
+            self.add(index, count)
+
+    def _collapse(self) -> None:
+        """Fold the smallest-magnitude buckets so at most ``max_buckets`` remain."""
+        indexes = sorted(self.buckets)
+        excess = len(indexes) - self.max_buckets
+        self.floor = indexes[excess]
+        for index in indexes[:excess]:
+            self.buckets[self.floor] += self.buckets.pop(index)
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with bounded relative error.
+
+    Every quantile is accurate to within ``relative_accuracy`` of the true
+    sample value (1% by default). When the number of buckets exceeds
+    ``max_buckets`` the smallest-magnitude buckets are collapsed together,
+    which only affects the accuracy of the lowest quantiles.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048) -> None:
+        """Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of reported quantiles
+                (between 0 and 1, exclusive)
+            max_buckets: Maximum buckets kept for each sign of value
+
+        Raises:
+            ValueError: If an argument is out of range
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_buckets < 1:
+            raise ValueError("max_buckets must be at least 1")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+        self._positive = _BucketStore(max_buckets)
+        self._negative = _BucketStore(max_buckets)
+        self._zero = 0
+
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        """Representative value of a bucket (its midpoint in relative terms)."""
+        return 2 * self._gamma**index / (self._gamma + 1)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a value to the sketch.
+
+        Args:
+            value: Sample value
+            count: Number of times the value was observed
+        """
+        if count <= 0:
+            return
+
+        if value > _MIN_INDEXABLE:
+            self._positive.add(self._index(value), count)
+        elif value < -_MIN_INDEXABLE:
+            self._negative.add(self._index(-value), count)
+        else:
+            self._zero += count
+
+        self.count += count
+        self.sum += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add all values of another sketch to this one.
+
+        Args:
+            other: Sketch built with the same relative accuracy
+
+        Raises:
+            ValueError: If the sketches have different relative accuracies
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracies")
+        if not other.count:
+            return
+
+        self._positive.merge(other._positive)
+        self._negative.merge(other._negative)
+        self._zero += other._zero
+
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile.
+
+        Args:
+            q: Quantile between 0 and 1 (e.g. 0.95)
+
+        Returns:
+            Estimated value, within the relative accuracy of the true quantile
+
+        Raises:
+            ValueError: If the sketch is empty or q is out of range
+        """
+        if not self.count:
+            raise ValueError("Cannot calculate quantile of empty sketch")
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        seen = 0
+
+        # Most negative values first: larger magnitudes come first
+        negative = self._negative.buckets
+        for index in sorted(negative, reverse=True):
+            seen += negative[index]
+            if seen > rank:
+                return self._clamp(-self._value(index))
+
+        seen += self._zero
+        if seen > rank:
+            return self._clamp(0.0)
+
+        positive = self._positive.buckets
+        for index in sorted(positive):
+            seen += positive[index]
+            if seen > rank:
+                return self._clamp(self._value(index))
+
+        return self.max
+
+    def percentile(self, percentile: float) -> float:
+        """Estimate a percentile.
+
+        Args:
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            Estimated value
+
+        Raises:
+            ValueError: If the sketch is empty or percentile is out of range
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError("Percentile must be between 0 and 100")
+        return self.quantile(percentile / 100)
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self.min), self.max)
+
+    @property
+    def mean(self) -> float:
+        """Mean of all values (0.0 if empty)."""
+        return self.sum / self.count if self.count else 0.0
+
+    @property
+    def bucket_count(self) -> int:
+        """Number of histogram buckets in use."""
+        buckets = len(self._positive.buckets) + len(self._negative.buckets)
+        return buckets + (1 if self._zero else 0)
+
+    def summary(self) -> dict[str, float]:
+        """Get count, mean, min, max, p50, p95 and p99.
+
+        Returns:
+            Dictionary of statistics (all zero if the sketch is empty)
+        """
+        if not self.count:
+            return {
+                "count": 0,
+                "mean": 0.0,
+                "min": 0.0,
+                "max": 0.0,
+                "p50": 0.0,
+                "p95": 0.0,
+                "p99": 0.0,
+            }
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+    def copy(self) -> "QuantileSketch":
+        """Get an independent copy of the sketch."""
+        return QuantileSketch.from_dict(self.to_dict())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dictionary (e.g. to send between processes)."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_buckets": self.max_buckets,
+            "positive": {str(k): v for k, v in self._positive.buckets.items()},
+            "negative": {str(k): v for k, v in self._negative.buckets.items()},
+            "zero": self._zero,
+            "positive_floor": self._positive.floor,
+            "negative_floor": self._negative.floor,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QuantileSketch":
+        """Rebuild a sketch from ``to_dict`` output.
+
+        Args:
+            data: Serialized sketch
+
+        Returns:
+            Equivalent QuantileSketch
+        """
+        sketch = cls(data["relative_accuracy"], data["max_buckets"])
+        sketch._positive.buckets = {int(k): v for k, v in data["positive"].items()}
+        sketch._negative.buckets = {int(k): v for k, v in data["negative"].items()}
+        sketch._positive.floor = data["positive_floor"]
+        sketch._negative.floor = data["negative_floor"]
+        sketch._zero = data["zero"]
+        sketch.count = data["count"]
+        sketch.sum = data["sum"]
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
+
+    def __repr__(self) -> str:
+        return (
+            f"QuantileSketch(count={self.count}, "
+            f"relative_accuracy={self.relative_accuracy}, buckets={self.bucket_count})"
+        )
+
+
+@dataclass
+class WindowTotals:
+    """Aggregates of a sliding window.
+
+    Attributes:
+        count: Number of values in the window
+        total: Sum of the values
+        failures: Number of values recorded as failures
+    """
+
+    count: int
+    total: float
+    failures: int
+
+    @property
+    def mean(self) -> float:
+        """Mean value (0.0 if the window is empty)."""
+        return self.total / self.count if self.count else 0.0
+
+
+class SlidingWindow:
+    """Counts, sums and failures over the last ``window_seconds``.
+
+    Time is divided into ``slots`` equal slots kept in a ring. Recording a
+    value updates one slot and reading the totals sums the slots, so both
+    cost O(slots) at most regardless of how many values were recorded. The
+    window moves one slot at a time, so it covers between
+    ``window_seconds - window_seconds / slots`` and ``window_seconds`` of
+    history.
+    """
+
+    def __init__(self, window_seconds: float = 60.0, slots: int = 60) -> None:
+        """Initialize an empty window.
+
+        Args:
+            window_seconds: Length of the window in seconds
+            slots: Number of time slots the window is divided into
+
+        Raises:
+            ValueError: If an argument is not positive
+        """
+        if window_seconds <= 0 or slots < 1:
+            raise ValueError("window_seconds and slots must be positive")
+
+        self.window_seconds = window_seconds
+        self._slot_width = window_seconds / slots
+        self._slots = slots
+        self._slot_ids = [-1] * slots
+        self._counts = [0] * slots
+        self._totals = [0.0] * slots
+        self._failures = [0] * slots
+
+    def add(self, value: float, success: bool = True, now: float | None = None) -> None:
+        """Record a value.
+
+        Observations may arrive out of order. One older than the slot it
+        maps to has already left the window and is ignored.
+
+        Args:
+            value: Value to add to the window sum (e.g. a duration)
+            success: Whether to count the value as a failure
+            now: Time of the observation (defaults to the current time)
+        """
+        slot_id = int((time.time() if now is None else now) / self._slot_width)
+        i = slot_id % self._slots
+        if self._slot_ids[i] > slot_id:
+            return
+        if self._slot_ids[i] != slot_id:
+            self._slot_ids[i] = slot_id
+            self._counts[i] = 0
+            self._totals[i] = 0.0
+            self._failures[i] = 0
+
+        self._counts[i] += 1
+        self._totals[i] += value
+        if not success:
+            self._failures[i] += 1
+
+    def totals(self, now: float | None = None) -> WindowTotals:
+        """Get the aggregates of the values currently in the window.
+
+        Args:
+            now: Time to read the window at (defaults to the current time)
+
+        Returns:
+            WindowTotals for the window ending at ``now``
+        """
+        current = int((time.time() if now is None else now) / self._slot_width)
+        oldest = current - self._slots + 1
+
+        count = 0
+        total = 0.0
+        failures = 0
+        for i, slot_id in enumerate(self._slot_ids):
+            if oldest <= slot_id <= current:
+                count += self._counts[i]
+                total += self._totals[i]
+                failures += self._failures[i]
+
+        return WindowTotals(count=count, total=total, failures=failures)
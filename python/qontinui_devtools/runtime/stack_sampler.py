@@ -0,0 +1,175 @@
+"""Low-overhead statistical stack sampler.
+
+A background thread wakes up every ``interval`` seconds, reads the current
+frame of every thread with ``sys._current_frames()`` and records the call
+stack of the threads that are being profiled. The profiled code is never
+instrumented or interrupted, so the overhead is the sampler thread's own
+work (a few percent at 1 kHz) rather than a cost on every function call as
+with ``cProfile``. While profiled threads run pure Python code the sampler
+only gets the GIL at the interpreter's switch interval
+(``sys.getswitchinterval()``, 5 ms by default), which caps the effective
+sample rate.
+
+Frame labels are built once per code object and interned, so a sample is a
+list of references to shared strings. Samples are delivered to the sink
+registered for the sampled thread, which lets ``ActionProfiler`` attribute
+them to the action running in that thread.
+
+Samples have the ``(timestamp, stack)`` shape used by ``flame_graph``: the
+timestamp comes from ``time.perf_counter`` and the stack lists frame labels
+from the outermost call to the innermost.
+"""
+
+import sys
+import threading
+import time
+from types import CodeType, FrameType
+
+# A sink receives (timestamp, stack) samples, e.g. ActionProfile.stack_samples
+SampleSink = list[tuple[float, list[str]]]
+
+
+class StackSampler:
+    """Sample the call stacks of registered threads from a background thread.
+
+    Example:
+        >>> sampler = StackSampler(interval=0.001)
+        >>> sampler.start()
+        >>> samples: list[tuple[float, list[str]]] = []
+        >>> sampler.attach(threading.get_ident(), samples)
+        >>> run_workload()
+        >>> sampler.detach(threading.get_ident())
+        >>> sampler.stop()
+        >>> hot = get_hot_paths(samples)
+    """
+
+    def __init__(self, interval: float = 0.001, max_depth: int = 128) -> None:
+        """Initialize the sampler.
+
+        Args:
+            interval: Time between samples in seconds
+            max_depth: Maximum number of frames recorded per stack (innermost kept)
+
+        Raises:
+            ValueError: If interval or max_depth is not positive
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if max_depth < 1:
+            raise ValueError("max_depth must be at least 1")
+
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples_taken = 0
+        self.sampling_time = 0.0  # Seconds spent inside the sampler loop
+
+        # Thread ID -> stack of sinks; samples go to the innermost (last) sink
+        self._sinks: dict[int, list[SampleSink]] = {}
+        self._lock = threading.Lock()
+        self._labels: dict[CodeType, str] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the sampling thread (no-op if already running)."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="qontinui-stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread and wait for it to exit."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=5.0)
+        self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the sampling thread is running."""
+        return self._thread is not None
+
+    def attach(self, thread_id: int, sink: SampleSink) -> None:
+        """Start recording a thread's stacks into a sink.
+
+        Attaching again for the same thread nests: samples go to the newest
+        sink until it is detached.
+
+        Args:
+            thread_id: Thread identifier (``threading.get_ident()``)
+            sink: List that samples are appended to
+        """
+        with self._lock:
+            self._sinks.setdefault(thread_id, []).append(sink)
+
+    def detach(self, thread_id: int) -> None:
+        """Stop recording into a thread's most recently attached sink.
+
+        Args:
+            thread_id: Thread identifier
+        """
+        with self._lock:
+            sinks = self._sinks.get(thread_id)
+            if sinks:
+                sinks.pop()
+                if not sinks:
+                    del self._sinks[thread_id]
+
+    def _label(self, code: CodeType) -> str:
+        """Get the interned label of a code object."""
+        label = self._labels.get(code)
+        if label is None:
+            label = sys.intern(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+            self._labels[code] = label
+        return label
+
+    def _stack(self, frame: FrameType | None) -> list[str]:
+        """Get frame labels from the outermost to the innermost call."""
+        stack: list[str] = []
+        while frame is not None and len(stack) < self.max_depth:
+            stack.append(self._label(frame.f_code))
+            frame = frame.f_back
+        stack.reverse()
+        return stack
+
+    def sample(self) -> int:
+        """Take one sample of every attached thread.
+
+        Called by the sampling thread; can also be called directly to take
+        samples at chosen points.
+
+        Returns:
+            Number of stacks recorded
+        """
+        with self._lock:
+            targets = [(thread_id, sinks[-1]) for thread_id, sinks in self._sinks.items()]
+        if not targets:
+            return 0
+
+        timestamp = time.perf_counter()
+        frames = sys._current_frames()
+        recorded = 0
+        for thread_id, sink in targets:
+            frame = frames.get(thread_id)
+            if frame is not None:
+                sink.append((timestamp, self._stack(frame)))
+                recorded += 1
+        del frames  # Drop frame references promptly
+
+        self.samples_taken += recorded
+        return recorded
+
+    def _run(self) -> None:
+        """Sampling loop run by the background thread."""
+        while not self._stop.wait(self.interval):
+            started = time.perf_counter()
+            try:
+                self.sample()
+            except Exception:
+                # Keep sampling even if one sample fails
+                pass
+            self.sampling_time += time.perf_counter() - started
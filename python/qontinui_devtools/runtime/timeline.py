@@ -5,22 +5,28 @@ including Chrome Trace Event Format and interactive HTML timelines.
 """
 
 import json
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
+from .trace_writer import ChromeTraceWriter
+
 if TYPE_CHECKING:
-    from .event_tracer import EventTrace
+    from .event_tracer import AnyEventTrace
 
 
-def export_chrome_trace(traces: list["EventTrace"], output_path: str) -> None:
+def export_chrome_trace(traces: Sequence["AnyEventTrace"], output_path: str) -> None:
     """Export traces to Chrome Trace Event Format.
 
     This format can be viewed in chrome://tracing or https://ui.perfetto.dev/
 
+    Events are streamed to the file one trace at a time; see
+    ``ChromeTraceWriter`` for rotation and background export.
+
     Format specification:
     https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU
 
     Args:
-        traces: List of EventTrace instances
+        traces: EventTrace or CompactEventTrace instances
         output_path: Output file path (.json)
 
     Example:
@@ -29,78 +35,15 @@ def export_chrome_trace(traces: list["EventTrace"], output_path: str) -> None:
         >>> export_chrome_trace(tracer.get_all_traces(), "timeline.json")
         >>> # Open chrome://tracing and load timeline.json
     """
-    events: list[Any] = []
-
-    for trace in traces:
-        # Add trace metadata as instant event
-        events.append(
-            {
-                "name": f"{trace.event_type}:{trace.event_id}",
-                "cat": "metadata",
-                "ph": "i",  # Instant event
-                "ts": int(trace.created_at * 1_000_000),
-                "pid": 0,
-                "tid": 0,
-                "s": "g",  # Global scope
-                "args": {
-                    "event_id": trace.event_id,
-                    "event_type": trace.event_type,
-                    "completed": trace.completed,
-                    "total_latency": trace.total_latency,
-                },
-            }
-        )
-
-        # Add duration events for each stage
-        for i, checkpoint in enumerate(trace.checkpoints):
-            if i < len(trace.checkpoints) - 1:
-                next_checkpoint = trace.checkpoints[i + 1]
-
-                # Duration event (Complete event type)
-                events.append(
-                    {
-                        "name": checkpoint.name,
-                        "cat": trace.event_type,
-                        "ph": "X",  # Complete event
-                        "ts": int(checkpoint.timestamp * 1_000_000),  # microseconds
-                        "dur": int((next_checkpoint.timestamp - checkpoint.timestamp) * 1_000_000),
-                        "pid": 0,
-                        "tid": checkpoint.thread_id,
-                        "args": checkpoint.metadata,
-                    }
-                )
-
-            # Add instant event for checkpoint
-            events.append(
-                {
-                    "name": f"checkpoint:{checkpoint.name}",
-                    "cat": trace.event_type,
-                    "ph": "i",  # Instant event
-                    "ts": int(checkpoint.timestamp * 1_000_000),
-                    "pid": 0,
-                    "tid": checkpoint.thread_id,
-                    "s": "t",  # Thread scope
-                    "args": checkpoint.metadata,
-                }
-            )
-
-    # Write trace file
-    trace_data = {
-        "traceEvents": events,
-        "displayTimeUnit": "ms",
-        "systemTraceEvents": "SystemTraceData",
-        "otherData": {"version": "qontinui-devtools-1.0", "trace_count": len(traces)},
-    }
-
-    with open(output_path, "w") as f:
-        json.dump(trace_data, f, indent=2)
+    with ChromeTraceWriter(output_path) as writer:
+        writer.write_traces(traces)
 
 
-def export_timeline_html(traces: list["EventTrace"], output_path: str) -> None:
+def export_timeline_html(traces: Sequence["AnyEventTrace"], output_path: str) -> None:
     """Export interactive HTML timeline visualization.
 
     Args:
-        traces: List of EventTrace instances
+        traces: EventTrace or CompactEventTrace instances
         output_path: Output file path (.html)
 
     Example:
@@ -0,0 +1,565 @@
+"""Streaming trace writers for Chrome Trace Event JSON and Perfetto.
+
+``export_chrome_trace`` used to build every trace event in a list and dump
+it in one go, so exporting a multi-hour session took as much memory as the
+JSON file itself. The writers here encode one trace at a time and append it
+to the open file, so memory stays constant however long the recording is.
+
+``ChromeTraceWriter`` writes the JSON Object Format read by chrome://tracing
+and https://ui.perfetto.dev/. ``PerfettoTraceWriter`` writes Perfetto's
+protobuf trace format, which is several times smaller and loads faster; it
+is encoded by hand, so no protobuf package is needed.
+
+Both writers can rotate to a new file once the current one reaches
+``max_bytes``, and can keep only the newest ``max_files`` files. Every file
+is complete on its own. ``BackgroundTraceExporter`` connects a writer to an
+``EventTracer`` and exports traces from a background thread as they
+complete.
+
+Example:
+    >>> tracer = EventTracer()
+    >>> writer = ChromeTraceWriter("session.json", max_bytes=100 * 1024 * 1024)
+    >>> exporter = BackgroundTraceExporter(tracer, writer)
+    >>> exporter.start()
+    >>> # ... trace events for hours ...
+    >>> exporter.stop()
+    >>> writer.paths
+    [PosixPath('session.json'), PosixPath('session.1.json'), ...]
+"""
+
+import itertools
+import json
+import queue
+import struct
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+if TYPE_CHECKING:
+    from .event_tracer import AnyEventTrace, EventTracer
+
+# File suffixes that select the Perfetto protobuf format
+PERFETTO_SUFFIXES = frozenset({".perfetto-trace", ".pftrace", ".pb"})
+
+
+def chrome_trace_events(trace: "AnyEventTrace") -> Iterator[dict[str, Any]]:
+    """Convert one trace to Chrome Trace Event Format events.
+
+    Yields a global instant event with the trace's summary, a complete
+    ("X") event for each stage between consecutive checkpoints and a
+    thread-scoped instant event for each checkpoint.
+
+    Args:
+        trace: EventTrace or CompactEventTrace to convert
+
+    Yields:
+        Trace event dictionaries
+    """
+    yield {
+        "name": f"{trace.event_type}:{trace.event_id}",
+        "cat": "metadata",
+        "ph": "i",  # Instant event
+        "ts": int(trace.created_at * 1_000_000),
+        "pid": 0,
+        "tid": 0,
+        "s": "g",  # Global scope
+        "args": {
+            "event_id": trace.event_id,
+            "event_type": trace.event_type,
+            "completed": trace.completed,
+            "total_latency": trace.total_latency,
+        },
+    }
+
+    checkpoints = trace.checkpoints
+    for i, checkpoint in enumerate(checkpoints):
+        if i < len(checkpoints) - 1:
+            next_checkpoint = checkpoints[i + 1]
+
+            # Duration event (Complete event type)
+            yield {
+                "name": checkpoint.name,
+                "cat": trace.event_type,
+                "ph": "X",  # Complete event
+                "ts": int(checkpoint.timestamp * 1_000_000),  # microseconds
+                "dur": int((next_checkpoint.timestamp - checkpoint.timestamp) * 1_000_000),
+                "pid": 0,
+                "tid": checkpoint.thread_id,
+                "args": checkpoint.metadata,
+            }
+
+        # Add instant event for checkpoint
+        yield {
+            "name": f"checkpoint:{checkpoint.name}",
+            "cat": trace.event_type,
+            "ph": "i",  # Instant event
+            "ts": int(checkpoint.timestamp * 1_000_000),
+            "pid": 0,
+            "tid": checkpoint.thread_id,
+            "s": "t",  # Thread scope
+            "args": checkpoint.metadata,
+        }
+
+
+class TraceWriter(ABC):
+    """Base class for writers that append traces to a rotating file.
+
+    Subclasses encode traces; this class handles files, rotation and
+    locking. All methods are thread-safe.
+    """
+
+    def __init__(
+        self, path: str | Path, max_bytes: int | None = None, max_files: int | None = None
+    ) -> None:
+        """Open the first output file.
+
+        Args:
+            path: Output file path. Rotated files are named ``<stem>.<n><suffix>``
+            max_bytes: Start a new file rather than grow the current one past
+                this size (None never rotates). A trace is never split, so a
+                file holding a single large trace can exceed it
+            max_files: Delete the oldest files beyond this many (None keeps all)
+
+        Raises:
+            ValueError: If max_bytes or max_files is not positive
+        """
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        if max_files is not None and max_files < 1:
+            raise ValueError(f"max_files must be at least 1, got {max_files}")
+
+        self._path = Path(path)
+        self._max_bytes = max_bytes
+        self._max_files = max_files
+        self._lock = threading.Lock()
+        self._paths: list[Path] = []
+        self._file: BinaryIO | None = None
+        self._file_index = 0
+        self._bytes = 0
+        self._file_traces = 0
+        self.traces_written = 0
+        self._open_next()
+
+    @property
+    def paths(self) -> list[Path]:
+        """Files written so far and still on disk, oldest first."""
+        with self._lock:
+            return self._paths.copy()
+
+    def write_trace(self, trace: "AnyEventTrace") -> None:
+        """Append one trace, rotating to a new file if the current one is full.
+
+        Args:
+            trace: EventTrace or CompactEventTrace to write
+
+        Raises:
+            ValueError: If the writer has been closed
+        """
+        with self._lock:
+            if self._file is None:
+                raise ValueError("Trace writer is closed")
+            data = self._encode_trace(trace)
+            if self._file_traces and not self._fits(len(data)):
+                self._finish_file()
+                self._open_next()
+                data = self._encode_trace(trace)  # Per-file state was reset
+
+            self._write(self._separator() + data)
+            self._file_traces += 1
+            self.traces_written += 1
+
+    def _fits(self, size: int) -> bool:
+        """Whether a trace of ``size`` bytes fits in the current file, footer included."""
+        if self._max_bytes is None:
+            return True
+        needed = self._bytes + len(self._separator()) + size
+        self._file_traces += 1  # The footer may count the trace
+        needed += len(self._footer())
+        self._file_traces -= 1
+        return needed <= self._max_bytes
+
+    def write_traces(self, traces: Iterable["AnyEventTrace"]) -> None:
+        """Append several traces.
+
+        Args:
+            traces: Traces to write
+        """
+        for trace in traces:
+            self.write_trace(trace)
+
+    def flush(self) -> None:
+        """Flush buffered output to the operating system."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Finish the current file. Further writes raise ValueError."""
+        with self._lock:
+            if self._file is not None:
+                self._finish_file()
+
+    def __enter__(self) -> "TraceWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _open_next(self) -> None:
+        """Open the next file in the rotation and write its header."""
+        if self._file_index == 0:
+            path = self._path
+        else:
+            path = self._path.with_name(f"{self._path.stem}.{self._file_index}{self._path.suffix}")
+        self._file_index += 1
+
+        self._file = open(path, "wb")  # noqa: SIM115 - closed in _finish_file
+        self._paths.append(path)
+        self._bytes = 0
+        self._file_traces = 0
+        self._start_file()
+        self._write(self._header())
+
+        if self._max_files is not None:
+            while len(self._paths) > self._max_files:
+                self._paths.pop(0).unlink(missing_ok=True)
+
+    def _finish_file(self) -> None:
+        """Write the current file's footer and close it."""
+        assert self._file is not None
+        self._write(self._footer())
+        self._file.close()
+        self._file = None
+
+    def _write(self, data: bytes) -> None:
+        assert self._file is not None
+        self._file.write(data)
+        self._bytes += len(data)
+
+    def _start_file(self) -> None:  # noqa: B027 - optional hook
+        """Reset per-file encoder state (called before the header)."""
+
+    def _header(self) -> bytes:
+        return b""
+
+    def _footer(self) -> bytes:
+        return b""
+
+    def _separator(self) -> bytes:
+        """Bytes written before each trace."""
+        return b""
+
+    @abstractmethod
+    def _encode_trace(self, trace: "AnyEventTrace") -> bytes:
+        """Encode one trace (called under the writer lock)."""
+
+
+class ChromeTraceWriter(TraceWriter):
+    """Streams traces as Chrome Trace Event Format JSON.
+
+    Each file is a JSON object with a ``traceEvents`` array, written as
+    traces arrive and terminated on rotation or ``close``. A file that was
+    never closed (e.g. after a crash) lacks the closing bracket; Perfetto's
+    UI still loads it, and appending ``]}`` repairs it for other readers.
+    """
+
+    def _header(self) -> bytes:
+        return b'{"traceEvents": [\n'
+
+    def _footer(self) -> bytes:
+        trailer = {
+            "displayTimeUnit": "ms",
+            "systemTraceEvents": "SystemTraceData",
+            "otherData": {"version": "qontinui-devtools-1.0", "trace_count": self._file_traces},
+        }
+        # Splice the trailer's members in after the event array
+        return b"\n], " + json.dumps(trailer)[1:].encode() + b"\n"
+
+    def _separator(self) -> bytes:
+        return b",\n" if self._file_traces else b""
+
+    def _encode_trace(self, trace: "AnyEventTrace") -> bytes:
+        # Metadata values that are not JSON types are written as strings
+        return ",\n".join(
+            json.dumps(event, default=str) for event in chrome_trace_events(trace)
+        ).encode()
+
+
+# Protobuf wire types
+_VARINT = 0
+_FIXED64 = 1
+_LENGTH_DELIMITED = 2
+
+# Field numbers from Perfetto's trace.proto / track_event.proto
+_TRACE_PACKET = 1  # Trace.packet
+_PACKET_TIMESTAMP = 8
+_PACKET_SEQUENCE_ID = 10  # trusted_packet_sequence_id
+_PACKET_TRACK_EVENT = 11
+_PACKET_TRACK_DESCRIPTOR = 60
+_DESCRIPTOR_UUID = 1
+_DESCRIPTOR_NAME = 2
+_DESCRIPTOR_PARENT_UUID = 5
+_EVENT_DEBUG_ANNOTATIONS = 4
+_EVENT_TYPE = 9
+_EVENT_TRACK_UUID = 11
+_EVENT_CATEGORIES = 22
+_EVENT_NAME = 23
+_ANNOTATION_BOOL = 2
+_ANNOTATION_INT = 4
+_ANNOTATION_DOUBLE = 5
+_ANNOTATION_STRING = 6
+_ANNOTATION_NAME = 10
+
+# TrackEvent.Type values
+_SLICE_BEGIN = 1
+_SLICE_END = 2
+_INSTANT = 3
+
+_SEQUENCE_ID = 1
+
+
+def _varint(value: int) -> bytes:
+    """Encode an integer as a protobuf varint (negatives as 64-bit two's complement)."""
+    value &= 0xFFFF_FFFF_FFFF_FFFF
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _int_field(field_number: int, value: int) -> bytes:
+    return _varint(field_number << 3 | _VARINT) + _varint(value)
+
+
+def _bytes_field(field_number: int, data: bytes) -> bytes:
+    return _varint(field_number << 3 | _LENGTH_DELIMITED) + _varint(len(data)) + data
+
+
+def _str_field(field_number: int, value: str) -> bytes:
+    return _bytes_field(field_number, value.encode())
+
+
+def _debug_annotation(name: str, value: Any) -> bytes:
+    """Encode one DebugAnnotation; unsupported values are written as strings."""
+    data = _str_field(_ANNOTATION_NAME, name)
+    if isinstance(value, bool):
+        data += _int_field(_ANNOTATION_BOOL, value)
+    elif isinstance(value, int) and -(1 << 63) <= value < 1 << 63:
+        data += _int_field(_ANNOTATION_INT, value)
+    elif isinstance(value, float):
+        data += _varint(_ANNOTATION_DOUBLE << 3 | _FIXED64) + struct.pack("<d", value)
+    else:
+        data += _str_field(_ANNOTATION_STRING, str(value))
+    return data
+
+
+class PerfettoTraceWriter(TraceWriter):
+    """Streams traces in Perfetto's protobuf trace format.
+
+    A Perfetto trace is a sequence of ``TracePacket`` messages, so traces are
+    appended without a header or footer. Each event gets its own track,
+    grouped under one parent track per event type; stages become slices on
+    that track and checkpoints become instant events. Checkpoint metadata and
+    thread IDs are attached as debug annotations.
+
+    Open the files in https://ui.perfetto.dev/ or query them with Perfetto's
+    trace processor.
+    """
+
+    def _start_file(self) -> None:
+        # Track descriptors are written to each file, so UUIDs start over
+        self._uuids = itertools.count(1)
+        self._type_tracks: dict[str, int] = {}
+
+    def _packet(self, payload: bytes, timestamp: float | None = None) -> bytes:
+        data = _int_field(_PACKET_SEQUENCE_ID, _SEQUENCE_ID) + payload
+        if timestamp is not None:
+            data = _int_field(_PACKET_TIMESTAMP, int(timestamp * 1_000_000_000)) + data
+        return _bytes_field(_TRACE_PACKET, data)
+
+    def _descriptor(self, uuid: int, name: str, parent_uuid: int | None = None) -> bytes:
+        data = _int_field(_DESCRIPTOR_UUID, uuid) + _str_field(_DESCRIPTOR_NAME, name)
+        if parent_uuid is not None:
+            data += _int_field(_DESCRIPTOR_PARENT_UUID, parent_uuid)
+        return self._packet(_bytes_field(_PACKET_TRACK_DESCRIPTOR, data))
+
+    def _event(
+        self,
+        timestamp: float,
+        track_uuid: int,
+        event_type: int,
+        name: str | None = None,
+        category: str | None = None,
+        annotations: dict[str, Any] | None = None,
+    ) -> bytes:
+        data = _int_field(_EVENT_TYPE, event_type) + _int_field(_EVENT_TRACK_UUID, track_uuid)
+        if name is not None:
+            data += _str_field(_EVENT_NAME, name)
+        if category is not None:
+            data += _str_field(_EVENT_CATEGORIES, category)
+        for key, value in (annotations or {}).items():
+            data += _bytes_field(_EVENT_DEBUG_ANNOTATIONS, _debug_annotation(str(key), value))
+        return self._packet(_bytes_field(_PACKET_TRACK_EVENT, data), timestamp)
+
+    def _encode_trace(self, trace: "AnyEventTrace") -> bytes:
+        parts: list[bytes] = []
+        parent_uuid = self._type_tracks.get(trace.event_type)
+        if parent_uuid is None:
+            parent_uuid = self._type_tracks[trace.event_type] = next(self._uuids)
+            parts.append(self._descriptor(parent_uuid, trace.event_type))
+
+        track_uuid = next(self._uuids)
+        parts.append(self._descriptor(track_uuid, trace.event_id, parent_uuid))
+        parts.append(
+            self._event(
+                trace.created_at,
+                track_uuid,
+                _INSTANT,
+                f"{trace.event_type}:{trace.event_id}",
+                "metadata",
+                {"completed": trace.completed, "total_latency": trace.total_latency},
+            )
+        )
+
+        checkpoints = trace.checkpoints
+        for i, checkpoint in enumerate(checkpoints):
+            annotations = {"thread_id": checkpoint.thread_id, **checkpoint.metadata}
+            parts.append(
+                self._event(
+                    checkpoint.timestamp,
+                    track_uuid,
+                    _INSTANT,
+                    f"checkpoint:{checkpoint.name}",
+                    trace.event_type,
+                    annotations,
+                )
+            )
+            if i < len(checkpoints) - 1:
+                parts.append(
+                    self._event(
+                        checkpoint.timestamp,
+                        track_uuid,
+                        _SLICE_BEGIN,
+                        checkpoint.name,
+                        trace.event_type,
+                        annotations,
+                    )
+                )
+                parts.append(self._event(checkpoints[i + 1].timestamp, track_uuid, _SLICE_END))
+
+        return b"".join(parts)
+
+
+def open_trace_writer(
+    path: str | Path, max_bytes: int | None = None, max_files: int | None = None
+) -> TraceWriter:
+    """Open a writer for the format implied by a file's suffix.
+
+    ``.perfetto-trace``, ``.pftrace`` and ``.pb`` select the Perfetto
+    protobuf format; anything else writes Chrome Trace Event JSON.
+
+    Args:
+        path: Output file path
+        max_bytes: Rotation size, see ``TraceWriter``
+        max_files: Number of files to keep, see ``TraceWriter``
+
+    Returns:
+        ChromeTraceWriter or PerfettoTraceWriter
+    """
+    writer_class = (
+        PerfettoTraceWriter if Path(path).suffix in PERFETTO_SUFFIXES else ChromeTraceWriter
+    )
+    return writer_class(path, max_bytes=max_bytes, max_files=max_files)
+
+
+class BackgroundTraceExporter:
+    """Exports traces from an EventTracer to a writer as they complete.
+
+    Completed traces are handed over through a bounded queue and written by
+    a background thread, so tracing never waits for the disk. If the writer
+    falls more than ``max_pending`` traces behind, further traces are
+    dropped and counted rather than buffered. Traces that never complete
+    are not exported; ``EventTracer.find_lost_events`` reports those.
+
+    Example:
+        >>> exporter = BackgroundTraceExporter(tracer, open_trace_writer("run.pftrace"))
+        >>> exporter.start()
+        >>> # ... trace events ...
+        >>> exporter.stop()  # Writes pending traces and closes the writer
+    """
+
+    def __init__(
+        self,
+        tracer: "EventTracer",
+        writer: TraceWriter,
+        max_pending: int = 10_000,
+        flush_interval: float = 1.0,
+    ) -> None:
+        """Initialize the exporter.
+
+        Args:
+            tracer: Tracer whose completed traces are exported
+            writer: Writer to export to; closed by ``stop``
+            max_pending: Maximum number of traces waiting to be written
+            flush_interval: Seconds between flushes of the writer to disk
+        """
+        self._tracer = tracer
+        self._writer = writer
+        self._queue: queue.Queue[AnyEventTrace | None] = queue.Queue(maxsize=max_pending)
+        self._flush_interval = flush_interval
+        self._thread: threading.Thread | None = None
+        self.dropped = 0
+        self.errors = 0
+
+    @property
+    def exported(self) -> int:
+        """Number of traces written so far."""
+        return self._writer.traces_written
+
+    def start(self) -> None:
+        """Start exporting traces completed from now on."""
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(target=self._export_loop, daemon=True)
+        self._thread.start()
+        self._tracer.add_completion_listener(self._enqueue)
+
+    def stop(self) -> None:
+        """Stop exporting, write the traces still queued and close the writer."""
+        if self._thread is None:
+            return
+
+        self._tracer.remove_completion_listener(self._enqueue)
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        self._writer.close()
+
+    def _enqueue(self, trace: "AnyEventTrace") -> None:
+        """Completion listener: hand a trace to the export thread."""
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+
+    def _export_loop(self) -> None:
+        """Write queued traces until stopped."""
+        while True:
+            try:
+                trace = self._queue.get(timeout=self._flush_interval)
+            except queue.Empty:
+                self._writer.flush()
+                continue
+
+            if trace is None:
+                break
+            try:
+                self._writer.write_trace(trace)
+            except Exception:
+                # Keep exporting even if one trace cannot be written
+                self.errors += 1
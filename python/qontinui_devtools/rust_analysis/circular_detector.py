@@ -12,6 +12,8 @@ from typing import Any
 
 from rich.console import Console
 
+from ..project import FileInventory, find_files
+
 HAS_NETWORKX = importlib.util.find_spec("networkx") is not None
 
 
@@ -51,15 +53,19 @@ class CircularDependencyDetector:
         ...     print(cycle)
     """
 
-    def __init__(self, root_path: str, verbose: bool = False) -> None:
+    def __init__(
+        self, root_path: str, verbose: bool = False, inventory: FileInventory | None = None
+    ) -> None:
         """Initialize the detector.
 
         Args:
             root_path: Root directory of the Rust project to analyze
             verbose: If True, print progress information
+            inventory: Shared file inventory (the tree is scanned if omitted)
         """
         self.root_path = Path(root_path).resolve()
         self.verbose = verbose
+        self.inventory = inventory
         self.console = Console()
 
         # State populated during analysis
@@ -99,7 +105,7 @@ class CircularDependencyDetector:
 
     def _scan_directory(self) -> None:
         """Scan directory tree and extract modules from all Rust files."""
-        rust_files = list(self.root_path.rglob("*.rs"))
+        rust_files = find_files(self.root_path, "rust", self.inventory)
 
         for file_path in rust_files:
             self._process_file(file_path)
@@ -8,6 +8,7 @@ This module measures code complexity in Rust projects:
 """
 
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -15,6 +16,8 @@ from typing import Any
 from rich.console import Console
 from rich.table import Table
 
+from ..project import FileInventory, find_files
+
 
 @dataclass
 class ComplexityMetrics:
@@ -52,7 +55,11 @@ class ComplexityAnalyzer:
     """
 
     def __init__(
-        self, root_path: str, verbose: bool = False, complexity_threshold: int = 10
+        self,
+        root_path: str,
+        verbose: bool = False,
+        complexity_threshold: int = 10,
+        inventory: FileInventory | None = None,
     ) -> None:
         """Initialize the analyzer.
 
@@ -60,23 +67,19 @@ class ComplexityAnalyzer:
             root_path: Root directory to analyze
             verbose: If True, print progress information
             complexity_threshold: Threshold for flagging complex functions
+            inventory: Shared file inventory (the tree is scanned if omitted)
         """
         self.root_path = Path(root_path)
         self.verbose = verbose
+        self.inventory = inventory
         self.complexity_threshold = complexity_threshold
         self.console = Console()
         self._metrics: list[ComplexityMetrics] = []
 
     def _find_rust_files(self) -> list[Path]:
         """Find all Rust files in the project."""
-        rust_files: list[Any] = []
-        for path in self.root_path.rglob("*.rs"):
-            parts = path.parts
-            skip_dirs = {"target", ".git", "vendor"}
-            if any(skip_dir in parts for skip_dir in skip_dirs):
-                continue
-            rust_files.append(path)
-        return rust_files
+        # target/ and .git/ are pruned by every scan; vendored crates are skipped too
+        return find_files(self.root_path, "rust", self.inventory, {"vendor"})
 
     def _calculate_cyclomatic_complexity(self, code: str) -> int:
         """Calculate approximate cyclomatic complexity.
@@ -260,6 +263,21 @@ class ComplexityAnalyzer:
 
         return self._metrics
 
+    def iter_findings(self) -> Iterator[ComplexityMetrics]:
+        """Yield complex elements file by file as each file is analyzed.
+
+        Metrics are not kept on the analyzer, so memory stays bounded on large
+        projects (``get_statistics`` only covers ``analyze`` runs).
+
+        Yields:
+            Complex elements in file order (unsorted by complexity)
+        """
+        for file_path in self._find_rust_files():
+            start = len(self._metrics)
+            self._analyze_file(file_path)
+            yield from self._metrics[start:]
+            del self._metrics[start:]
+
     def get_statistics(self) -> dict[str, Any]:
         """Get statistics about code complexity.
 
@@ -16,7 +16,8 @@ definitions and usages across the codebase.
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+
+from ..project import FileInventory, find_files
 
 
 @dataclass
@@ -56,15 +57,19 @@ class DeadCodeDetector:
     across all Rust files in the project.
     """
 
-    def __init__(self, root_path: str, verbose: bool = False) -> None:
+    def __init__(
+        self, root_path: str, verbose: bool = False, inventory: FileInventory | None = None
+    ) -> None:
         """Initialize the detector.
 
         Args:
             root_path: Root directory to analyze
             verbose: If True, print progress information
+            inventory: Shared file inventory (the tree is scanned if omitted)
         """
         self.root_path = Path(root_path)
         self.verbose = verbose
+        self.inventory = inventory
         self._definitions: dict[str, list[tuple[str, int, str, str]]] = {
             "function": [],
             "struct": [],
@@ -77,15 +82,8 @@ class DeadCodeDetector:
 
     def _find_rust_files(self) -> list[Path]:
         """Find all Rust files in the project."""
-        rust_files: list[Any] = []
-        for path in self.root_path.rglob("*.rs"):
-            # Skip common directories
-            parts = path.parts
-            skip_dirs = {"target", ".git", "vendor"}
-            if any(skip_dir in parts for skip_dir in skip_dirs):
-                continue
-            rust_files.append(path)
-        return rust_files
+        # target/ and .git/ are pruned by every scan; vendored crates are skipped too
+        return find_files(self.root_path, "rust", self.inventory, {"vendor"})
 
     def _extract_visibility(self, line: str) -> str:
         """Extract visibility modifier from a line.
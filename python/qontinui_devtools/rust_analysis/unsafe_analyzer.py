@@ -7,6 +7,7 @@ This module analyzes the usage of unsafe code in Rust projects:
 """
 
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -14,6 +15,8 @@ from typing import Any
 from rich.console import Console
 from rich.table import Table
 
+from ..project import FileInventory, find_files
+
 
 @dataclass
 class UnsafeBlock:
@@ -50,28 +53,26 @@ class UnsafeAnalyzer:
     The analyzer uses regex patterns to identify unsafe code patterns.
     """
 
-    def __init__(self, root_path: str, verbose: bool = False) -> None:
+    def __init__(
+        self, root_path: str, verbose: bool = False, inventory: FileInventory | None = None
+    ) -> None:
         """Initialize the analyzer.
 
         Args:
             root_path: Root directory to analyze
             verbose: If True, print progress information
+            inventory: Shared file inventory (the tree is scanned if omitted)
         """
         self.root_path = Path(root_path)
         self.verbose = verbose
+        self.inventory = inventory
         self.console = Console()
         self._unsafe_blocks: list[UnsafeBlock] = []
 
     def _find_rust_files(self) -> list[Path]:
         """Find all Rust files in the project."""
-        rust_files: list[Any] = []
-        for path in self.root_path.rglob("*.rs"):
-            parts = path.parts
-            skip_dirs = {"target", ".git", "vendor"}
-            if any(skip_dir in parts for skip_dir in skip_dirs):
-                continue
-            rust_files.append(path)
-        return rust_files
+        # target/ and .git/ are pruned by every scan; vendored crates are skipped too
+        return find_files(self.root_path, "rust", self.inventory, {"vendor"})
 
     def _categorize_unsafe(self, code: str) -> str:
         """Categorize the type of unsafe operation.
@@ -251,6 +252,21 @@ class UnsafeAnalyzer:
 
         return self._unsafe_blocks
 
+    def iter_findings(self) -> Iterator[UnsafeBlock]:
+        """Yield unsafe blocks file by file as each file is scanned.
+
+        Blocks are not kept on the analyzer, so memory stays bounded on large
+        projects (``get_statistics`` only covers ``analyze`` runs).
+
+        Yields:
+            Unsafe blocks in file order
+        """
+        for file_path in self._find_rust_files():
+            start = len(self._unsafe_blocks)
+            self._scan_file(file_path)
+            yield from self._unsafe_blocks[start:]
+            del self._unsafe_blocks[start:]
+
     def get_statistics(self) -> dict[str, Any]:
         """Get statistics about unsafe code usage.
 
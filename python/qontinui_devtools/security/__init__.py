@@ -7,6 +7,14 @@ hardcoded secrets, insecure deserialization, weak cryptography, SSRF, and XXE.
 """
 
 from .models import SecurityReport, Severity, Vulnerability, VulnerabilityType
-from .security_analyzer import SecurityAnalyzer
+from .security_analyzer import FileScan, FileScanResult, SecurityAnalyzer
 
-__all__ = ["SecurityAnalyzer", "SecurityReport", "Vulnerability", "VulnerabilityType", "Severity"]
+__all__ = [
+    "FileScan",
+    "FileScanResult",
+    "SecurityAnalyzer",
+    "SecurityReport",
+    "Vulnerability",
+    "VulnerabilityType",
+    "Severity",
+]
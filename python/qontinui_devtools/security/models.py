@@ -120,6 +120,24 @@ class Vulnerability:
             "confidence": self.confidence,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Vulnerability":
+        """Create vulnerability from dictionary format."""
+        return cls(
+            type=VulnerabilityType(data["type"]),
+            severity=Severity(data["severity"]),
+            file_path=data["file_path"],
+            line_number=data["line_number"],
+            code_snippet=data["code_snippet"],
+            description=data["description"],
+            remediation=data["remediation"],
+            cwe_id=data["cwe_id"],
+            owasp_category=data["owasp_category"],
+            column_offset=data.get("column_offset"),
+            end_line_number=data.get("end_line_number"),
+            confidence=data.get("confidence", 1.0),
+        )
+
     def __str__(self) -> str:
         """String representation of vulnerability."""
         return (
@@ -1,6 +1,4 @@
 """
-from typing import Any, Any
-
 Comprehensive security analyzer for Python code.
 
 This module provides static analysis capabilities to detect common security
@@ -9,12 +7,104 @@ hardcoded secrets, insecure deserialization, weak cryptography, SSRF, and XXE.
 """
 
 import ast
+import bisect
+import os
 import re
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
+from ..project import AnalysisCache, FileInventory, SourceRepository, find_files
 from .models import SecurityReport, Severity, Vulnerability, VulnerabilityType
 
+# Upper bound on files sent to a worker process per task
+_MAX_BATCH_SIZE = 32
+
+
+class FileScan:
+    """
+    Per-file state of a security scan.
+
+    Rules report findings through ``add_vulnerability``. Keeping this state out
+    of the analyzer lets one analyzer scan many files concurrently.
+    """
+
+    def __init__(self, file_path: str, source_lines: list[str], detectors: list[str]) -> None:
+        """
+        Initialize the scan of one file.
+
+        Args:
+            file_path: Path of the file being scanned
+            source_lines: Source split into lines, used for code snippets
+            detectors: Detector names in reporting order
+        """
+        self.file_path = file_path
+        self.source_lines = source_lines
+        self.detector = ""
+        self._findings: dict[str, list[Vulnerability]] = {d: [] for d in detectors}
+
+    def get_code_snippet(self, lineno: int, context: int = 2) -> str:
+        """Get code snippet with context lines."""
+        start = max(0, lineno - context - 1)
+        end = min(len(self.source_lines), lineno + context)
+        lines = self.source_lines[start:end]
+        return "\n".join(lines)
+
+    def add_vulnerability(
+        self,
+        vuln_type: VulnerabilityType,
+        severity: Severity,
+        lineno: int,
+        description: str,
+        remediation: str,
+        cwe_id: str,
+        owasp_category: str,
+        confidence: float = 1.0,
+    ) -> None:
+        """Add a vulnerability found by the currently running detector."""
+        vulnerability = Vulnerability(
+            type=vuln_type,
+            severity=severity,
+            file_path=self.file_path,
+            line_number=lineno,
+            code_snippet=self.get_code_snippet(lineno),
+            description=description,
+            remediation=remediation,
+            cwe_id=cwe_id,
+            owasp_category=owasp_category,
+            confidence=confidence,
+        )
+        self._findings.setdefault(self.detector, []).append(vulnerability)
+
+    def vulnerabilities(self) -> list[Vulnerability]:
+        """Get all findings, grouped by detector in reporting order."""
+        return [vuln for findings in self._findings.values() for vuln in findings]
+
+
+@dataclass
+class FileScanResult:
+    """
+    Result of scanning one file as part of a directory scan.
+
+    Attributes:
+        file_path: Path of the scanned file
+        vulnerabilities: Vulnerabilities found in the file
+        error: Error message if the scan itself failed
+    """
+
+    file_path: str
+    vulnerabilities: list[Vulnerability] = field(default_factory=list)
+    error: str | None = None
+
+
+# A node rule inspects one AST node during the shared traversal. It receives the
+# file's FileScan, the node and, for ``ast.Call`` nodes, the dotted name of the
+# called function ("" for other node types).
+NodeRule = Callable[[FileScan, Any, str], None]
+
 
 class SecurityAnalyzer:
     """
@@ -42,6 +132,34 @@ class SecurityAnalyzer:
         ),
     }
 
+    # Cheap pre-check: source without any of these words cannot match SECRET_PATTERNS
+    SECRET_HINT = re.compile(r"(?i)pass|pwd|api|token|secret|private|cred|auth|akia")
+
+    # Detectors in reporting order; findings are grouped by detector in this order
+    DETECTORS = (
+        "sql_injection",
+        "command_injection",
+        "path_traversal",
+        "hardcoded_secrets",
+        "insecure_deserialization",
+        "weak_crypto",
+        "ssrf",
+        "xxe",
+    )
+
+    # (detector, node type, method) rules dispatched during the single AST traversal
+    NODE_RULES: tuple[tuple[str, type[ast.AST], str], ...] = (
+        ("sql_injection", ast.Call, "_check_sql_injection_call"),
+        ("sql_injection", ast.Assign, "_check_sql_injection_assign"),
+        ("command_injection", ast.Call, "_check_command_injection"),
+        ("path_traversal", ast.Call, "_check_path_traversal"),
+        ("insecure_deserialization", ast.Call, "_check_insecure_deserialization"),
+        ("weak_crypto", ast.Call, "_check_weak_crypto_call"),
+        ("weak_crypto", ast.Constant, "_check_weak_crypto_constant"),
+        ("ssrf", ast.Call, "_check_ssrf"),
+        ("xxe", ast.Call, "_check_xxe"),
+    )
+
     # Common SQL operations that might be vulnerable
     SQL_OPERATIONS = {
         "execute",
@@ -132,17 +250,75 @@ class SecurityAnalyzer:
         "lxml.etree.XMLParser",
     }
 
-    def __init__(self, exclude_patterns: list[str] | None = None) -> None:
+    # Bump when detection rules change so cached results are invalidated
+    CACHE_VERSION = "1"
+
+    def __init__(
+        self,
+        exclude_patterns: list[str] | None = None,
+        sources: SourceRepository | None = None,
+        cache: AnalysisCache | None = None,
+        inventory: FileInventory | None = None,
+    ) -> None:
         """
         Initialize the security analyzer.
 
         Args:
             exclude_patterns: List of glob patterns to exclude from analysis
+            sources: Shared source repository (a private one is created if omitted)
+            cache: Persistent cache for per-file results (disabled if omitted)
+            inventory: Shared file inventory (the tree is scanned if omitted)
         """
         self.exclude_patterns = exclude_patterns or []
+        self.sources = sources if sources is not None else SourceRepository(retain_trees=False)
+        self.cache = cache
+        self.inventory = inventory
+
+        # Result of the most recent analyze_file call
         self.vulnerabilities: list[Vulnerability] = []
         self.current_file = ""
-        self.current_source_lines: list[str] = []
+
+        self.detectors = list(self.DETECTORS)
+        self._dispatch: dict[type[ast.AST], list[tuple[str, NodeRule]]] = {}
+        for detector, node_type, method_name in self.NODE_RULES:
+            self.register_rule(detector, node_type, getattr(self, method_name))
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the analyzer configuration for worker processes.
+
+        The source repository, cache and file inventory are process-local and
+        are not sent; workers read files directly and the parent process
+        handles caching and file discovery.
+        """
+        state = self.__dict__.copy()
+        state["sources"] = None
+        state["cache"] = None
+        state["inventory"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled analyzer with a private source repository."""
+        self.__dict__.update(state)
+        self.sources = SourceRepository(retain_trees=False)
+
+    def register_rule(self, detector: str, node_type: type[ast.AST], rule: NodeRule) -> None:
+        """
+        Register a rule to run on every node of a given type.
+
+        All rules share one traversal of the tree, so adding rules does not add
+        passes over the file. Rules used with ``jobs > 1`` must be picklable
+        (module-level functions or methods of a picklable object).
+
+        Args:
+            detector: Detector name used to group findings (new names are
+                reported after the built-in detectors)
+            node_type: Exact AST node class the rule inspects (e.g. ``ast.Call``)
+            rule: Callable receiving the FileScan, the node and the called
+                function name; it reports findings via ``scan.add_vulnerability``
+        """
+        if detector not in self.detectors:
+            self.detectors.append(detector)
+        self._dispatch.setdefault(node_type, []).append((detector, rule))
 
     def analyze_file(self, file_path: str) -> list[Vulnerability]:
         """
@@ -154,28 +330,35 @@ class SecurityAnalyzer:
         Returns:
             List of detected vulnerabilities
         """
-        self.vulnerabilities = []
         self.current_file = file_path
+        self.vulnerabilities = self._analyze_cached(file_path)
+        return self.vulnerabilities
 
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                source = f.read()
-                self.current_source_lines = source.splitlines()
+    def scan_file(self, file_path: str) -> list[Vulnerability]:
+        """
+        Scan a single file without touching the cache or analyzer state.
+
+        This is the unit of work used by parallel scans: it only reads the
+        analyzer's configuration, so it can run in several threads or worker
+        processes at once.
+
+        Args:
+            file_path: Path to the Python file
 
-            # Parse AST
-            tree = ast.parse(source, filename=file_path)
+        Returns:
+            List of detected vulnerabilities (empty if the file cannot be parsed)
+        """
+        try:
+            source = self.sources.read(file_path)
+            tree = self.sources.parse(file_path)
+            scan = FileScan(file_path, self.sources.lines(file_path), self.detectors)
 
             # Run all detectors
-            self._detect_sql_injection(tree)
-            self._detect_command_injection(tree)
-            self._detect_path_traversal(tree)
-            self._detect_hardcoded_secrets(source)
-            self._detect_insecure_deserialization(tree)
-            self._detect_weak_crypto(tree)
-            self._detect_ssrf(tree)
-            self._detect_xxe(tree)
+            self._run_node_rules(scan, tree)
+            scan.detector = "hardcoded_secrets"
+            self._detect_hardcoded_secrets(scan, source)
 
-            return self.vulnerabilities
+            return scan.vulnerabilities()
 
         except SyntaxError:
             # Skip files with syntax errors
@@ -184,41 +367,189 @@ class SecurityAnalyzer:
             # Skip files that can't be parsed
             return []
 
-    def analyze_directory(self, directory: str, recursive: bool = True) -> SecurityReport:
+    def _analyze_cached(self, file_path: str) -> list[Vulnerability]:
+        """Scan a file, reusing the cached result when its content is unchanged."""
+        cached = self._load_cached(file_path)
+        if cached is not None:
+            return cached
+
+        vulnerabilities = self.scan_file(file_path)
+        self._store_cached(file_path, vulnerabilities)
+        return vulnerabilities
+
+    def _load_cached(self, file_path: str) -> list[Vulnerability] | None:
+        """Load cached vulnerabilities for a file, if any."""
+        if self.cache is None:
+            return None
+
+        cached = self.cache.get("security", file_path, self.CACHE_VERSION, self.detectors)
+        if cached is None:
+            return None
+        return [Vulnerability.from_dict(data) for data in cached]
+
+    def _store_cached(self, file_path: str, vulnerabilities: list[Vulnerability]) -> None:
+        """Store vulnerabilities for a file in the cache."""
+        if self.cache is None:
+            return
+
+        self.cache.put(
+            "security",
+            file_path,
+            [vuln.to_dict() for vuln in vulnerabilities],
+            self.CACHE_VERSION,
+            self.detectors,
+        )
+
+    def find_files(self, directory: str, recursive: bool = True) -> list[Path]:
         """
-        Analyze all Python files in a directory.
+        Find the Python files a directory scan covers.
 
         Args:
             directory: Path to directory
-            recursive: Whether to analyze subdirectories
+            recursive: Whether to include subdirectories
 
         Returns:
-            SecurityReport with all detected vulnerabilities
+            Files not matching any exclude pattern
         """
-        start_time = time.time()
-        all_vulnerabilities: list[Vulnerability] = []
-        files_scanned = 0
-        errors: list[str] = []
-
         directory_path = Path(directory)
 
         # Find all Python files
         if recursive:
-            python_files = list(directory_path.rglob("*.py"))
+            python_files = find_files(directory_path, "python", self.inventory)
         else:
             python_files = list(directory_path.glob("*.py"))
 
         # Filter out excluded patterns
-        python_files = [f for f in python_files if not self._is_excluded(str(f))]
+        return [f for f in python_files if not self._is_excluded(str(f))]
+
+    def scan_directory(
+        self, directory: str, recursive: bool = True, jobs: int = 1
+    ) -> Iterator[FileScanResult]:
+        """
+        Scan a directory, yielding each file's result as soon as it finishes.
+
+        Args:
+            directory: Path to directory
+            recursive: Whether to analyze subdirectories
+            jobs: Number of worker processes (0 uses one per CPU)
+
+        Yields:
+            FileScanResult for every scanned file
+        """
+        yield from self.scan_files(self.find_files(directory, recursive), jobs)
+
+    def iter_findings(
+        self, directory: str, recursive: bool = True, jobs: int = 1
+    ) -> Iterator[Vulnerability]:
+        """
+        Yield vulnerabilities as each file's scan finishes.
+
+        Unlike ``analyze_directory`` nothing is collected, so memory stays
+        bounded on very large trees. Files that fail to scan are skipped; use
+        ``scan_directory`` to see their errors.
+
+        Args:
+            directory: Path to directory
+            recursive: Whether to analyze subdirectories
+            jobs: Number of worker processes (0 uses one per CPU)
+
+        Yields:
+            Vulnerabilities, grouped by file
+        """
+        for result in self.scan_directory(directory, recursive, jobs):
+            yield from result.vulnerabilities
+
+    def scan_files(
+        self, file_paths: list[Path] | list[str], jobs: int = 1
+    ) -> Iterator[FileScanResult]:
+        """
+        Scan files, yielding each file's result as soon as it finishes.
 
-        # Analyze each file
-        for file_path in python_files:
-            try:
-                vulns = self.analyze_file(str(file_path))
-                all_vulnerabilities.extend(vulns)
-                files_scanned += 1
-            except Exception as e:
-                errors.append(f"{file_path}: {str(e)}")
+        With ``jobs > 1`` files are scanned by a pool of worker processes and
+        results arrive in completion order; with ``jobs == 1`` they arrive in
+        file order. Cached results are yielded first without being re-scanned.
+
+        Args:
+            file_paths: Python files to scan
+            jobs: Number of worker processes (0 uses one per CPU)
+
+        Yields:
+            FileScanResult for every file
+        """
+        jobs = jobs if jobs > 0 else os.cpu_count() or 1
+
+        pending: list[str] = []
+        for file_path in map(str, file_paths):
+            cached = self._load_cached(file_path)
+            if cached is not None:
+                yield FileScanResult(file_path, cached)
+            else:
+                pending.append(file_path)
+
+        if jobs == 1 or len(pending) <= 1:
+            for file_path in pending:
+                try:
+                    yield FileScanResult(file_path, self._scan_and_store(file_path))
+                except Exception as e:
+                    yield FileScanResult(file_path, [], error=str(e))
+            return
+
+        batch_size = max(1, min(_MAX_BATCH_SIZE, len(pending) // (jobs * 4)))
+        batches = [pending[i : i + batch_size] for i in range(0, len(pending), batch_size)]
+
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(self,)
+        ) as pool:
+            futures = {pool.submit(_scan_batch, batch): batch for batch in batches}
+            for future in as_completed(futures):
+                try:
+                    results = future.result()
+                except Exception as e:
+                    results = [FileScanResult(path, [], error=str(e)) for path in futures[future]]
+
+                for result in results:
+                    if result.error is None:
+                        self._store_cached(result.file_path, result.vulnerabilities)
+                    yield result
+
+    def _scan_and_store(self, file_path: str) -> list[Vulnerability]:
+        """Scan a file that missed the cache and store its result."""
+        vulnerabilities = self.scan_file(file_path)
+        self._store_cached(file_path, vulnerabilities)
+        return vulnerabilities
+
+    def analyze_directory(
+        self, directory: str, recursive: bool = True, jobs: int = 1
+    ) -> SecurityReport:
+        """
+        Analyze all Python files in a directory.
+
+        Args:
+            directory: Path to directory
+            recursive: Whether to analyze subdirectories
+            jobs: Number of worker processes (1 scans in this process, 0 uses
+                one per CPU). Results are ordered by file either way.
+
+        Returns:
+            SecurityReport with all detected vulnerabilities
+        """
+        start_time = time.time()
+        errors: list[str] = []
+        files_scanned = 0
+        python_files = self.find_files(directory, recursive)
+
+        # Collect per-file results, then merge in file order for a stable report
+        results: dict[str, list[Vulnerability]] = {}
+        for result in self.scan_files(python_files, jobs):
+            if result.error is not None:
+                errors.append(f"{result.file_path}: {result.error}")
+                continue
+            results[result.file_path] = result.vulnerabilities
+            files_scanned += 1
+
+        all_vulnerabilities = [
+            vuln for file_path in python_files for vuln in results.get(str(file_path), [])
+        ]
 
         # Count vulnerabilities by severity
         severity_counts = {
@@ -254,151 +585,151 @@ class SecurityAnalyzer:
                 return True
         return False
 
-    def _get_code_snippet(self, lineno: int, context: int = 2) -> str:
-        """Get code snippet with context lines."""
-        start = max(0, lineno - context - 1)
-        end = min(len(self.current_source_lines), lineno + context)
-        lines = self.current_source_lines[start:end]
-        return "\n".join(lines)
-
-    def _detect_sql_injection(self, tree: ast.AST) -> None:
-        """Detect SQL injection vulnerabilities."""
+    def _run_node_rules(self, scan: FileScan, tree: ast.AST) -> None:
+        """Traverse the tree once, dispatching each node to its registered rules."""
+        dispatch = self._dispatch
         for node in ast.walk(tree):
-            # Check for string concatenation in SQL operations
-            if isinstance(node, ast.Call):
-                func_name = self._get_func_name(node.func)
-
-                if any(sql_op in func_name.lower() for sql_op in self.SQL_OPERATIONS):
-                    # Check if SQL query uses string concatenation or f-strings
-                    for arg in node.args:
-                        if self._is_dynamic_string(arg):
-                            self._add_vulnerability(
-                                VulnerabilityType.SQL_INJECTION,
-                                Severity.CRITICAL,
-                                node.lineno,
-                                "SQL query uses string concatenation or f-strings, "
-                                "potentially vulnerable to SQL injection",
-                                "Use parameterized queries with placeholders (?, %s, or :param) "
-                                "instead of string concatenation. Example: "
-                                "cursor.execute('SELECT * FROM users WHERE id = ?', (user_id,))",
-                                "CWE-89",
-                                "A03:2021 - Injection",
-                            )
-
-            # Also check for dynamic SQL query assignments
-            elif isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        if "query" in target.id.lower() or "sql" in target.id.lower():
-                            if self._is_dynamic_string(node.value):
-                                self._add_vulnerability(
-                                    VulnerabilityType.SQL_INJECTION,
-                                    Severity.CRITICAL,
-                                    node.lineno,
-                                    "SQL query uses string concatenation or f-strings, "
-                                    "potentially vulnerable to SQL injection",
-                                    "Use parameterized queries with placeholders (?, %s, or :param) "
-                                    "instead of string concatenation. Example: "
-                                    "cursor.execute('SELECT * FROM users WHERE id = ?', (user_id,))",
-                                    "CWE-89",
-                                    "A03:2021 - Injection",
-                                )
-
-    def _detect_command_injection(self, tree: ast.AST) -> None:
+            rules = dispatch.get(type(node))
+            if not rules:
+                continue
+
+            func_name = self._get_func_name(node.func) if isinstance(node, ast.Call) else ""
+            for detector, rule in rules:
+                scan.detector = detector
+                rule(scan, node, func_name)
+
+    def _check_sql_injection_call(self, scan: FileScan, node: ast.Call, func_name: str) -> None:
+        """Detect SQL operations called with dynamically built queries."""
+        if any(sql_op in func_name.lower() for sql_op in self.SQL_OPERATIONS):
+            # Check if SQL query uses string concatenation or f-strings
+            for arg in node.args:
+                if self._is_dynamic_string(arg):
+                    scan.add_vulnerability(
+                        VulnerabilityType.SQL_INJECTION,
+                        Severity.CRITICAL,
+                        node.lineno,
+                        "SQL query uses string concatenation or f-strings, "
+                        "potentially vulnerable to SQL injection",
+                        "Use parameterized queries with placeholders (?, %s, or :param) "
+                        "instead of string concatenation. Example: "
+                        "cursor.execute('SELECT * FROM users WHERE id = ?', (user_id,))",
+                        "CWE-89",
+                        "A03:2021 - Injection",
+                    )
+
+    def _check_sql_injection_assign(self, scan: FileScan, node: ast.Assign, func_name: str) -> None:
+        """Detect dynamic SQL query assignments."""
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                if "query" in target.id.lower() or "sql" in target.id.lower():
+                    if self._is_dynamic_string(node.value):
+                        scan.add_vulnerability(
+                            VulnerabilityType.SQL_INJECTION,
+                            Severity.CRITICAL,
+                            node.lineno,
+                            "SQL query uses string concatenation or f-strings, "
+                            "potentially vulnerable to SQL injection",
+                            "Use parameterized queries with placeholders (?, %s, or :param) "
+                            "instead of string concatenation. Example: "
+                            "cursor.execute('SELECT * FROM users WHERE id = ?', (user_id,))",
+                            "CWE-89",
+                            "A03:2021 - Injection",
+                        )
+
+    def _check_command_injection(self, scan: FileScan, node: ast.Call, func_name: str) -> None:
         """Detect command injection vulnerabilities."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                func_name = self._get_func_name(node.func)
-
-                # Check for dangerous exec functions
-                if func_name in self.DANGEROUS_EXEC_FUNCS:
-                    # Check for shell=True in subprocess calls
-                    if "subprocess" in func_name:
-                        has_shell_true = any(
-                            isinstance(kw, ast.keyword)
-                            and kw.arg == "shell"
-                            and isinstance(kw.value, ast.Constant)
-                            and kw.value.value is True
-                            for kw in node.keywords
+        # Check for dangerous exec functions
+        if func_name in self.DANGEROUS_EXEC_FUNCS:
+            # Check for shell=True in subprocess calls
+            if "subprocess" in func_name:
+                has_shell_true = any(
+                    isinstance(kw, ast.keyword)
+                    and kw.arg == "shell"
+                    and isinstance(kw.value, ast.Constant)
+                    and kw.value.value is True
+                    for kw in node.keywords
+                )
+
+                if has_shell_true:
+                    # Check if command uses dynamic strings
+                    if node.args and self._is_dynamic_string(node.args[0]):
+                        scan.add_vulnerability(
+                            VulnerabilityType.COMMAND_INJECTION,
+                            Severity.CRITICAL,
+                            node.lineno,
+                            f"{func_name} with shell=True and dynamic input "
+                            "is vulnerable to command injection",
+                            "Avoid shell=True. Use list arguments instead: "
+                            "subprocess.run(['cmd', arg1, arg2]). "
+                            "If shell is required, use shlex.quote() to escape input.",
+                            "CWE-78",
+                            "A03:2021 - Injection",
+                        )
+                else:
+                    # shell=False but check for dynamic strings in list
+                    if node.args and self._contains_dynamic_elements(node.args[0]):
+                        scan.add_vulnerability(
+                            VulnerabilityType.COMMAND_INJECTION,
+                            Severity.HIGH,
+                            node.lineno,
+                            f"{func_name} uses dynamic command arguments",
+                            "Validate and sanitize all user input before using in commands. "
+                            "Use allowlists for acceptable values.",
+                            "CWE-78",
+                            "A03:2021 - Injection",
                         )
 
-                        if has_shell_true:
-                            # Check if command uses dynamic strings
-                            if node.args and self._is_dynamic_string(node.args[0]):
-                                self._add_vulnerability(
-                                    VulnerabilityType.COMMAND_INJECTION,
-                                    Severity.CRITICAL,
-                                    node.lineno,
-                                    f"{func_name} with shell=True and dynamic input "
-                                    "is vulnerable to command injection",
-                                    "Avoid shell=True. Use list arguments instead: "
-                                    "subprocess.run(['cmd', arg1, arg2]). "
-                                    "If shell is required, use shlex.quote() to escape input.",
-                                    "CWE-78",
-                                    "A03:2021 - Injection",
-                                )
-                        else:
-                            # shell=False but check for dynamic strings in list
-                            if node.args and self._contains_dynamic_elements(node.args[0]):
-                                self._add_vulnerability(
-                                    VulnerabilityType.COMMAND_INJECTION,
-                                    Severity.HIGH,
-                                    node.lineno,
-                                    f"{func_name} uses dynamic command arguments",
-                                    "Validate and sanitize all user input before using in commands. "
-                                    "Use allowlists for acceptable values.",
-                                    "CWE-78",
-                                    "A03:2021 - Injection",
-                                )
-
-                    # os.system is always dangerous with dynamic input
-                    elif func_name == "os.system":
-                        if node.args and self._is_dynamic_string(node.args[0]):
-                            self._add_vulnerability(
-                                VulnerabilityType.COMMAND_INJECTION,
-                                Severity.CRITICAL,
-                                node.lineno,
-                                "os.system() with dynamic input is vulnerable to command injection",
-                                "Replace os.system() with subprocess.run() using list arguments. "
-                                "Never concatenate user input into shell commands.",
-                                "CWE-78",
-                                "A03:2021 - Injection",
-                            )
-
-    def _detect_path_traversal(self, tree: ast.AST) -> None:
+            # os.system is always dangerous with dynamic input
+            elif func_name == "os.system":
+                if node.args and self._is_dynamic_string(node.args[0]):
+                    scan.add_vulnerability(
+                        VulnerabilityType.COMMAND_INJECTION,
+                        Severity.CRITICAL,
+                        node.lineno,
+                        "os.system() with dynamic input is vulnerable to command injection",
+                        "Replace os.system() with subprocess.run() using list arguments. "
+                        "Never concatenate user input into shell commands.",
+                        "CWE-78",
+                        "A03:2021 - Injection",
+                    )
+
+    def _check_path_traversal(self, scan: FileScan, node: ast.Call, func_name: str) -> None:
         """Detect path traversal vulnerabilities."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                func_name = self._get_func_name(node.func)
+        # Check file operations
+        if any(file_op in func_name for file_op in self.FILE_OPERATIONS):
+            # Check if path uses dynamic/user input
+            if node.args and self._is_dynamic_string(node.args[0]):
+                # Check if there's path validation
+                has_validation = self._has_path_validation(node)
+
+                if not has_validation:
+                    scan.add_vulnerability(
+                        VulnerabilityType.PATH_TRAVERSAL,
+                        Severity.HIGH,
+                        node.lineno,
+                        f"{func_name} with unsanitized user input can lead to "
+                        "path traversal attacks",
+                        "Validate file paths using os.path.abspath() and ensure they "
+                        "stay within expected directory. Use os.path.commonpath() to "
+                        "check if path is within allowed directory. "
+                        "Example: if not path.startswith(safe_dir): raise ValueError()",
+                        "CWE-22",
+                        "A01:2021 - Broken Access Control",
+                    )
 
-                # Check file operations
-                if any(file_op in func_name for file_op in self.FILE_OPERATIONS):
-                    # Check if path uses dynamic/user input
-                    if node.args and self._is_dynamic_string(node.args[0]):
-                        # Check if there's path validation
-                        has_validation = self._has_path_validation(node)
-
-                        if not has_validation:
-                            self._add_vulnerability(
-                                VulnerabilityType.PATH_TRAVERSAL,
-                                Severity.HIGH,
-                                node.lineno,
-                                f"{func_name} with unsanitized user input can lead to "
-                                "path traversal attacks",
-                                "Validate file paths using os.path.abspath() and ensure they "
-                                "stay within expected directory. Use os.path.commonpath() to "
-                                "check if path is within allowed directory. "
-                                "Example: if not path.startswith(safe_dir): raise ValueError()",
-                                "CWE-22",
-                                "A01:2021 - Broken Access Control",
-                            )
-
-    def _detect_hardcoded_secrets(self, source: str) -> None:
+    def _detect_hardcoded_secrets(self, scan: FileScan, source: str) -> None:
         """Detect hardcoded secrets in source code."""
+        if not self.SECRET_HINT.search(source):
+            return
+
+        # Offsets of line starts, for mapping match positions to line numbers
+        line_starts = [0]
+        line_starts.extend(m.end() for m in re.finditer("\n", source))
+
         for secret_type, pattern in self.SECRET_PATTERNS.items():
             for match in pattern.finditer(source):
                 # Calculate line number
-                lineno = source[: match.start()].count("\n") + 1
+                lineno = bisect.bisect_right(line_starts, match.start())
 
                 # Skip common false positives (except AWS keys which have specific format)
                 matched_text = match.group(0)
@@ -413,7 +744,7 @@ class SecurityAnalyzer:
                 else:
                     severity = Severity.MEDIUM
 
-                self._add_vulnerability(
+                scan.add_vulnerability(
                     VulnerabilityType.HARDCODED_SECRET,
                     severity,
                     lineno,
@@ -426,166 +757,156 @@ class SecurityAnalyzer:
                     "A07:2021 - Identification and Authentication Failures",
                 )
 
-    def _detect_insecure_deserialization(self, tree: ast.AST) -> None:
+    def _check_insecure_deserialization(
+        self, scan: FileScan, node: ast.Call, func_name: str
+    ) -> None:
         """Detect insecure deserialization vulnerabilities."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                func_name = self._get_func_name(node.func)
+        if func_name in self.DESERIALIZATION_FUNCS:
+            severity = Severity.CRITICAL
+            description = ""
+            remediation = ""
+
+            if "pickle" in func_name:
+                description = (
+                    "pickle.loads/load with untrusted data can execute "
+                    "arbitrary code during deserialization"
+                )
+                remediation = (
+                    "Avoid pickle for untrusted data. Use JSON or other safe "
+                    "serialization formats. If pickle is necessary, implement "
+                    "HMAC signature verification to ensure data integrity."
+                )
+            elif "yaml.load" in func_name and not self._uses_safe_loader(node):
+                description = "yaml.load() without SafeLoader can execute arbitrary code"
+                remediation = (
+                    "Use yaml.safe_load() instead of yaml.load(), or specify "
+                    "Loader=yaml.SafeLoader explicitly."
+                )
+            elif func_name in ["eval", "exec"]:
+                description = f"{func_name}() with user input can execute arbitrary code"
+                remediation = (
+                    f"Avoid {func_name}() with user input. Use ast.literal_eval() "
+                    "for safe evaluation of Python literals, or implement proper "
+                    "parsing/validation logic."
+                )
+            elif func_name == "compile":
+                description = "compile() with user input can create malicious code objects"
+                remediation = "Avoid compile() with user input. Use safe alternatives."
+            else:
+                return
+
+            scan.add_vulnerability(
+                VulnerabilityType.INSECURE_DESERIALIZATION,
+                severity,
+                node.lineno,
+                description,
+                remediation,
+                "CWE-502",
+                "A08:2021 - Software and Data Integrity Failures",
+            )
+
+    def _check_weak_crypto_call(self, scan: FileScan, node: ast.Call, func_name: str) -> None:
+        """Detect calls to weak hash algorithms."""
+        func_name = func_name.lower()
+
+        # Check for weak hash algorithms
+        for weak_algo, (algo_name, cwe) in self.WEAK_CRYPTO.items():
+            if weak_algo in func_name and "hashlib" in func_name:
+                # Check if this is likely non-security use (content hashing, caching, etc.)
+                # by examining the surrounding context
+                if self._is_likely_non_security_hash(scan, node):
+                    continue
 
-                if func_name in self.DESERIALIZATION_FUNCS:
-                    severity = Severity.CRITICAL
-                    description = ""
-                    remediation = ""
+                scan.add_vulnerability(
+                    VulnerabilityType.WEAK_CRYPTO,
+                    Severity.MEDIUM,
+                    node.lineno,
+                    f"Use of weak cryptographic algorithm: {algo_name}",
+                    f"Replace {algo_name} with SHA-256 or SHA-3 for hashing. "
+                    "For password hashing, use bcrypt, scrypt, or Argon2. "
+                    "Example: hashlib.sha256() or from passlib.hash import bcrypt",
+                    cwe,
+                    "A02:2021 - Cryptographic Failures",
+                )
 
-                    if "pickle" in func_name:
-                        description = (
-                            "pickle.loads/load with untrusted data can execute "
-                            "arbitrary code during deserialization"
-                        )
-                        remediation = (
-                            "Avoid pickle for untrusted data. Use JSON or other safe "
-                            "serialization formats. If pickle is necessary, implement "
-                            "HMAC signature verification to ensure data integrity."
-                        )
-                    elif "yaml.load" in func_name and not self._uses_safe_loader(node):
-                        description = "yaml.load() without SafeLoader can execute arbitrary code"
-                        remediation = (
-                            "Use yaml.safe_load() instead of yaml.load(), or specify "
-                            "Loader=yaml.SafeLoader explicitly."
-                        )
-                    elif func_name in ["eval", "exec"]:
-                        description = f"{func_name}() with user input can execute arbitrary code"
-                        remediation = (
-                            f"Avoid {func_name}() with user input. Use ast.literal_eval() "
-                            "for safe evaluation of Python literals, or implement proper "
-                            "parsing/validation logic."
-                        )
-                    elif func_name == "compile":
-                        description = "compile() with user input can create malicious code objects"
-                        remediation = "Avoid compile() with user input. Use safe alternatives."
-                    else:
-                        continue
-
-                    self._add_vulnerability(
-                        VulnerabilityType.INSECURE_DESERIALIZATION,
-                        severity,
+    def _check_weak_crypto_constant(
+        self, scan: FileScan, node: ast.Constant, func_name: str
+    ) -> None:
+        """Detect weak algorithms specified by name in string constants."""
+        if isinstance(node.value, str):
+            value_lower = node.value.lower()
+            for weak_algo, (algo_name, cwe) in self.WEAK_CRYPTO.items():
+                if weak_algo == value_lower:
+                    scan.add_vulnerability(
+                        VulnerabilityType.WEAK_CRYPTO,
+                        Severity.MEDIUM,
                         node.lineno,
-                        description,
-                        remediation,
-                        "CWE-502",
-                        "A08:2021 - Software and Data Integrity Failures",
+                        f"Weak cryptographic algorithm specified: {algo_name}",
+                        f"Replace {algo_name} with stronger alternatives like "
+                        "AES-256-GCM for encryption or SHA-256 for hashing.",
+                        cwe,
+                        "A02:2021 - Cryptographic Failures",
                     )
 
-    def _detect_weak_crypto(self, tree: ast.AST) -> None:
-        """Detect weak cryptographic algorithms."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                func_name = self._get_func_name(node.func).lower()
-
-                # Check for weak hash algorithms
-                for weak_algo, (algo_name, cwe) in self.WEAK_CRYPTO.items():
-                    if weak_algo in func_name and "hashlib" in func_name:
-                        # Check if this is likely non-security use (content hashing, caching, etc.)
-                        # by examining the surrounding context
-                        if self._is_likely_non_security_hash(node):
-                            continue
-
-                        self._add_vulnerability(
-                            VulnerabilityType.WEAK_CRYPTO,
-                            Severity.MEDIUM,
-                            node.lineno,
-                            f"Use of weak cryptographic algorithm: {algo_name}",
-                            f"Replace {algo_name} with SHA-256 or SHA-3 for hashing. "
-                            "For password hashing, use bcrypt, scrypt, or Argon2. "
-                            "Example: hashlib.sha256() or from passlib.hash import bcrypt",
-                            cwe,
-                            "A02:2021 - Cryptographic Failures",
-                        )
-
-            # Check for algorithm specification in strings
-            elif isinstance(node, ast.Constant):
-                if isinstance(node.value, str):
-                    value_lower = node.value.lower()
-                    for weak_algo, (algo_name, cwe) in self.WEAK_CRYPTO.items():
-                        if weak_algo == value_lower:
-                            self._add_vulnerability(
-                                VulnerabilityType.WEAK_CRYPTO,
-                                Severity.MEDIUM,
-                                node.lineno,
-                                f"Weak cryptographic algorithm specified: {algo_name}",
-                                f"Replace {algo_name} with stronger alternatives like "
-                                "AES-256-GCM for encryption or SHA-256 for hashing.",
-                                cwe,
-                                "A02:2021 - Cryptographic Failures",
-                            )
-
-    def _detect_ssrf(self, tree: ast.AST) -> None:
+    def _check_ssrf(self, scan: FileScan, node: ast.Call, func_name: str) -> None:
         """Detect Server-Side Request Forgery vulnerabilities."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                func_name = self._get_func_name(node.func)
-
-                if any(net_func in func_name for net_func in self.NETWORK_FUNCS):
-                    # Check if URL is dynamic or from variable
-                    if node.args:
-                        url_arg = node.args[0]
-                        if self._is_dynamic_string(url_arg) or isinstance(url_arg, ast.Name):
-                            self._add_vulnerability(
-                                VulnerabilityType.SSRF,
-                                Severity.HIGH,
-                                node.lineno,
-                                f"{func_name} with user-controlled URL can lead to SSRF attacks",
-                                "Validate and sanitize URLs. Use an allowlist of permitted domains. "
-                                "Parse URLs and verify scheme, host, and port. Block private IP ranges "
-                                "(127.0.0.0/8, 10.0.0.0/8, 172.16.0.0/12, 192.168.0.0/16). "
-                                "Example: if urlparse(url).hostname not in ALLOWED_HOSTS: raise ValueError()",
-                                "CWE-918",
-                                "A10:2021 - Server-Side Request Forgery",
-                            )
-
-    def _detect_xxe(self, tree: ast.AST) -> None:
+        if any(net_func in func_name for net_func in self.NETWORK_FUNCS):
+            # Check if URL is dynamic or from variable
+            if node.args:
+                url_arg = node.args[0]
+                if self._is_dynamic_string(url_arg) or isinstance(url_arg, ast.Name):
+                    scan.add_vulnerability(
+                        VulnerabilityType.SSRF,
+                        Severity.HIGH,
+                        node.lineno,
+                        f"{func_name} with user-controlled URL can lead to SSRF attacks",
+                        "Validate and sanitize URLs. Use an allowlist of permitted domains. "
+                        "Parse URLs and verify scheme, host, and port. Block private IP ranges "
+                        "(127.0.0.0/8, 10.0.0.0/8, 172.16.0.0/12, 192.168.0.0/16). "
+                        "Example: if urlparse(url).hostname not in ALLOWED_HOSTS: raise ValueError()",
+                        "CWE-918",
+                        "A10:2021 - Server-Side Request Forgery",
+                    )
+
+    def _check_xxe(self, scan: FileScan, node: ast.Call, func_name: str) -> None:
         """Detect XML External Entity vulnerabilities."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                func_name = self._get_func_name(node.func)
-
-                # Check if this is an actual XML parser call
-                # Must match the full path or end with a known XML module prefix
-                is_xml_parser = False
-                for xml_parser in self.XML_PARSERS:
-                    # Check for exact match or proper suffix match
-                    if func_name == xml_parser:
-                        is_xml_parser = True
-                        break
-                    # Also check if it ends with the parser function and starts with xml/lxml
-                    if func_name.endswith(xml_parser.split(".")[-1]):
-                        # Verify it's actually from an XML module
-                        if any(
-                            func_name.startswith(prefix)
-                            for prefix in ["xml.", "lxml.", "ElementTree.", "etree.", "minidom."]
-                        ):
-                            is_xml_parser = True
-                            break
-
-                if is_xml_parser:
-                    # Check if secure processing is enabled
-                    has_secure_processing = self._has_secure_xml_processing(node)
-
-                    if not has_secure_processing:
-                        severity = Severity.HIGH
-
-                        self._add_vulnerability(
-                            VulnerabilityType.XXE,
-                            severity,
-                            node.lineno,
-                            f"{func_name} without secure processing is vulnerable to XXE attacks",
-                            "Disable external entity processing. For xml.etree.ElementTree, use: "
-                            "parser = ET.XMLParser(); parser.entity = {}. "
-                            "For lxml, use: parser = etree.XMLParser(resolve_entities=False). "
-                            "Use defusedxml library for safer XML parsing.",
-                            "CWE-611",
-                            "A05:2021 - Security Misconfiguration",
-                        )
+        # Check if this is an actual XML parser call
+        # Must match the full path or end with a known XML module prefix
+        is_xml_parser = False
+        for xml_parser in self.XML_PARSERS:
+            # Check for exact match or proper suffix match
+            if func_name == xml_parser:
+                is_xml_parser = True
+                break
+            # Also check if it ends with the parser function and starts with xml/lxml
+            if func_name.endswith(xml_parser.split(".")[-1]):
+                # Verify it's actually from an XML module
+                if any(
+                    func_name.startswith(prefix)
+                    for prefix in ["xml.", "lxml.", "ElementTree.", "etree.", "minidom."]
+                ):
+                    is_xml_parser = True
+                    break
+
+        if is_xml_parser:
+            # Check if secure processing is enabled
+            has_secure_processing = self._has_secure_xml_processing(node)
+
+            if not has_secure_processing:
+                severity = Severity.HIGH
+
+                scan.add_vulnerability(
+                    VulnerabilityType.XXE,
+                    severity,
+                    node.lineno,
+                    f"{func_name} without secure processing is vulnerable to XXE attacks",
+                    "Disable external entity processing. For xml.etree.ElementTree, use: "
+                    "parser = ET.XMLParser(); parser.entity = {}. "
+                    "For lxml, use: parser = etree.XMLParser(resolve_entities=False). "
+                    "Use defusedxml library for safer XML parsing.",
+                    "CWE-611",
+                    "A05:2021 - Security Misconfiguration",
+                )
 
     def _get_func_name(self, node: ast.AST) -> str:
         """Extract full function name from AST node."""
@@ -683,7 +1004,7 @@ class SecurityAnalyzer:
         text_lower = text.lower()
         return any(fp in text_lower for fp in false_positives)
 
-    def _is_likely_non_security_hash(self, node: ast.Call) -> bool:
+    def _is_likely_non_security_hash(self, scan: FileScan, node: ast.Call) -> bool:
         """
         Check if a hash function is likely used for non-security purposes.
 
@@ -691,7 +1012,7 @@ class SecurityAnalyzer:
         deduplication, checksums, etc. These are fine with MD5/SHA1.
         """
         # Check the code snippet around this line for context clues
-        snippet = self._get_code_snippet(node.lineno).lower()
+        snippet = scan.get_code_snippet(node.lineno).lower()
 
         # Keywords suggesting non-security use
         non_security_keywords = [
@@ -747,28 +1068,20 @@ class SecurityAnalyzer:
 
         return False
 
-    def _add_vulnerability(
-        self,
-        vuln_type: VulnerabilityType,
-        severity: Severity,
-        lineno: int,
-        description: str,
-        remediation: str,
-        cwe_id: str,
-        owasp_category: str,
-        confidence: float = 1.0,
-    ) -> None:
-        """Add a vulnerability to the current analysis."""
-        vulnerability = Vulnerability(
-            type=vuln_type,
-            severity=severity,
-            file_path=self.current_file,
-            line_number=lineno,
-            code_snippet=self._get_code_snippet(lineno),
-            description=description,
-            remediation=remediation,
-            cwe_id=cwe_id,
-            owasp_category=owasp_category,
-            confidence=confidence,
-        )
-        self.vulnerabilities.append(vulnerability)
+
+# Analyzer installed in each worker process by _init_worker
+_worker_analyzer: SecurityAnalyzer | None = None
+
+
+def _init_worker(analyzer: SecurityAnalyzer) -> None:
+    """Install the analyzer used by _scan_batch in a worker process."""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _scan_batch(file_paths: list[str]) -> list[FileScanResult]:
+    """Scan a batch of files in a worker process."""
+    assert _worker_analyzer is not None
+    return [
+        FileScanResult(file_path, _worker_analyzer.scan_file(file_path)) for file_path in file_paths
+    ]
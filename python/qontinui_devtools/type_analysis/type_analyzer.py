@@ -10,6 +10,7 @@ import time
 from pathlib import Path
 from typing import Any
 
+from ..project import SourceRepository
 from .models import AnyUsage, MypyError, TypeAnalysisReport, TypeCoverage, UntypedItem
 from .type_inference import TypeInferenceEngine
 
@@ -211,7 +212,11 @@ class TypeAnalyzer:
     """Analyzes type hint coverage in Python code."""
 
     def __init__(
-        self, run_mypy: bool = True, strict_mode: bool = False, mypy_config: str | None = None
+        self,
+        run_mypy: bool = True,
+        strict_mode: bool = False,
+        mypy_config: str | None = None,
+        sources: SourceRepository | None = None,
     ) -> None:
         """Initialize the type analyzer.
 
@@ -219,10 +224,12 @@ class TypeAnalyzer:
             run_mypy: Whether to run mypy for additional checking
             strict_mode: Whether to use strict type checking
             mypy_config: Path to mypy configuration file
+            sources: Shared source repository (a private one is created if omitted)
         """
         self.run_mypy = run_mypy
         self.strict_mode = strict_mode
         self.mypy_config = mypy_config
+        self.sources = sources if sources is not None else SourceRepository(retain_trees=False)
         self.inference_engine = TypeInferenceEngine()
 
     def analyze_file(
@@ -242,10 +249,8 @@ class TypeAnalyzer:
             raise FileNotFoundError(f"File not found: {file_path}")
 
         # Read and parse file
-        source = file_path.read_text(encoding="utf-8")
-
         try:
-            tree = ast.parse(source, filename=str(file_path))
+            tree = self.sources.parse(file_path)
         except SyntaxError:
             # Return empty results for files with syntax errors
             return (TypeCoverage(), [], [])
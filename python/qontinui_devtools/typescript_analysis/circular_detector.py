@@ -13,8 +13,10 @@ import networkx as nx
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from ..project import FileInventory
 from .ts_utils import (
     ImportStatement,
+    ResolutionIndex,
     extract_imports,
     find_ts_js_files,
     module_path_from_file,
@@ -58,19 +60,24 @@ class CircularDependencyDetector:
         ...     print(cycle)
     """
 
-    def __init__(self, root_path: str, verbose: bool = False) -> None:
+    def __init__(
+        self, root_path: str, verbose: bool = False, inventory: FileInventory | None = None
+    ) -> None:
         """Initialize the detector.
 
         Args:
             root_path: Root directory of the project to analyze
             verbose: If True, print progress information
+            inventory: Shared file inventory (the tree is scanned if omitted)
         """
         self.root_path = Path(root_path).resolve()
         self.verbose = verbose
+        self.inventory = inventory
         self.console = Console()
 
         # State populated during analysis
         self.file_map: dict[str, Path] = {}  # module -> file path
+        self.resolution_index = ResolutionIndex([], self.root_path, compiler_options={})
         self.import_map: dict[str, list[ImportStatement]] = {}  # module -> imports
         self.graph: nx.DiGraph = nx.DiGraph()
         self.cycles: list[list[str]] = []
@@ -108,7 +115,7 @@ class CircularDependencyDetector:
 
     def _scan_directory(self) -> None:
         """Scan directory for TS/JS files and build file map."""
-        files = find_ts_js_files(self.root_path)
+        files = find_ts_js_files(self.root_path, self.inventory)
 
         if self.verbose:
             self.console.print(f"Found {len(files)} TypeScript/JavaScript files")
@@ -117,6 +124,9 @@ class CircularDependencyDetector:
             module_name = module_path_from_file(file_path, self.root_path)
             self.file_map[module_name] = file_path
 
+        # Resolve imports against the listing instead of probing the filesystem
+        self.resolution_index = ResolutionIndex(files, self.root_path)
+
     def _build_dependency_graph(self) -> None:
         """Build dependency graph from import statements."""
         if self.verbose:
@@ -146,7 +156,9 @@ class CircularDependencyDetector:
         # Add edges for each import
         for imp in imports:
             # Resolve the import to a file path
-            resolved_path = resolve_import_path(imp.source, file_path, self.root_path)
+            resolved_path = resolve_import_path(
+                imp.source, file_path, self.root_path, self.resolution_index
+            )
 
             if resolved_path:
                 # Convert back to module name
@@ -188,7 +200,9 @@ class CircularDependencyDetector:
                     for imp in self.import_map[from_module]:
                         # Check if this import leads to the target module
                         file_path = self.file_map[from_module]
-                        resolved = resolve_import_path(imp.source, file_path, self.root_path)
+                        resolved = resolve_import_path(
+                            imp.source, file_path, self.root_path, self.resolution_index
+                        )
                         if resolved:
                             target = module_path_from_file(resolved, self.root_path)
                             if target == to_module:
@@ -8,6 +8,7 @@ This module analyzes code complexity including:
 """
 
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -15,6 +16,7 @@ from typing import Any
 from rich.console import Console
 from rich.table import Table
 
+from ..project import FileInventory
 from .ts_utils import count_lines_of_code, find_ts_js_files
 
 
@@ -64,6 +66,7 @@ class ComplexityAnalyzer:
         max_file_lines: int = 500,
         max_function_lines: int = 50,
         max_complexity: int = 10,
+        inventory: FileInventory | None = None,
     ) -> None:
         """Initialize the analyzer.
 
@@ -73,9 +76,11 @@ class ComplexityAnalyzer:
             max_file_lines: Maximum lines per file before flagging
             max_function_lines: Maximum lines per function before flagging
             max_complexity: Maximum cyclomatic complexity before flagging
+            inventory: Shared file inventory (the tree is scanned if omitted)
         """
         self.root_path = Path(root_path).resolve()
         self.verbose = verbose
+        self.inventory = inventory
         self.console = Console()
 
         # Thresholds
@@ -105,7 +110,7 @@ class ComplexityAnalyzer:
             )
 
         # Find all files
-        self.files = find_ts_js_files(self.root_path)
+        self.files = find_ts_js_files(self.root_path, self.inventory)
 
         if self.verbose:
             self.console.print(f"Found {len(self.files)} files")
@@ -135,6 +140,32 @@ class ComplexityAnalyzer:
             "issues": self.issues,
         }
 
+    def iter_findings(self) -> Iterator[ComplexityIssue]:
+        """Yield complexity issues file by file as each file is analyzed.
+
+        Issues are not kept in ``issues``, so memory stays bounded on large
+        projects. ``metrics`` is filled in once the generator is exhausted.
+
+        Yields:
+            Complexity issues in file order
+        """
+        self.files = find_ts_js_files(self.root_path, self.inventory)
+        total_complexity = 0
+        function_count = 0
+
+        for file_path in self.files:
+            start = len(self.issues)
+            file_complexity, file_functions = self._analyze_file(file_path)
+            total_complexity += file_complexity
+            function_count += file_functions
+            yield from self.issues[start:]
+            del self.issues[start:]
+
+        if function_count > 0:
+            self.metrics["avg_complexity"] = total_complexity / function_count
+        self.metrics["total_files"] = len(self.files)
+        self.metrics["total_functions"] = function_count
+
     def _analyze_file(self, file_path: Path) -> tuple[int, int]:
         """Analyze a single file.
 
@@ -15,6 +15,7 @@ from typing import Any
 from rich.console import Console
 from rich.table import Table
 
+from ..project import FileInventory
 from .ts_utils import extract_exports, extract_imports, find_ts_js_files
 
 
@@ -55,15 +56,19 @@ class DeadCodeDetector:
         ...     print(f"{code.name} is unused")
     """
 
-    def __init__(self, root_path: str, verbose: bool = False) -> None:
+    def __init__(
+        self, root_path: str, verbose: bool = False, inventory: FileInventory | None = None
+    ) -> None:
         """Initialize the detector.
 
         Args:
             root_path: Root directory of the project to analyze
             verbose: If True, print progress information
+            inventory: Shared file inventory (the tree is scanned if omitted)
         """
         self.root_path = Path(root_path).resolve()
         self.verbose = verbose
+        self.inventory = inventory
         self.console = Console()
 
         # State
@@ -83,7 +88,7 @@ class DeadCodeDetector:
             )
 
         # Step 1: Find all files
-        self.files = find_ts_js_files(self.root_path)
+        self.files = find_ts_js_files(self.root_path, self.inventory)
 
         if self.verbose:
             self.console.print(f"Found {len(self.files)} files")
@@ -6,11 +6,25 @@ This module provides functions to parse and analyze TS/JS files without
 requiring Node.js or external dependencies.
 """
 
+import json
+import os
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from ..project import FileInventory, find_files
+
+# Extensions tried, in order, when resolving an extensionless import
+RESOLVE_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", "")
+
+# Aliases assumed when tsconfig.json does not define them (relative to the root)
+DEFAULT_PATH_ALIASES: dict[str, list[str]] = {"@/*": ["src/*"], "~/*": ["*"]}
+
+_JSONC_COMMENT = re.compile(r'("(?:\\.|[^"\\])*")|//[^\n]*|/\*.*?\*/', re.DOTALL)
+_TRAILING_COMMA = re.compile(r",(\s*[}\]])")
+
 
 @dataclass
 class ImportStatement:
@@ -35,30 +49,19 @@ class ExportStatement:
     is_type_only: bool  # True if this is a type-only export
 
 
-def find_ts_js_files(root_path: Path) -> list[Path]:
+def find_ts_js_files(root_path: Path, inventory: FileInventory | None = None) -> list[Path]:
     """Find all TypeScript and JavaScript files in a directory tree.
 
     Args:
         root_path: Root directory to search
+        inventory: Shared file inventory (the tree is scanned if omitted)
 
     Returns:
-        List of paths to TS/JS files
+        Sorted list of paths to TS/JS files
     """
-    patterns = ["**/*.ts", "**/*.tsx", "**/*.js", "**/*.jsx"]
-    files: list[Path] = []
-
-    for pattern in patterns:
-        files.extend(root_path.glob(pattern))
-
-    # Filter out node_modules, dist, build directories
-    filtered: list[Any] = []
-    exclude_dirs = {"node_modules", "dist", "build", ".next", "out", "__tests__"}
-
-    for file in files:
-        if not any(exclude_dir in file.parts for exclude_dir in exclude_dirs):
-            filtered.append(file)
-
-    return sorted(filtered)
+    # node_modules is pruned by every scan; also skip build output and tests
+    exclude_dirs = {"dist", "build", ".next", "out", "__tests__"}
+    return find_files(root_path, ("typescript", "javascript"), inventory, exclude_dirs)
 
 
 def extract_imports(file_path: Path) -> list[ImportStatement]:
@@ -294,17 +297,158 @@ def extract_exports(file_path: Path) -> list[ExportStatement]:
     return exports
 
 
-def resolve_import_path(import_source: str, from_file: Path, root_path: Path) -> Path | None:
+def load_tsconfig(root_path: Path) -> dict[str, Any]:
+    """Load ``compilerOptions`` from the project's tsconfig.json.
+
+    tsconfig files are JSON with comments and trailing commas, both of which
+    are stripped before parsing. ``extends`` is not followed.
+
+    Args:
+        root_path: Project root containing tsconfig.json
+
+    Returns:
+        The compilerOptions mapping, or an empty dict if there is none
+    """
+    try:
+        text = (root_path / "tsconfig.json").read_text(encoding="utf-8")
+        text = _JSONC_COMMENT.sub(lambda m: m.group(1) or "", text)
+        config = json.loads(_TRAILING_COMMA.sub(r"\1", text))
+    except (OSError, ValueError):
+        return {}
+
+    options = config.get("compilerOptions") if isinstance(config, dict) else None
+    return options if isinstance(options, dict) else {}
+
+
+class ResolutionIndex:
+    """In-memory index for resolving TS/JS import sources to project files.
+
+    Built once from the directory listing and tsconfig.json, so resolving an
+    import is a handful of set lookups instead of filesystem calls.
+
+    Example:
+        >>> files = find_ts_js_files(root)
+        >>> index = ResolutionIndex(files, root)
+        >>> index.resolve("./utils", root / "src" / "app.ts")
+        PosixPath('/project/src/utils.ts')
+    """
+
+    def __init__(
+        self,
+        files: Iterable[Path],
+        root_path: Path,
+        compiler_options: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            files: Project files that imports may resolve to
+            root_path: Project root (where tsconfig.json lives)
+            compiler_options: tsconfig compilerOptions (loaded from
+                ``root_path`` if omitted)
+        """
+        root = os.path.abspath(root_path)
+        options = compiler_options if compiler_options is not None else load_tsconfig(root_path)
+
+        self.files: set[str] = {os.path.normpath(os.path.join(root, f)) for f in files}
+
+        base_url = options.get("baseUrl")
+        self.base_url = os.path.normpath(os.path.join(root, base_url)) if base_url else None
+
+        # pattern -> absolute target templates; tsconfig entries override defaults
+        aliases = {
+            pattern: [os.path.join(root, target) for target in targets]
+            for pattern, targets in DEFAULT_PATH_ALIASES.items()
+        }
+        paths_base = self.base_url or root
+        for pattern, targets in (options.get("paths") or {}).items():
+            if isinstance(targets, list):
+                aliases[pattern] = [os.path.join(paths_base, str(t)) for t in targets]
+
+        # Longest prefix first, as TypeScript prefers the most specific pattern
+        self.aliases: list[tuple[str, str | None, list[str]]] = []
+        for pattern, targets in aliases.items():
+            if "*" in pattern:
+                prefix, _, suffix = pattern.partition("*")
+                self.aliases.append((prefix, suffix, targets))
+            else:
+                self.aliases.append((pattern, None, targets))
+        self.aliases.sort(key=lambda alias: len(alias[0]), reverse=True)
+
+    def _lookup(self, base: str) -> Path | None:
+        """Find a known file for a path without extension or a directory index."""
+        for ext in RESOLVE_EXTENSIONS:
+            candidate = os.path.normpath(base + ext)
+            if candidate in self.files:
+                return Path(candidate)
+
+            index_file = os.path.normpath(os.path.join(base, f"index{ext}"))
+            if index_file in self.files:
+                return Path(index_file)
+
+        return None
+
+    def resolve(self, import_source: str, from_file: Path) -> Path | None:
+        """Resolve an import source to a project file.
+
+        Args:
+            import_source: The import source string (e.g., './foo', '@/components/bar')
+            from_file: The file containing the import
+
+        Returns:
+            Resolved file path or None if the import is external or unknown
+        """
+        if import_source.startswith("."):
+            return self._lookup(
+                os.path.join(os.path.dirname(os.path.abspath(from_file)), import_source)
+            )
+
+        for prefix, suffix, targets in self.aliases:
+            if suffix is None:
+                if import_source != prefix:
+                    continue
+                star = ""
+            elif (
+                import_source.startswith(prefix)
+                and import_source.endswith(suffix)
+                and len(import_source) >= len(prefix) + len(suffix)
+            ):
+                star = import_source[len(prefix) : len(import_source) - len(suffix)]
+            else:
+                continue
+
+            for target in targets:
+                resolved = self._lookup(target.replace("*", star, 1))
+                if resolved is not None:
+                    return resolved
+            return None
+
+        if self.base_url is not None:
+            return self._lookup(os.path.join(self.base_url, import_source))
+
+        return None
+
+
+def resolve_import_path(
+    import_source: str,
+    from_file: Path,
+    root_path: Path,
+    index: ResolutionIndex | None = None,
+) -> Path | None:
     """Resolve an import source to an actual file path.
 
     Args:
         import_source: The import source string (e.g., './foo', '@/components/bar')
         from_file: The file containing the import
         root_path: The project root path
+        index: Prebuilt resolution index; when given, no filesystem calls are made
 
     Returns:
         Resolved file path or None if not found
     """
+    if index is not None:
+        return index.resolve(import_source, from_file)
+
     # Skip external modules (no ./ or ../ or @/)
     if not import_source.startswith(("..", ".", "@", "~")):
         return None
@@ -8,6 +8,7 @@ This module analyzes TypeScript type coverage including:
 """
 
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -16,6 +17,7 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from ..project import FileInventory
 from .ts_utils import find_ts_js_files
 
 
@@ -53,15 +55,19 @@ class TypeCoverageAnalyzer:
         >>> print(f"Type coverage: {coverage['percentage']:.1f}%")
     """
 
-    def __init__(self, root_path: str, verbose: bool = False) -> None:
+    def __init__(
+        self, root_path: str, verbose: bool = False, inventory: FileInventory | None = None
+    ) -> None:
         """Initialize the analyzer.
 
         Args:
             root_path: Root directory of the project to analyze
             verbose: If True, print progress information
+            inventory: Shared file inventory (the tree is scanned if omitted)
         """
         self.root_path = Path(root_path).resolve()
         self.verbose = verbose
+        self.inventory = inventory
         self.console = Console()
 
         # State
@@ -88,7 +94,7 @@ class TypeCoverageAnalyzer:
             )
 
         # Find TypeScript files (not JavaScript)
-        all_files = find_ts_js_files(self.root_path)
+        all_files = find_ts_js_files(self.root_path, self.inventory)
         self.files = [f for f in all_files if f.suffix in [".ts", ".tsx"]]
 
         if self.verbose:
@@ -119,6 +125,32 @@ class TypeCoverageAnalyzer:
 
         return coverage
 
+    def iter_findings(self) -> Iterator[TypeIssue]:
+        """Yield type issues file by file as each file is analyzed.
+
+        Issues are not kept in ``issues``, so memory stays bounded on large
+        projects. ``metrics`` still accumulates, so ``coverage_percentage``
+        is available once the generator is exhausted.
+
+        Yields:
+            Type issues in file order
+        """
+        all_files = find_ts_js_files(self.root_path, self.inventory)
+        self.files = [f for f in all_files if f.suffix in [".ts", ".tsx"]]
+
+        for file_path in self.files:
+            start = len(self.issues)
+            self._analyze_file(file_path)
+            yield from self.issues[start:]
+            del self.issues[start:]
+
+    @property
+    def coverage_percentage(self) -> float:
+        """Share of typed parameters and functions analyzed so far (0-100)."""
+        total_items = self.metrics["total_parameters"] + self.metrics["total_functions"]
+        typed_items = self.metrics["typed_parameters"] + self.metrics["typed_functions"]
+        return (typed_items / total_items) * 100 if total_items > 0 else 0.0
+
     def _analyze_file(self, file_path: Path) -> None:
         """Analyze a single TypeScript file.
 
@@ -238,13 +270,7 @@ class TypeCoverageAnalyzer:
             Dictionary with coverage metrics
         """
         # Calculate overall coverage
-        total_items = self.metrics["total_parameters"] + self.metrics["total_functions"]
-        typed_items = self.metrics["typed_parameters"] + self.metrics["typed_functions"]
-
-        if total_items > 0:
-            percentage = (typed_items / total_items) * 100
-        else:
-            percentage = 0.0
+        percentage = self.coverage_percentage
 
         # Group issues by type
         issues_by_type: dict[Any, Any] = {}
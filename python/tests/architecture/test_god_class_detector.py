@@ -301,6 +301,16 @@ class TestGodClassDetector:
         huge_class = next(c for c in god_classes if c.name == "HugeClass")
         assert huge_class.severity in ["critical", "high"]
 
+    def test_iter_findings_matches_analyze_directory(
+        self, detector: GodClassDetector, fixtures_dir: Path
+    ) -> None:
+        """Test that streamed god classes are the same set as the sorted report."""
+        streamed = list(detector.iter_findings(str(fixtures_dir)))
+
+        assert sorted(streamed, key=lambda c: (c.file_path, c.line_start)) == sorted(
+            detector.analyze_directory(str(fixtures_dir)), key=lambda c: (c.file_path, c.line_start)
+        )
+
     def test_threshold_configuration(self, god_class_file: Path) -> None:
         """Test configuring detection thresholds."""
         # Very strict thresholds
@@ -0,0 +1,212 @@
+"""Tests for RaceConditionTester execution backends."""
+
+import asyncio
+import os
+import pickle
+import threading
+import time
+from typing import Any
+
+import pytest
+from qontinui_devtools.concurrency import (
+    AsyncioBackend,
+    ExecutionBackend,
+    FreeThreadedBackend,
+    ProcessBackend,
+    RaceConditionTester,
+    SharedArray,
+    ThreadBackend,
+    available_backends,
+    compare_results,
+    get_backend,
+)
+
+
+def _increment(counter: SharedArray) -> int:
+    """Unsynchronized increment of a shared counter; returns the process id."""
+    counter[0] += 1
+    return os.getpid()
+
+
+def _fail_odd(counter: SharedArray) -> None:
+    """Raise on every odd count."""
+    counter[0] += 1
+    if counter[0] % 2:
+        raise ValueError("odd")
+
+
+def _hang() -> None:
+    """Block far longer than any test timeout."""
+    time.sleep(60)
+
+
+def test_get_backend() -> None:
+    """Test resolving backend names."""
+    assert isinstance(get_backend("threads"), ThreadBackend)
+    assert isinstance(get_backend("processes"), ProcessBackend)
+    backend = AsyncioBackend()
+    assert get_backend(backend) is backend
+    assert get_backend("auto").name in ("threads", "free-threaded")
+    assert {"threads", "processes", "asyncio"} <= set(available_backends())
+
+    with pytest.raises(ValueError, match="Unknown backend"):
+        get_backend("greenlets")
+    if not FreeThreadedBackend.is_available():
+        with pytest.raises(RuntimeError):
+            RaceConditionTester(backend="free-threaded")
+    with pytest.raises(TypeError):
+        ExecutionBackend()  # type: ignore[abstract]
+
+
+def test_thread_workers_run_together() -> None:
+    """Test that all thread workers are running at the same time."""
+    started = threading.Barrier(4)
+
+    def check_all_started() -> None:
+        # Would time out if the pool ran workers one after another
+        started.wait(timeout=5.0)
+        started.reset()
+
+    tester = RaceConditionTester(threads=4, iterations=1)
+    result = tester.test_function(check_all_started)
+
+    assert result.failed == 0
+    assert result.backend == "threads"
+
+
+def test_thread_backend_timeout_does_not_join() -> None:
+    """Test that a hung thread worker doesn't block the test past its timeout."""
+    release = threading.Event()
+
+    def hang_once() -> None:
+        if not release.is_set():
+            release.wait(30.0)
+
+    tester = RaceConditionTester(threads=2, iterations=1, timeout=0.2)
+    start = time.perf_counter()
+    try:
+        result = tester.test_function(hang_once)
+    finally:
+        release.set()
+
+    assert time.perf_counter() - start < 5.0
+    assert "Test timeout exceeded" in result.failure_details
+
+
+def test_process_backend_timeout_terminates_workers() -> None:
+    """Test that hung process workers are killed at the timeout."""
+    tester = RaceConditionTester(threads=2, iterations=1, timeout=0.5, backend="processes")
+    start = time.perf_counter()
+    result = tester.test_function(_hang)
+
+    assert time.perf_counter() - start < 10.0
+    assert "Test timeout exceeded" in result.failure_details
+    assert result.successful == 0
+
+
+def test_process_backend_shares_array() -> None:
+    """Test that process workers update the same shared memory."""
+    with SharedArray(1) as counter:
+        tester = RaceConditionTester(threads=3, iterations=20, backend="processes")
+        result = tester.test_function(_increment, counter)
+
+        assert result.backend == "processes"
+        assert result.successful == 60
+        # Unsynchronized increments may lose updates, never add them
+        assert 0 < counter[0] <= 60
+
+
+def test_process_backend_worker_processes() -> None:
+    """Test that each worker gets its own process."""
+    with SharedArray(1) as counter:
+        backend = ProcessBackend()
+        run = backend.run(_increment, (counter,), {}, workers=3, iterations=5, timeout=30.0)
+
+    # The start barrier holds every job until all three processes are up
+    assert len(set(run.results)) == 3
+    assert os.getpid() not in run.results
+
+
+def test_process_backend_failures() -> None:
+    """Test that exceptions raised in processes are reported."""
+    with SharedArray(1) as counter:
+        tester = RaceConditionTester(threads=2, iterations=10, backend="processes")
+        result = tester.test_function(_fail_odd, counter)
+
+    assert result.race_detected
+    assert result.failed > 0
+    assert result.exceptions == ["ValueError"]
+
+
+def test_process_backend_requires_picklable_function() -> None:
+    """Test that closures are rejected before starting processes."""
+    tester = RaceConditionTester(threads=2, iterations=1, backend="processes")
+
+    with pytest.raises(TypeError, match="picklable"):
+        tester.test_function(lambda: None)
+
+
+def test_asyncio_backend_finds_lost_updates() -> None:
+    """Test that an await between read and write loses updates across tasks."""
+    shared = {"value": 0}
+
+    async def update() -> None:
+        value = shared["value"]
+        await asyncio.sleep(0)
+        shared["value"] = value + 1
+
+    tester = RaceConditionTester(threads=5, iterations=20, backend="asyncio")
+    result = tester.test_function(update)
+
+    assert result.successful == 100
+    assert result.backend == "asyncio"
+    assert shared["value"] < 100
+
+
+def test_asyncio_backend_timeout() -> None:
+    """Test that slow tasks are cancelled at the timeout."""
+
+    async def hang() -> None:
+        await asyncio.sleep(10)
+
+    tester = RaceConditionTester(threads=2, iterations=1, timeout=0.1, backend="asyncio")
+    result = tester.test_function(hang)
+
+    assert "Test timeout exceeded" in result.failure_details
+    assert result.successful == 0
+
+
+def test_results_record_backend() -> None:
+    """Test comparing the same function across backends."""
+    calls: dict[str, Any] = {"count": 0}
+
+    def flaky() -> None:
+        calls["count"] += 1
+        if calls["count"] % 7 == 0:
+            raise RuntimeError("lost update")
+
+    tester = RaceConditionTester(threads=2, iterations=10)
+    results = tester.test_backends(flaky, backends=["threads", "asyncio"])
+
+    assert [r.backend for r in results] == ["threads", "asyncio"]
+    assert "Backend: asyncio" in str(results[1])
+    summary = compare_results(results)
+    assert summary["races_by_backend"] == {"threads": 1, "asyncio": 1}
+
+    scenario = tester.stress_test(flaky, [{"name": "tasks", "backend": "asyncio"}])
+    assert scenario[0].backend == "asyncio"
+
+
+def test_shared_array() -> None:
+    """Test element access and attaching by pickling."""
+    with SharedArray(3, typecode="d") as array:
+        array[1] = 2.5
+        attached = pickle.loads(pickle.dumps(array))
+        attached[2] = 4.0
+
+        assert array.tolist() == [0.0, 2.5, 4.0]
+        assert len(attached) == 3
+        attached.close()
+
+    with pytest.raises(ValueError):
+        SharedArray(0)
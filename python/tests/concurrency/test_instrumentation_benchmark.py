@@ -0,0 +1,77 @@
+"""Performance benchmarks for state instrumentation.
+
+Compares the overhead of InstrumentedObject and instrument() with an
+uninstrumented run of the same workload. The pytest-benchmark test is
+skipped when the plugin is not installed.
+"""
+
+import importlib.util
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from qontinui_devtools.concurrency import InstrumentedObject, SharedStateTracker, instrument
+
+requires_benchmark = pytest.mark.skipif(
+    importlib.util.find_spec("pytest_benchmark") is None,
+    reason="pytest-benchmark is not installed",
+)
+
+
+class Counter:
+    """Object with one hot field and one untracked field."""
+
+    def __init__(self) -> None:
+        self.value = 0
+        self.step = 1
+
+
+def _workload(counter: Any, iterations: int = 20_000) -> None:
+    for _ in range(iterations):
+        counter.value = counter.value + counter.step
+
+
+def _best_time(make_counter: Callable[[], Any], repeats: int = 5) -> float:
+    """Best-of-N run time of the workload."""
+    best = float("inf")
+    for _ in range(repeats):
+        counter = make_counter()
+        start = time.perf_counter()
+        _workload(counter)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@requires_benchmark
+def test_instrument_overhead(benchmark: Any) -> Any:
+    """Benchmark the workload on an object instrumented with instrument()."""
+    tracker = SharedStateTracker()
+    counter = instrument(Counter(), tracker, fields=["value"])
+
+    benchmark(_workload, counter)
+
+    assert tracker.get_stats()["write_count"] > 0
+
+
+def test_overhead_relative_to_uninstrumented() -> None:
+    """Measure both instrumentation modes against the plain workload."""
+    baseline = _best_time(Counter)
+    legacy = _best_time(lambda: InstrumentedObject(Counter(), SharedStateTracker()))
+    fast = _best_time(lambda: instrument(Counter(), SharedStateTracker(), fields=["value"]))
+
+    print(
+        f"\nInstrumentation overhead: InstrumentedObject {legacy / baseline:.1f}x, "
+        f"instrument() {fast / baseline:.1f}x (uninstrumented {baseline * 1000:.2f} ms)"
+    )
+
+    # Only the selected field is tracked, so untracked reads of step cost nothing
+    fast_tracker = SharedStateTracker()
+    _workload(instrument(Counter(), fast_tracker, fields=["value"]))
+    legacy_tracker = SharedStateTracker()
+    _workload(InstrumentedObject(Counter(), legacy_tracker))
+
+    assert fast_tracker.get_stats()["read_count"] == 20_000
+    assert fast_tracker.get_stats()["write_count"] == 20_000
+    assert legacy_tracker.get_stats()["read_count"] == 40_000
+    assert legacy_tracker.get_stats()["write_count"] == 20_000
@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Any
 
 import pytest
-from qontinui_devtools.concurrency import RaceConditionDetector
+from qontinui_devtools.concurrency import RaceConditionDetector, race_detector
 
 
 class TestRaceDetectorBasics:
@@ -513,6 +513,51 @@ def process() -> None:
         assert stats["files_analyzed"] == 1
 
 
+class TestIterFindings:
+    """Test streaming race detection."""
+
+    def test_matches_analyze(self, tmp_path: Path) -> None:
+        """Test that streamed races match a full analysis without keeping contexts."""
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.py").write_text(
+                f"""
+class Counter_{name}:
+    count = 0
+
+    def increment(self) -> None:
+        self.count += 1
+"""
+            )
+
+        streamed = list(RaceConditionDetector(tmp_path, exclude_patterns=[]).iter_findings())
+        detector = RaceConditionDetector(tmp_path, exclude_patterns=[])
+        analyzed = detector.analyze()
+
+        key = lambda r: (r.shared_state.file_path, r.shared_state.line_number)  # noqa: E731
+        assert sorted(streamed, key=key) == sorted(analyzed, key=key)
+        assert {Path(r.shared_state.file_path).name for r in streamed} == {"a.py", "b.py"}
+
+    def test_iter_findings_keeps_stdout_clean(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that files that fail to analyze are reported on stderr only."""
+        (tmp_path / "broken.py").write_text("x = 1\n")
+
+        def fail(file_path: Path, sources: Any) -> None:
+            raise OSError("unreadable")
+
+        monkeypatch.setattr(race_detector, "analyze_file", fail)
+
+        assert list(RaceConditionDetector(tmp_path, exclude_patterns=[]).iter_findings()) == []
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert "broken.py" in captured.err
+
+
 class TestSeverityCalculation:
     """Test severity calculation logic."""
 
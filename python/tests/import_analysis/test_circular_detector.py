@@ -1,7 +1,9 @@
 """Tests for the circular dependency detector."""
 
+import time
 from pathlib import Path
 
+import networkx as nx
 import pytest
 from qontinui_devtools.import_analysis import CircularDependencyDetector
 from qontinui_devtools.import_analysis.ast_utils import (
@@ -9,6 +11,8 @@ from qontinui_devtools.import_analysis.ast_utils import (
     find_python_files,
     module_path_from_file,
 )
+from qontinui_devtools.import_analysis.cycle_analysis import feedback_edges
+from qontinui_devtools.project import AnalysisCache
 
 
 class TestImportExtraction:
@@ -369,3 +373,146 @@ class TestModulePathConversion:
 
         result = module_path_from_file(str(file_path), str(root))
         assert result == "my_module"
+
+
+def _write_dense_package(root: Path, size: int) -> None:
+    """Write modules that all import each other (one large cycle component)."""
+    for i in range(size):
+        imports = "".join(f"import m{j}\n" for j in range(size) if j != i)
+        (root / f"m{i}.py").write_text(imports)
+
+
+class TestCycleModes:
+    """Tests for SCC-based cycle reporting and bounded enumeration."""
+
+    def test_scc_mode_reports_component_once(self, tmp_path: Path) -> None:
+        """Test that a dense component yields a bounded summary."""
+        _write_dense_package(tmp_path, 8)
+
+        detector = CircularDependencyDetector(
+            str(tmp_path), cycle_mode="scc", cycles_per_component=3
+        )
+        cycles = detector.analyze()
+
+        assert len(detector.components) == 1
+        component = detector.components[0]
+        assert component.modules == [f"m{i}" for i in range(8)]
+        assert len(component.cycles) <= 3
+        assert len(cycles) == len(component.cycles)
+        assert all(len(c.cycle) == 3 for c in cycles)  # shortest cycles: a -> b -> a
+
+    def test_feedback_edges_break_all_cycles(self, tmp_path: Path) -> None:
+        """Test that removing the feedback edges leaves an acyclic graph."""
+        _write_dense_package(tmp_path, 6)
+        (tmp_path / "leaf.py").write_text("import os\n")
+
+        detector = CircularDependencyDetector(str(tmp_path), cycle_mode="scc")
+        detector.analyze()
+
+        graph = detector.graph.copy()
+        graph.remove_edges_from(detector.components[0].feedback_edges)
+        assert nx.is_directed_acyclic_graph(graph)
+        assert detector.get_statistics()["feedback_edges"] == 15
+
+    def test_feedback_edges_scale_linearly(self) -> None:
+        """Test the greedy ordering on a large random component."""
+        graph = nx.gnm_random_graph(5000, 20000, directed=True, seed=5)
+        graph = nx.relabel_nodes(graph, {i: f"m{i}" for i in graph})
+        component = max(nx.strongly_connected_components(graph), key=len)
+
+        start = time.perf_counter()
+        edges = feedback_edges(graph, component)
+        elapsed = time.perf_counter() - start
+
+        acyclic = graph.subgraph(component).copy()
+        acyclic.remove_edges_from(edges)
+        assert nx.is_directed_acyclic_graph(acyclic)
+        assert edges == sorted(edges) == feedback_edges(graph, set(component))
+        # The quadratic version took several seconds on this graph
+        assert elapsed < 2.0
+
+    def test_enumeration_cap(self, tmp_path: Path) -> None:
+        """Test that full enumeration stops at max_cycles."""
+        _write_dense_package(tmp_path, 6)
+
+        detector = CircularDependencyDetector(str(tmp_path), cycle_mode="all", max_cycles=10)
+        cycles = detector.analyze()
+
+        assert len(cycles) == 10
+        assert detector.cycles_truncated
+        assert detector.components == []
+
+    def test_auto_mode_falls_back_to_scc(self, tmp_path: Path) -> None:
+        """Test that auto mode summarizes components when enumeration is capped."""
+        _write_dense_package(tmp_path, 6)
+
+        detector = CircularDependencyDetector(str(tmp_path), max_cycles=10)
+        detector.analyze()
+
+        stats = detector.get_statistics()
+        assert stats["cycle_mode"] == "scc"
+        assert stats["cyclic_components"] == 1
+
+    def test_auto_mode_enumerates_small_graphs(self) -> None:
+        """Test that auto mode keeps full enumeration for small components."""
+        fixtures_path = Path(__file__).parent.parent / "fixtures" / "circular"
+
+        auto = CircularDependencyDetector(str(fixtures_path))
+        full = CircularDependencyDetector(str(fixtures_path), cycle_mode="all")
+
+        assert [c.cycle for c in auto.analyze()] == [c.cycle for c in full.analyze()]
+        assert auto.get_statistics()["cycle_mode"] == "all"
+
+    def test_invalid_cycle_mode(self, tmp_path: Path) -> None:
+        """Test that an unknown cycle mode is rejected."""
+        with pytest.raises(ValueError, match="Unknown cycle mode"):
+            CircularDependencyDetector(str(tmp_path), cycle_mode="fast")
+
+
+class TestChangedFiles:
+    """Tests for analysis scoped to changed files and the cached graph baseline."""
+
+    @staticmethod
+    def _write_two_cycles(root: Path) -> None:
+        """Write two independent cycles (a <-> b, c <-> d) and an outsider e."""
+        (root / "a.py").write_text("import b\n")
+        (root / "b.py").write_text("import a\n")
+        (root / "c.py").write_text("import d\n")
+        (root / "d.py").write_text("import c\n")
+        (root / "e.py").write_text("import a\n")
+
+    def test_scope_limited_to_changed_components(self, tmp_path: Path) -> None:
+        """Test that only cycles through changed modules' components are reported."""
+        self._write_two_cycles(tmp_path)
+
+        detector = CircularDependencyDetector(str(tmp_path))
+        cycles = detector.analyze(changed_files=[tmp_path / "c.py"])
+
+        assert detector.scope == {"c", "d"}
+        assert [sorted(c.cycle[:-1]) for c in cycles] == [["c", "d"]]
+        assert detector.get_statistics()["modules_searched"] == 2
+
+    def test_changed_file_outside_cycles(self, tmp_path: Path) -> None:
+        """Test that a change to an acyclic module reports no cycles."""
+        self._write_two_cycles(tmp_path)
+
+        detector = CircularDependencyDetector(str(tmp_path))
+
+        assert detector.analyze(changed_files=[tmp_path / "e.py"]) == []
+        assert len(detector.graph) == 5
+
+    def test_baseline_reused_for_unchanged_files(self, tmp_path: Path) -> None:
+        """Test that a warm run only re-reads edited files and sees new cycles."""
+        self._write_two_cycles(tmp_path)
+        cache = AnalysisCache(tmp_path / ".cache")
+        CircularDependencyDetector(str(tmp_path), cache=cache).analyze()
+
+        (tmp_path / "e.py").write_text("import a\nimport c\n")
+        (tmp_path / "d.py").write_text("import c\nimport e\n")
+        warm = CircularDependencyDetector(str(tmp_path), cache=AnalysisCache(tmp_path / ".cache"))
+        cycles = warm.analyze(changed_files=[tmp_path / "d.py", tmp_path / "e.py"])
+
+        assert len(warm.sources) == 2  # only the edited files were read
+        assert warm.graph.has_edge("d", "e")
+        assert warm.scope == {"c", "d", "e"}
+        assert {tuple(sorted(c.cycle[:-1])) for c in cycles} == {("c", "d"), ("c", "d", "e")}
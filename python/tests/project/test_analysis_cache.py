@@ -0,0 +1,156 @@
+"""Tests for the persistent analysis cache."""
+
+from pathlib import Path
+
+import pytest
+from qontinui_devtools.architecture import GodClassDetector
+from qontinui_devtools.code_quality import DeadCodeDetector
+from qontinui_devtools.import_analysis import CircularDependencyDetector
+from qontinui_devtools.project import AnalysisCache
+from qontinui_devtools.regression.snapshot import APISnapshot
+from qontinui_devtools.security import SecurityAnalyzer
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a small project with imports, a vulnerability and dead code."""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.py").write_text(
+        "import os\n\nfrom b import helper\n\n\n"
+        "def run(target: str) -> None:\n    os.system('ls ' + target)\n    helper()\n"
+    )
+    (src / "b.py").write_text(
+        "def helper() -> None:\n    pass\n\n\ndef unused() -> None:\n    pass\n"
+    )
+    return src
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> AnalysisCache:
+    """Create a cache in a temporary directory."""
+    return AnalysisCache(tmp_path / "cache")
+
+
+class TestAnalysisCache:
+    """Tests for AnalysisCache storage."""
+
+    def test_round_trip(self, project: Path, cache: AnalysisCache) -> None:
+        """Test that stored data is returned for the same file and key."""
+        file_path = project / "a.py"
+
+        assert cache.get("test", file_path, "1") is None
+        cache.put("test", file_path, {"value": [1, 2]}, "1")
+
+        assert cache.get("test", file_path, "1") == {"value": [1, 2]}
+        assert cache.stats == {"hits": 1, "misses": 1, "writes": 1, "errors": 0}
+
+    def test_key_includes_version_and_config(self, project: Path, cache: AnalysisCache) -> None:
+        """Test that version and config changes miss the cache."""
+        file_path = project / "a.py"
+        cache.put("test", file_path, 1, "1", {"threshold": 5})
+
+        assert cache.get("test", file_path, "2", {"threshold": 5}) is None
+        assert cache.get("test", file_path, "1", {"threshold": 6}) is None
+        assert cache.get("test", file_path, "1", {"threshold": 5}) == 1
+
+    def test_content_change_invalidates(self, project: Path, tmp_path: Path) -> None:
+        """Test that a new run sees edited files as misses."""
+        file_path = project / "a.py"
+        AnalysisCache(tmp_path / "cache").put("test", file_path, 1, "1")
+
+        file_path.write_text("x = 1\n")
+
+        assert AnalysisCache(tmp_path / "cache").get("test", file_path, "1") is None
+
+    def test_content_change_replaces_entry(self, project: Path, tmp_path: Path) -> None:
+        """Test that re-analyzing an edited file overwrites its entry in place."""
+        file_path = project / "a.py"
+        AnalysisCache(tmp_path / "cache").put("test", file_path, 1, "1")
+
+        file_path.write_text("x = 1\n")
+        cache = AnalysisCache(tmp_path / "cache")
+        cache.put("test", file_path, 2, "1")
+
+        assert cache.get("test", file_path, "1") == 2
+        assert len(list((tmp_path / "cache").rglob("*.json"))) == 1
+
+    def test_project_entry(self, cache: AnalysisCache) -> None:
+        """Test that project entries round-trip and are replaced on put."""
+        assert cache.get_project("graph", "1", "/root") is None
+
+        cache.put_project("graph", {"a": 1}, "1", "/root")
+        cache.put_project("graph", {"a": 2}, "1", "/root")
+
+        assert cache.get_project("graph", "1", "/root") == {"a": 2}
+        assert cache.get_project("graph", "1", "/other") is None
+        assert cache.get_project("graph", "2", "/root") is None
+
+    def test_clear(self, project: Path, cache: AnalysisCache) -> None:
+        """Test that clear removes stored entries."""
+        cache.put("test", project / "a.py", 1, "1")
+        cache.clear()
+
+        assert not cache.cache_dir.exists()
+        assert cache.get("test", project / "a.py", "1") is None
+
+
+class TestCachedAnalyzers:
+    """Tests that analyzers return identical results from a warm cache."""
+
+    def test_security_analyzer(self, project: Path, cache: AnalysisCache) -> None:
+        """Test that cached vulnerabilities match a fresh analysis."""
+        cold = SecurityAnalyzer(cache=cache).analyze_file(str(project / "a.py"))
+        warm = SecurityAnalyzer(cache=cache).analyze_file(str(project / "a.py"))
+
+        assert cold
+        assert [v.to_dict() for v in warm] == [v.to_dict() for v in cold]
+        assert cache.stats["hits"] == 1
+
+    def test_god_class_detector(self, project: Path, cache: AnalysisCache) -> None:
+        """Test that cached class metrics match a fresh analysis."""
+        (project / "big.py").write_text(
+            "class Big:\n" + "".join(f"    def m{i}(self):\n        pass\n" for i in range(12))
+        )
+
+        cold = GodClassDetector(min_lines=1, min_methods=2, cache=cache).analyze_directory(
+            str(project)
+        )
+        warm = GodClassDetector(min_lines=1, min_methods=2, cache=cache).analyze_directory(
+            str(project)
+        )
+
+        assert [m.name for m in cold] == ["Big"]
+        assert warm == cold
+        assert cache.stats["hits"] == 3
+
+    def test_import_detector(self, project: Path, cache: AnalysisCache) -> None:
+        """Test that cached imports build the same dependency graph."""
+        cold = CircularDependencyDetector(str(project), cache=cache)
+        cold.analyze()
+        warm = CircularDependencyDetector(str(project), cache=cache)
+        warm.analyze()
+
+        assert warm.import_map == cold.import_map
+        # Unchanged files are answered by the import graph baseline alone
+        assert cache.stats["hits"] == 1
+
+    def test_dead_code_detector(self, project: Path, cache: AnalysisCache) -> None:
+        """Test that cached definitions and usages give the same dead code."""
+        cold = DeadCodeDetector(str(project), cache=cache).analyze()
+        warm = DeadCodeDetector(str(project), cache=cache).analyze()
+
+        assert "unused" in {dc.name for dc in cold}
+        assert warm == cold
+        assert cache.stats["hits"] == 4
+
+    def test_api_snapshot(self, project: Path, cache: AnalysisCache) -> None:
+        """Test that cached signatures match a fresh snapshot."""
+        cold = APISnapshot(cache=cache)
+        cold.create_snapshot(project)
+        warm = APISnapshot(cache=cache)
+        warm.create_snapshot(project)
+
+        assert "b.helper" in cold.functions
+        assert warm.functions == cold.functions
+        assert cache.stats["hits"] == 2
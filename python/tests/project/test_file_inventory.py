@@ -0,0 +1,142 @@
+"""Tests for the shared file inventory."""
+
+import os
+from pathlib import Path
+
+import pytest
+from qontinui_devtools.architecture import GodClassDetector
+from qontinui_devtools.import_analysis.ast_utils import find_python_files
+from qontinui_devtools.project import FileInventory, file_inventory, find_files
+
+
+def _touch(root: Path, *names: str) -> None:
+    """Create empty files below a root."""
+    for name in names:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x = 1\n")
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a mixed-language project with directories that should be skipped."""
+    _touch(
+        tmp_path,
+        "pkg/__init__.py",
+        "pkg/core.py",
+        "pkg/sub/helpers.py",
+        "web/app.ts",
+        "web/view.tsx",
+        "web/legacy.js",
+        "crate/src/lib.rs",
+        "README.md",
+        ".venv/lib/site.py",
+        "node_modules/dep/index.js",
+        "crate/target/debug/build.rs",
+        "pkg/__pycache__/core.py",
+    )
+    return tmp_path
+
+
+class TestFileInventory:
+    """Tests for FileInventory.scan and file selection."""
+
+    def test_scan_records_languages(self, project: Path) -> None:
+        """Test that source files are listed with their language, size and mtime."""
+        inventory = FileInventory.scan(project)
+
+        listed = {entry.path.relative_to(project).as_posix(): entry for entry in inventory}
+        assert sorted(listed) == [
+            "crate/src/lib.rs",
+            "pkg/__init__.py",
+            "pkg/core.py",
+            "pkg/sub/helpers.py",
+            "web/app.ts",
+            "web/legacy.js",
+            "web/view.tsx",
+        ]
+        core = listed["pkg/core.py"]
+        assert core.language == "python"
+        assert core.size == 6
+        assert core.mtime == os.stat(project / "pkg" / "core.py").st_mtime
+        assert listed["web/view.tsx"].language == "typescript"
+
+    def test_excluded_directories_are_pruned(
+        self, project: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that excluded directories are never listed."""
+        visited: list[str] = []
+        real_scandir = os.scandir
+
+        def recording_scandir(path: str) -> "os._ScandirIterator[str]":
+            visited.append(Path(path).name)
+            return real_scandir(path)
+
+        monkeypatch.setattr(file_inventory.os, "scandir", recording_scandir)
+        FileInventory.scan(project)
+
+        assert "pkg" in visited
+        assert not {".venv", "node_modules", "target", "__pycache__"} & set(visited)
+
+    def test_gitignore(self, project: Path) -> None:
+        """Test gitignore patterns, negation, anchoring and nested files."""
+        (project / ".gitignore").write_text("# generated\n/web/*.js\npkg/sub/\n*.tsx\n!keep.tsx\n")
+        _touch(project, "web/keep.tsx", "other/web/legacy.js", "crate/gen.rs")
+        (project / "crate" / ".gitignore").write_text("gen.rs\n")
+
+        names = {p.relative_to(project).as_posix() for p in FileInventory.scan(project).files()}
+
+        assert "web/legacy.js" not in names
+        assert "other/web/legacy.js" in names  # anchored to the root
+        assert "pkg/sub/helpers.py" not in names
+        assert "web/view.tsx" not in names
+        assert "web/keep.tsx" in names
+        assert "crate/gen.rs" not in names
+        assert "crate/src/lib.rs" in names
+
+        unfiltered = FileInventory.scan(project, use_gitignore=False)
+        assert len(unfiltered) == len(names) + 4
+
+    def test_select(self, project: Path) -> None:
+        """Test selecting by language, subdirectory and extra excluded directories."""
+        inventory = FileInventory.scan(project)
+
+        assert [p.name for p in inventory.files("rust")] == ["lib.rs"]
+        assert len(inventory.files(("typescript", "javascript"))) == 3
+        assert [p.name for p in inventory.files("python", under=project / "pkg" / "sub")] == [
+            "helpers.py"
+        ]
+        assert [p.name for p in inventory.files("python", exclude_dirs={"sub"})] == [
+            "__init__.py",
+            "core.py",
+        ]
+
+
+class TestFindFiles:
+    """Tests for sharing one inventory between analyzers."""
+
+    def test_uses_covering_inventory(self, project: Path) -> None:
+        """Test that a covering inventory is reused without rescanning."""
+        inventory = FileInventory.scan(project)
+        (project / "pkg" / "late.py").write_text("x = 1\n")
+
+        # Files created after the scan are not seen when the inventory is shared
+        assert "late.py" not in {p.name for p in find_files(project / "pkg", "python", inventory)}
+        assert "late.py" in {p.name for p in find_files(project / "pkg", "python")}
+
+    def test_single_file(self, project: Path) -> None:
+        """Test that a file path returns itself when the language matches."""
+        assert find_files(project / "pkg" / "core.py", "python") == [project / "pkg" / "core.py"]
+        assert find_files(project / "web" / "app.ts", "python") == []
+
+    def test_analyzers_skip_virtualenvs(self, project: Path) -> None:
+        """Test that analyzers no longer descend into virtualenvs."""
+        (project / ".venv" / "lib" / "big.py").write_text(
+            "class Big:\n" + "".join(f"    def m{i}(self):\n        pass\n" for i in range(12))
+        )
+        inventory = FileInventory.scan(project)
+
+        detector = GodClassDetector(min_lines=1, min_methods=2, inventory=inventory)
+
+        assert detector.analyze_directory(str(project)) == []
+        assert all(".venv" not in path for path in find_python_files(str(project), inventory))
@@ -0,0 +1,84 @@
+"""Tests for finding files changed since a git revision."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+from qontinui_devtools.project import changed_files
+
+
+def _git(repo: Path, *args: str) -> None:
+    """Run a git command in a repository."""
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Create a repository with one commit of three files."""
+    _git(tmp_path, "init", "-q")
+    for name in ("a.py", "b.py", "c.py"):
+        (tmp_path / name).write_text(f"# {name}\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+class TestChangedFiles:
+    """Tests for changed_files."""
+
+    def test_no_changes(self, repo: Path) -> None:
+        """Test that a clean tree has no changed files."""
+        assert changed_files("HEAD", repo) == []
+
+    def test_modified_staged_and_untracked(self, repo: Path) -> None:
+        """Test that unstaged, staged and untracked files are all reported."""
+        (repo / "a.py").write_text("x = 1\n")
+        (repo / "b.py").write_text("y = 2\n")
+        _git(repo, "add", "b.py")
+        (repo / "new.py").write_text("z = 3\n")
+
+        assert changed_files("HEAD", repo) == [
+            (repo / name).resolve() for name in ("a.py", "b.py", "new.py")
+        ]
+        assert (repo / "new.py").resolve() not in changed_files(
+            "HEAD", repo, include_untracked=False
+        )
+
+    def test_committed_changes_and_deletions(self, repo: Path) -> None:
+        """Test comparing against an older commit, leaving out deleted files."""
+        (repo / "a.py").write_text("x = 1\n")
+        (repo / "c.py").unlink()
+        _git(repo, "commit", "-q", "-am", "change")
+
+        assert changed_files("HEAD~1", repo) == [(repo / "a.py").resolve()]
+
+    def test_from_subdirectory(self, repo: Path) -> None:
+        """Test that paths are resolved from the repository root."""
+        sub = repo / "pkg"
+        sub.mkdir()
+        (sub / "mod.py").write_text("")
+        (repo / "a.py").write_text("x = 1\n")
+
+        assert changed_files("HEAD", sub) == [
+            (repo / "a.py").resolve(),
+            (sub / "mod.py").resolve(),
+        ]
+
+    def test_invalid_revision(self, repo: Path) -> None:
+        """Test that unknown or option-like revisions raise ValueError."""
+        with pytest.raises(ValueError):
+            changed_files("no-such-branch", repo)
+        with pytest.raises(ValueError):
+            changed_files("--output=x", repo)
+
+    def test_not_a_repository(self, tmp_path: Path) -> None:
+        """Test that a directory outside git raises ValueError."""
+        plain = tmp_path / "plain"
+        plain.mkdir()
+        with pytest.raises(ValueError):
+            changed_files("HEAD", plain)
@@ -0,0 +1,43 @@
+"""Tests for the module resolution index."""
+
+from qontinui_devtools.project import ModuleIndex
+
+
+class TestModuleIndex:
+    """Tests for longest-prefix module resolution."""
+
+    def test_resolves_longest_prefix(self) -> None:
+        """Test that submodule and attribute imports resolve to the deepest module."""
+        index = ModuleIndex({"pkg": "pkg/__init__.py", "pkg.models": "pkg/models.py"})
+
+        assert index.resolve("pkg.models") == "pkg.models"
+        assert index.resolve("pkg.models.User") == "pkg.models"
+        assert index.resolve("pkg.views") == "pkg"
+        assert index.resolve("pkg") == "pkg"
+
+    def test_external_imports(self) -> None:
+        """Test that names outside the project do not resolve."""
+        index = ModuleIndex({"pkg.models": "pkg/models.py"})
+
+        assert index.resolve("os.path") is None
+        assert index.resolve("pkg") is None  # package without __init__ module
+        assert index.resolve("pkgx.models") is None
+
+    def test_membership_and_paths(self) -> None:
+        """Test exact-name lookups."""
+        index = ModuleIndex({"a.b": "a/b.py", "c": "c.py"})
+
+        assert "a.b" in index
+        assert "a" not in index
+        assert index.get_path("c") == "c.py"
+        assert len(index) == 2
+        assert sorted(index) == ["a.b", "c"]
+
+    def test_add_invalidates_memo(self) -> None:
+        """Test that adding a module updates earlier resolutions."""
+        index = ModuleIndex({"pkg": "pkg/__init__.py"})
+        assert index.resolve("pkg.models.User") == "pkg"
+
+        index.add("pkg.models", "pkg/models.py")
+
+        assert index.resolve("pkg.models.User") == "pkg.models"
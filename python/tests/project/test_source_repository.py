@@ -0,0 +1,127 @@
+"""Tests for the shared source repository."""
+
+import ast
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from qontinui_devtools.architecture import GodClassDetector, SRPAnalyzer
+from qontinui_devtools.project import SourceRepository
+from qontinui_devtools.security import SecurityAnalyzer
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a small project with a valid and an invalid module."""
+    (tmp_path / "good.py").write_text(
+        "import os\n\n\nclass Service:\n    def run(self, target: str) -> None:\n        os.system('ls ' + target)\n"
+    )
+    (tmp_path / "bad.py").write_text("def broken(:\n")
+    return tmp_path
+
+
+class TestSourceRepository:
+    """Tests for SourceRepository caching behaviour."""
+
+    def test_parse_returns_same_tree(self, project: Path) -> None:
+        """Test that repeated parses return the cached tree."""
+        sources = SourceRepository()
+
+        first = sources.parse(project / "good.py")
+        second = sources.parse(str(project / "good.py"))
+
+        assert isinstance(first, ast.Module)
+        assert first is second
+        assert sources.stats["parses"] == 1
+        assert sources.stats["reads"] == 1
+
+    def test_read_and_lines(self, project: Path) -> None:
+        """Test source text and line access."""
+        sources = SourceRepository()
+
+        assert sources.read(project / "good.py").startswith("import os")
+        assert sources.lines(project / "good.py")[0] == "import os"
+        assert project / "good.py" in sources
+        assert len(sources) == 1
+
+    def test_syntax_error_is_cached(self, project: Path) -> None:
+        """Test that parse failures are raised again without re-parsing."""
+        sources = SourceRepository()
+
+        with pytest.raises(SyntaxError):
+            sources.parse(project / "bad.py")
+        with pytest.raises(SyntaxError):
+            sources.parse(project / "bad.py")
+
+        assert sources.stats["parses"] == 0
+        assert sources.stats["reads"] == 1
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test that missing files raise OSError."""
+        sources = SourceRepository()
+
+        with pytest.raises(OSError):
+            sources.read(tmp_path / "missing.py")
+
+    def test_without_retained_trees(self, project: Path) -> None:
+        """Test that retain_trees=False re-parses but keeps the source."""
+        sources = SourceRepository(retain_trees=False)
+
+        first = sources.parse(project / "good.py")
+        second = sources.parse(project / "good.py")
+
+        assert first is not second
+        assert sources.stats["parses"] == 2
+        assert sources.stats["reads"] == 1
+
+    def test_without_retained_trees_holds_one_file(self, project: Path) -> None:
+        """Test that retain_trees=False drops a file once another is read."""
+        sources = SourceRepository(retain_trees=False)
+
+        sources.read(project / "good.py")
+        sources.read(project / "bad.py")
+
+        assert len(sources) == 1
+        assert project / "bad.py" in sources
+        assert project / "good.py" not in sources
+
+    def test_concurrent_reads(self, project: Path) -> None:
+        """Test that threads asking for the same file share one read and parse."""
+        sources = SourceRepository()
+        good = project / "good.py"
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            trees = list(pool.map(lambda _: sources.parse(good), range(32)))
+
+        assert all(tree is trees[0] for tree in trees)
+        assert sources.stats["reads"] == 1
+        assert sources.stats["parses"] == 1
+        assert sources.stats["hits"] == 31
+
+    def test_invalidate(self, project: Path) -> None:
+        """Test that invalidated files are read again."""
+        sources = SourceRepository()
+        sources.parse(project / "good.py")
+
+        (project / "good.py").write_text("x = 1\n")
+        sources.invalidate(project / "good.py")
+
+        assert sources.read(project / "good.py") == "x = 1\n"
+        assert sources.stats["reads"] == 2
+
+
+class TestSharedParsing:
+    """Tests for analyzers sharing one repository."""
+
+    def test_analyzers_parse_each_file_once(self, project: Path) -> None:
+        """Test that several analyzers reuse the same parse."""
+        sources = SourceRepository()
+        good = str(project / "good.py")
+
+        GodClassDetector(sources=sources).analyze_file(good)
+        SRPAnalyzer(sources=sources).analyze_file(good)
+        vulnerabilities = SecurityAnalyzer(sources=sources).analyze_file(good)
+
+        assert sources.stats["parses"] == 1
+        assert sources.stats["reads"] == 1
+        assert vulnerabilities  # os.system is still reported from the shared tree
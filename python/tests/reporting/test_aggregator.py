@@ -359,3 +359,75 @@ class BigClass:
                 assert len(section.content) > 0
                 assert section.severity in ["success", "warning", "error", "info"]
                 assert isinstance(section.metrics, dict)
+
+
+class TestParallelAggregation:
+    """Tests for process-pool execution of the aggregator."""
+
+    def _create_project(self, root: Path) -> None:
+        """Create a project with enough files to be split into batches."""
+        for i in range(12):
+            (root / f"module{i}.py").write_text(
+                f"""
+_instances_{i} = {{}}
+
+def get_instance_{i}(key):
+    if key not in _instances_{i}:
+        _instances_{i}[key] = object()
+    return _instances_{i}[key]
+
+class Service{i}:
+"""
+                + "".join(f"    def method{j}(self): pass\n" for j in range(25))
+            )
+
+    def test_parallel_matches_serial(self) -> None:
+        """Test that jobs > 1 produces the same results as a serial run."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._create_project(Path(tmpdir))
+
+            serial = ReportAggregator(tmpdir, jobs=1)
+            serial.run_all_analyses()
+            parallel = ReportAggregator(tmpdir, jobs=3)
+            parallel.run_all_analyses()
+
+            assert parallel.results["quality"] == serial.results["quality"]
+            assert parallel.results["architecture"] == serial.results["architecture"]
+            assert parallel.results["concurrency"] == serial.results["concurrency"]
+            assert (
+                parallel.results["imports"]["circular_dependencies"]
+                == serial.results["imports"]["circular_dependencies"]
+            )
+            assert serial.results["architecture"]["god_classes"] == 12
+            assert serial.results["concurrency"]["race_conditions"] == 12
+
+    def test_parallel_empty_project(self) -> None:
+        """Test that a parallel run on an empty project yields empty results."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            aggregator = ReportAggregator(tmpdir, jobs=2)
+            report_data = aggregator.run_all_analyses()
+
+            assert aggregator.results["quality"]["total_files"] == 0
+            assert aggregator.results["architecture"]["god_classes"] == 0
+            assert "files_analyzed" in report_data.summary_metrics
+
+    def test_jobs_zero_uses_cpu_count(self) -> None:
+        """Test that jobs=0 selects one worker per CPU."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            aggregator = ReportAggregator(tmpdir, jobs=0)
+            assert aggregator.jobs >= 1
+
+    def test_changed_files_only(self) -> None:
+        """Test that per-file analyses only see the changed files, serial or parallel."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._create_project(Path(tmpdir))
+            changed = [Path(tmpdir) / "module3.py", Path(tmpdir) / "module7.py"]
+
+            for jobs in (1, 2):
+                aggregator = ReportAggregator(tmpdir, jobs=jobs, changed_files=changed)
+                aggregator.run_all_analyses()
+
+                assert aggregator.results["quality"]["total_files"] == 2
+                assert aggregator.results["architecture"]["god_classes"] == 2
+                assert aggregator.results["concurrency"]["race_conditions"] == 2
+                assert aggregator.results["imports"]["circular_dependencies"] == 0
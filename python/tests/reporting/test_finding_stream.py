@@ -0,0 +1,118 @@
+"""Tests for streaming finding writers."""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+from qontinui_devtools.reporting import (
+    Finding,
+    FindingWriter,
+    NDJSONWriter,
+    SARIFWriter,
+    open_finding_writer,
+)
+
+
+def _finding(rule_id: str = "sql_injection", severity: str = "high", line: int = 3) -> Finding:
+    """Create a finding for tests."""
+    return Finding(
+        rule_id=rule_id,
+        message=f"{rule_id} found",
+        severity=severity,
+        file_path="src/app.py",
+        line=line,
+        tool="security",
+        properties={"cwe_id": "CWE-89"},
+    )
+
+
+class TestNDJSONWriter:
+    """Tests for the NDJSON writer."""
+
+    def test_one_object_per_line(self) -> None:
+        """Test that each finding is written as its own JSON line."""
+        stream = io.StringIO()
+        with NDJSONWriter(stream, "security") as writer:
+            writer.write(_finding())
+            writer.write(_finding("command_injection", "critical"))
+
+        lines = stream.getvalue().splitlines()
+        assert writer.count == 2
+        assert [json.loads(line)["rule_id"] for line in lines] == [
+            "sql_injection",
+            "command_injection",
+        ]
+
+    def test_written_before_close(self) -> None:
+        """Test that findings are visible as soon as they are written."""
+        stream = io.StringIO()
+        writer = NDJSONWriter(stream, "security")
+        writer.write(_finding())
+
+        assert json.loads(stream.getvalue())["line"] == 3
+
+    def test_write_after_close(self) -> None:
+        """Test that writing to a closed writer fails."""
+        writer = NDJSONWriter(io.StringIO(), "security")
+        writer.close()
+
+        with pytest.raises(ValueError):
+            writer.write(_finding())
+
+    def test_base_class_is_abstract(self) -> None:
+        """Test that FindingWriter itself can't be instantiated."""
+        with pytest.raises(TypeError):
+            FindingWriter(io.StringIO(), "security")  # type: ignore[abstract]
+
+
+class TestSARIFWriter:
+    """Tests for the SARIF writer."""
+
+    def test_valid_log(self) -> None:
+        """Test that the streamed document is a valid SARIF log."""
+        stream = io.StringIO()
+        with SARIFWriter(stream, "security") as writer:
+            writer.write(_finding())
+            writer.write(_finding("weak_crypto", "low", line=0))
+            writer.write(_finding(line=9))
+
+        log = json.loads(stream.getvalue())
+        run = log["runs"][0]
+        assert log["version"] == "2.1.0"
+        assert [r["ruleId"] for r in run["results"]] == [
+            "sql_injection",
+            "weak_crypto",
+            "sql_injection",
+        ]
+        assert [r["level"] for r in run["results"]] == ["error", "note", "error"]
+        region = run["results"][1]["locations"][0]["physicalLocation"]["region"]
+        assert region["startLine"] == 1  # SARIF lines start at 1
+        rules = run["tool"]["driver"]["rules"]
+        assert [rule["id"] for rule in rules] == ["sql_injection", "weak_crypto"]
+        assert rules[1]["fullDescription"]["text"] == "weak_crypto found"
+
+    def test_empty_log(self) -> None:
+        """Test that a run without findings is still valid."""
+        stream = io.StringIO()
+        SARIFWriter(stream, "security").close()
+
+        assert json.loads(stream.getvalue())["runs"][0]["results"] == []
+
+
+class TestOpenFindingWriter:
+    """Tests for open_finding_writer."""
+
+    def test_writes_file(self, tmp_path: Path) -> None:
+        """Test that a file output is written and closed."""
+        output = tmp_path / "findings.ndjson"
+        with open_finding_writer("ndjson", output, "security") as writer:
+            writer.write(_finding())
+
+        assert writer.stream.closed
+        assert json.loads(output.read_text())["tool"] == "security"
+
+    def test_unknown_format(self) -> None:
+        """Test that a non-streaming format is rejected."""
+        with pytest.raises(ValueError, match="Unknown stream format"):
+            open_finding_writer("html", None, "security")
@@ -333,6 +333,39 @@ class TestActionProfiler:
 
         profiler.end_session()
 
+    def test_stack_sampling_attributes_samples_to_action(self, tmp_path: Path) -> None:
+        """Test that stack samples are recorded for the running action."""
+        profiler = ActionProfiler(sample_interval=0.001, enable_stack_sampling=True)
+        profiler.start_session()
+
+        def busy_wait(seconds: float) -> None:
+            end = time.perf_counter() + seconds
+            while time.perf_counter() < end:
+                pass
+
+        with profiler.profile_action("compute", "sampled") as sampled:
+            busy_wait(0.2)
+        with profiler.profile_action("noop", "idle") as idle:
+            pass
+
+        assert len(sampled.stack_samples) > 0
+        assert idle.stack_samples == []
+        assert all(
+            sampled.start_time <= timestamp <= sampled.end_time
+            for timestamp, _ in sampled.stack_samples
+        )
+        # Stacks go from the outermost frame to the innermost
+        innermost = [stack[-1] for _, stack in sampled.stack_samples]
+        assert any(frame.startswith("busy_wait ") for frame in innermost)
+
+        output_path = tmp_path / "flame.json"
+        profiler.generate_flame_graph(str(output_path), format="json")
+        assert output_path.exists()
+
+        profiler.end_session()
+        assert profiler._stack_sampler is not None
+        assert not profiler._stack_sampler.is_running
+
     def test_disabled_memory_tracking(self) -> None:
         """Test that memory tracking can be disabled."""
         profiler = ActionProfiler(enable_memory=False)
@@ -11,6 +11,7 @@ This module tests:
 import asyncio
 import json
 import time
+from typing import Any
 
 import pytest
 from aiohttp import WSMsgType
@@ -20,8 +21,10 @@ from qontinui_devtools.runtime import (
     DashboardServer,
     EventMetrics,
     MetricsCollector,
+    QuantileSketch,
     SystemMetrics,
 )
+from qontinui_devtools.runtime.dashboard_server import _ClientChannel, _diff_state
 
 
 class TestMetricsCollector:
@@ -178,6 +181,7 @@ class TestMetricsCollector:
         # Record more actions than history size
         for i in range(10):
             collector.record_action(f"action_{i}", 0.1, success=True)
+        collector.flush()
 
         # Should only keep last 5
         assert len(collector._action_history) == 5
@@ -209,6 +213,68 @@ class TestMetricsCollector:
 
         assert metrics.success_rate == 75.0
 
+    def test_error_count_follows_history(self) -> None:
+        """Test that errors drop out of the count with their history records."""
+        collector = MetricsCollector(history_size=3)
+        collector.record_action("fail", 0.1, success=False)
+        collector.record_action("ok1", 0.1, success=True)
+        collector.record_action("ok2", 0.1, success=True)
+        assert collector.collect_action_metrics().error_count == 1
+
+        collector.record_action("ok3", 0.1, success=True)
+        assert collector.collect_action_metrics().error_count == 0
+
+    def test_duration_percentiles(self) -> None:
+        """Test percentiles of action durations and event processing times."""
+        collector = MetricsCollector()
+        for i in range(1, 101):
+            collector.record_action("test", i / 1000)
+            collector.record_event(i / 1000)
+
+        actions = collector.collect_action_metrics()
+        assert actions.p50_duration == pytest.approx(0.050, rel=0.02)
+        assert actions.p99_duration == pytest.approx(0.099, rel=0.02)
+
+        events = collector.get_latest_metrics()["events"]
+        assert events["p95_processing_time"] == pytest.approx(0.095, rel=0.02)
+
+    def test_merge_sketches_from_worker(self) -> None:
+        """Test combining percentiles of collectors in different processes."""
+        main = MetricsCollector()
+        worker = MetricsCollector()
+        for _ in range(99):
+            main.record_action("fast", 0.01)
+        worker.record_action("slow", 1.0)
+
+        payload = {name: sketch.to_dict() for name, sketch in worker.get_sketches().items()}
+        main.merge_sketches(
+            {name: QuantileSketch.from_dict(data) for name, data in payload.items()}
+        )
+
+        sketch = main.get_sketches()["action_duration"]
+        assert sketch.count == 100
+        assert sketch.max == 1.0
+
+    def test_buffered_recording_from_exited_threads(self) -> None:
+        """Test that records from finished threads are counted and their buffers released."""
+        import threading
+
+        collector = MetricsCollector()
+
+        def record() -> None:
+            collector.record_action("worker", 0.01, success=False)
+            collector.record_event(0.02)
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert collector.collect_action_metrics().error_count == 8
+        assert collector.collect_event_metrics().events_processed == 8
+        assert collector._buffers == []
+
     def test_empty_metrics(self) -> None:
         """Test metrics with no recorded data."""
         collector = MetricsCollector()
@@ -229,8 +295,11 @@ class TestDashboardServer(AioHTTPTestCase):
     async def get_application(self):  # type: ignore[no-untyped-def]
         """Create application for testing."""
         self.collector = MetricsCollector(sample_interval=0.1)
-        self.server = DashboardServer(host="localhost", port=8765, metrics_collector=self.collector)  # type: ignore[assignment]
-        return self.server.app
+        self.dashboard = DashboardServer(
+            host="localhost", port=8765, metrics_collector=self.collector, client_queue_size=4
+        )
+        self.server = self.dashboard  # type: ignore[assignment]
+        return self.dashboard.app
 
     @unittest_run_loop
     async def test_index_handler(self) -> None:
@@ -363,6 +432,38 @@ class TestDashboardServer(AioHTTPTestCase):
             # Check event metrics
             assert data["events"]["events_queued"] >= 1
 
+    @unittest_run_loop
+    async def test_broadcast_sends_deltas(self) -> None:
+        """Test that ticks after the initial state are sent as deltas."""
+        async with self.client.ws_connect("/ws") as ws:
+            initial = json.loads((await ws.receive()).data)
+
+            self.collector.set_action_queue_depth(7)
+            self.dashboard.broadcast_once()
+            delta = json.loads((await ws.receive()).data)
+
+            assert delta["type"] == "delta"
+            assert delta["changes"]["actions"]["queue_depth"] == 7
+            assert "success_rate" not in delta["changes"]["actions"]
+            assert set(delta["changes"]) <= set(initial)
+
+    @unittest_run_loop
+    async def test_history_replay(self) -> None:
+        """Test that late joiners can request recent states."""
+        for depth in range(3):
+            self.collector.set_action_queue_depth(depth)
+            self.dashboard.broadcast_once()
+
+        async with self.client.ws_connect("/ws") as ws:
+            initial = json.loads((await ws.receive()).data)
+            assert initial["actions"]["queue_depth"] == 2
+
+            await ws.send_json({"type": "request_history"})
+            history = json.loads((await ws.receive()).data)
+
+            assert history["type"] == "history"
+            assert [s["actions"]["queue_depth"] for s in history["samples"]] == [0, 1, 2]
+
     def test_dashboard_server_initialization(self) -> None:
         """Test DashboardServer initialization."""
         collector = MetricsCollector()
@@ -384,6 +485,58 @@ class TestDashboardServer(AioHTTPTestCase):
         assert "WebSocket" in html
 
 
+class TestBroadcastFanOut:
+    """Test per-client queues and shared serialization."""
+
+    def _connect(self, server: DashboardServer) -> Any:
+        channel = _ClientChannel(object())  # type: ignore[arg-type]
+        server._channels[channel.ws] = channel
+        return channel
+
+    def test_slow_client_drops_ticks(self) -> None:
+        """Test that a full queue drops ticks for that client only."""
+
+        async def run() -> None:
+            server = DashboardServer(client_queue_size=3)
+            slow = self._connect(server)
+            for _ in range(5):
+                server.broadcast_once()
+
+            assert slow.queue.qsize() == 3
+            assert slow.dropped == 2
+
+            # After draining, the next delta is against the last queued state
+            queued = [json.loads(slow.queue.get_nowait()) for _ in range(3)]
+            assert "type" not in queued[0]
+            assert queued[1]["type"] == queued[2]["type"] == "delta"
+            server.broadcast_once()
+            assert json.loads(slow.queue.get_nowait())["type"] == "delta"
+
+        asyncio.run(run())
+
+    def test_clients_share_serialized_message(self) -> None:
+        """Test that clients with the same delta base share one message."""
+
+        async def run() -> None:
+            server = DashboardServer()
+            first = self._connect(server)
+            second = self._connect(server)
+            server.broadcast_once()
+            server.broadcast_once()
+
+            for _ in range(2):
+                assert first.queue.get_nowait() is second.queue.get_nowait()
+
+        asyncio.run(run())
+
+    def test_diff_state(self) -> None:
+        """Test nested state diffs."""
+        old = {"system": {"cpu": 1.0, "threads": 4}, "events": {"depth": 0}, "gone": 1}
+        new = {"system": {"cpu": 2.0, "threads": 4}, "events": {"depth": 0}, "action": None}
+
+        assert _diff_state(old, new) == {"system": {"cpu": 2.0}, "action": None, "gone": None}
+
+
 @pytest.mark.integration
 class TestDashboardIntegration:
     """Integration tests for dashboard system."""
@@ -1,6 +1,7 @@
 """Tests for event tracer functionality."""
 
 import json
+import sys
 import threading
 import time
 from pathlib import Path
@@ -8,12 +9,15 @@ from typing import Any
 
 import pytest
 from qontinui_devtools.runtime import (
+    CompactEventTrace,
     EventTrace,
     EventTracer,
     analyze_latencies,
     detect_anomalies,
     export_chrome_trace,
     find_bottleneck,
+    latency_analyzer,
+    stage_statistics,
 )
 
 
@@ -114,6 +118,70 @@ class TestEventTrace:
         assert latencies["tauri_receive -> python_receive"] >= 0.02
 
 
+class TestCompactEventTrace:
+    """Tests for CompactEventTrace class."""
+
+    def _filled(self, trace_class: type) -> Any:
+        trace = trace_class(event_id="evt_001", event_type="click", created_at=1000.0)
+        trace.add_checkpoint("frontend_emit", timestamp=1000.0, metadata={"x": 1})
+        trace.add_checkpoint("tauri_receive", timestamp=1000.5)
+        trace.add_checkpoint("python_receive", timestamp=1001.25)
+        return trace
+
+    def test_matches_event_trace(self) -> None:
+        """Test that the compact trace behaves like EventTrace."""
+        compact = self._filled(CompactEventTrace)
+        regular = self._filled(EventTrace)
+
+        assert compact.checkpoints == regular.checkpoints
+        assert compact.get_stage_latencies() == regular.get_stage_latencies()
+        assert compact.get_latency("frontend_emit", "python_receive") == 1.25
+        assert compact.total_latency == regular.total_latency == 1.25
+        assert compact.checkpoint_count == 3
+        assert compact.first_timestamp == 1000.0
+
+    def test_metadata_stored_only_when_present(self) -> None:
+        """Test that checkpoints without metadata allocate no metadata dict."""
+        trace = CompactEventTrace(event_id="evt_001", event_type="click", created_at=0.0)
+        trace.add_checkpoint("frontend_emit")
+        assert trace._metadata is None
+
+        trace.add_checkpoint("tauri_receive", metadata={"x": 1})
+        assert trace._metadata == {1: {"x": 1}}
+        assert trace.checkpoints[0].metadata == {}
+        assert trace.checkpoints[1].metadata == {"x": 1}
+
+    def test_get_latency_invalid_checkpoint(self) -> None:
+        """Test that unknown checkpoint names raise ValueError."""
+        trace = self._filled(CompactEventTrace)
+
+        with pytest.raises(ValueError, match="Checkpoint not found"):
+            trace.get_latency("frontend_emit", "never_recorded_checkpoint")
+
+    def test_compact_tracer(self, tmp_path: Path) -> None:
+        """Test tracing, analysis and export with compact storage."""
+        tracer = EventTracer(compact=True)
+        for i in range(3):
+            tracer.start_trace(f"evt_{i}", "click", metadata={"i": i})
+            tracer.checkpoint(f"evt_{i}", "frontend_emit")
+            tracer.checkpoint(f"evt_{i}", "tauri_receive")
+            tracer.complete_trace(f"evt_{i}")
+
+        trace = tracer.get_trace("evt_1")
+        assert isinstance(trace, CompactEventTrace)
+        assert trace.completed
+        assert trace.checkpoints[0].metadata == {"i": 1}
+
+        flow = tracer.analyze_flow()
+        assert flow.completed_events == 3
+        assert "frontend_emit -> tauri_receive" in flow.stage_latencies
+        assert tracer.get_statistics()["compact"] is True
+
+        output_path = tmp_path / "trace.json"
+        tracer.export_trace_timeline(str(output_path))
+        assert len(json.loads(output_path.read_text())["traceEvents"]) > 0
+
+
 class TestEventTracer:
     """Tests for EventTracer class."""
 
@@ -261,6 +329,102 @@ class TestEventTracer:
         assert tracer.get_trace("evt_5") is not None
         assert tracer.get_trace("evt_9") is not None
 
+    def test_restarted_trace_becomes_newest(self) -> None:
+        """Test that restarting an event moves it to the back of the eviction order."""
+        tracer = EventTracer(max_traces=3)
+        for i in range(3):
+            tracer.start_trace(f"evt_{i}", "click")
+
+        tracer.start_trace("evt_0", "click")
+        tracer.start_trace("evt_3", "click")
+
+        assert tracer.get_trace("evt_0") is not None
+        assert tracer.get_trace("evt_1") is None
+        assert tracer.get_statistics()["total_traces"] == 3
+
+    def test_eviction_at_capacity_is_fast(self) -> None:
+        """Test that a full tracer keeps accepting traces without scanning all of them."""
+        tracer = EventTracer(max_traces=10000)
+        start = time.perf_counter()
+        for i in range(30000):
+            tracer.start_trace(f"evt_{i}", "test")
+        elapsed = time.perf_counter() - start
+
+        assert tracer.get_statistics()["total_traces"] == 10000
+        assert tracer.get_trace("evt_19999") is None
+        assert tracer.get_trace("evt_20000") is not None
+        assert elapsed < 5.0
+
+    def test_concurrent_checkpoints_on_shared_events(self) -> None:
+        """Test that striped locking records every checkpoint from many threads."""
+        tracer = EventTracer(lock_stripes=4)
+        for i in range(8):
+            tracer.start_trace(f"evt_{i}", "test")
+
+        def worker() -> None:
+            for j in range(500):
+                tracer.checkpoint(f"evt_{j % 8}", "step")
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        total = sum(len(t.checkpoints) - 1 for t in tracer.get_all_traces())  # minus trace_start
+        assert total == 8 * 500
+        assert tracer.get_statistics()["lock_stripes"] == 4
+
+    def test_concurrent_auto_create_keeps_checkpoints(self) -> None:
+        """Test that threads auto-creating the same trace share one trace."""
+        tracer = EventTracer()
+        barrier = threading.Barrier(8)
+
+        def worker() -> None:
+            barrier.wait()
+            for j in range(200):
+                tracer.checkpoint(f"evt_{j}", "step")
+
+        # Switch threads often so that they interleave inside checkpoint()
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        traces = tracer.get_all_traces()
+        assert len(traces) == 200
+        assert all(len(t.checkpoints) == 1 + 8 for t in traces)  # trace_start + steps
+
+    def test_latency_sketches(self) -> None:
+        """Test that stage and total latency sketches are maintained while tracing."""
+        tracer = EventTracer(max_traces=5, lock_stripes=4)
+        for i in range(20):
+            tracer.start_trace(f"evt_{i}", "click")
+            tracer.checkpoint(f"evt_{i}", "frontend_emit")
+            tracer.checkpoint(f"evt_{i}", "tauri_receive")
+            tracer.complete_trace(f"evt_{i}")
+
+        stages = tracer.get_stage_sketches()
+        # Sketches keep counting after traces are evicted
+        assert stages["frontend_emit -> tauri_receive"].count == 20
+        assert stages["trace_start -> frontend_emit"].count == 20
+        assert tracer.get_latency_sketch().count == 20
+
+        tracer.clear()
+        assert tracer.get_stage_sketches() == {}
+        assert tracer.get_latency_sketch().count == 0
+
+    def test_lock_stripes_rounded_to_power_of_two(self) -> None:
+        """Test that the stripe count is rounded up to a power of two."""
+        assert EventTracer(lock_stripes=5).get_statistics()["lock_stripes"] == 8
+        assert EventTracer(lock_stripes=1).get_statistics()["lock_stripes"] == 1
+
     def test_analyze_flow(self) -> None:
         """Test flow analysis."""
         tracer = EventTracer()
@@ -382,6 +546,31 @@ class TestLatencyAnalyzer:
             assert "count" in stats
             assert stats["count"] == 10
 
+    def test_stage_statistics_backends_agree(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that vectorized and pure-Python statistics give identical results."""
+        traces: list[Any] = []
+        for i in range(50):
+            trace_class = CompactEventTrace if i % 2 else EventTrace
+            trace = trace_class(event_id=f"evt_{i}", event_type="click", created_at=0.0)
+            trace.add_checkpoint("a", timestamp=0.0)
+            trace.add_checkpoint("b", timestamp=0.001 * (i + 1))
+            if i % 3:
+                trace.add_checkpoint("c", timestamp=0.5 + 0.002 * i)
+            traces.append(trace)
+        # Single-checkpoint and empty traces contribute no stages
+        traces.append(EventTrace(event_id="evt_empty", event_type="click", created_at=0.0))
+
+        vectorized = stage_statistics(traces)
+        monkeypatch.setattr(latency_analyzer, "NUMPY_AVAILABLE", False)
+        fallback = stage_statistics(traces)
+
+        assert vectorized == fallback
+        assert list(vectorized) == ["a -> b", "b -> c"]
+        assert vectorized["a -> b"]["count"] == 50
+        assert vectorized["a -> b"]["min"] == pytest.approx(0.001)
+        assert vectorized["a -> b"]["max"] == pytest.approx(0.05)
+        assert vectorized["b -> c"]["count"] == 33
+
     def test_find_bottleneck(self) -> None:
         """Test bottleneck detection."""
         tracer = EventTracer()
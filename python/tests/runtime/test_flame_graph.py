@@ -0,0 +1,174 @@
+"""Tests for flame graph aggregation and rendering."""
+
+import json
+from pathlib import Path
+
+import pytest
+from qontinui_devtools.runtime.flame_graph import (
+    StackTrie,
+    aggregate_stacks,
+    diff_stacks,
+    differential_svg,
+    generate_flame_graph,
+    get_hot_paths,
+    samples_to_speedscope,
+    samples_to_svg,
+)
+
+
+def _samples(count: int = 1000) -> list[tuple[float, list[str]]]:
+    """Samples from three distinct stacks: 70% step, 29% load, 1% log."""
+    stacks = [["main", "run", "step"]] * 70 + [["main", "load"]] * 29 + [["main", "run", "log"]]
+    return [(i * 0.001, list(stacks[i % 100])) for i in range(count)]
+
+
+class TestStackTrie:
+    """Tests for StackTrie."""
+
+    def test_aggregates_distinct_stacks(self) -> None:
+        """Test that the trie maps each distinct stack to its count."""
+        trie = aggregate_stacks(_samples())
+
+        assert dict(trie) == {
+            ("main", "run", "step"): 700,
+            ("main", "load"): 290,
+            ("main", "run", "log"): 10,
+        }
+        assert trie.total == 1000
+        assert trie.node_count == 5
+        assert trie.inclusive(["main", "run"]) == 710
+        assert trie.inclusive(["other"]) == 0
+        with pytest.raises(KeyError):
+            trie[("main", "run")]
+
+    def test_prune_keeps_widths(self) -> None:
+        """Test that pruned samples move to the nearest remaining caller."""
+        trie = aggregate_stacks(_samples())
+
+        pruned = trie.prune(0.05)
+
+        assert dict(pruned) == {
+            ("main", "run", "step"): 700,
+            ("main", "load"): 290,
+            ("main", "run"): 10,
+        }
+        assert pruned.inclusive(["main", "run"]) == 710
+        assert pruned.total == trie.total
+
+    def test_collapsed_round_trip(self, tmp_path: Path) -> None:
+        """Test writing and reading collapsed stacks."""
+        trie = aggregate_stacks(_samples())
+        trie.add(["main", "a;b"], 3)
+        path = tmp_path / "profile.folded"
+
+        trie.write_collapsed(path)
+        lines = path.read_text().splitlines()
+        loaded = StackTrie.read_collapsed(path)
+
+        assert "main;run;step 700" in lines
+        assert "main;a,b 3" in lines
+        assert loaded.total == trie.total
+        assert loaded[("main", "load")] == 290
+
+    def test_invalid_collapsed_line(self) -> None:
+        """Test that lines without a count are rejected."""
+        with pytest.raises(ValueError, match="line 2"):
+            StackTrie.from_collapsed(["main;run 3", "main;run"])
+
+    def test_merge(self) -> None:
+        """Test combining the samples of two tries."""
+        trie = aggregate_stacks(_samples(100))
+        trie.merge(aggregate_stacks(_samples(100)))
+
+        assert trie.total == 200
+        assert trie[("main", "load")] == 58
+
+
+class TestRendering:
+    """Tests for flame graph output."""
+
+    def test_speedscope_weights_distinct_stacks(self) -> None:
+        """Test that speedscope output has one weighted entry per stack."""
+        profile = samples_to_speedscope(_samples(10_000))["profiles"][0]
+
+        assert len(profile["samples"]) == 3
+        assert sorted(profile["weights"]) == [100, 2900, 7000]
+        assert profile["endValue"] == 10_000
+
+    def test_svg_size_depends_on_distinct_stacks(self) -> None:
+        """Test that SVG output does not grow with the sample count."""
+        small = samples_to_svg(_samples(1000))
+        large = samples_to_svg(_samples(100_000))
+
+        assert small.count("<rect") == large.count("<rect") == 5
+
+    def test_svg_min_width_prunes_frames(self) -> None:
+        """Test that frames narrower than min_width are left out."""
+        svg = samples_to_svg(aggregate_stacks(_samples()), width=1000, min_width=20)
+
+        assert "step" in svg
+        assert ">log" not in svg
+        # Frames are escaped as XML
+        assert "&lt;module&gt;" in samples_to_svg([(0.0, ["<module>"])])
+
+    def test_callees_stack_above_callers(self) -> None:
+        """Test that children are drawn within their parent's span."""
+        svg = samples_to_svg(_samples(), width=1000)
+
+        frames = {part.split(" (")[0]: part for part in svg.split("<g><title>")[1:]}
+
+        # Siblings sorted by name: load (290) then run (710) with log before step
+        assert 'x="0.0" y="' in frames["main"]
+        assert 'x="0.0" y="' in frames["load"]
+        assert 'x="290.0" y="' in frames["run"]
+        assert 'x="300.0" y="' in frames["step"]
+
+    def test_generate_collapsed(self, tmp_path: Path) -> None:
+        """Test the collapsed output format and empty input."""
+        path = tmp_path / "profile.folded"
+        generate_flame_graph(_samples(), str(path), format="collapsed")
+
+        assert StackTrie.read_collapsed(path).total == 1000
+        with pytest.raises(ValueError):
+            generate_flame_graph([], str(path))
+
+    def test_json_output(self, tmp_path: Path) -> None:
+        """Test the speedscope output file."""
+        path = tmp_path / "profile.json"
+        generate_flame_graph(aggregate_stacks(_samples()), str(path), format="json")
+
+        assert json.loads(path.read_text())["profiles"][0]["type"] == "sampled"
+
+    def test_hot_paths(self) -> None:
+        """Test ranking stacks by sample count."""
+        hot = get_hot_paths(_samples(), top_n=2)
+
+        assert hot[0] == (("main", "run", "step"), 700, 70.0)
+        assert len(hot) == 2
+
+
+class TestDifferential:
+    """Tests for differential flame graphs."""
+
+    def test_diff_stacks(self) -> None:
+        """Test pairing counts from two profiles."""
+        before = aggregate_stacks(_samples())
+        after = StackTrie.from_collapsed(["main;run;step 100", "main;save 5"])
+
+        diff = diff_stacks(before, after)
+
+        assert diff[("main", "run", "step")] == (700, 100)
+        assert diff[("main", "save")] == (0, 5)
+        assert diff[("main", "load")] == (290, 0)
+
+    def test_differential_colors(self) -> None:
+        """Test that grown frames are red and shrunk frames are blue."""
+        before = StackTrie.from_collapsed(["main;fast 50", "main;slow 50"])
+        after = StackTrie.from_collapsed(["main;fast 20", "main;slow 80"])
+
+        svg = differential_svg(before, after)
+        frames = {part.split(" (")[0]: part for part in svg.split("<g><title>")[1:]}
+
+        assert 'fill="rgb(230,0,0)"' in frames["slow"]
+        assert 'fill="rgb(0,0,230)"' in frames["fast"]
+        assert 'fill="rgb(180,180,180)"' in frames["main"]
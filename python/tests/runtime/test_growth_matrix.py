@@ -0,0 +1,77 @@
+"""Tests for the object-count growth matrix."""
+
+import random
+
+import pytest
+from qontinui_devtools.runtime import GrowthMatrix, fit_growth
+from qontinui_devtools.runtime import growth_matrix as growth_module
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def numpy_mode(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    """Run a test with and without the NumPy path."""
+    if request.param and not growth_module.NUMPY_AVAILABLE:
+        pytest.skip("numpy not available")
+    monkeypatch.setattr(growth_module, "NUMPY_AVAILABLE", request.param)
+    return bool(request.param)
+
+
+def _fill(matrix: GrowthMatrix, snapshots: int = 50) -> None:
+    """Append snapshots with a leaking, a stable, a noisy and a late type."""
+    rng = random.Random(3)
+    for i in range(snapshots):
+        counts = {
+            "dict": 5_000_000 + 40 * i,
+            "list": 1000,
+            "str": 2000 + rng.randint(-500, 500),
+        }
+        if i >= snapshots // 2:
+            counts["Widget"] = 10 * i
+        matrix.append(1_700_000_000.0 + 0.5 * i, counts)
+
+
+class TestGrowthMatrix:
+    """Tests for GrowthMatrix."""
+
+    def test_growing_types(self, numpy_mode: bool) -> None:
+        """Test that only steadily growing types are reported."""
+        matrix = GrowthMatrix()
+        _fill(matrix)
+
+        growing = {name: (slope, r2) for name, slope, r2 in matrix.growing(threshold=10.0)}
+
+        assert set(growing) == {"dict", "Widget"}
+        assert growing["dict"][0] == pytest.approx(80.0)
+        assert growing["dict"][1] == pytest.approx(1.0)
+        assert len(matrix) == 50
+
+    def test_incremental_matches_batch_fit(self, numpy_mode: bool) -> None:
+        """Test that running sums agree with a fit over the full matrix."""
+        matrix = GrowthMatrix()
+        _fill(matrix)
+
+        slopes, r_squared = fit_growth(matrix.timestamps, matrix.to_rows())
+        batch = dict(zip(matrix.types, zip(slopes, r_squared, strict=True), strict=True))
+
+        for name, slope, r2 in matrix.growing(threshold=-1e9, min_r_squared=-1.0):
+            assert slope == pytest.approx(batch[name][0], abs=1e-6)
+            assert r2 == pytest.approx(batch[name][1], abs=1e-6)
+
+    def test_samples_pad_late_types(self) -> None:
+        """Test that types first seen later read as 0 in earlier snapshots."""
+        matrix = GrowthMatrix()
+        matrix.append(0.0, {"dict": 1})
+        matrix.append(1.0, {"dict": 2, "list": 5})
+
+        assert matrix.samples("list") == [(0.0, 0), (1.0, 5)]
+        assert matrix.samples("dict") == [(0.0, 1), (1.0, 2)]
+        assert matrix.samples("set") == []
+        assert matrix.to_rows() == [[1, 2], [0, 5]]
+
+    def test_too_few_snapshots(self, numpy_mode: bool) -> None:
+        """Test that a single snapshot reports no growth."""
+        matrix = GrowthMatrix()
+        matrix.append(0.0, {"dict": 100})
+
+        assert matrix.growing(threshold=0.0) == []
+        assert fit_growth([0.0], [[1.0]]) == ([0.0], [0.0])
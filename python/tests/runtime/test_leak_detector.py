@@ -6,6 +6,7 @@ from typing import Any
 import pytest
 from qontinui_devtools.runtime import (
     analyze_growth_trend,
+    analyze_growth_trends,
     analyze_object_retention,
     classify_leak_severity,
     detect_common_leak_patterns,
@@ -65,6 +66,24 @@ class TestAnalyzeGrowthTrend:
         assert not is_growing
         assert rate < 0.01
 
+    def test_many_series_match_single_series(self) -> None:
+        """Test that the vectorized fit agrees with per-series analysis."""
+        timestamps = [float(i) for i in range(10)]
+        series = {
+            "dict": [i * 10 for i in range(10)],
+            "list": [100] * 10,
+            "set": [100 - i * 5 for i in range(10)],
+        }
+
+        trends = analyze_growth_trends(timestamps, series, threshold=1.0)
+
+        for name, values in series.items():
+            is_growing, rate = analyze_growth_trend(
+                list(zip(timestamps, values, strict=True)), threshold=1.0
+            )
+            assert trends[name][0] == is_growing
+            assert trends[name][1] == pytest.approx(rate)
+
 
 class TestFindReferenceChains:
     """Test reference chain finding."""
@@ -5,7 +5,7 @@ import time
 from typing import Any
 
 import pytest
-from qontinui_devtools.runtime import MemoryLeak, MemoryProfiler, MemorySnapshot
+from qontinui_devtools.runtime import GrowthMatrix, MemoryLeak, MemoryProfiler, MemorySnapshot
 
 
 class TestMemorySnapshot:
@@ -304,42 +304,40 @@ class TestMemoryProfiler:
 
     def test_analyze_growth_linear(self) -> None:
         """Test growth analysis with linear growth."""
-        profiler = MemoryProfiler(enable_tracemalloc=False)
+        growth = GrowthMatrix()
 
         # Simulate linear growth
-        samples = [(float(i), i * 10) for i in range(10)]
+        for i in range(10):
+            growth.append(float(i), {"dict": i * 10})
 
-        is_growing, rate, confidence = profiler._analyze_growth(samples, threshold=5.0)
+        [(name, rate, confidence)] = growth.growing(threshold=5.0)
 
-        assert is_growing
+        assert name == "dict"
         assert rate > 5.0
         assert confidence > 0.9  # Should be very confident about linear growth
 
     def test_analyze_growth_no_growth(self) -> None:
         """Test growth analysis with no growth."""
-        profiler = MemoryProfiler(enable_tracemalloc=False)
+        growth = GrowthMatrix()
 
         # Simulate no growth
-        samples = [(float(i), 100) for i in range(10)]
-
-        is_growing, rate, confidence = profiler._analyze_growth(samples, threshold=1.0)
+        for i in range(10):
+            growth.append(float(i), {"dict": 100})
 
-        assert not is_growing
-        assert abs(rate) < 1.0
+        assert growth.growing(threshold=1.0) == []
 
     def test_analyze_growth_noisy_data(self) -> None:
         """Test growth analysis with noisy data."""
-        profiler = MemoryProfiler(enable_tracemalloc=False)
+        growth = GrowthMatrix()
 
         # Simulate noisy data (random fluctuation)
         import random
 
-        samples = [(float(i), 100 + random.randint(-10, 10)) for i in range(10)]
-
-        is_growing, rate, confidence = profiler._analyze_growth(samples, threshold=5.0)
+        for i in range(10):
+            growth.append(float(i), {"dict": 100 + random.randint(-10, 10)})
 
         # Should not detect growth with random noise
-        assert not is_growing or confidence < 0.7
+        assert growth.growing(threshold=5.0) == []
 
     def test_estimate_size_increase(self) -> None:
         """Test size increase estimation."""
@@ -373,6 +371,49 @@ class TestMemoryProfiler:
 
         profiler.stop()
 
+    def test_tracemalloc_diff_by_filename(self) -> None:
+        """Test that snapshots diff allocations against the previous one."""
+        profiler = MemoryProfiler(enable_tracemalloc=True, retain_tracemalloc_snapshots=False)
+        profiler.start()
+
+        assert profiler.baseline is not None
+        assert profiler.baseline.allocation_diff == []
+
+        data = [bytearray(1024) for _ in range(500)]
+        snapshot = profiler.take_snapshot()
+
+        assert snapshot.allocation_diff
+        assert any(diff > 0 for _, diff in snapshot.allocation_diff)
+        assert snapshot.top_objects
+        assert snapshot.tracemalloc_snapshot is not None
+        assert profiler.baseline.tracemalloc_snapshot is None
+
+        profiler.stop()
+        del data
+
+    def test_sampled_object_counts(self) -> None:
+        """Test that sampled counts are scaled to the full population."""
+        profiler = MemoryProfiler(enable_tracemalloc=False, gc_generation=0, object_sample_rate=0.1)
+        profiler.start()
+
+        snapshot = profiler.take_snapshot()
+        total = snapshot.gc_stats["objects"]
+        sampled = sum(snapshot.objects_by_type.values())
+
+        assert total > 0
+        assert abs(sampled - total) <= 10 * 2
+        assert all(count % 10 == 0 for count in snapshot.objects_by_type.values())
+
+        profiler.stop()
+
+    def test_invalid_snapshot_options(self) -> None:
+        """Test that invalid lightweight options are rejected."""
+        with pytest.raises(ValueError, match="object_sample_rate"):
+            MemoryProfiler(enable_tracemalloc=False, object_sample_rate=0.0)
+
+        with pytest.raises(ValueError, match="gc_generation"):
+            MemoryProfiler(enable_tracemalloc=False, gc_generation=3)
+
     def test_empty_snapshots_report(self) -> None:
         """Test generating report with no snapshots."""
         profiler = MemoryProfiler(enable_tracemalloc=False)
@@ -0,0 +1,99 @@
+"""Tests for background memory sampling."""
+
+import time
+
+import pytest
+from qontinui_devtools.runtime import ActionProfiler, MemorySampler, MemoryTrack
+
+SPIKE_BYTES = 64 * 1024 * 1024
+
+
+def _transient_spike() -> None:
+    """Allocate and touch a large buffer, then free it."""
+    data = b"\x01" * SPIKE_BYTES
+    time.sleep(0.05)
+    del data
+
+
+class TestMemoryTrack:
+    """Tests for MemoryTrack."""
+
+    def test_peak_and_downsampling(self) -> None:
+        """Test that the curve stays bounded while the peak stays exact."""
+        track = MemoryTrack(max_points=8)
+        for i in range(100):
+            track.record(float(i), 1000 + (5000 if i == 37 else i))
+
+        assert track.peak == 6000
+        assert len(track.samples) <= 8
+        timestamps = [t for t, _ in track.samples]
+        assert timestamps == sorted(timestamps)
+        assert timestamps[0] == 0.0
+
+
+class TestMemorySampler:
+    """Tests for MemorySampler."""
+
+    def test_invalid_arguments(self) -> None:
+        """Test that invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            MemorySampler(interval=0)
+        with pytest.raises(ValueError):
+            MemorySampler(max_points=1)
+
+    def test_attach_and_detach_take_readings(self) -> None:
+        """Test that a track has readings even without the background thread."""
+        sampler = MemorySampler()
+        track = sampler.attach()
+        sampler.sample()
+        sampler.detach(track)
+        sampler.sample()  # Detached tracks are no longer updated
+
+        assert len(track.samples) == 3
+        assert track.peak > 0
+
+    def test_shared_thread_tracks_concurrent_actions(self) -> None:
+        """Test one sampler thread serving overlapping tracks."""
+        sampler = MemorySampler(interval=0.002)
+        sampler.start()
+        first = sampler.attach()
+        second = sampler.attach()
+        time.sleep(0.05)
+        sampler.detach(first)
+        time.sleep(0.02)
+        sampler.detach(second)
+        sampler.stop()
+
+        assert not sampler.is_running
+        assert len(first.samples) > 2
+        assert len(second.samples) > len(first.samples)
+
+
+class TestPeakMemoryProfiling:
+    """Tests for peak memory tracking in ActionProfiler."""
+
+    def test_transient_spike_is_captured(self) -> None:
+        """Test that a spike freed before the action ends shows up in the peak."""
+        profiler = ActionProfiler(track_peak_memory=True, memory_sample_interval=0.002)
+        profiler.start_session()
+
+        with profiler.profile_action("decode", "screenshot") as profile:
+            _transient_spike()
+
+        session = profiler.end_session()
+
+        assert profile.peak_memory - profile.memory_before >= SPIKE_BYTES // 2
+        assert profile.peak_memory > profile.memory_after
+        assert profile.memory_samples
+        assert session.profiles[0] is profile
+
+    def test_disabled_by_default(self) -> None:
+        """Test that peak tracking is opt-in."""
+        profiler = ActionProfiler()
+        profiler.start_session()
+
+        with profiler.profile_action("click", "test") as profile:
+            pass
+
+        profiler.end_session()
+        assert profile.memory_samples == []
@@ -0,0 +1,64 @@
+"""Performance benchmarks for metrics collector.
+
+Tests recording overhead with many concurrent recording threads. The
+pytest-benchmark test is skipped when the plugin is not installed.
+"""
+
+import importlib.util
+import threading
+import time
+from typing import Any
+
+import pytest
+from qontinui_devtools.runtime import MetricsCollector
+
+requires_benchmark = pytest.mark.skipif(
+    importlib.util.find_spec("pytest_benchmark") is None,
+    reason="pytest-benchmark is not installed",
+)
+
+
+@requires_benchmark
+def test_record_action_overhead(benchmark: Any) -> Any:
+    """Benchmark recording a single action."""
+    collector = MetricsCollector()
+
+    benchmark(collector.record_action, "click", 0.01, True)
+
+    assert collector.collect_action_metrics().total_actions > 0
+
+
+def test_record_action_with_32_threads() -> None:
+    """Measure per-record overhead with 32 threads recording at once."""
+    collector = MetricsCollector(sample_interval=0.05)
+    collector.start()
+
+    thread_count = 32
+    records_per_thread = 5000
+    barrier = threading.Barrier(thread_count + 1)
+
+    def record() -> None:
+        barrier.wait()
+        for i in range(records_per_thread):
+            collector.record_action("click", 0.01, success=i % 10 != 0)
+            collector.record_event(0.005)
+
+    threads = [threading.Thread(target=record) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    collector.stop()
+
+    total = thread_count * records_per_thread
+    per_record_us = elapsed / (2 * total) * 1e6
+    print(f"\nRecording overhead: {per_record_us:.2f} µs per record with {thread_count} threads")
+
+    # History is bounded, but the sketches and event counters see every record
+    assert collector.get_sketches()["action_duration"].count == total
+    events = collector.collect_event_metrics()
+    assert events.events_processed == total
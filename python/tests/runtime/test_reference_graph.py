@@ -0,0 +1,107 @@
+"""Tests for the referrer index used by leak analysis."""
+
+import gc
+import sys
+from typing import Any
+
+from qontinui_devtools.runtime import (
+    ReferenceGraph,
+    find_cycles_containing,
+    find_reference_chains,
+    get_object_size_deep,
+)
+
+
+class Holder:
+    """Class whose attribute keeps objects alive."""
+
+    items: list[Any] = []
+
+
+class TestReferenceGraph:
+    """Tests for ReferenceGraph."""
+
+    def test_referrers_match_gc(self) -> None:
+        """Test that indexed referrers include the containing objects."""
+        leaked = [1, 2, 3]
+        container = {"leaked": leaked}
+        graph = ReferenceGraph()
+
+        assert any(ref is container for ref in graph.referrers(leaked))
+        assert len(graph) > 0
+
+    def test_graph_does_not_keep_itself_alive(self) -> None:
+        """Test that a dropped graph is freed without a collection."""
+        gc.disable()
+        try:
+            find_reference_chains([1, 2, 3])
+            alive = [obj for obj in gc.get_objects() if isinstance(obj, ReferenceGraph)]
+        finally:
+            gc.enable()
+
+        assert alive == []
+
+    def test_chain_to_class_attribute(self) -> None:
+        """Test finding the chain through a class attribute."""
+        leaked = {"payload": [0] * 10}
+        Holder.items.append(leaked)
+        try:
+            chains = ReferenceGraph().reference_chains(leaked, max_depth=4)
+        finally:
+            Holder.items.clear()
+
+        assert any(chain[:3] == ["dict", "list", "dict"] for chain in chains)
+        assert all(chain[0] == "dict" for chain in chains)
+
+    def test_cycles_start_with_object(self) -> None:
+        """Test that cycles through the object are found and ordered."""
+        first: dict[str, Any] = {"name": "first"}
+        second: dict[str, Any] = {"name": "second", "ref": first}
+        first["ref"] = second
+        graph = ReferenceGraph()
+
+        cycles = graph.cycles_containing(first)
+
+        assert [first, second] in cycles
+        assert find_cycles_containing({"key": "value"}, graph=graph) == []
+
+    def test_retained_size_excludes_shared_objects(self) -> None:
+        """Test that objects also held elsewhere are not counted as retained."""
+        shared = [object() for _ in range(100)]
+        private = [object() for _ in range(100)]
+        owner = {"shared": shared, "private": private}
+        keep_alive = [shared]
+        graph = ReferenceGraph()
+
+        retained = graph.retained_size(owner)
+
+        expected = sys.getsizeof(owner) + sys.getsizeof(private)
+        expected += sum(sys.getsizeof(item) for item in private)
+        assert retained == expected
+        assert keep_alive
+
+    def test_node_budget_limits_search(self) -> None:
+        """Test that exhausting the node budget returns partial results."""
+        obj: list[Any] = []
+        graph = ReferenceGraph()
+
+        assert find_reference_chains(obj, max_depth=50, graph=graph, max_nodes=0) == []
+        assert graph.retained_size(obj, max_nodes=0) == sys.getsizeof(obj)
+
+
+class TestIterativeDeepSize:
+    """Tests for the iterative get_object_size_deep."""
+
+    def test_deep_nesting_does_not_recurse(self) -> None:
+        """Test structures nested deeper than the recursion limit."""
+        nested: list[Any] = []
+        for _ in range(sys.getrecursionlimit() * 2):
+            nested = [nested]
+
+        assert get_object_size_deep(nested) > 0
+
+    def test_max_nodes(self) -> None:
+        """Test that measurement stops after max_nodes objects."""
+        obj = [[i] for i in range(100)]
+
+        assert get_object_size_deep(obj, max_nodes=1) == sys.getsizeof(obj)
@@ -0,0 +1,147 @@
+"""Tests for streaming quantile sketches and sliding windows."""
+
+import json
+import random
+
+import pytest
+from qontinui_devtools.runtime import QuantileSketch, SlidingWindow
+
+
+def _exact(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestQuantileSketch:
+    """Tests for QuantileSketch."""
+
+    def test_quantiles_within_relative_accuracy(self) -> None:
+        """Test that quantiles are within the configured relative error."""
+        rng = random.Random(42)
+        values = [rng.lognormvariate(-5, 1.5) for _ in range(20000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.01, 0.25, 0.5, 0.9, 0.95, 0.99, 0.999):
+            assert sketch.quantile(q) == pytest.approx(_exact(values, q), rel=0.01)
+        assert sketch.quantile(0) == min(values)
+        assert sketch.quantile(1) == max(values)
+        assert sketch.count == len(values)
+        assert sketch.mean == pytest.approx(sum(values) / len(values))
+
+    def test_percentile(self) -> None:
+        """Test percentiles on a 0-100 scale."""
+        sketch = QuantileSketch()
+        for value in range(1, 101):
+            sketch.add(float(value))
+
+        assert sketch.percentile(50) == pytest.approx(50, rel=0.01)
+        assert sketch.percentile(99) == pytest.approx(99, rel=0.01)
+        with pytest.raises(ValueError):
+            sketch.percentile(101)
+
+    def test_zero_and_negative_values(self) -> None:
+        """Test values at and below zero."""
+        sketch = QuantileSketch()
+        for value in (-10.0, -1.0, 0.0, 0.0, 1.0, 10.0):
+            sketch.add(value)
+
+        assert sketch.quantile(0.0) == -10.0
+        assert sketch.quantile(0.2) == pytest.approx(-1.0, rel=0.01)
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == 10.0
+
+    def test_empty_sketch(self) -> None:
+        """Test reading an empty sketch."""
+        sketch = QuantileSketch()
+
+        with pytest.raises(ValueError, match="empty"):
+            sketch.quantile(0.5)
+        assert sketch.summary()["p99"] == 0.0
+        assert sketch.mean == 0.0
+
+    def test_merge_matches_single_sketch(self) -> None:
+        """Test that merging per-worker sketches equals one combined sketch."""
+        rng = random.Random(7)
+        values = [rng.expovariate(100) for _ in range(9000)]
+
+        combined = QuantileSketch()
+        workers = [QuantileSketch() for _ in range(3)]
+        for i, value in enumerate(values):
+            combined.add(value)
+            workers[i % 3].add(value)
+
+        merged = QuantileSketch()
+        for worker in workers:
+            merged.merge(worker)
+
+        assert merged.count == combined.count
+        for q in (0.5, 0.95, 0.99):
+            assert merged.quantile(q) == combined.quantile(q)
+
+    def test_merge_rejects_different_accuracy(self) -> None:
+        """Test that sketches with different accuracies cannot be merged."""
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        other = QuantileSketch(relative_accuracy=0.02)
+        other.add(1.0)
+
+        with pytest.raises(ValueError, match="relative accuracies"):
+            sketch.merge(other)
+
+    def test_bucket_count_is_bounded(self) -> None:
+        """Test that collapsing keeps memory bounded and high quantiles accurate."""
+        values = [10.0**exponent for exponent in range(-8, 8) for _ in range(10)]
+        sketch = QuantileSketch(relative_accuracy=0.01, max_buckets=64)
+        for value in values:
+            sketch.add(value)
+
+        assert sketch.bucket_count <= 64
+        assert sketch.quantile(0.99) == pytest.approx(_exact(values, 0.99), rel=0.01)
+
+    def test_serialization_round_trip(self) -> None:
+        """Test that sketches survive JSON serialization (e.g. between processes)."""
+        sketch = QuantileSketch()
+        for value in (0.0, 0.001, 0.002, 0.5, -0.25):
+            sketch.add(value)
+
+        restored = QuantileSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+        assert restored.summary() == sketch.summary()
+        assert QuantileSketch.from_dict(QuantileSketch().to_dict()).count == 0
+
+
+class TestSlidingWindow:
+    """Tests for SlidingWindow."""
+
+    def test_totals_within_window(self) -> None:
+        """Test counts, sums and failures for recent values."""
+        window = SlidingWindow(window_seconds=60.0, slots=60)
+        window.add(0.1, now=1000.0)
+        window.add(0.3, success=False, now=1010.0)
+
+        totals = window.totals(now=1020.0)
+        assert totals.count == 2
+        assert totals.total == pytest.approx(0.4)
+        assert totals.failures == 1
+        assert totals.mean == pytest.approx(0.2)
+
+    def test_old_values_expire(self) -> None:
+        """Test that values older than the window are dropped."""
+        window = SlidingWindow(window_seconds=10.0, slots=10)
+        window.add(1.0, now=100.0)
+        window.add(2.0, now=105.0)
+
+        assert window.totals(now=109.5).count == 2
+        assert window.totals(now=112.0).count == 1
+        assert window.totals(now=200.0).count == 0
+
+    def test_slot_reused_after_wraparound(self) -> None:
+        """Test that a reused slot does not keep stale totals."""
+        window = SlidingWindow(window_seconds=10.0, slots=10)
+        window.add(1.0, now=100.0)
+        window.add(5.0, now=110.0)  # Same ring position, next lap
+
+        totals = window.totals(now=110.0)
+        assert totals.count == 1
+        assert totals.total == 5.0
@@ -0,0 +1,106 @@
+"""Tests for the background stack sampler."""
+
+import threading
+import time
+
+import pytest
+from qontinui_devtools.runtime import StackSampler
+from qontinui_devtools.runtime.flame_graph import aggregate_stacks, samples_to_speedscope
+
+
+def _spin(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestStackSampler:
+    """Tests for StackSampler."""
+
+    def test_invalid_arguments(self) -> None:
+        """Test that non-positive settings are rejected."""
+        with pytest.raises(ValueError):
+            StackSampler(interval=0)
+        with pytest.raises(ValueError):
+            StackSampler(max_depth=0)
+
+    def test_sample_records_attached_thread(self) -> None:
+        """Test a direct sample of the calling thread."""
+        sampler = StackSampler()
+        samples: list[tuple[float, list[str]]] = []
+
+        assert sampler.sample() == 0
+
+        sampler.attach(threading.get_ident(), samples)
+        assert sampler.sample() == 1
+        sampler.detach(threading.get_ident())
+        assert sampler.sample() == 0
+
+        _, stack = samples[0]
+        assert stack[-1].startswith("sample ")
+        assert stack[-2].startswith("test_sample_records_attached_thread ")
+
+    def test_frame_labels_are_interned(self) -> None:
+        """Test that repeated samples share frame label strings."""
+        sampler = StackSampler()
+        samples: list[tuple[float, list[str]]] = []
+        sampler.attach(threading.get_ident(), samples)
+        sampler.sample()
+        sampler.sample()
+
+        assert all(a is b for a, b in zip(samples[0][1], samples[1][1], strict=True))
+
+    def test_nested_sinks(self) -> None:
+        """Test that samples go to the innermost attached sink."""
+        sampler = StackSampler()
+        outer: list[tuple[float, list[str]]] = []
+        inner: list[tuple[float, list[str]]] = []
+        thread_id = threading.get_ident()
+
+        sampler.attach(thread_id, outer)
+        sampler.attach(thread_id, inner)
+        sampler.sample()
+        sampler.detach(thread_id)
+        sampler.sample()
+
+        assert len(inner) == 1
+        assert len(outer) == 1
+
+    def test_max_depth_keeps_innermost_frames(self) -> None:
+        """Test that deep stacks are truncated at the root end."""
+        sampler = StackSampler(max_depth=2)
+        samples: list[tuple[float, list[str]]] = []
+        sampler.attach(threading.get_ident(), samples)
+        sampler.sample()
+
+        stack = samples[0][1]
+        assert len(stack) == 2
+        assert stack[-1].startswith("sample ")
+
+    def test_background_sampling_of_worker_thread(self) -> None:
+        """Test sampling another thread from the background thread."""
+        sampler = StackSampler(interval=0.001)
+        samples: list[tuple[float, list[str]]] = []
+        attached = threading.Event()
+
+        def worker() -> None:
+            sampler.attach(threading.get_ident(), samples)
+            attached.set()
+            _spin(0.2)
+            sampler.detach(threading.get_ident())
+
+        sampler.start()
+        thread = threading.Thread(target=worker)
+        thread.start()
+        attached.wait()
+        thread.join()
+        sampler.stop()
+
+        assert not sampler.is_running
+        assert sampler.samples_taken == len(samples) > 0
+        assert any(stack[-1].startswith("_spin ") for _, stack in samples)
+
+        # Samples feed the flame graph helpers directly
+        assert sum(aggregate_stacks(samples).values()) == len(samples)
+        profile = samples_to_speedscope(samples)["profiles"][0]
+        assert sum(profile["weights"]) == len(samples)
@@ -0,0 +1,203 @@
+"""Tests for the streaming trace writers."""
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from qontinui_devtools.runtime import (
+    BackgroundTraceExporter,
+    ChromeTraceWriter,
+    CompactEventTrace,
+    EventTrace,
+    EventTracer,
+    PerfettoTraceWriter,
+    TraceWriter,
+    open_trace_writer,
+)
+
+
+def _make_trace(event_id: str, trace_class: Any = EventTrace) -> Any:
+    """Build a completed trace with three checkpoints."""
+    trace = trace_class(event_id=event_id, event_type="click", created_at=100.0)
+    trace.add_checkpoint("frontend_emit", timestamp=100.0, metadata={"x": 1, "obj": object()})
+    trace.add_checkpoint("tauri_receive", timestamp=100.01)
+    trace.add_checkpoint("python_receive", timestamp=100.03)
+    trace.completed = True
+    return trace
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """Decode a protobuf varint; returns (value, next position)."""
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            return value, pos
+
+
+def _fields(data: bytes) -> list[tuple[int, Any]]:
+    """Decode a protobuf message into (field number, value) pairs."""
+    fields: list[tuple[int, Any]] = []
+    pos = 0
+    while pos < len(data):
+        key, pos = _read_varint(data, pos)
+        field_number, wire_type = key >> 3, key & 7
+        value: int | bytes
+        if wire_type == 0:
+            value, pos = _read_varint(data, pos)
+        elif wire_type == 1:
+            value, pos = data[pos : pos + 8], pos + 8
+        else:
+            length, pos = _read_varint(data, pos)
+            value, pos = data[pos : pos + length], pos + length
+        fields.append((field_number, value))
+    return fields
+
+
+class TestChromeTraceWriter:
+    """Tests for ChromeTraceWriter."""
+
+    @pytest.mark.parametrize("trace_class", [EventTrace, CompactEventTrace])
+    def test_streamed_file_is_valid_json(self, tmp_path: Path, trace_class: Any) -> None:
+        """Test that a streamed file loads as a Chrome trace object."""
+        path = tmp_path / "trace.json"
+        with ChromeTraceWriter(path) as writer:
+            writer.write_traces(_make_trace(f"evt_{i}", trace_class) for i in range(3))
+
+        data = json.loads(path.read_text())
+
+        assert data["displayTimeUnit"] == "ms"
+        assert data["otherData"]["trace_count"] == 3
+        # Per trace: one metadata event, two stages and three checkpoints
+        assert len(data["traceEvents"]) == 18
+        stage = next(e for e in data["traceEvents"] if e["ph"] == "X")
+        assert stage["name"] == "frontend_emit"
+        assert stage["dur"] == pytest.approx(10_000, abs=1)
+        assert stage["args"]["x"] == 1
+
+    def test_empty_export(self, tmp_path: Path) -> None:
+        """Test that a writer without traces still produces a valid file."""
+        path = tmp_path / "trace.json"
+        ChromeTraceWriter(path).close()
+
+        assert json.loads(path.read_text())["traceEvents"] == []
+
+    def test_rotation(self, tmp_path: Path) -> None:
+        """Test that files rotate on size and old files are deleted."""
+        writer = ChromeTraceWriter(tmp_path / "trace.json", max_bytes=4096, max_files=3)
+        for i in range(50):
+            writer.write_trace(_make_trace(f"evt_{i}"))
+        writer.close()
+
+        paths = writer.paths
+        assert len(paths) == 3
+        assert paths[-1].name.startswith("trace.") and paths[-1].suffix == ".json"
+        assert not (tmp_path / "trace.json").exists()
+        assert sorted(tmp_path.iterdir()) == sorted(paths)
+
+        counts = [json.loads(path.read_text())["otherData"]["trace_count"] for path in paths]
+        assert all(count > 0 for count in counts)
+        assert all(path.stat().st_size <= 4096 for path in paths)
+        assert writer.traces_written == 50
+
+    def test_closed_writer_rejects_traces(self, tmp_path: Path) -> None:
+        """Test writing after close and invalid arguments."""
+        writer = ChromeTraceWriter(tmp_path / "trace.json")
+        writer.close()
+
+        with pytest.raises(ValueError):
+            writer.write_trace(_make_trace("evt"))
+        with pytest.raises(ValueError):
+            ChromeTraceWriter(tmp_path / "other.json", max_bytes=0)
+        with pytest.raises(TypeError):
+            TraceWriter(tmp_path / "base.json")  # type: ignore[abstract]
+        assert not (tmp_path / "base.json").exists()
+
+
+class TestPerfettoTraceWriter:
+    """Tests for PerfettoTraceWriter."""
+
+    def test_packets(self, tmp_path: Path) -> None:
+        """Test the encoded tracks and slices."""
+        path = tmp_path / "trace.pftrace"
+        with open_trace_writer(path) as writer:
+            assert isinstance(writer, PerfettoTraceWriter)
+            writer.write_trace(_make_trace("evt_0"))
+            writer.write_trace(_make_trace("evt_1"))
+
+        packets = [_fields(value) for field, value in _fields(path.read_bytes()) if field == 1]
+        descriptors = [dict(_fields(dict(p)[60])) for p in packets if 60 in dict(p)]
+        events = [dict(p) for p in packets if 11 in dict(p)]
+
+        # One parent track for the event type, one track per event
+        assert [d[2] for d in descriptors] == [b"click", b"evt_0", b"evt_1"]
+        assert descriptors[1][5] == descriptors[0][1]
+
+        track_events = [dict(_fields(e[11])) for e in events]
+        types = [e[9] for e in track_events]
+        # Per trace: metadata instant, three checkpoints and two begin/end pairs
+        assert len(events) == 2 * 8
+        assert types.count(1) == types.count(2) == 4
+        begin = next(e for e in track_events if e[9] == 1)
+        assert begin[23] == b"frontend_emit"
+        assert events[0][8] == 100 * 1_000_000_000
+
+
+class TestBackgroundTraceExporter:
+    """Tests for BackgroundTraceExporter."""
+
+    def test_exports_completed_traces(self, tmp_path: Path) -> None:
+        """Test that traces are exported as they complete."""
+        tracer = EventTracer()
+        writer = ChromeTraceWriter(tmp_path / "trace.json")
+        exporter = BackgroundTraceExporter(tracer, writer, flush_interval=0.01)
+        exporter.start()
+
+        for i in range(20):
+            tracer.start_trace(f"evt_{i}", "click")
+            tracer.checkpoint(f"evt_{i}", "frontend_emit")
+            if i % 2 == 0:
+                tracer.complete_trace(f"evt_{i}")
+
+        deadline = time.time() + 5.0
+        while exporter.exported < 10 and time.time() < deadline:
+            time.sleep(0.01)
+        exporter.stop()
+
+        data = json.loads((tmp_path / "trace.json").read_text())
+        exported = {e["args"]["event_id"] for e in data["traceEvents"] if e["cat"] == "metadata"}
+        assert exported == {f"evt_{i}" for i in range(0, 20, 2)}
+        assert exporter.dropped == 0
+
+        # Stopped exporters no longer listen
+        tracer.start_trace("late", "click")
+        tracer.complete_trace("late")
+        assert exporter.exported == 10
+
+    def test_full_queue_drops_traces(self, tmp_path: Path) -> None:
+        """Test that traces beyond max_pending are dropped and counted."""
+        tracer = EventTracer()
+        writer = ChromeTraceWriter(tmp_path / "trace.json")
+        exporter = BackgroundTraceExporter(tracer, writer, max_pending=1)
+
+        tracer.add_completion_listener(exporter._enqueue)
+        for i in range(3):
+            tracer.start_trace(f"evt_{i}", "click")
+            tracer.complete_trace(f"evt_{i}")
+
+        assert exporter.dropped == 2
+
+    def test_export_trace_timeline_perfetto(self, tmp_path: Path) -> None:
+        """Test that the tracer's export picks the format from the suffix."""
+        tracer = EventTracer()
+        tracer.start_trace("evt", "click")
+        tracer.complete_trace("evt")
+
+        tracer.export_trace_timeline(str(tmp_path / "trace.perfetto-trace"))
+
+        assert (tmp_path / "trace.perfetto-trace").read_bytes()[:1] == b"\x0a"
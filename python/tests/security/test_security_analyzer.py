@@ -10,7 +10,7 @@ from collections.abc import Generator
 from pathlib import Path
 
 import pytest
-from qontinui_devtools.security import SecurityAnalyzer, Severity, VulnerabilityType
+from qontinui_devtools.security import FileScan, SecurityAnalyzer, Severity, VulnerabilityType
 
 
 @pytest.fixture
@@ -1101,3 +1101,121 @@ def unsafe_function(user_input) -> None:
 
     # Code snippet should contain the problematic line
     assert "os.system" in vulns[0].code_snippet
+
+
+# Rule Dispatch Tests
+
+
+def test_findings_grouped_by_detector(analyzer: SecurityAnalyzer, temp_dir: Path) -> None:
+    """Test that findings are reported in detector order, not traversal order."""
+    (temp_dir / "vuln.py").write_text("""
+import os
+import pickle
+
+pickle.loads(data)
+os.system("ls " + user_input)
+""")
+
+    vulns = analyzer.analyze_file(str(temp_dir / "vuln.py"))
+
+    assert [v.type for v in vulns] == [
+        VulnerabilityType.COMMAND_INJECTION,
+        VulnerabilityType.INSECURE_DESERIALIZATION,
+    ]
+
+
+def test_register_custom_rule(analyzer: SecurityAnalyzer, temp_dir: Path) -> None:
+    """Test that a registered rule runs in the shared traversal."""
+    import ast
+
+    def check_marshal(scan: FileScan, node: ast.Call, func_name: str) -> None:
+        if func_name == "marshal.loads":
+            scan.add_vulnerability(
+                VulnerabilityType.INSECURE_DESERIALIZATION,
+                Severity.HIGH,
+                node.lineno,
+                "marshal.loads() is not safe for untrusted data",
+                "Use JSON for data received from untrusted sources.",
+                "CWE-502",
+                "A08:2021 - Software and Data Integrity Failures",
+            )
+
+    analyzer.register_rule("marshal", ast.Call, check_marshal)
+    (temp_dir / "vuln.py").write_text("""
+import marshal
+import os
+marshal.loads(data)
+os.system("ls " + user_input)
+""")
+
+    vulns = analyzer.analyze_file(str(temp_dir / "vuln.py"))
+
+    assert [v.type for v in vulns] == [
+        VulnerabilityType.COMMAND_INJECTION,
+        VulnerabilityType.INSECURE_DESERIALIZATION,
+    ]
+    assert vulns[1].line_number == 4
+    assert "marshal" in analyzer.detectors
+
+
+# Parallel Scanning Tests
+
+
+def test_analyze_directory_parallel_matches_serial(
+    analyzer: SecurityAnalyzer, temp_dir: Path
+) -> None:
+    """Test that a multi-process scan reports the same findings in file order."""
+    for i in range(8):
+        (temp_dir / f"vuln{i}.py").write_text(
+            f"""
+import os
+import pickle
+os.system("ls " + user_input_{i})
+pickle.loads(payload_{i})
+"""
+        )
+
+    serial = analyzer.analyze_directory(str(temp_dir))
+    parallel = SecurityAnalyzer().analyze_directory(str(temp_dir), jobs=2)
+
+    assert parallel.total_files_scanned == serial.total_files_scanned == 8
+    assert [v.to_dict() for v in parallel.vulnerabilities] == [
+        v.to_dict() for v in serial.vulnerabilities
+    ]
+    assert parallel.errors == []
+
+
+def test_scan_directory_streams_results(analyzer: SecurityAnalyzer, temp_dir: Path) -> None:
+    """Test that scan_directory yields one result per file."""
+    for i in range(4):
+        (temp_dir / f"vuln{i}.py").write_text(f'import os\nos.system("ls " + arg_{i})\n')
+
+    results = list(analyzer.scan_directory(str(temp_dir), jobs=2))
+
+    assert sorted(Path(r.file_path).name for r in results) == [f"vuln{i}.py" for i in range(4)]
+    assert all(len(r.vulnerabilities) == 1 for r in results)
+
+
+def test_iter_findings_yields_vulnerabilities(analyzer: SecurityAnalyzer, temp_dir: Path) -> None:
+    """Test that iter_findings streams the same vulnerabilities as a full report."""
+    for i in range(3):
+        (temp_dir / f"vuln{i}.py").write_text(f'import os\nos.system("ls " + arg_{i})\n')
+
+    streamed = list(analyzer.iter_findings(str(temp_dir)))
+    report = analyzer.analyze_directory(str(temp_dir))
+
+    assert [v.to_dict() for v in streamed] == [v.to_dict() for v in report.vulnerabilities]
+    assert len(streamed) == 3
+
+
+def test_scan_file_leaves_analyzer_state_untouched(
+    analyzer: SecurityAnalyzer, temp_dir: Path
+) -> None:
+    """Test that scan_file does not record per-file state on the analyzer."""
+    (temp_dir / "vuln.py").write_text('import os\nos.system("ls " + user_input)\n')
+
+    vulns = analyzer.scan_file(str(temp_dir / "vuln.py"))
+
+    assert len(vulns) == 1
+    assert analyzer.vulnerabilities == []
+    assert analyzer.current_file == ""
@@ -0,0 +1 @@
+"""Tests for TypeScript/JavaScript analysis tools."""
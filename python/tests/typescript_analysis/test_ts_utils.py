@@ -0,0 +1,83 @@
+"""Tests for TypeScript/JavaScript import resolution."""
+
+from pathlib import Path
+
+import pytest
+from qontinui_devtools.typescript_analysis.ts_utils import (
+    ResolutionIndex,
+    find_ts_js_files,
+    load_tsconfig,
+    resolve_import_path,
+)
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a small TS project."""
+    for name in [
+        "src/app.ts",
+        "src/utils.ts",
+        "src/components/index.tsx",
+        "src/components/Button.tsx",
+        "lib/shared/format.ts",
+    ]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("export const x = 1;\n")
+    return tmp_path
+
+
+class TestResolutionIndex:
+    """Tests for ResolutionIndex."""
+
+    def test_relative_imports(self, project: Path) -> None:
+        """Test relative files and directory index files."""
+        index = ResolutionIndex(find_ts_js_files(project), project)
+        app = project / "src" / "app.ts"
+
+        assert index.resolve("./utils", app) == project / "src" / "utils.ts"
+        assert index.resolve("./components", app) == project / "src" / "components" / "index.tsx"
+        assert (
+            index.resolve("../lib/shared/format", app) == project / "lib" / "shared" / "format.ts"
+        )
+        assert index.resolve("./missing", app) is None
+        assert index.resolve("react", app) is None
+
+    def test_default_aliases(self, project: Path) -> None:
+        """Test the built-in '@/' and '~/' aliases."""
+        index = ResolutionIndex(find_ts_js_files(project), project)
+        app = project / "src" / "app.ts"
+
+        assert index.resolve("@/components/Button", app) == (
+            project / "src" / "components" / "Button.tsx"
+        )
+        assert index.resolve("~/lib/shared/format", app) == project / "lib" / "shared" / "format.ts"
+
+    def test_tsconfig_paths(self, project: Path) -> None:
+        """Test aliases and baseUrl from a tsconfig.json with comments."""
+        (project / "tsconfig.json").write_text(
+            "{\n"
+            "  // Path aliases\n"
+            '  "compilerOptions": {\n'
+            '    "baseUrl": "./src",\n'
+            '    "paths": {"@shared/*": ["../lib/shared/*"], /* exact */ "ui": ["components"],},\n'
+            "  },\n"
+            "}\n"
+        )
+        index = ResolutionIndex(find_ts_js_files(project), project)
+        app = project / "src" / "app.ts"
+
+        assert load_tsconfig(project)["baseUrl"] == "./src"
+        assert index.resolve("@shared/format", app) == project / "lib" / "shared" / "format.ts"
+        assert index.resolve("ui", app) == project / "src" / "components" / "index.tsx"
+        assert index.resolve("utils", app) == project / "src" / "utils.ts"
+
+    def test_matches_filesystem_resolution(self, project: Path) -> None:
+        """Test that the index agrees with filesystem-based resolution."""
+        index = ResolutionIndex(find_ts_js_files(project), project)
+        app = project / "src" / "app.ts"
+
+        for source in ["./utils", "./components", "@/components/Button", "./nope", "lodash"]:
+            assert resolve_import_path(source, app, project, index) == resolve_import_path(
+                source, app, project
+            )